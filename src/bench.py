@@ -0,0 +1,20 @@
+import logging
+import sys
+
+from src.facades.benchmark_facade import BenchmarkFacade
+from src.parsers.bench_arguments_parser import BenchArgumentsParser
+
+logging.basicConfig()
+logging.getLogger().setLevel(logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def main(args) -> None:
+
+    arguments_parser = BenchArgumentsParser()
+    facade = BenchmarkFacade(arguments_parser=arguments_parser, args=args)
+    facade.run_benchmarks()
+
+
+if __name__ == "__main__":
+    main(args=sys.argv[1:])
@@ -2,6 +2,10 @@ from abc import ABC, abstractmethod
 
 from src.services.analytics.analyzer_intrerface import IAnalyzer
 
+REPORTED_PERCENTILES = (50, 90, 95, 99)
+INTERVAL_FORMAT = "%Y-%m-%d %H:%M:%S"
+SLOWEST_ENDPOINTS = 10
+
 
 class IConverter(ABC):
     """
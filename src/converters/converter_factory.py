@@ -1,6 +1,8 @@
 from src.converters.converter import IConverter
 from src.converters.from_nginx_log_to_markdown_converter import FromNginxLogToMarkDownConverter
 from src.converters.from_nginx_logs_to_adoc_converter import FromNginxLogsToAdocConverter
+from src.converters.from_nginx_logs_to_csv_converter import FromNginxLogsToCsvConverter
+from src.converters.from_nginx_logs_to_json_converter import FromNginxLogsToJsonConverter
 from src.models.format_option import FormatOption
 
 
@@ -9,7 +11,7 @@ class ConverterFactory:
     Factory class to create converter instances based on format options.
 
     The `ConverterFactory` provides a method to retrieve an appropriate converter
-    instance according to the specified format option (e.g., Markdown or AsciiDoc).
+    instance according to the specified format option (e.g., Markdown, AsciiDoc, CSV or JSON).
     If the format is unsupported, it raises a `ValueError`.
     """
 
@@ -36,5 +38,9 @@ class ConverterFactory:
             return FromNginxLogToMarkDownConverter()
         elif format_option == FormatOption.ADOC:
             return FromNginxLogsToAdocConverter()
+        elif format_option == FormatOption.CSV:
+            return FromNginxLogsToCsvConverter()
+        elif format_option == FormatOption.JSON:
+            return FromNginxLogsToJsonConverter()
         else:
             raise ValueError(f"Error: Unsupported format '{format_option}'")
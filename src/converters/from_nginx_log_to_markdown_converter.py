@@ -1,4 +1,6 @@
-from src.converters.converter import IConverter
+from src.converters.converter import INTERVAL_FORMAT, REPORTED_PERCENTILES, SLOWEST_ENDPOINTS, IConverter
+from src.models.heavy_hitter import HeavyHitter
+from src.models.latency_summary import LatencySummary
 from src.services.analytics.analyzer_intrerface import IAnalyzer
 
 
@@ -17,6 +19,8 @@ class FromNginxLogToMarkDownConverter(IConverter):
 
         This method uses the data provided by the `analyzer` to construct a Markdown
         document with sections on general metrics, requested resources, and response codes.
+        Sections on heavy hitters, the time series, latency and unparsed lines follow
+        when the analyzer collected them.
 
         Args:
             analyzer: An object that provides analysis methods for log data, such as
@@ -40,8 +44,9 @@ class FromNginxLogToMarkDownConverter(IConverter):
         average_size = analyzer.get_average_size_logs()
         builder.append(f"| Средний размер ответа |         {average_size:.0f}b |\n")
 
-        percentile_95 = analyzer.calculate_95th_percentile()
-        builder.append(f"|   95p размера ответа  |         {percentile_95:.0f}b |\n")
+        for percentile in REPORTED_PERCENTILES:
+            percentile_value = analyzer.calculate_percentile(percentile)
+            builder.append(f"|   {percentile}p размера ответа  |         {percentile_value:.0f}b |\n")
 
         # Additional metrics
         builder.append(
@@ -68,8 +73,83 @@ class FromNginxLogToMarkDownConverter(IConverter):
             code_name = analyzer.get_status_code_name(code)
             builder.append(f"| {code} | {code_name} |       {self.format_number_with_underscores(count)} |\n")
 
+        heavy_hitters = analyzer.get_heavy_hitters()
+        if heavy_hitters is not None:
+            builder.append("\n#### Самые активные IP-адреса\n\n")
+            self.append_heavy_hitter_table(builder, "IP-адрес", heavy_hitters.get_top_addresses())
+            builder.append("\n#### Самые частые User-Agent\n\n")
+            self.append_heavy_hitter_table(builder, "User-Agent", heavy_hitters.get_top_user_agents())
+            builder.append("\n#### Самые частые Referer\n\n")
+            self.append_heavy_hitter_table(builder, "Referer", heavy_hitters.get_top_referers())
+
+        time_series = analyzer.get_time_series()
+        if time_series is not None:
+            builder.append("\n#### Временной ряд (UTC)\n\n")
+            builder.append("|  Начало интервала   | Запросы | Процент ошибок | Объём ответов | 95p размера ответа |\n")
+            builder.append("|:-------------------:|--------:|---------------:|--------------:|-------------------:|\n")
+            for interval in time_series.get_intervals():
+                builder.append(
+                    f"| {interval.start.strftime(INTERVAL_FORMAT)} | "
+                    f"{self.format_number_with_underscores(interval.count)} | "
+                    f"{interval.get_error_rate():.2f}% | "
+                    f"{self.format_number_with_underscores(interval.byte_sum)}b | "
+                    f"{interval.p95:.0f}b |\n"
+                )
+
+        latency = analyzer.get_latency_stats()
+        if latency is not None:
+            builder.append("\n#### Время ответа\n\n")
+            summaries = [latency.get_request_summary(), latency.get_upstream_summary()]
+            self.append_latency_table(builder, "Метрика", [summary for summary in summaries if summary.count])
+            builder.append("\n#### Самые медленные ресурсы (по 99p)\n\n")
+            self.append_latency_table(builder, "Ресурс", latency.get_slowest_endpoints(SLOWEST_ENDPOINTS), "`")
+            builder.append("\n#### Время ответа по кодам\n\n")
+            self.append_latency_table(builder, "Код", latency.get_status_summaries())
+
+        bad_line_counts = analyzer.get_bad_line_counts()
+        if bad_line_counts:
+            builder.append("\n#### Некорректные строки\n\n")
+            builder.append("|     Файл      | Количество |\n")
+            builder.append("|:-------------:|-----------:|\n")
+            for source, count in bad_line_counts.items():
+                builder.append(f"|  `{source}`  |      {self.format_number_with_underscores(count)} |\n")
+
         return "".join(builder)
 
+    def append_latency_table(self, builder: list[str], label_header: str, summaries: list[LatencySummary],
+                             quote: str = "") -> None:
+        """
+        Appends a table of latency percentiles.
+
+        Args:
+            builder (list[str]): The report parts to append to.
+            label_header (str): The header of the label column.
+            summaries (list[LatencySummary]): The rows of the table.
+            quote (str): The markup put around every label.
+        """
+        builder.append(f"| {label_header} | Запросы | 50p | 95p | 99p | 99.9p |\n")
+        builder.append("|:---:|--------:|----:|----:|----:|------:|\n")
+        for summary in summaries:
+            builder.append(
+                f"| {quote}{summary.label}{quote} | {self.format_number_with_underscores(summary.count)} | "
+                f"{summary.p50:.3f}s | {summary.p95:.3f}s | {summary.p99:.3f}s | {summary.p999:.3f}s |\n"
+            )
+
+    def append_heavy_hitter_table(self, builder: list[str], label_header: str, hitters: list[HeavyHitter]) -> None:
+        """
+        Appends a table of the most frequent values of a field.
+
+        Args:
+            builder (list[str]): The report parts to append to.
+            label_header (str): The header of the value column.
+            hitters (list[HeavyHitter]): The rows of the table.
+        """
+        builder.append(f"| {label_header} | Количество | Погрешность |\n")
+        builder.append("|:---:|-----------:|------------:|\n")
+        for hitter in hitters:
+            builder.append(f"| `{hitter.value}` | {self.format_number_with_underscores(hitter.count)} | "
+                           f"{self.format_number_with_underscores(hitter.error)} |\n")
+
     @staticmethod
     def format_number_with_underscores(number: int) -> str:
         """
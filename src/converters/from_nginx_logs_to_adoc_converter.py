@@ -1,4 +1,6 @@
-from src.converters.converter import IConverter
+from src.converters.converter import INTERVAL_FORMAT, REPORTED_PERCENTILES, SLOWEST_ENDPOINTS, IConverter
+from src.models.heavy_hitter import HeavyHitter
+from src.models.latency_summary import LatencySummary
 from src.services.analytics.analyzer_intrerface import IAnalyzer
 
 
@@ -17,6 +19,8 @@ class FromNginxLogsToAdocConverter(IConverter):
 
         This method uses the data provided by the `analyzer` to construct an AsciiDoc
         document with sections on general metrics, requested resources, and response codes.
+        Sections on heavy hitters, the time series, latency and unparsed lines follow
+        when the analyzer collected them.
 
         Args:
             analyzer: An object that provides analysis methods for log data, such as
@@ -38,8 +42,9 @@ class FromNginxLogsToAdocConverter(IConverter):
         average_size = analyzer.get_average_size_logs()
         builder.append(f"| Средний размер ответа | {average_size:.0f}b\n")
 
-        percentile_95 = analyzer.calculate_95th_percentile()
-        builder.append(f"| 95p размера ответа | {percentile_95:.0f}b\n")
+        for percentile in REPORTED_PERCENTILES:
+            percentile_value = analyzer.calculate_percentile(percentile)
+            builder.append(f"| {percentile}p размера ответа | {percentile_value:.0f}b\n")
 
         builder.append(f"| Количество уникальных IP | {analyzer.get_unique_ip_count()}\n")
         builder.append(f"| Процент ошибок (4xx и 5xx) | {analyzer.get_error_rate():.2f}%\n")
@@ -71,4 +76,83 @@ class FromNginxLogsToAdocConverter(IConverter):
 
         builder.append("|===\n")
 
+        heavy_hitters = analyzer.get_heavy_hitters()
+        if heavy_hitters is not None:
+            builder.append("\n== Самые активные IP-адреса\n\n")
+            self.append_heavy_hitter_table(builder, "IP-адрес", heavy_hitters.get_top_addresses())
+            builder.append("\n== Самые частые User-Agent\n\n")
+            self.append_heavy_hitter_table(builder, "User-Agent", heavy_hitters.get_top_user_agents())
+            builder.append("\n== Самые частые Referer\n\n")
+            self.append_heavy_hitter_table(builder, "Referer", heavy_hitters.get_top_referers())
+
+        time_series = analyzer.get_time_series()
+        if time_series is not None:
+            builder.append("\n== Временной ряд (UTC)\n\n")
+            builder.append("[cols=\"2,1,1,1,1\", options=\"header\"]\n")
+            builder.append("|===\n")
+            builder.append("| Начало интервала | Запросы | Процент ошибок | Объём ответов | 95p размера ответа\n")
+            for interval in time_series.get_intervals():
+                builder.append(
+                    f"| {interval.start.strftime(INTERVAL_FORMAT)} | {interval.count} | "
+                    f"{interval.get_error_rate():.2f}% | {interval.byte_sum}b | {interval.p95:.0f}b\n"
+                )
+            builder.append("|===\n")
+
+        latency = analyzer.get_latency_stats()
+        if latency is not None:
+            builder.append("\n== Время ответа\n\n")
+            summaries = [latency.get_request_summary(), latency.get_upstream_summary()]
+            self.append_latency_table(builder, "Метрика", [summary for summary in summaries if summary.count])
+            builder.append("\n== Самые медленные ресурсы (по 99p)\n\n")
+            self.append_latency_table(builder, "Ресурс", latency.get_slowest_endpoints(SLOWEST_ENDPOINTS))
+            builder.append("\n== Время ответа по кодам\n\n")
+            self.append_latency_table(builder, "Код", latency.get_status_summaries())
+
+        bad_line_counts = analyzer.get_bad_line_counts()
+        if bad_line_counts:
+            builder.append("\n== Некорректные строки\n\n")
+            builder.append("[cols=\"3,1\", options=\"header\"]\n")
+            builder.append("|===\n")
+            builder.append("| Файл | Количество\n")
+            for source, count in bad_line_counts.items():
+                builder.append(f"| {source} | {count}\n")
+            builder.append("|===\n")
+
         return "".join(builder)
+
+    @staticmethod
+    def append_heavy_hitter_table(builder: list[str], label_header: str, hitters: list[HeavyHitter]) -> None:
+        """
+        Appends a table of the most frequent values of a field.
+
+        Args:
+            builder (list[str]): The report parts to append to.
+            label_header (str): The header of the value column.
+            hitters (list[HeavyHitter]): The rows of the table.
+        """
+        builder.append("[cols=\"3,1,1\", options=\"header\"]\n")
+        builder.append("|===\n")
+        builder.append(f"| {label_header} | Количество | Погрешность\n")
+        for hitter in hitters:
+            builder.append(f"| {hitter.value} | {hitter.count} | {hitter.error}\n")
+        builder.append("|===\n")
+
+    @staticmethod
+    def append_latency_table(builder: list[str], label_header: str, summaries: list[LatencySummary]) -> None:
+        """
+        Appends a table of latency percentiles.
+
+        Args:
+            builder (list[str]): The report parts to append to.
+            label_header (str): The header of the label column.
+            summaries (list[LatencySummary]): The rows of the table.
+        """
+        builder.append("[cols=\"3,1,1,1,1,1\", options=\"header\"]\n")
+        builder.append("|===\n")
+        builder.append(f"| {label_header} | Запросы | 50p | 95p | 99p | 99.9p\n")
+        for summary in summaries:
+            builder.append(
+                f"| {summary.label} | {summary.count} | {summary.p50:.3f}s | {summary.p95:.3f}s | "
+                f"{summary.p99:.3f}s | {summary.p999:.3f}s\n"
+            )
+        builder.append("|===\n")
@@ -0,0 +1,47 @@
+import csv
+import io
+
+from src.converters.converter import IConverter
+from src.services.analytics.analyzer_intrerface import IAnalyzer
+
+CSV_HEADER = ("interval_start", "requests", "errors", "error_rate", "bytes", "p95_size")
+
+
+class FromNginxLogsToCsvConverter(IConverter):
+    """
+    Converter class to generate a CSV time series from NGINX log data.
+
+    The `FromNginxLogsToCsvConverter` class writes one row per time series
+    interval with the request count, error count and rate, response byte sum
+    and 95th percentile of response sizes. Without a time series, a single row
+    covers the whole analyzed range.
+    """
+
+    def create_a_report(self, analyzer: IAnalyzer) -> str:
+        """
+        Converts analyzed NGINX log data to CSV.
+
+        Args:
+            analyzer: An object that provides analysis methods for log data.
+
+        Returns:
+            str: The CSV document, with interval starts in ISO 8601 format.
+        """
+        output = io.StringIO()
+        writer = csv.writer(output, lineterminator="\n")
+        writer.writerow(CSV_HEADER)
+
+        time_series = analyzer.get_time_series()
+        if time_series is not None:
+            for interval in time_series.get_intervals():
+                writer.writerow((interval.start.isoformat(), interval.count, interval.error_count,
+                                 f"{interval.get_error_rate():.2f}", interval.byte_sum, f"{interval.p95:.0f}"))
+        elif analyzer.get_count_logs() > 0:
+            count = analyzer.get_count_logs()
+            start_date = analyzer.get_start_date()
+            writer.writerow((start_date.isoformat() if start_date else "", count,
+                             round(analyzer.get_error_rate() * count / 100), f"{analyzer.get_error_rate():.2f}",
+                             round(analyzer.get_average_size_logs() * count),
+                             f"{analyzer.calculate_95th_percentile():.0f}"))
+
+        return output.getvalue()
@@ -0,0 +1,79 @@
+import json
+from dataclasses import asdict
+
+from src.converters.converter import REPORTED_PERCENTILES, SLOWEST_ENDPOINTS, IConverter
+from src.services.analytics.analyzer_intrerface import IAnalyzer
+
+
+class FromNginxLogsToJsonConverter(IConverter):
+    """
+    Converter class to generate a JSON report from NGINX log data.
+
+    The `FromNginxLogsToJsonConverter` class emits the general metrics,
+    requested resources, response codes, the number of lines that could not be
+    parsed per source and, if collected, the most frequent field values, the
+    per-interval time series and the latency percentiles as a single JSON
+    document for further processing.
+    """
+
+    def create_a_report(self, analyzer: IAnalyzer) -> str:
+        """
+        Converts analyzed NGINX log data to JSON.
+
+        Args:
+            analyzer: An object that provides analysis methods for log data.
+
+        Returns:
+            str: The JSON document, with dates in ISO 8601 format.
+        """
+        start_date = analyzer.get_start_date()
+        end_date = analyzer.get_end_date()
+        time_series = analyzer.get_time_series()
+        heavy_hitters = analyzer.get_heavy_hitters()
+        latency = analyzer.get_latency_stats()
+
+        report = {
+            "summary": {
+                "start_date": start_date.isoformat() if start_date else None,
+                "end_date": end_date.isoformat() if end_date else None,
+                "requests": analyzer.get_count_logs(),
+                "average_size": analyzer.get_average_size_logs(),
+                "size_percentiles": {
+                    f"p{percentile}": analyzer.calculate_percentile(percentile) for percentile in REPORTED_PERCENTILES
+                },
+                "unique_ips": analyzer.get_unique_ip_count(),
+                "error_rate": analyzer.get_error_rate(),
+            },
+            "resources": dict(sorted(analyzer.get_requested_resources().items(), key=lambda item: item[1],
+                                     reverse=True)),
+            "status_codes": {
+                str(code): {"name": analyzer.get_status_code_name(code), "count": count}
+                for code, count in sorted(analyzer.get_status_code_counts().items(), key=lambda item: item[1],
+                                          reverse=True)
+            },
+            "bad_lines": analyzer.get_bad_line_counts(),
+            "top": {
+                "resources": [asdict(hitter) for hitter in heavy_hitters.get_top_resources()],
+                "addresses": [asdict(hitter) for hitter in heavy_hitters.get_top_addresses()],
+                "user_agents": [asdict(hitter) for hitter in heavy_hitters.get_top_user_agents()],
+                "referers": [asdict(hitter) for hitter in heavy_hitters.get_top_referers()],
+            } if heavy_hitters is not None else None,
+            "time_series": [
+                {
+                    "start": interval.start.isoformat(),
+                    "requests": interval.count,
+                    "errors": interval.error_count,
+                    "error_rate": interval.get_error_rate(),
+                    "bytes": interval.byte_sum,
+                    "p95_size": interval.p95,
+                }
+                for interval in time_series.get_intervals()
+            ] if time_series is not None else None,
+            "latency": {
+                "overall": [asdict(summary) for summary in (latency.get_request_summary(),
+                                                            latency.get_upstream_summary()) if summary.count],
+                "slowest_endpoints": [asdict(summary) for summary in latency.get_slowest_endpoints(SLOWEST_ENDPOINTS)],
+                "status_codes": [asdict(summary) for summary in latency.get_status_summaries()],
+            } if latency is not None else None,
+        }
+        return json.dumps(report, ensure_ascii=False, indent=2)
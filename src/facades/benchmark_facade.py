@@ -0,0 +1,96 @@
+import logging
+import os
+import tempfile
+
+from src.models.log_profile import LogProfile
+from src.services.benchmarks.benchmark_report import BenchmarkReport
+from src.services.benchmarks.benchmark_runner import DEFAULT_REPEAT, BenchmarkRunner
+from src.services.benchmarks.synthetic_log_generator import SyntheticLogGenerator
+
+LOGGER = logging.getLogger("BenchmarkFacade")
+
+PROFILE_OPTIONS = {
+    "lines": "lines",
+    "ip-count": "ip_count",
+    "resources": "resource_count",
+    "resource-skew": "resource_skew",
+    "status-mix": "status_mix",
+    "time-span": "time_span",
+    "seed": "seed",
+}
+
+
+class BenchmarkFacade:
+    """
+    Facade class for the benchmark workflow.
+
+    The `BenchmarkFacade` class generates a synthetic log for the requested
+    profile in a temporary directory, runs the benchmarks over it, logs the
+    results next to an optional baseline, and optionally saves them as JSON.
+    """
+
+    def __init__(self, arguments_parser, args):
+        """
+        Initializes the BenchmarkFacade with the provided arguments parser and arguments.
+
+        Args:
+            arguments_parser: A parser object to interpret command-line arguments.
+            args: Command-line arguments for configuring the benchmarks.
+        """
+        self.arguments_parser = arguments_parser
+        self.args = args
+
+    def run_benchmarks(self) -> None:
+        """
+        Main method to run the benchmarks based on command-line arguments.
+        """
+        options = self.arguments_parser.parse(self.args)
+        if isinstance(options, str):
+            LOGGER.error(options)
+            return
+
+        profile = LogProfile(**{field: options[option] for option, field in PROFILE_OPTIONS.items() if option in options})
+        names = options.get("benchmark", BenchmarkRunner.get_available_benchmarks())
+        LOGGER.info(self.get_result_benchmarks(profile, names, options.get("repeat", DEFAULT_REPEAT),
+                                               options.get("output"), options.get("baseline")))
+
+    def get_result_benchmarks(self, profile: LogProfile, names: list[str], repeat: int = DEFAULT_REPEAT,
+                              output: str | None = None, baseline: str | None = None, isolate: bool = True) -> str:
+        """
+        Runs benchmarks over a synthetic log and renders their results.
+
+        Args:
+            profile (LogProfile): The shape of the synthetic log.
+            names (list[str]): The names of the benchmarks to run.
+            repeat (int): How many times each benchmark is run.
+            output (str | None): A JSON file to save the results to, or `None`.
+            baseline (str | None): A JSON file with earlier results to compare with, or `None`.
+            isolate (bool): Whether each benchmark runs in its own worker process.
+
+        Returns:
+            str: The results as a markdown table, or an error message.
+        """
+        report = BenchmarkReport()
+        try:
+            baseline_results = report.load(baseline) if baseline else None
+        except (OSError, ValueError):
+            return f"Error: cannot read baseline '{baseline}'"
+
+        try:
+            generator = SyntheticLogGenerator(profile)
+            runner = BenchmarkRunner(repeat, isolate)
+        except ValueError as error:
+            return str(error)
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "access.log")
+            size = generator.write(file_path)
+            LOGGER.info(f"Generated {profile.lines} lines ({size / (1 << 20):.1f} MiB) with seed {profile.seed}")
+            try:
+                results = runner.run(names, file_path, profile.lines)
+            except ValueError as error:
+                return str(error)
+
+        if output:
+            report.save(output, profile, results)
+        return report.render(results, baseline_results)
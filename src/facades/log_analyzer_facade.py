@@ -1,14 +1,68 @@
+import json
 import logging
+import threading
+from contextlib import nullcontext
+from datetime import datetime, timezone
+from typing import Callable
 
+from src.converters.converter import IConverter
 from src.converters.converter_factory import ConverterFactory
+from src.models.analysis_options import AnalysisOptions
+from src.models.analyzer_engine import AnalyzerEngine
+from src.models.format_option import FormatOption
+from src.models.log_format_preset import LogFormatPreset
+from src.models.quantile_mode import QuantileMode
+from src.models.unique_ip_mode import UniqueIpMode
 from src.parsers.data_parser import DateParser
+from src.parsers.log_format_compiler import LogFormatCompiler
 from src.parsers.paths_parser import PathsParser
-from src.services.analytics.analyzer import Analyzer
+from src.services.analytics.analyzer import OPTIONAL_FIELDS, Analyzer
+from src.services.analytics.heavy_hitters import HeavyHitters
+from src.services.analytics.latency_stats import LatencyStats
+from src.services.analytics.log_filter import LogFilter
+from src.services.analytics.log_predicate import LogPredicate
+from src.services.analytics.numpy_batch_analyzer import NumpyBatchAnalyzer
+from src.services.analytics.quantile_estimator_factory import QuantileEstimatorFactory
+from src.services.analytics.resource_normalizer import ResourceNormalizer
+from src.services.analytics.rolling_window_analyzer import RollingWindowAnalyzer
+from src.services.analytics.time_series import TimeSeries
+from src.services.analytics.unique_counter_factory import UniqueCounterFactory
+from src.services.checkpoints.checkpoint_store import CheckpointStore
+from src.services.columnar.log_columns_cache import LogColumnsCache
+from src.services.indexes.time_index_store import TimeIndexStore
+from src.services.readers.bad_line_handler import BadLineHandler
+from src.services.readers.follow_log_reader import FollowLogReader
 from src.services.readers.log_reader_service import LogReaderService
 from src.services.writers.file_log_writer import FileLogWriter
 
 LOGGER = logging.getLogger("FileLogReader")
 
+ANALYSIS_OPTIONS = {
+    "workers": "workers",
+    "quantile-mode": "quantile_mode",
+    "quantile-error": "quantile_error",
+    "unique-ip-mode": "unique_ip_mode",
+    "hll-precision": "hll_precision",
+    "max-connections": "max_connections",
+    "timeout": "timeout",
+    "retries": "retries",
+    "state-file": "state_file",
+    "bucket": "time_bucket",
+    "index-dir": "index_dir",
+    "cache-dir": "cache_dir",
+    "engine": "engine",
+    "batch-size": "batch_size",
+    "log-format": "log_format",
+    "latency": "latency",
+    "on-error": "on_error",
+    "quarantine-file": "quarantine_file",
+    "top": "top",
+    "normalize-urls": "normalize_urls",
+    "route": "routes",
+    "window": "window_minutes",
+    "refresh": "refresh_interval",
+}
+
 
 class LogAnalyzerFacade:
     """
@@ -49,15 +103,39 @@ class LogAnalyzerFacade:
 
         filter_field = options.get("filter-field")
         filter_value = options.get("filter-value")
+        analysis_options = AnalysisOptions(**{field: options[option] for option, field in ANALYSIS_OPTIONS.items()
+                                              if option in options})
+
+        if options.get("follow"):
+            try:
+                result = self.follow_logs(path_option, from_option, to_option, format_option, filter_field, filter_value,
+                                          lambda report: self.write_result(report, output_option), analysis_options)
+            except KeyboardInterrupt:
+                return
+            if result is not None:
+                self.write_result(result, output_option)
+            return
 
-        result = self.get_result_analyze(path_option, from_option, to_option, format_option, filter_field, filter_value)
+        result = self.get_result_analyze(path_option, from_option, to_option, format_option, filter_field, filter_value,
+                                         analysis_options)
+        self.write_result(result, output_option)
+
+    def write_result(self, result: str, output_option: str) -> None:
+        """
+        Logs a report or writes it to the output file.
+
+        Args:
+            result (str): The report or error message.
+            output_option (str): The output file, or an empty string to log the report.
+        """
         if not output_option:
             LOGGER.info(result)
         else:
             file_log_writer = FileLogWriter()
             file_log_writer.write_logs(output_option, result)
 
-    def get_result_analyze(self, path_option: list, from_option: str, to_option: str, format_option: str, filter_field: str, filter_value: str) -> str:
+    def get_result_analyze(self, path_option: list, from_option: str, to_option: str, format_option: str, filter_field: str, filter_value: str,
+                           options: AnalysisOptions | None = None) -> str:
         """
         Retrieves and analyzes log data based on provided options.
 
@@ -71,10 +149,12 @@ class LogAnalyzerFacade:
             format_option (str): The desired output format (e.g., markdown or adoc).
             filter_field (str): Log field to filter by.
             filter_value (str): Value to filter in the specified field.
+            options (AnalysisOptions | None): The analysis settings, or `None` for the defaults.
 
         Returns:
             str: The analyzed and formatted log data as a string, or an error message.
         """
+        options = options or AnalysisOptions()
         date_parser = DateParser()
 
         from_date_time = date_parser.parse(from_option)
@@ -84,22 +164,294 @@ class LogAnalyzerFacade:
         paths_parser = PathsParser()
         paths = paths_parser.parse(path_option)
 
-        analyzer = Analyzer()
+        if options.cache_dir and options.top is not None:
+            # Cached columns keep no referers.
+            return "Error: --top option cannot be combined with --cache-dir"
+
+        try:
+            analyzer = self.create_analyzer(options)
+            fields, bad_lines, converter = self.prepare_analysis(analyzer, format_option, filter_field, filter_value,
+                                                                 from_date_time, to_date_time, options)
+        except ValueError as error:
+            return str(error)
+
+        try:
+            column_cache = LogColumnsCache(options.cache_dir, options.log_format) if options.cache_dir else None
+        except ImportError:
+            return "Error: --cache-dir option requires the 'numpy' package"
+
+        checkpoint_settings = self.get_checkpoint_settings(from_date_time, to_date_time, filter_field, filter_value,
+                                                           options)
+        try:
+            with CheckpointStore(options.state_file) if options.state_file else nullcontext() as checkpoint_store, \
+                    bad_lines:
+                log_reader_service = LogReaderService(workers=options.workers, fields=fields,
+                                                      max_connections=options.max_connections,
+                                                      timeout=options.timeout, retries=options.retries,
+                                                      checkpoint_store=checkpoint_store,
+                                                      checkpoint_settings=checkpoint_settings,
+                                                      time_index_store=TimeIndexStore(options.index_dir)
+                                                      if options.index_dir else None,
+                                                      column_cache=column_cache, log_format=options.log_format,
+                                                      bad_lines=bad_lines)
+                log_reader_service.read_all(
+                    paths,
+                    from_date_time,
+                    to_date_time,
+                    analyzer,
+                    filter_field,
+                    filter_value
+                )
+        except ValueError as error:
+            # Raised for a bad line under the fail error policy.
+            return str(error)
+        except ImportError:
+            # Raised by the codec detector for zstd files.
+            return "Error: reading zstd logs requires the 'zstandard' package"
+
+        return converter.create_a_report(analyzer)
+
+    def follow_logs(self, path_option: list, from_option: str, to_option: str, format_option: str, filter_field: str,
+                    filter_value: str, on_report: Callable[[str], None], options: AnalysisOptions | None = None,
+                    stop_event: threading.Event | None = None) -> str | None:
+        """
+        Follows a growing log file and reports metrics over a sliding time window.
+
+        New lines are analyzed as they are written, and every `refresh_interval`
+        seconds a report over the last `window_minutes` minutes is passed to
+        `on_report`. Following stops when `stop_event` is set.
+
+        Args:
+            path_option (list): The path of the followed log file.
+            from_option (str): Start date for filtering logs.
+            to_option (str): End date for filtering logs.
+            format_option (str): The desired output format (e.g., markdown or adoc).
+            filter_field (str): Log field to filter by.
+            filter_value (str): Value to filter in the specified field.
+            on_report (Callable[[str], None]): The function receiving each report.
+            options (AnalysisOptions | None): The analysis settings, or `None` for the defaults.
+            stop_event (threading.Event | None): The event that ends following, or
+                                                 `None` to follow until interrupted.
+
+        Returns:
+            str | None: An error message, or `None` once following has stopped.
+        """
+        options = options or AnalysisOptions()
+        date_parser = DateParser()
+        from_date_time = date_parser.parse(from_option)
+        to_date_time = date_parser.parse(to_option)
 
-        log_reader_service = LogReaderService()
-        for path in paths:
-            log_reader_service.read_logs(
-                path,
+        try:
+            analyzer = RollingWindowAnalyzer(self.create_analyzer(options), options.window_minutes * 60)
+            fields, bad_lines, converter = self.prepare_analysis(analyzer, format_option, filter_field, filter_value,
+                                                                 from_date_time, to_date_time, options)
+        except ValueError as error:
+            return str(error)
+
+        reader = FollowLogReader(analyzer, fields=fields, log_format=options.log_format, bad_lines=bad_lines)
+        try:
+            reader.follow(
+                path_option[0],
                 from_date_time,
                 to_date_time,
-                analyzer,
                 filter_field,
-                filter_value
+                filter_value,
+                lambda: on_report(converter.create_a_report(analyzer.snapshot(datetime.now(timezone.utc)))),
+                refresh_interval=options.refresh_interval,
+                stop_event=stop_event
             )
+        except ValueError as error:
+            return str(error)
+        return None
+
+    def prepare_analysis(self, analyzer, format_option: str, filter_field: str, filter_value: str,
+                         from_date_time: datetime | None, to_date_time: datetime | None,
+                         options: AnalysisOptions) -> tuple[frozenset[str], BadLineHandler, IConverter]:
+        """
+        Validates the options shared by full and followed analyses.
+
+        Args:
+            analyzer: The analyzer that receives the log entries.
+            format_option (str): The desired output format (e.g., markdown or adoc).
+            filter_field (str): Log field to filter by.
+            filter_value (str): Value to filter in the specified field.
+            from_date_time (datetime | None): The start of the time range.
+            to_date_time (datetime | None): The end of the time range.
+            options (AnalysisOptions): The analysis settings.
+
+        Returns:
+            tuple[frozenset[str], BadLineHandler, IConverter]: The log entry fields the
+            readers have to extract, the bad line handler and the report converter.
+
+        Raises:
+            ValueError: If an option is invalid; the message is the error shown to the user.
+        """
+        if options.latency and format_option == FormatOption.CSV:
+            # The CSV report holds only the time series.
+            raise ValueError("Error: --latency option cannot be combined with --format csv")
 
-        converter_factory = ConverterFactory()
         try:
-            converter = converter_factory.get_converter(format_option)
+            predicate = LogFilter().compile(filter_field, filter_value)
         except ValueError:
-            return "Error: no such converter"
-        return converter.create_a_report(analyzer)
+            raise ValueError("Error: invalid filter")
+
+        bad_lines = BadLineHandler(options.on_error, options.quarantine_file)
+
+        try:
+            converter = ConverterFactory().get_converter(format_option)
+        except ValueError:
+            raise ValueError("Error: no such converter")
+
+        fields = self.get_required_fields(analyzer, predicate, from_date_time, to_date_time)
+        log_format_error = self.check_log_format(options.log_format, fields)
+        if log_format_error is not None:
+            raise ValueError(log_format_error)
+        return fields, bad_lines, converter
+
+    @staticmethod
+    def create_analyzer(options: AnalysisOptions) -> Analyzer | NumpyBatchAnalyzer:
+        """
+        Creates an empty analyzer with the requested estimators.
+
+        Args:
+            options (AnalysisOptions): The analysis settings.
+
+        Returns:
+            Analyzer | NumpyBatchAnalyzer: The configured analyzer.
+
+        Raises:
+            ValueError: If a mode is not supported; the message is the error shown to the user.
+        """
+        quantile_estimator_factory = QuantileEstimatorFactory()
+        try:
+            response_sizes = quantile_estimator_factory.get_quantile_estimator(options.quantile_mode,
+                                                                               options.quantile_error)
+        except ValueError:
+            raise ValueError("Error: no such quantile mode")
+
+        unique_counter_factory = UniqueCounterFactory()
+        try:
+            unique_ips = unique_counter_factory.get_unique_counter(options.unique_ip_mode, options.hll_precision)
+        except ValueError:
+            raise ValueError("Error: no such unique IP mode")
+
+        try:
+            time_series = (TimeSeries.for_bucket(options.time_bucket, options.quantile_error)
+                           if options.time_bucket else None)
+        except ValueError:
+            raise ValueError("Error: no such time bucket")
+
+        try:
+            normalize_urls = options.normalize_urls or options.routes
+            resource_normalizer = ResourceNormalizer(options.routes or ()) if normalize_urls else None
+        except ValueError:
+            raise ValueError("Error: invalid route template")
+
+        if options.engine == AnalyzerEngine.PYTHON:
+            try:
+                heavy_hitters = HeavyHitters(options.top) if options.top is not None else None
+            except ValueError:
+                raise ValueError("Error: invalid number of top entries")
+            latency_stats = LatencyStats(options.quantile_error) if options.latency else None
+            return Analyzer(response_sizes, unique_ips, time_series, latency_stats, heavy_hitters, resource_normalizer)
+        elif options.engine == AnalyzerEngine.NUMPY:
+            if options.latency:
+                raise ValueError("Error: --latency option requires --engine python")
+            if options.top is not None:
+                raise ValueError("Error: --top option requires --engine python")
+            try:
+                # Exact percentiles are computed from the analyzer's own NumPy arrays.
+                exact = options.quantile_mode.lower() == QuantileMode.EXACT
+                return NumpyBatchAnalyzer(response_sizes if not exact else None, unique_ips, time_series,
+                                          options.batch_size, resource_normalizer)
+            except ImportError:
+                raise ValueError("Error: --engine numpy option requires the 'numpy' package")
+            except ValueError:
+                raise ValueError("Error: invalid batch size")
+        else:
+            raise ValueError("Error: no such analyzer engine")
+
+    @staticmethod
+    def get_checkpoint_settings(from_date_time: datetime | None, to_date_time: datetime | None, filter_field: str,
+                                filter_value: str, options: AnalysisOptions) -> str:
+        """
+        Describes the settings that a stored analyzer state depends on.
+
+        A checkpoint is only continued by a run with the same description, so
+        changing the time range, the filter or the estimators reprocesses files.
+
+        Args:
+            from_date_time (datetime | None): The start of the time range.
+            to_date_time (datetime | None): The end of the time range.
+            filter_field (str): Log field to filter by.
+            filter_value (str): Value to filter in the specified field.
+            options (AnalysisOptions): The analysis settings.
+
+        Returns:
+            str: The settings description.
+        """
+        return json.dumps({
+            "from": from_date_time.isoformat() if from_date_time is not None else None,
+            "to": to_date_time.isoformat() if to_date_time is not None else None,
+            "filter-field": filter_field,
+            "filter-value": filter_value,
+            "quantile-mode": str(options.quantile_mode),
+            # Time series and latency sketches always use the quantile error.
+            "quantile-error": options.quantile_error
+            if options.quantile_mode == QuantileMode.SKETCH or options.time_bucket or options.latency else None,
+            "unique-ip-mode": str(options.unique_ip_mode),
+            "hll-precision": options.hll_precision if options.unique_ip_mode == UniqueIpMode.HLL else None,
+            "bucket": str(options.time_bucket) if options.time_bucket else None,
+            "log-format": options.log_format,
+            "latency": options.latency,
+            "top": options.top,
+            "normalize-urls": bool(options.normalize_urls or options.routes),
+            "routes": list(options.routes) if options.routes else None,
+        }, sort_keys=True)
+
+    @staticmethod
+    def get_required_fields(analyzer, predicate: LogPredicate | None, from_date_time: datetime | None,
+                            to_date_time: datetime | None) -> frozenset[str]:
+        """
+        Computes the log entry fields that the readers have to extract.
+
+        Args:
+            analyzer: The analyzer that receives the log entries.
+            predicate (LogPredicate | None): The compiled filter, if any.
+            from_date_time (datetime | None): The start of the time range.
+            to_date_time (datetime | None): The end of the time range.
+
+        Returns:
+            frozenset[str]: The names of the `NginxLog` attributes in use.
+        """
+        fields = set(analyzer.get_required_fields())
+        if predicate is not None:
+            fields.add(predicate.field)
+        if from_date_time is not None or to_date_time is not None:
+            fields.add("time_local")
+        return frozenset(fields)
+
+    @staticmethod
+    def check_log_format(log_format: str | None, fields: frozenset[str]) -> str | None:
+        """
+        Checks that a log format compiles and provides the fields the readers have to extract.
+
+        Optional fields, such as `upstream_response_time`, may be missing from the format.
+
+        Args:
+            log_format (str | None): The format of the log lines, or `None` for the
+                                     NGINX `combined` format.
+            fields (frozenset[str]): The names of the `NginxLog` attributes in use.
+
+        Returns:
+            str | None: An error message, or `None` if the format can be used.
+        """
+        try:
+            compiled = LogFormatCompiler.compile(log_format or LogFormatPreset.COMBINED)
+        except ValueError:
+            return "Error: invalid log format"
+
+        missing_fields = fields - compiled.fields - OPTIONAL_FIELDS
+        if missing_fields:
+            return f"Error: log format lacks fields: {', '.join(sorted(missing_fields))}"
+        return None
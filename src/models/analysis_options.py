@@ -0,0 +1,50 @@
+from dataclasses import dataclass, field
+
+from src.models.analyzer_engine import AnalyzerEngine
+from src.models.error_policy import ErrorPolicy
+from src.models.quantile_mode import QuantileMode
+from src.models.unique_ip_mode import UniqueIpMode
+from src.services.analytics.ddsketch_quantile_estimator import DEFAULT_RELATIVE_ACCURACY
+from src.services.analytics.hyperloglog_unique_counter import DEFAULT_PRECISION
+from src.services.analytics.numpy_batch_analyzer import DEFAULT_BATCH_SIZE
+from src.services.readers.follow_log_reader import DEFAULT_REFRESH_INTERVAL
+from src.services.readers.http_session_factory import DEFAULT_MAX_CONNECTIONS, DEFAULT_RETRIES, DEFAULT_TIMEOUT
+
+DEFAULT_WINDOW_MINUTES = 5
+
+
+@dataclass
+class AnalysisOptions:
+    """
+    Data class holding the settings of a log analysis run.
+
+    The `AnalysisOptions` class groups how the analyzer is built (the estimators,
+    the engine, the time series, latency, top entries and URL normalization), how
+    logs are read (workers, remote sources, checkpoints, indexes, cached columns,
+    the log format and the bad line policy) and how a followed log is reported
+    (the window and the pause between reports). Routes imply `normalize_urls`.
+    """
+
+    workers: int = 1
+    quantile_mode: str = QuantileMode.EXACT
+    quantile_error: float = DEFAULT_RELATIVE_ACCURACY
+    unique_ip_mode: str = UniqueIpMode.EXACT
+    hll_precision: int = DEFAULT_PRECISION
+    max_connections: int = DEFAULT_MAX_CONNECTIONS
+    timeout: float = DEFAULT_TIMEOUT
+    retries: int = DEFAULT_RETRIES
+    state_file: str | None = None
+    time_bucket: str | None = None
+    index_dir: str | None = None
+    cache_dir: str | None = None
+    engine: str = AnalyzerEngine.PYTHON
+    batch_size: int = DEFAULT_BATCH_SIZE
+    log_format: str | None = None
+    latency: bool = False
+    on_error: str = ErrorPolicy.SKIP
+    quarantine_file: str | None = None
+    top: int | None = None
+    normalize_urls: bool = False
+    routes: list[str] = field(default_factory=list)
+    window_minutes: int = DEFAULT_WINDOW_MINUTES
+    refresh_interval: float = DEFAULT_REFRESH_INTERVAL
@@ -0,0 +1,14 @@
+from enum import StrEnum
+
+
+class AnalyzerEngine(StrEnum):
+    """
+    Enumeration for the engines that aggregate log entries.
+
+    The `AnalyzerEngine` enum defines constants for supported analyzer
+    backends, such as `python` (updates counters entry by entry) and `numpy`
+    (aggregates batches of entries with vectorized array operations).
+    """
+
+    PYTHON = "python"
+    NUMPY = "numpy"
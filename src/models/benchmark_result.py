@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    Data class representing the outcome of one benchmark.
+
+    The `BenchmarkResult` class holds the benchmark name, the number of log
+    lines it processed, the best wall-clock time over its repetitions, the
+    resulting throughput, and the peak resident set size of the process that
+    ran it (`None` where the platform doesn't report it).
+    """
+
+    name: str
+    lines: int
+    seconds: float
+    lines_per_second: float
+    peak_rss: int | None
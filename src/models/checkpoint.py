@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class Checkpoint:
+    """
+    Data class representing how far a log file has been analyzed.
+
+    The `Checkpoint` class identifies a file by its device, inode, size and
+    modification time, records the offset right after the last analyzed line,
+    and holds the serialized analyzer state for everything before that offset.
+    A digest of the file head and of the data right before the offset lets a
+    file rewritten under the same inode be told apart from one that was only
+    appended to.
+    """
+
+    path: str
+    settings: str
+    device: int
+    inode: int
+    size: int
+    mtime_ns: int
+    offset: int
+    head_digest: bytes
+    state: bytes
@@ -0,0 +1,17 @@
+from enum import StrEnum
+
+
+class CompressionCodec(StrEnum):
+    """
+    Enumeration for compression codecs of log files.
+
+    The `CompressionCodec` enum defines constants for the codecs recognized by
+    their magic bytes, such as `gzip` for rotated `access.log.N.gz` files, and
+    `none` for plain text logs.
+    """
+
+    NONE = "none"
+    GZIP = "gzip"
+    BZ2 = "bz2"
+    XZ = "xz"
+    ZSTD = "zstd"
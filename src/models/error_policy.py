@@ -0,0 +1,15 @@
+from enum import StrEnum
+
+
+class ErrorPolicy(StrEnum):
+    """
+    Enumeration for the ways of handling log lines that cannot be parsed.
+
+    The `ErrorPolicy` enum defines constants for supported policies, such as
+    `skip` (count the line and go on), `quarantine` (also copy the line to a
+    quarantine file) and `fail` (stop the analysis with an error).
+    """
+
+    SKIP = "skip"
+    QUARANTINE = "quarantine"
+    FAIL = "fail"
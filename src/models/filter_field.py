@@ -6,9 +6,10 @@ class FilterField(StrEnum):
     Enumeration for possible filter fields in log analysis.
 
     The `FilterField` enum defines constants for common fields that can be used
-    to filter log data, such as `agent`, `request`, and `status`.
+    to filter log data, such as `agent`, `request`, `status`, and `ip`.
     """
 
     AGENT = "agent"
     REQUEST = "request"
     STATUS = "status"
+    IP = "ip"
@@ -6,8 +6,10 @@ class FormatOption(StrEnum):
     Enumeration for output format options in log analysis.
 
     The `FormatOption` enum defines constants for supported output formats,
-    such as `markdown` and `adoc` (AsciiDoc).
+    such as `markdown`, `adoc` (AsciiDoc), `csv` (time series only) and `json`.
     """
 
     MARKDOWN = "markdown"
     ADOC = "adoc"
+    CSV = "csv"
+    JSON = "json"
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class HeavyHitter:
+    """
+    Data class representing one of the most frequent values of a log field.
+
+    The `HeavyHitter` class holds the value (a resource, a client address, a
+    user agent or a referer), its estimated number of occurrences and the
+    largest possible overestimation of that number. A zero error means the
+    count is exact.
+    """
+
+    value: str
+    count: int
+    error: int
@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class LatencySummary:
+    """
+    Data class representing the latency percentiles of a group of requests.
+
+    The `LatencySummary` class holds the group label (an endpoint, a status
+    code or the whole log), the number of timed requests in the group and its
+    50th, 95th, 99th and 99.9th latency percentiles in seconds.
+    """
+
+    label: str
+    count: int
+    p50: float
+    p95: float
+    p99: float
+    p999: float
@@ -0,0 +1,41 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+@dataclass
+class LogColumns:
+    """
+    Data class representing parsed log entries stored column by column.
+
+    The `LogColumns` class keeps one NumPy array per field. Client addresses,
+    requests and user agents are dictionary-encoded: their arrays hold codes
+    into the lists of distinct values, numbered in order of first appearance.
+    Timestamps are stored as epoch seconds together with the UTC offset of
+    every entry, so both absolute and local times can be recovered. The number
+    of lines that could not be parsed is kept with the columns, so analyses
+    answered from them count bad lines like a parsing run does.
+    """
+
+    remote_addr: "np.ndarray"
+    remote_addr_values: list[str]
+    request: "np.ndarray"
+    request_values: list[str]
+    http_user_agent: "np.ndarray"
+    http_user_agent_values: list[str]
+    status: "np.ndarray"
+    body_bytes_sent: "np.ndarray"
+    time: "np.ndarray"
+    utc_offset: "np.ndarray"
+    bad_line_count: int = 0
+
+    def __len__(self) -> int:
+        """
+        Returns the number of stored log entries.
+
+        Returns:
+            int: The number of rows.
+        """
+        return len(self.status)
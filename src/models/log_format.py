@@ -0,0 +1,45 @@
+import re
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class LogFormat:
+    """
+    Data class representing a compiled access log format.
+
+    A `LogFormat` is built by `LogFormatCompiler.compile` for a format string
+    and a projection of `NginxLog` fields. Plain-text formats carry a regex in
+    `str` and `bytes` flavors with a named group per captured field; JSON
+    formats carry no regex, but the JSON key of every captured field instead.
+    The `delimiters` of a plain-text format hold the literal text right before
+    and right after the first variable of every field, which every line
+    reproduces verbatim.
+    """
+
+    source: str
+    fields: frozenset[str]
+    pattern: re.Pattern | None
+    raw_pattern: re.Pattern | None
+    json_keys: dict[str, str] | None
+    time_variable: str | None
+    delimiters: dict[str, tuple[str, str]]
+
+    @property
+    def is_json(self) -> bool:
+        """
+        Tells whether log lines are JSON objects.
+
+        Returns:
+            bool: `True` for JSON formats, `False` for plain-text ones.
+        """
+        return self.json_keys is not None
+
+    @property
+    def has_bracketed_time(self) -> bool:
+        """
+        Tells whether every line holds its `$time_local` between square brackets.
+
+        Returns:
+            bool: `True` if the timestamp can be found without parsing the whole line.
+        """
+        return not self.is_json and "[$time_local]" in self.source
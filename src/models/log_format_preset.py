@@ -0,0 +1,17 @@
+from enum import StrEnum
+
+
+class LogFormatPreset(StrEnum):
+    """
+    Enumeration for the built-in access log formats.
+
+    The `LogFormatPreset` enum names the layouts that can be passed instead of
+    a `log_format` string, such as `combined` (the NGINX default), `json` (a
+    `log_format ... escape=json` object), and `apache-common` and
+    `apache-combined` (the Apache HTTP Server CLF layouts).
+    """
+
+    COMBINED = "combined"
+    JSON = "json"
+    APACHE_COMMON = "apache-common"
+    APACHE_COMBINED = "apache-combined"
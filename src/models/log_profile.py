@@ -0,0 +1,34 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+
+
+def default_status_mix() -> dict[int, float]:
+    """
+    Returns the status mix of a typical web server.
+
+    Returns:
+        dict[int, float]: The relative weight of every status code.
+    """
+    return {200: 80.0, 301: 4.0, 304: 6.0, 404: 7.0, 500: 2.0, 503: 1.0}
+
+
+@dataclass
+class LogProfile:
+    """
+    Data class describing the shape of a synthetic access log.
+
+    The `LogProfile` class sets the number of lines, how many distinct client
+    addresses and resources appear, how skewed resource popularity is (the
+    exponent of a Zipf distribution, `0` for uniform), the relative weights of
+    the response statuses, the time span covered by the lines, and the random
+    seed that makes the generated log reproducible.
+    """
+
+    lines: int = 100_000
+    ip_count: int = 5_000
+    resource_count: int = 500
+    resource_skew: float = 1.1
+    status_mix: dict[int, float] = field(default_factory=default_status_mix)
+    time_span: int = 24 * 60 * 60
+    start: datetime = datetime(2023, 11, 19, tzinfo=timezone(timedelta(hours=3)))
+    seed: int = 42
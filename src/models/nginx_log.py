@@ -9,7 +9,9 @@ class NginxLog:
 
     The `NginxLog` class holds details of an NGINX log entry, including fields
     such as the IP address, request status, and user agent, among others.
-    It provides a string representation of the log entry for easy reading.
+    Fields that only custom log formats provide, such as the request time,
+    default to `None`. It provides a string representation of the log entry
+    for easy reading.
     """
 
     remote_addr: str
@@ -20,6 +22,9 @@ class NginxLog:
     body_bytes_sent: int
     http_referer: str
     http_user_agent: str
+    host: str | None = None
+    request_time: float | None = None
+    upstream_response_time: float | None = None
 
     def __str__(self) -> str:
         """
@@ -0,0 +1,14 @@
+from enum import StrEnum
+
+
+class QuantileMode(StrEnum):
+    """
+    Enumeration for quantile estimation modes in log analysis.
+
+    The `QuantileMode` enum defines constants for supported ways of computing
+    response size percentiles, such as `exact` (keeps every value) and
+    `sketch` (bounded memory with a configurable relative error).
+    """
+
+    EXACT = "exact"
+    SKETCH = "sketch"
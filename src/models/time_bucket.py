@@ -0,0 +1,14 @@
+from enum import StrEnum
+
+
+class TimeBucket(StrEnum):
+    """
+    Enumeration for the interval widths of the time series report.
+
+    The `TimeBucket` enum defines the supported intervals that log entries are
+    grouped by: `second`, `minute` and `hour`.
+    """
+
+    SECOND = "second"
+    MINUTE = "minute"
+    HOUR = "hour"
@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass
+class TimeInterval:
+    """
+    Data class representing the metrics of one time series interval.
+
+    The `TimeInterval` class holds the start of the interval (in UTC), the
+    number of requests and errors in it, the total response size and the
+    95th percentile of response sizes.
+    """
+
+    start: datetime
+    count: int
+    error_count: int
+    byte_sum: int
+    p95: float
+
+    def get_error_rate(self) -> float:
+        """
+        Calculates the error rate of the interval as a percentage.
+
+        Returns:
+            float: The error rate in percentage, or 0.0 for an empty interval.
+        """
+        return 0.0 if self.count == 0 else (self.error_count / self.count) * 100
@@ -0,0 +1,14 @@
+from enum import StrEnum
+
+
+class UniqueIpMode(StrEnum):
+    """
+    Enumeration for unique IP counting modes in log analysis.
+
+    The `UniqueIpMode` enum defines constants for supported ways of counting
+    distinct client addresses, such as `exact` (packed integer sets) and
+    `hll` (a HyperLogLog estimate in fixed memory).
+    """
+
+    EXACT = "exact"
+    HLL = "hll"
@@ -1,6 +1,18 @@
 import argparse
 from datetime import datetime
 
+from src.models.analyzer_engine import AnalyzerEngine
+from src.models.error_policy import ErrorPolicy
+from src.models.format_option import FormatOption
+from src.models.log_format_preset import LogFormatPreset
+from src.models.quantile_mode import QuantileMode
+from src.models.time_bucket import TimeBucket
+from src.models.unique_ip_mode import UniqueIpMode
+from src.parsers.time_local_parser import TimeLocalParser
+from src.services.analytics.hyperloglog_unique_counter import MAX_PRECISION, MIN_PRECISION
+
+TIME_LOCAL_PARSER = TimeLocalParser()
+
 
 class DateParser:
     """
@@ -28,6 +40,9 @@ class DateParser:
         """
         Verifies if a date string matches any predefined formats for NGINX logs.
 
+        The fixed `dd/Mon/yyyy:HH:MM:SS +zzzz` layout is handled by a shared
+        `TimeLocalParser`; other formats fall back to `strptime`.
+
         Args:
             date_option (str): The date string to check.
 
@@ -37,18 +52,7 @@ class DateParser:
         Raises:
             ValueError: If the date string doesn't match any predefined format.
         """
-        date_time_formats = [
-            "%d/%B/%Y:%H:%M:%S %z",
-            "%d/%b/%Y:%H:%M:%S %z",
-        ]
-
-        for date_format in date_time_formats:
-            try:
-                return datetime.strptime(date_option, date_format)
-            except ValueError:
-                continue
-
-        raise ValueError(f"Incorrect date format: {date_option}")
+        return TIME_LOCAL_PARSER.parse(date_option)
 
 
 class ArgumentsParser:
@@ -68,6 +72,73 @@ class ArgumentsParser:
         self.parser.add_argument("--path", action="append", help="Specify one or more paths.")
         self.parser.add_argument("--from", help="Specify the start date in yyyy-MM-dd format.")
         self.parser.add_argument("--to", help="Specify the end date in yyyy-MM-dd format.")
+        self.parser.add_argument("--format", choices=list(FormatOption), default=argparse.SUPPRESS,
+                                 help="Specify the report format: markdown, adoc, csv or json.")
+        self.parser.add_argument("--output", default=argparse.SUPPRESS,
+                                 help="Specify a file to write the report to instead of logging it.")
+        self.parser.add_argument("--bucket", choices=list(TimeBucket), default=argparse.SUPPRESS,
+                                 help="Add a time series with one row per second, minute or hour.")
+        self.parser.add_argument("--latency", action="store_true", default=argparse.SUPPRESS,
+                                 help="Add latency percentiles from $request_time and $upstream_response_time; "
+                                      "requires a --log-format logging $request_time.")
+        self.parser.add_argument("--top", type=int, default=argparse.SUPPRESS,
+                                 help="Report only the N most frequent resources, IPs, user agents and referers, "
+                                      "counted in bounded memory.")
+        self.parser.add_argument("--normalize-urls", dest="normalize-urls", action="store_true",
+                                 default=argparse.SUPPRESS,
+                                 help="Count resources without query strings and with numeric IDs, UUIDs and "
+                                      "hashes replaced by {id}, {uuid} and {hash}.")
+        self.parser.add_argument("--route", action="append", default=argparse.SUPPRESS,
+                                 help="Specify a route template such as '/api/users/{id}/orders' or '/static/*' "
+                                      "to count matching resources under; repeat the option to add several. "
+                                      "Implies --normalize-urls.")
+        self.parser.add_argument("--filter-field", dest="filter-field", default=argparse.SUPPRESS,
+                                 help="Specify the log field to filter by: agent, request, status or ip.")
+        self.parser.add_argument("--filter-value", dest="filter-value", default=argparse.SUPPRESS,
+                                 help="Specify the filter value, e.g. 'Mozilla', 're:^GET /api', '>=500', "
+                                      "'5xx' or '10.0.0.0/8'.")
+        self.parser.add_argument("--workers", type=int, default=argparse.SUPPRESS,
+                                 help="Specify the number of worker processes used to read local files.")
+        self.parser.add_argument("--quantile-mode", dest="quantile-mode", choices=list(QuantileMode),
+                                 default=argparse.SUPPRESS,
+                                 help="Specify how response size percentiles are computed: exact or sketch.")
+        self.parser.add_argument("--quantile-error", dest="quantile-error", type=float, default=argparse.SUPPRESS,
+                                 help="Specify the relative error of the sketch quantile mode (e.g., 0.01).")
+        self.parser.add_argument("--unique-ip-mode", dest="unique-ip-mode", choices=list(UniqueIpMode),
+                                 default=argparse.SUPPRESS,
+                                 help="Specify how unique IPs are counted: exact or hll (HyperLogLog estimate).")
+        self.parser.add_argument("--hll-precision", dest="hll-precision", type=int, default=argparse.SUPPRESS,
+                                 help="Specify the HyperLogLog precision (4-18) used by the hll unique IP mode.")
+        self.parser.add_argument("--max-connections", dest="max-connections", type=int, default=argparse.SUPPRESS,
+                                 help="Specify the number of remote sources downloaded at once.")
+        self.parser.add_argument("--timeout", type=float, default=argparse.SUPPRESS,
+                                 help="Specify the connect and read timeout for remote sources in seconds.")
+        self.parser.add_argument("--retries", type=int, default=argparse.SUPPRESS,
+                                 help="Specify the number of retries for a failed request.")
+        self.parser.add_argument("--state-file", dest="state-file", default=argparse.SUPPRESS,
+                                 help="Specify a checkpoint database to analyze growing local files incrementally.")
+        self.parser.add_argument("--index-dir", dest="index-dir", default=argparse.SUPPRESS,
+                                 help="Specify a directory caching the time indexes used to seek to --from/--to.")
+        self.parser.add_argument("--cache-dir", dest="cache-dir", default=argparse.SUPPRESS,
+                                 help="Specify a directory caching parsed local files as columns for repeat queries.")
+        self.parser.add_argument("--engine", choices=list(AnalyzerEngine), default=argparse.SUPPRESS,
+                                 help="Specify how log entries are aggregated: python or numpy (vectorized batches).")
+        self.parser.add_argument("--batch-size", dest="batch-size", type=int, default=argparse.SUPPRESS,
+                                 help="Specify how many log entries the numpy engine parses and aggregates at once.")
+        self.parser.add_argument("--log-format", dest="log-format", default=argparse.SUPPRESS,
+                                 help="Specify the log line format: a preset (" + ", ".join(LogFormatPreset) + "), "
+                                      "an NGINX log_format string, or a whole log_format directive.")
+        self.parser.add_argument("--on-error", dest="on-error", choices=list(ErrorPolicy), default=argparse.SUPPRESS,
+                                 help="Specify what happens to lines that cannot be parsed: skip (default), "
+                                      "quarantine (also append them to --quarantine-file) or fail.")
+        self.parser.add_argument("--quarantine-file", dest="quarantine-file", default=argparse.SUPPRESS,
+                                 help="Specify the file the quarantine error policy appends bad lines to.")
+        self.parser.add_argument("--follow", action="store_true", default=argparse.SUPPRESS,
+                                 help="Follow a growing local file and report metrics over a sliding window.")
+        self.parser.add_argument("--window", type=int, default=argparse.SUPPRESS,
+                                 help="Specify the sliding window of --follow in minutes (e.g., 1, 5 or 15).")
+        self.parser.add_argument("--refresh", type=float, default=argparse.SUPPRESS,
+                                 help="Specify how often --follow re-renders the report, in seconds.")
 
     def parse(self, args=None):
         """
@@ -101,4 +172,53 @@ class ArgumentsParser:
         if to_option and to_date_time is None:
             return "Error: Invalid date format for --to option. Expected format is yyyy-MM-dd."
 
+        workers_option = options.get("workers")
+        if workers_option is not None and workers_option < 1:
+            return "Error: --workers option must be a positive integer."
+
+        top_option = options.get("top")
+        if top_option is not None and top_option < 1:
+            return "Error: --top option must be a positive integer."
+
+        for route in options.get("route", []):
+            if not route.startswith("/"):
+                return f"Error: --route option must start with '/': {route}"
+
+        quantile_error_option = options.get("quantile-error")
+        if quantile_error_option is not None and not 0 < quantile_error_option < 1:
+            return "Error: --quantile-error option must be between 0 and 1."
+
+        hll_precision_option = options.get("hll-precision")
+        if hll_precision_option is not None and not MIN_PRECISION <= hll_precision_option <= MAX_PRECISION:
+            return f"Error: --hll-precision option must be between {MIN_PRECISION} and {MAX_PRECISION}."
+
+        max_connections_option = options.get("max-connections")
+        if max_connections_option is not None and max_connections_option < 1:
+            return "Error: --max-connections option must be a positive integer."
+
+        timeout_option = options.get("timeout")
+        if timeout_option is not None and timeout_option <= 0:
+            return "Error: --timeout option must be positive."
+
+        retries_option = options.get("retries")
+        if retries_option is not None and retries_option < 0:
+            return "Error: --retries option must not be negative."
+
+        on_error_option = options.get("on-error")
+        if on_error_option == ErrorPolicy.QUARANTINE and not options.get("quarantine-file"):
+            return "Error: --on-error quarantine requires a --quarantine-file option."
+        if "quarantine-file" in options and on_error_option != ErrorPolicy.QUARANTINE:
+            return "Error: --quarantine-file option requires --on-error quarantine."
+
+        if options.get("follow") and (len(path_option) != 1 or path_option[0].startswith("http")):
+            return "Error: --follow option requires a single local --path."
+
+        window_option = options.get("window")
+        if window_option is not None and window_option < 1:
+            return "Error: --window option must be a positive integer."
+
+        refresh_option = options.get("refresh")
+        if refresh_option is not None and refresh_option <= 0:
+            return "Error: --refresh option must be positive."
+
         return options
@@ -0,0 +1,104 @@
+import argparse
+
+from src.services.benchmarks.benchmark_runner import BenchmarkRunner
+
+
+class BenchArgumentsParser:
+    """
+    Wrapper around the argparse.ArgumentParser for the benchmark command line.
+
+    The `BenchArgumentsParser` class defines the options describing the
+    synthetic log (size, address and resource cardinality, resource skew,
+    status mix, time span and seed) and the benchmark run (benchmarks,
+    repetitions, result and baseline files), and validates their values.
+    """
+
+    def __init__(self):
+        """
+        Initializes the argument parser and sets up the arguments.
+        """
+        self.parser = argparse.ArgumentParser(description="Measure the throughput of the log analyzer.")
+        self.parser.add_argument("--lines", type=int, default=argparse.SUPPRESS,
+                                 help="Specify the number of lines of the synthetic log.")
+        self.parser.add_argument("--ip-count", dest="ip-count", type=int, default=argparse.SUPPRESS,
+                                 help="Specify the number of distinct client addresses.")
+        self.parser.add_argument("--resources", type=int, default=argparse.SUPPRESS,
+                                 help="Specify the number of distinct requested resources.")
+        self.parser.add_argument("--resource-skew", dest="resource-skew", type=float, default=argparse.SUPPRESS,
+                                 help="Specify the Zipf exponent of resource popularity (0 for uniform).")
+        self.parser.add_argument("--status-mix", dest="status-mix", default=argparse.SUPPRESS,
+                                 help="Specify the weights of response statuses, e.g. '200=90,404=8,500=2'.")
+        self.parser.add_argument("--time-span", dest="time-span", type=int, default=argparse.SUPPRESS,
+                                 help="Specify the time span covered by the log, in seconds.")
+        self.parser.add_argument("--seed", type=int, default=argparse.SUPPRESS,
+                                 help="Specify the random seed of the synthetic log.")
+        self.parser.add_argument("--benchmark", action="append", default=argparse.SUPPRESS,
+                                 choices=BenchmarkRunner.get_available_benchmarks(),
+                                 help="Specify a benchmark to run; repeat the option to run several. "
+                                      "Defaults to all of them.")
+        self.parser.add_argument("--repeat", type=int, default=argparse.SUPPRESS,
+                                 help="Specify how many times each benchmark is run; the best run is reported.")
+        self.parser.add_argument("--output", default=argparse.SUPPRESS,
+                                 help="Specify a JSON file to save the results to, e.g. as a new baseline.")
+        self.parser.add_argument("--baseline", default=argparse.SUPPRESS,
+                                 help="Specify a JSON file with earlier results to compare with.")
+
+    def parse(self, args=None):
+        """
+        Parses and validates command-line arguments.
+
+        Args:
+            args (list, optional): A list of command-line arguments to parse. If not provided,
+                                   `argparse` will use `sys.argv`.
+
+        Returns:
+            dict or str: A dictionary containing the parsed arguments and their values if valid,
+                         or an error message string if validation fails.
+        """
+        options = vars(self.parser.parse_args(args))
+
+        for option in ("lines", "ip-count", "resources", "repeat"):
+            value = options.get(option)
+            if value is not None and value < 1:
+                return f"Error: --{option} option must be a positive integer."
+
+        resource_skew_option = options.get("resource-skew")
+        if resource_skew_option is not None and resource_skew_option < 0:
+            return "Error: --resource-skew option must not be negative."
+
+        time_span_option = options.get("time-span")
+        if time_span_option is not None and time_span_option < 0:
+            return "Error: --time-span option must not be negative."
+
+        status_mix_option = options.get("status-mix")
+        if status_mix_option is not None:
+            status_mix = self.parse_status_mix(status_mix_option)
+            if status_mix is None:
+                return "Error: Invalid --status-mix option. Expected format is '200=90,404=8,500=2'."
+            options["status-mix"] = status_mix
+
+        return options
+
+    @staticmethod
+    def parse_status_mix(value: str) -> dict[int, float] | None:
+        """
+        Parses a status mix such as `200=90,404=8,500=2`.
+
+        Args:
+            value (str): The comma-separated `status=weight` pairs.
+
+        Returns:
+            dict[int, float] | None: The weight of every status, or `None` if the
+                                     value is malformed or has no positive weight.
+        """
+        status_mix = {}
+        try:
+            for pair in value.split(","):
+                status, weight = pair.split("=")
+                status_code, status_weight = int(status), float(weight)
+                if not 100 <= status_code <= 999 or status_weight < 0:
+                    return None
+                status_mix[status_code] = status_weight
+        except ValueError:
+            return None
+        return status_mix if sum(status_mix.values()) > 0 else None
@@ -11,8 +11,9 @@ class DateParser(IParser):
     Class for parsing date strings into datetime objects.
 
     The `DateParser` class provides methods to parse date strings in specified
-    formats and convert them into `datetime` objects. It logs an error if the input
-    date string does not match any of the expected formats.
+    formats (the `yyyy-MM-dd` dates accepted on the command line and the NGINX
+    `$time_local` layout) and convert them into `datetime` objects. It logs an
+    error if the input date string does not match any of the expected formats.
     """
 
     def __init__(self):
@@ -20,6 +21,7 @@ class DateParser(IParser):
         Initializes the DateParser with common date-time formats.
         """
         self.date_time_formats = [
+            "%Y-%m-%d",
             "%d/%B/%Y:%H:%M:%S %z",
             "%d/%b/%Y:%H:%M:%S %z",
         ]
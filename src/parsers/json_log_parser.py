@@ -0,0 +1,110 @@
+import json
+
+from src.models.log_format_preset import LogFormatPreset
+from src.models.nginx_log import NginxLog
+from src.parsers.nginx_log_parser import NginxLogParser
+from src.services.analytics.log_predicate import LogPredicate
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JsonLogParser(NginxLogParser):
+    """
+    Class for parsing JSON access log lines into NginxLog objects.
+
+    The `JsonLogParser` decodes lines written by a `log_format ... escape=json`
+    object format. Each line is decoded by a single call to a C JSON decoder
+    (`orjson` when installed, the standard `json` module otherwise), and the
+    values of the captured fields are looked up by their JSON keys. Field
+    conversion and filtering then work exactly as for plain-text lines.
+    """
+
+    JSON = True
+
+    def __init__(self, fields: frozenset[str] | None = None, log_format: str | None = None):
+        """
+        Initializes the JsonLogParser with the JSON keys of the captured fields.
+
+        Args:
+            fields (frozenset[str] | None): The `NginxLog` attributes to extract.
+                Defaults to all fields.
+            log_format (str | None): A JSON object log format, as accepted by
+                `LogFormatCompiler.compile`. Defaults to the `json` preset.
+
+        Raises:
+            ValueError: If an unknown field is requested, or if the log format
+                        is malformed or not a JSON object.
+        """
+        super().__init__(fields, log_format or LogFormatPreset.JSON)
+        self.json_keys = tuple(self.log_format.json_keys.items())
+        self.loads = orjson.loads if orjson is not None else json.loads
+
+    def match(self, log_line: str | bytes) -> dict:
+        """
+        Decodes a log line and picks the raw values of the captured fields.
+
+        Args:
+            log_line (str | bytes): A single line from a JSON access log.
+
+        Returns:
+            dict: The raw field values keyed by regex group name.
+
+        Raises:
+            ValueError: If the line is not a JSON object with all captured keys.
+        """
+        try:
+            record = self.loads(log_line)
+            return {group: record[key] for group, key in self.json_keys}
+        except (ValueError, TypeError, KeyError):
+            raise ValueError("Incorrect format of log string")
+
+    def match_range(self, buffer, start: int, end: int) -> dict:
+        """
+        Decodes the log line stored in a slice of a bytes-like buffer.
+
+        Args:
+            buffer: A bytes-like object holding log lines.
+            start (int): The offset of the first byte of the line.
+            end (int): The offset right after the last byte of the line.
+
+        Returns:
+            dict: The raw field values keyed by regex group name.
+
+        Raises:
+            ValueError: If the line is not a JSON object with all captured keys.
+        """
+        return self.match(buffer[start:end])
+
+    def build_log(self, values: dict) -> NginxLog:
+        """
+        Converts the decoded field values into an NginxLog object.
+
+        Args:
+            values (dict): The raw field values keyed by regex group name.
+
+        Returns:
+            NginxLog: An instance of the `NginxLog` class with parsed data.
+
+        Raises:
+            ValueError: If any field fails to parse (e.g., status or body bytes).
+        """
+        return self.convert_values(values)
+
+    def build_matching_log(self, values: dict, predicate: LogPredicate) -> NginxLog | None:
+        """
+        Converts the decoded field values into an NginxLog object if they satisfy a predicate.
+
+        Args:
+            values (dict): The raw field values keyed by regex group name.
+            predicate (LogPredicate): The compiled filter predicate.
+
+        Returns:
+            NginxLog or None: The parsed log entry, or `None` if it doesn't match
+                              the predicate.
+        """
+        if not predicate.matches_value(str(values[predicate.group])):
+            return None
+        return self.convert_values(values)
@@ -0,0 +1,214 @@
+import re
+import shlex
+from functools import lru_cache
+
+from src.models.log_format import LogFormat
+from src.models.log_format_preset import LogFormatPreset
+
+VARIABLE_PATTERN = re.compile(r"\$(?:\{(\w+)\}|(\w+))")
+JSON_MEMBER_PATTERN = re.compile(r"\"([^\"\\]+)\"\s*:\s*(\"?)\$(?:\{(\w+)\}|(\w+))\2\s*(?=[,}])")
+
+PRESETS = {
+    LogFormatPreset.COMBINED: (
+        "$remote_addr - $remote_user [$time_local] "
+        "\"$request\" $status $body_bytes_sent \"$http_referer\" \"$http_user_agent\""
+    ),
+    LogFormatPreset.JSON: (
+        "{\"time_local\":\"$time_local\",\"remote_addr\":\"$remote_addr\",\"remote_user\":\"$remote_user\","
+        "\"request\":\"$request\",\"status\":\"$status\",\"body_bytes_sent\":\"$body_bytes_sent\","
+        "\"request_time\":\"$request_time\",\"http_referer\":\"$http_referer\","
+        "\"http_user_agent\":\"$http_user_agent\"}"
+    ),
+    LogFormatPreset.APACHE_COMMON: (
+        "$remote_addr $remote_ident $remote_user [$time_local] \"$request\" $status $body_bytes_sent"
+    ),
+    LogFormatPreset.APACHE_COMBINED: (
+        "$remote_addr $remote_ident $remote_user [$time_local] "
+        "\"$request\" $status $body_bytes_sent \"$http_referer\" \"$http_user_agent\""
+    ),
+}
+
+# NGINX variable -> (NginxLog attribute, regex group, value pattern)
+VARIABLES = {
+    "remote_addr": ("remote_addr", "remoteAddr", r"\S+"),
+    "remote_user": ("remote_user", "remoteUser", r"\S+"),
+    "time_local": ("time_local", "timeLocal", r".+?"),
+    "time_iso8601": ("time_local", "timeLocal", r"\S+"),
+    "request": ("request", "request", r".+?"),
+    "status": ("status", "status", r"\d{3}"),
+    "body_bytes_sent": ("body_bytes_sent", "bodyBytesSent", r"\d+|-"),
+    "http_referer": ("http_referer", "httpReferer", r".*?"),
+    "http_user_agent": ("http_user_agent", "httpUserAgent", r".*?"),
+    "host": ("host", "host", r"\S+"),
+    "request_time": ("request_time", "requestTime", r"\d+(?:\.\d+)?"),
+    "upstream_response_time": ("upstream_response_time", "upstreamResponseTime",
+                               r"(?:[\d.]+|-)(?:(?:, | : )(?:[\d.]+|-))*"),
+}
+GROUP_FIELDS = {group: field for field, group, _ in VARIABLES.values()}
+OTHER_VALUE_PATTERN = r".*?"
+
+
+class LogFormatCompiler:
+    """
+    Class for compiling access log formats into parsing patterns.
+
+    The `LogFormatCompiler` accepts a preset name, an NGINX `log_format`
+    string, or a whole `log_format` directive copied from the server
+    configuration. Plain-text formats become a single regex in which the
+    variables mapped to `NginxLog` attributes are named groups and all other
+    variables are skipped by non-capturing groups. Formats that are JSON
+    objects map every attribute to its JSON key instead, so lines can be
+    decoded by a JSON parser. Compiled formats are cached per format string
+    and projection of fields.
+    """
+
+    ALL_FIELDS = frozenset(field for field, _, _ in VARIABLES.values())
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def compile(log_format: str, fields: frozenset[str] | None = None) -> LogFormat:
+        """
+        Compiles a log format, capturing only the given fields.
+
+        Args:
+            log_format (str): A preset name, a `log_format` string or a `log_format` directive.
+            fields (frozenset[str] | None): The `NginxLog` attributes to capture, or
+                                            `None` to capture every attribute the format provides.
+
+        Returns:
+            LogFormat: The compiled format.
+
+        Raises:
+            ValueError: If the format has no variables or the directive is malformed.
+        """
+        source = LogFormatCompiler.resolve(log_format)
+        requested = LogFormatCompiler.ALL_FIELDS if fields is None else fields
+        text = source.strip()
+        if text.startswith("{") and text.endswith("}"):
+            return LogFormatCompiler.compile_json(source, requested)
+        return LogFormatCompiler.compile_text(source, requested)
+
+    @staticmethod
+    def resolve(log_format: str) -> str:
+        """
+        Resolves a preset name or a `log_format` directive into a format string.
+
+        A directive such as `log_format main escape=json '...' '...';` is split
+        like NGINX does: its quoted parts are concatenated, and the name and
+        parameters are dropped.
+
+        Args:
+            log_format (str): A preset name, a `log_format` string or a `log_format` directive.
+
+        Returns:
+            str: The format string.
+
+        Raises:
+            ValueError: If the directive is malformed.
+        """
+        if log_format in PRESETS:
+            return PRESETS[log_format]
+
+        text = log_format.strip()
+        if not text.startswith("log_format "):
+            return log_format
+
+        try:
+            tokens = shlex.split(text.rstrip(";"))
+        except ValueError:
+            raise ValueError(f"Malformed log_format directive: {log_format}")
+        parts = [token for token in tokens[2:] if not token.startswith("escape=")]
+        if not parts:
+            raise ValueError(f"Malformed log_format directive: {log_format}")
+        return "".join(parts)
+
+    @staticmethod
+    def compile_text(source: str, fields: frozenset[str]) -> LogFormat:
+        """
+        Compiles a plain-text format into a regex.
+
+        Literal text is matched verbatim and recorded as the delimiters of the
+        field variables. If the format ends with a variable,
+        the regex is anchored at the end of the line so that lazy value
+        patterns still consume the whole value.
+
+        Args:
+            source (str): The format string.
+            fields (frozenset[str]): The `NginxLog` attributes to capture.
+
+        Returns:
+            LogFormat: The compiled format.
+
+        Raises:
+            ValueError: If the format has no variables.
+        """
+        parts = []
+        provided = set()
+        delimiters = {}
+        time_variable = None
+        position = 0
+        matchers = list(VARIABLE_PATTERN.finditer(source))
+
+        for index, matcher in enumerate(matchers):
+            literal = source[position:matcher.start()]
+            parts.append(re.escape(literal))
+            position = matcher.end()
+            name = matcher.group(1) or matcher.group(2)
+            field, group, pattern = VARIABLES.get(name, (None, None, OTHER_VALUE_PATTERN))
+            if field is not None and field not in provided:
+                provided.add(field)
+                next_start = matchers[index + 1].start() if index + 1 < len(matchers) else len(source)
+                delimiters[field] = (literal, source[position:next_start])
+                if field == "time_local":
+                    time_variable = name
+                if field in fields:
+                    parts.append(f"(?P<{group}>{pattern})")
+                    continue
+            parts.append(f"(?:{pattern})")
+
+        if not parts:
+            raise ValueError(f"Log format has no variables: {source}")
+        parts.append(re.escape(source[position:]) if position < len(source) else r"\s*$")
+
+        pattern = "".join(parts)
+        return LogFormat(source, frozenset(provided), re.compile(pattern), re.compile(pattern.encode("utf-8")),
+                         None, time_variable, delimiters)
+
+    @staticmethod
+    def compile_json(source: str, fields: frozenset[str]) -> LogFormat:
+        """
+        Compiles a JSON object format into the JSON keys of its fields.
+
+        Only members whose value is a single variable, quoted or not, are
+        mapped; members combining several variables are ignored.
+
+        Args:
+            source (str): The format string.
+            fields (frozenset[str]): The `NginxLog` attributes to capture.
+
+        Returns:
+            LogFormat: The compiled format.
+
+        Raises:
+            ValueError: If no member maps to an `NginxLog` attribute.
+        """
+        json_keys = {}
+        provided = set()
+        time_variable = None
+
+        for matcher in JSON_MEMBER_PATTERN.finditer(source):
+            name = matcher.group(3) or matcher.group(4)
+            if name not in VARIABLES:
+                continue
+            field, group, _ = VARIABLES[name]
+            if field in provided:
+                continue
+            provided.add(field)
+            if field == "time_local":
+                time_variable = name
+            if field in fields:
+                json_keys[group] = matcher.group(1)
+
+        if not provided:
+            raise ValueError(f"Log format has no variables: {source}")
+        return LogFormat(source, frozenset(provided), None, None, json_keys, time_variable, {})
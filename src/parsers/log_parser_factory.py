@@ -0,0 +1,34 @@
+from src.models.log_format_preset import LogFormatPreset
+from src.parsers.json_log_parser import JsonLogParser
+from src.parsers.log_format_compiler import LogFormatCompiler
+from src.parsers.nginx_log_parser import NginxLogParser
+
+
+class LogParserFactory:
+    """
+    Factory class to create log line parsers based on log formats.
+
+    The `LogParserFactory` returns a `JsonLogParser` for JSON object formats
+    and a regex-based `NginxLogParser` for all other formats.
+    """
+
+    def get_parser(self, fields: frozenset[str] | None = None, log_format: str | None = None) -> NginxLogParser:
+        """
+        Returns a parser for the given log format.
+
+        Args:
+            fields (frozenset[str] | None): The `NginxLog` attributes to extract,
+                                            or `None` to extract all of them.
+            log_format (str | None): The log format, as accepted by
+                `LogFormatCompiler.compile`. Defaults to the `combined` preset.
+
+        Returns:
+            NginxLogParser: A new parser.
+
+        Raises:
+            ValueError: If an unknown field is requested or the log format is malformed.
+        """
+        log_format = log_format or LogFormatPreset.COMBINED
+        if LogFormatCompiler.compile(log_format).is_json:
+            return JsonLogParser(fields, log_format)
+        return NginxLogParser(fields, log_format)
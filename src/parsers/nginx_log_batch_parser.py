@@ -0,0 +1,136 @@
+from datetime import datetime
+from typing import Iterable
+
+from src.models.log_columns import LogColumns
+from src.models.log_format_preset import LogFormatPreset
+from src.parsers.arguments_parser import DateParser
+from src.parsers.log_format_compiler import LogFormatCompiler
+from src.parsers.log_parser_factory import LogParserFactory
+from src.parsers.parser import IParser
+from src.services.analytics.log_predicate import LogPredicate
+from src.services.columnar.log_columns_builder import COLUMN_FIELDS, LogColumnsBuilder
+
+GROUPS = ("remoteAddr", "timeLocal", "request", "status", "bodyBytesSent", "httpUserAgent")
+
+
+class NginxLogBatchParser(IParser):
+    """
+    Class for parsing batches of raw NGINX log lines into `LogColumns`.
+
+    The `NginxLogBatchParser` matches every line with the `NginxLogParser`
+    pattern but builds no `NginxLog` objects: the captured fields go straight
+    into column arrays. String fields are dictionary-encoded on their raw
+    bytes and decoded once per distinct value, and a timestamp is only parsed
+    when it differs from the one of the previous line. Formats that are JSON
+    objects or lack some column fields are parsed line by line into
+    `NginxLog` objects instead.
+    """
+
+    def __init__(self, log_format: str | None = None):
+        """
+        Initializes the NginxLogBatchParser with the log pattern of the column fields.
+
+        Args:
+            log_format (str | None): The format of the log lines, or `None` for
+                                     the NGINX `combined` format.
+
+        Raises:
+            ValueError: If the log format is malformed.
+        """
+        log_format = log_format or LogFormatPreset.COMBINED
+        compiled = LogFormatCompiler.compile(log_format, COLUMN_FIELDS)
+        raw_pattern = compiled.raw_pattern
+        if raw_pattern is not None and all(group in raw_pattern.groupindex for group in GROUPS):
+            self.pattern = raw_pattern
+            self.line_parser = None
+        else:
+            self.pattern = None
+            self.line_parser = LogParserFactory().get_parser(COLUMN_FIELDS, log_format)
+        self.iso_time = compiled.time_variable == "time_iso8601"
+
+    def parse(self, lines: Iterable[bytes], predicate: LogPredicate | None = None) -> LogColumns:
+        """
+        Parses a batch of raw log lines.
+
+        With a predicate, lines whose raw field value doesn't satisfy it are
+        dropped before their timestamps are parsed. The predicate is evaluated
+        once per distinct raw value.
+
+        Args:
+            lines (Iterable[bytes]): The log lines without their line terminators.
+            predicate (LogPredicate | None): The compiled filter predicate, or
+                                             `None` to keep every line.
+
+        Returns:
+            LogColumns: The columns of the parsed (and matching) log entries, in line order.
+
+        Raises:
+            ValueError: If a log line format is incorrect or its timestamp
+                        fails to parse.
+        """
+        if self.pattern is None:
+            return self.parse_logs(lines, predicate)
+
+        builder = LogColumnsBuilder()
+        append = builder.append
+        parse_time = datetime.fromisoformat if self.iso_time else DateParser.check_time_pattern
+        match = self.pattern.match
+        last_time_local = None
+        epoch = utc_offset = 0
+        group = predicate.group if predicate is not None else None
+        matches: dict[bytes, bool] = {}
+
+        for line in lines:
+            matcher = match(line)
+            if matcher is None:
+                raise ValueError("Incorrect format of log string")
+
+            if group is not None:
+                value = matcher.group(group)
+                is_match = matches.get(value)
+                if is_match is None:
+                    is_match = matches[value] = predicate.matches_value(value.decode("utf-8", errors="replace"))
+                if not is_match:
+                    continue
+
+            remote_addr, time_local, request, status, body_bytes_sent, http_user_agent = matcher.group(*GROUPS)
+            if time_local != last_time_local:
+                time_local_str = time_local.decode("utf-8", errors="replace")
+                try:
+                    time = parse_time(time_local_str)
+                except ValueError:
+                    raise ValueError(f"Incorrect time format: {time_local_str}")
+                last_time_local = time_local
+                epoch = int(time.timestamp())
+                utc_offset = int(time.utcoffset().total_seconds())
+
+            # The Apache CLF layouts log an empty response body as "-".
+            append(remote_addr, request, http_user_agent, int(status),
+                   int(body_bytes_sent) if body_bytes_sent != b"-" else 0, epoch, utc_offset)
+
+        return builder.build()
+
+    def parse_logs(self, lines: Iterable[bytes], predicate: LogPredicate | None) -> LogColumns:
+        """
+        Parses a batch of raw log lines one by one with the line parser of the format.
+
+        Args:
+            lines (Iterable[bytes]): The log lines without their line terminators.
+            predicate (LogPredicate | None): The compiled filter predicate, or
+                                             `None` to keep every line.
+
+        Returns:
+            LogColumns: The columns of the parsed (and matching) log entries, in line order.
+
+        Raises:
+            ValueError: If a log line format is incorrect or any field fails to parse.
+        """
+        builder = LogColumnsBuilder()
+        for line in lines:
+            if predicate is None:
+                builder.add(self.line_parser.parse(line))
+            else:
+                nginx_log = self.line_parser.parse_matching(line, predicate)
+                if nginx_log is not None:
+                    builder.add(nginx_log)
+        return builder.build()
@@ -1,53 +1,80 @@
-import logging
 import re
+from datetime import datetime
 
+from src.models.log_format_preset import LogFormatPreset
 from src.models.nginx_log import NginxLog
 from src.parsers.arguments_parser import DateParser
+from src.parsers.log_format_compiler import GROUP_FIELDS, LogFormatCompiler
 from src.parsers.parser import IParser
+from src.services.analytics.log_predicate import LogPredicate
 
-LOGGER = logging.getLogger("NginxLogParser")
+UPSTREAM_TIME_SEPARATOR = re.compile(r"\s*[,:]\s*")
 
 
 class NginxLogParser(IParser):
     """
     Class for parsing NGINX log lines into NginxLog objects.
 
-    The `NginxLogParser` class provides functionality to parse log lines from NGINX
-    access logs using a regex pattern and convert them into structured `NginxLog`
-    objects. It handles errors in individual log fields and logs specific error
-    messages when formats are incorrect.
+    The `NginxLogParser` class provides functionality to parse log lines from
+    NGINX access logs using a regex pattern compiled from their `log_format`
+    and convert them into structured `NginxLog` objects. Lines or fields in an
+    incorrect format raise a `ValueError`; reporting them is left to the
+    `BadLineHandler` of the reader. A parser can be restricted to a projection
+    of fields, in which case the other fields are neither captured nor
+    converted. Lines can be given as `str` or as raw `bytes`; raw lines are
+    matched by a `bytes` regex and only the captured fields are decoded, with
+    invalid UTF-8 replaced rather than rejected.
     """
 
-    LOG_PATTERN = (
-        r"(?P<remoteAddr>\S+) "
-        r"- (?P<remoteUser>\S+) "
-        r"\[(?P<timeLocal>.+?)\] "
-        r"\"(?P<request>.+?)\" "
-        r"(?P<status>\d{3}) "
-        r"(?P<bodyBytesSent>\d+) "
-        r"\"(?P<httpReferer>.*?)\" "
-        r"\"(?P<httpUserAgent>.*?)\""
-    )
+    ALL_FIELDS = LogFormatCompiler.ALL_FIELDS
+    NUMERIC_FIELDS = frozenset({"status", "body_bytes_sent", "request_time", "upstream_response_time"})
+    JSON = False
 
-    def __init__(self):
+    def __init__(self, fields: frozenset[str] | None = None, log_format: str | None = None):
         """
         Initializes the NginxLogParser with a compiled regex pattern and
         date-time format.
+
+        Args:
+            fields (frozenset[str] | None): The `NginxLog` attributes to extract.
+                Groups for other fields become non-capturing, and those
+                attributes are left as `None`. Defaults to all fields.
+            log_format (str | None): The log format, as accepted by
+                `LogFormatCompiler.compile`. Defaults to the `combined` preset.
+
+        Raises:
+            ValueError: If an unknown field is requested, or if the log format
+                        is malformed or not parsed by this class.
         """
-        self.pattern = re.compile(self.LOG_PATTERN)
+        self.fields = self.ALL_FIELDS if fields is None else frozenset(fields)
+        unknown_fields = self.fields - self.ALL_FIELDS
+        if unknown_fields:
+            raise ValueError(f"Unknown log fields: {', '.join(sorted(unknown_fields))}")
+
+        self.log_format = LogFormatCompiler.compile(log_format or LogFormatPreset.COMBINED, self.fields)
+        if self.log_format.is_json != self.JSON:
+            raise ValueError(f"Unsupported log format for {type(self).__name__}: {self.log_format.source}")
+
+        self.pattern = self.log_format.pattern
+        self.raw_pattern = self.log_format.raw_pattern
+        self.text_groups = tuple(
+            group for group in (self.pattern.groupindex if self.pattern is not None else ())
+            if GROUP_FIELDS[group] not in self.NUMERIC_FIELDS
+        )
+        self.iso_time = self.log_format.time_variable == "time_iso8601"
         self.date_time_formatter = "%d/%B/%Y:%H:%M:%S %z"
         self.date_time_formatter_full = "%d/%b/%Y:%H:%M:%S %z"
 
-    def parse(self, log_line: str) -> NginxLog:
+    def parse(self, log_line: str | bytes) -> NginxLog:
         """
         Parses a single line from an NGINX log file into an NginxLog object.
 
         This method matches the log line against a regex pattern, extracts
-        fields, converts them to the correct types, and handles any parsing
-        errors with specific log messages.
+        fields and converts them to the correct types. It doesn't log parsing
+        errors; it raises them for the caller to report.
 
         Args:
-            log_line (str): A single line from an NGINX log file.
+            log_line (str | bytes): A single line from an NGINX log file.
 
         Returns:
             NginxLog: An instance of the `NginxLog` class with parsed data.
@@ -56,43 +83,254 @@ class NginxLogParser(IParser):
             ValueError: If the log line format is incorrect or if any field
                         fails to parse (e.g., status or body bytes).
         """
-        matcher = self.pattern.match(log_line)
+        return self.build_log(self.match(log_line))
+
+    def parse_matching(self, log_line: str | bytes, predicate: LogPredicate) -> NginxLog | None:
+        """
+        Parses a log line only if its raw field value satisfies a predicate.
+
+        The predicate is checked against the string captured by the regex, so
+        lines that don't match are rejected before the timestamp is parsed and
+        the `NginxLog` object is built.
+
+        Args:
+            log_line (str | bytes): A single line from an NGINX log file.
+            predicate (LogPredicate): The compiled filter predicate.
+
+        Returns:
+            NginxLog or None: The parsed log entry, or `None` if it doesn't match
+                              the predicate.
+
+        Raises:
+            ValueError: If the log line format is incorrect or if any field
+                        fails to parse.
+        """
+        return self.build_matching_log(self.match(log_line), predicate)
+
+    def parse_range(self, buffer, start: int, end: int) -> NginxLog:
+        """
+        Parses the log line stored in a slice of a bytes-like buffer.
+
+        The buffer is matched in place (e.g., an `mmap`), so the line itself is
+        never copied; only the captured fields are.
+
+        Args:
+            buffer: A bytes-like object holding log lines.
+            start (int): The offset of the first byte of the line.
+            end (int): The offset right after the last byte of the line.
+
+        Returns:
+            NginxLog: An instance of the `NginxLog` class with parsed data.
+
+        Raises:
+            ValueError: If the log line format is incorrect or if any field
+                        fails to parse.
+        """
+        return self.build_log(self.match_range(buffer, start, end))
+
+    def parse_range_matching(self, buffer, start: int, end: int, predicate: LogPredicate) -> NginxLog | None:
+        """
+        Parses the log line stored in a buffer slice only if it satisfies a predicate.
+
+        Args:
+            buffer: A bytes-like object holding log lines.
+            start (int): The offset of the first byte of the line.
+            end (int): The offset right after the last byte of the line.
+            predicate (LogPredicate): The compiled filter predicate.
+
+        Returns:
+            NginxLog or None: The parsed log entry, or `None` if it doesn't match
+                              the predicate.
+
+        Raises:
+            ValueError: If the log line format is incorrect or if any field
+                        fails to parse.
+        """
+        return self.build_matching_log(self.match_range(buffer, start, end), predicate)
+
+    def build_matching_log(self, matcher: re.Match, predicate: LogPredicate) -> NginxLog | None:
+        """
+        Builds an NginxLog object from a match if its raw field value satisfies a predicate.
+
+        Args:
+            matcher (re.Match): A match of the log pattern.
+            predicate (LogPredicate): The compiled filter predicate.
+
+        Returns:
+            NginxLog or None: The parsed log entry, or `None` if it doesn't match
+                              the predicate.
+        """
+        value = matcher.group(predicate.group)
+        if isinstance(value, bytes):
+            value = value.decode("utf-8", errors="replace")
+        if not predicate.matches_value(value):
+            return None
+        return self.build_log(matcher)
+
+    def match(self, log_line: str | bytes) -> re.Match:
+        """
+        Matches a log line against the log pattern.
+
+        Args:
+            log_line (str | bytes): A single line from an NGINX log file.
+
+        Returns:
+            re.Match: The match holding the raw field values.
+
+        Raises:
+            ValueError: If the log line format is incorrect.
+        """
+        pattern = self.raw_pattern if isinstance(log_line, bytes) else self.pattern
+        matcher = pattern.match(log_line)
+        if not matcher:
+            raise ValueError("Incorrect format of log string")
+        return matcher
+
+    def match_range(self, buffer, start: int, end: int) -> re.Match:
+        """
+        Matches the log line stored in a slice of a bytes-like buffer against the log pattern.
+
+        Args:
+            buffer: A bytes-like object holding log lines.
+            start (int): The offset of the first byte of the line.
+            end (int): The offset right after the last byte of the line.
+
+        Returns:
+            re.Match: The match holding the raw field values.
+
+        Raises:
+            ValueError: If the log line format is incorrect.
+        """
+        matcher = self.raw_pattern.match(buffer, start, end)
         if not matcher:
-            LOGGER.error("Incorrect format of log string")
             raise ValueError("Incorrect format of log string")
+        return matcher
+
+    def build_log(self, matcher: re.Match) -> NginxLog:
+        """
+        Converts the raw field values of a match into an NginxLog object.
 
-        remote_addr = matcher.group("remoteAddr")
-        remote_user = matcher.group("remoteUser")
-        time_local_str = matcher.group("timeLocal")
-        request = matcher.group("request")
-        http_referer = matcher.group("httpReferer")
-        http_user_agent = matcher.group("httpUserAgent")
-
-        try:
-            status = int(matcher.group("status"))
-        except ValueError:
-            LOGGER.error("Incorrect format for status: %s", matcher.group("status"))
-            raise ValueError(f"Incorrect format for status: {matcher.group('status')}")
-
-        try:
-            body_bytes_sent = int(matcher.group("bodyBytesSent"))
-        except ValueError:
-            LOGGER.error("Incorrect format for body_bytes_sent: %s", matcher.group("bodyBytesSent"))
-            raise ValueError(f"Incorrect format for body_bytes_sent: {matcher.group('bodyBytesSent')}")
-
-        try:
-            time_local = DateParser.check_time_pattern(time_local_str)
-        except ValueError:
-            LOGGER.error("Failed to parse time_local: %s", time_local_str)
-            raise ValueError(f"Incorrect time format: {time_local_str}")
+        Only captured fields are converted; fields outside the projection are
+        left as `None`, so their conversion cost is skipped.
+
+        Args:
+            matcher (re.Match): A match of the log pattern.
+
+        Returns:
+            NginxLog: An instance of the `NginxLog` class with parsed data.
+
+        Raises:
+            ValueError: If any field fails to parse (e.g., status or body bytes).
+        """
+        values = matcher.groupdict()
+        if not isinstance(matcher.string, str):
+            # Digits are converted by int() directly; only text fields are decoded.
+            for group in self.text_groups:
+                values[group] = values[group].decode("utf-8", errors="replace")
+        return self.convert_values(values)
+
+    def convert_values(self, values: dict) -> NginxLog:
+        """
+        Converts raw field values, keyed by regex group name, into an NginxLog object.
+
+        Args:
+            values (dict): The raw values of the captured fields; numeric fields
+                           may be `str`, `bytes` or already numbers.
+
+        Returns:
+            NginxLog: An instance of the `NginxLog` class with parsed data.
+
+        Raises:
+            ValueError: If any field fails to parse (e.g., status or body bytes).
+        """
+        time_local_str = values.get("timeLocal")
+        status_str = values.get("status")
+        body_bytes_sent_str = values.get("bodyBytesSent")
+        request_time_str = values.get("requestTime")
+        upstream_response_time_str = values.get("upstreamResponseTime")
+
+        status = None
+        if status_str is not None:
+            try:
+                status = int(status_str)
+            except ValueError:
+                raise ValueError(f"Incorrect format for status: {status_str}")
+
+        body_bytes_sent = None
+        if body_bytes_sent_str is not None:
+            try:
+                body_bytes_sent = int(body_bytes_sent_str)
+            except ValueError:
+                # The Apache CLF layouts log an empty response body as "-".
+                if body_bytes_sent_str not in ("-", b"-"):
+                    raise ValueError(f"Incorrect format for body_bytes_sent: {body_bytes_sent_str}")
+                body_bytes_sent = 0
+
+        time_local = None
+        if time_local_str is not None:
+            try:
+                if self.iso_time:
+                    time_local = datetime.fromisoformat(time_local_str)
+                else:
+                    time_local = DateParser.check_time_pattern(time_local_str)
+            except ValueError:
+                raise ValueError(f"Incorrect time format: {time_local_str}")
+
+        request_time = None
+        if request_time_str is not None:
+            try:
+                request_time = float(request_time_str)
+            except ValueError:
+                raise ValueError(f"Incorrect format for request_time: {request_time_str}")
+
+        upstream_response_time = None
+        if upstream_response_time_str is not None:
+            upstream_response_time = self.parse_upstream_time(upstream_response_time_str)
 
         return NginxLog(
-            remote_addr,
-            remote_user,
+            values.get("remoteAddr"),
+            values.get("remoteUser"),
             time_local,
-            request,
+            values.get("request"),
             status,
             body_bytes_sent,
-            http_referer,
-            http_user_agent
+            values.get("httpReferer"),
+            values.get("httpUserAgent"),
+            values.get("host"),
+            request_time,
+            upstream_response_time
         )
+
+    @staticmethod
+    def parse_upstream_time(value: str | bytes | float) -> float | None:
+        """
+        Parses an `$upstream_response_time` value.
+
+        When a request was passed to several upstream servers, NGINX logs one
+        time per server, separated by commas and colons; the total time is
+        their sum. Servers that didn't respond are logged as `-`.
+
+        Args:
+            value (str | bytes | float): The raw value, e.g. `0.012, 0.340`.
+
+        Returns:
+            float | None: The total upstream time in seconds, or `None` if no
+                          server responded.
+
+        Raises:
+            ValueError: If the value is not a list of times.
+        """
+        if isinstance(value, (int, float)):
+            return float(value)
+        if isinstance(value, bytes):
+            value = value.decode("ascii", errors="replace")
+
+        total = None
+        for part in UPSTREAM_TIME_SEPARATOR.split(value.strip()):
+            if part == "-":
+                continue
+            try:
+                total = (total or 0.0) + float(part)
+            except ValueError:
+                raise ValueError(f"Incorrect format for upstream_response_time: {value}")
+        return total
@@ -0,0 +1,167 @@
+from datetime import datetime, timedelta, timezone
+
+from src.parsers.parser import IParser
+
+MONTHS = {
+    "Jan": 1,
+    "Feb": 2,
+    "Mar": 3,
+    "Apr": 4,
+    "May": 5,
+    "Jun": 6,
+    "Jul": 7,
+    "Aug": 8,
+    "Sep": 9,
+    "Oct": 10,
+    "Nov": 11,
+    "Dec": 12,
+}
+
+TIME_LOCAL_LENGTH = len("19/Nov/2023:15:30:45 +0000")
+
+
+class TimeLocalParser(IParser):
+    """
+    Class for parsing the NGINX `$time_local` field into datetime objects.
+
+    The `TimeLocalParser` handles the fixed `dd/Mon/yyyy:HH:MM:SS +zzzz` layout
+    by slicing the string at known positions instead of calling `strptime`.
+    Timezone objects are cached per offset, and the last parsed value is
+    memoized because consecutive log lines usually share the same second.
+    Inputs that do not fit the fixed layout (e.g., full month names) fall back
+    to `datetime.strptime`.
+    """
+
+    FALLBACK_FORMATS = [
+        "%d/%B/%Y:%H:%M:%S %z",
+        "%d/%b/%Y:%H:%M:%S %z",
+    ]
+
+    def __init__(self):
+        """
+        Initializes the TimeLocalParser with empty timezone and timestamp caches.
+        """
+        self.time_zones: dict[str, timezone] = {}
+        self.last_parsed: tuple[str | None, datetime | None] = (None, None)
+
+    def parse(self, time_local: str) -> datetime:
+        """
+        Parses a `$time_local` string into a timezone-aware `datetime` object.
+
+        Args:
+            time_local (str): The time string, e.g. `19/Nov/2023:15:30:45 +0000`.
+
+        Returns:
+            datetime: The parsed `datetime` object.
+
+        Raises:
+            ValueError: If the string matches neither the fixed layout nor
+                        any of the fallback formats.
+        """
+        last_time_local, last_datetime = self.last_parsed
+        if time_local == last_time_local:
+            return last_datetime
+
+        result = self.parse_fixed_layout(time_local)
+        if result is None:
+            result = self.parse_with_strptime(time_local)
+
+        # A single tuple assignment keeps the memoized pair consistent across threads.
+        self.last_parsed = (time_local, result)
+        return result
+
+    def parse_fixed_layout(self, time_local: str) -> datetime | None:
+        """
+        Parses a time string laid out exactly as `dd/Mon/yyyy:HH:MM:SS +zzzz`.
+
+        Args:
+            time_local (str): The time string to parse.
+
+        Returns:
+            datetime or None: The parsed `datetime` object, or `None` if the
+                              string does not follow the fixed layout.
+        """
+        if (
+            len(time_local) != TIME_LOCAL_LENGTH
+            or time_local[2] != "/"
+            or time_local[6] != "/"
+            or time_local[11] != ":"
+            or time_local[14] != ":"
+            or time_local[17] != ":"
+            or time_local[20] != " "
+        ):
+            return None
+
+        month = MONTHS.get(time_local[3:6])
+        if month is None:
+            return None
+
+        digits = time_local[0:2] + time_local[7:11] + time_local[12:14] + time_local[15:17] + time_local[18:20]
+        if not (digits.isascii() and digits.isdigit()):
+            return None
+
+        offset = time_local[21:]
+        tzinfo = self.time_zones.get(offset)
+        if tzinfo is None:
+            tzinfo = self.parse_offset(offset)
+            if tzinfo is None:
+                return None
+            self.time_zones[offset] = tzinfo
+
+        try:
+            return datetime(
+                int(time_local[7:11]),
+                month,
+                int(time_local[0:2]),
+                int(time_local[12:14]),
+                int(time_local[15:17]),
+                int(time_local[18:20]),
+                tzinfo=tzinfo,
+            )
+        except ValueError:
+            return None
+
+    @staticmethod
+    def parse_offset(offset: str) -> timezone | None:
+        """
+        Converts a `+hhmm`/`-hhmm` UTC offset into a `timezone` object.
+
+        Args:
+            offset (str): The offset string.
+
+        Returns:
+            timezone or None: The matching `timezone`, or `None` if the offset is invalid.
+        """
+        sign = offset[0]
+        digits = offset[1:]
+        if sign not in "+-" or not (digits.isascii() and digits.isdigit()):
+            return None
+
+        hours = int(digits[0:2])
+        minutes = int(digits[2:4])
+        if hours > 23 or minutes > 59:
+            return None
+
+        delta = timedelta(hours=hours, minutes=minutes)
+        return timezone(-delta if sign == "-" else delta)
+
+    def parse_with_strptime(self, time_local: str) -> datetime:
+        """
+        Parses a time string with `datetime.strptime` using the fallback formats.
+
+        Args:
+            time_local (str): The time string to parse.
+
+        Returns:
+            datetime: The parsed `datetime` object.
+
+        Raises:
+            ValueError: If the string doesn't match any fallback format.
+        """
+        for date_format in self.FALLBACK_FORMATS:
+            try:
+                return datetime.strptime(time_local, date_format)
+            except ValueError:
+                continue
+
+        raise ValueError(f"Incorrect date format: {time_local}")
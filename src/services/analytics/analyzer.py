@@ -1,15 +1,37 @@
 from http import HTTPStatus
 from collections import defaultdict
 from datetime import datetime
-from typing import List, Dict, Set
+from pathlib import Path
+from typing import Dict
 
 from src.models.nginx_log import NginxLog
 from src.services.analytics.analyzer_intrerface import IAnalyzer
+from src.services.analytics.exact_quantile_estimator import ExactQuantileEstimator
+from src.services.analytics.heavy_hitters import HeavyHitters
+from src.services.analytics.latency_stats import LatencyStats
+from src.services.analytics.quantile_estimator import IQuantileEstimator
+from src.services.analytics.quantile_estimator_factory import QuantileEstimatorFactory
+from src.services.analytics.resource_normalizer import ResourceNormalizer
+from src.services.analytics.time_series import TimeSeries
+from src.services.analytics.exact_unique_counter import ExactUniqueCounter
+from src.services.analytics.unique_counter import IUniqueCounter
+from src.services.analytics.unique_counter_factory import UniqueCounterFactory
+from src.services.serialization.binary_reader import BinaryReader
+from src.services.serialization.binary_writer import BinaryWriter
 
 
 MINERRORINDEX = 400
 MAXERRORINDEX = 600
 
+REQUIRED_FIELDS = frozenset({"remote_addr", "time_local", "request", "status", "body_bytes_sent"})
+LATENCY_FIELDS = frozenset({"request_time", "upstream_response_time"})
+TOP_FIELDS = frozenset({"http_user_agent", "http_referer"})
+# Fields read when the log format provides them; formats without them are still accepted.
+OPTIONAL_FIELDS = frozenset({"upstream_response_time"})
+
+STATE_MAGIC = b"LGAN"
+STATE_VERSION = 8
+
 
 class Analyzer(IAnalyzer):
     """
@@ -17,22 +39,49 @@ class Analyzer(IAnalyzer):
 
     The `Analyzer` class processes individual log entries, updating counters,
     tracking unique IPs, calculating error rates, and computing other metrics.
-    It can retrieve analyzed data such as 95th percentile response size and
-    status code counts.
+    It can retrieve analyzed data such as response size percentiles and
+    status code counts. An optional `TimeSeries` additionally aggregates the
+    entries per time interval, and optional `LatencyStats` aggregate request
+    latencies. Optional `HeavyHitters` replace the exact count of every
+    requested resource with bounded counters of the most frequent resources,
+    addresses, user agents and referers. An optional `ResourceNormalizer`
+    collapses requested resources into routes before they are counted. Lines
+    the readers could not parse are counted per source.
     """
 
-    def __init__(self):
+    def __init__(self, response_sizes: IQuantileEstimator | None = None, unique_ips: IUniqueCounter | None = None,
+                 time_series: TimeSeries | None = None, latency: LatencyStats | None = None,
+                 heavy_hitters: HeavyHitters | None = None, resource_normalizer: ResourceNormalizer | None = None):
         """
         Initializes the Analyzer with default counters and storage structures.
+
+        Args:
+            response_sizes (IQuantileEstimator | None): The estimator used for response
+                size percentiles. Defaults to an exact estimator.
+            unique_ips (IUniqueCounter | None): The counter used for distinct client
+                addresses. Defaults to an exact counter.
+            time_series (TimeSeries | None): The per-interval aggregation, or `None`
+                to keep only global totals.
+            latency (LatencyStats | None): The latency aggregation, or `None` to
+                ignore request timings.
+            heavy_hitters (HeavyHitters | None): The counters of the most frequent
+                values, or `None` to count every requested resource exactly.
+            resource_normalizer (ResourceNormalizer | None): The normalizer of requested
+                resources, or `None` to count resources as requested.
         """
         self.count_logs = 0
         self.total_size_logs = 0.0
         self.total_size_count = 0
         self.error_count = 0
-        self.unique_ips: Set[str] = set()
-        self.response_sizes: List[int] = []
+        self.unique_ips = unique_ips if unique_ips is not None else ExactUniqueCounter()
+        self.response_sizes = response_sizes if response_sizes is not None else ExactQuantileEstimator()
+        self.time_series = time_series
+        self.latency = latency
+        self.heavy_hitters = heavy_hitters
+        self.resource_normalizer = resource_normalizer
         self.count_status_codes: Dict[int, int] = defaultdict(int)
         self.resource_counts: Dict[str, int] = defaultdict(int)
+        self.bad_line_counts: Dict[str, int] = defaultdict(int)
         self.start_time = None
         self.end_time = None
 
@@ -49,25 +98,266 @@ class Analyzer(IAnalyzer):
         self.count_logs += 1
         self.total_size_logs += log.body_bytes_sent
         self.total_size_count += 1
-        self.response_sizes.append(log.body_bytes_sent)
+        self.response_sizes.add(log.body_bytes_sent)
 
         status_code = log.status
         self.count_status_codes[status_code] += 1
 
         resource = self.extract_resource_from_request(log.request)
-        self.resource_counts[resource] += 1
+        if self.heavy_hitters is None:
+            self.resource_counts[resource] += 1
+        else:
+            self.heavy_hitters.add(resource, log.remote_addr, log.http_user_agent, log.http_referer)
+        if self.latency is not None:
+            self.latency.add(resource, status_code, log.request_time, log.upstream_response_time)
 
         self.unique_ips.add(log.remote_addr)
 
-        if MINERRORINDEX <= status_code < MAXERRORINDEX:
+        is_error = MINERRORINDEX <= status_code < MAXERRORINDEX
+        if is_error:
             self.error_count += 1
 
         log_time = log.time_local
+        if self.time_series is not None:
+            self.time_series.add(log_time, log.body_bytes_sent, is_error)
         if self.start_time is None or log_time < self.start_time:
             self.start_time = log_time
         if self.end_time is None or log_time > self.end_time:
             self.end_time = log_time
 
+    def record_bad_line(self, source: str) -> None:
+        """
+        Counts a line of a source that could not be parsed.
+
+        Args:
+            source (str): The path or URL the line was read from.
+        """
+        self.bad_line_counts[source] += 1
+
+    def get_required_fields(self) -> frozenset[str]:
+        """
+        Returns the log entry fields read by `update_metrics`.
+
+        Returns:
+            frozenset[str]: The names of the required `NginxLog` attributes.
+        """
+        fields = REQUIRED_FIELDS
+        if self.latency is not None:
+            fields |= LATENCY_FIELDS
+        if self.heavy_hitters is not None:
+            fields |= TOP_FIELDS
+        return fields
+
+    @classmethod
+    def combine(cls, analyzers) -> "Analyzer":
+        """
+        Combines several analyzers into a new one.
+
+        Args:
+            analyzers: An iterable of analyzers, merged in iteration order.
+
+        Returns:
+            Analyzer: A new analyzer holding the combined metrics, configured
+                      like the first analyzer.
+        """
+        combined = None
+        for analyzer in analyzers:
+            if combined is None:
+                combined = analyzer.create_empty()
+            combined.merge(analyzer)
+        return combined if combined is not None else cls()
+
+    def create_empty(self) -> "Analyzer":
+        """
+        Creates an empty analyzer with the same configuration as this one.
+
+        Returns:
+            Analyzer: A new analyzer without any metrics.
+        """
+        time_series = self.time_series.create_empty() if self.time_series is not None else None
+        latency = self.latency.create_empty() if self.latency is not None else None
+        heavy_hitters = self.heavy_hitters.create_empty() if self.heavy_hitters is not None else None
+        return Analyzer(self.response_sizes.create_empty(), self.unique_ips.create_empty(), time_series, latency,
+                        heavy_hitters, self.resource_normalizer)
+
+    def merge(self, other: "Analyzer") -> None:
+        """
+        Merges the metrics collected by another analyzer into this one.
+
+        Counters are summed, sets are united, and start and end times are
+        widened, so merging partial analyzers in input order gives the same
+        result as feeding all log entries into a single analyzer.
+
+        Args:
+            other (Analyzer): The analyzer whose metrics are merged in.
+        """
+        self.count_logs += other.count_logs
+        self.total_size_logs += other.total_size_logs
+        self.total_size_count += other.total_size_count
+        self.error_count += other.error_count
+        self.unique_ips.merge(other.unique_ips)
+        self.response_sizes.merge(other.response_sizes)
+        if other.time_series is not None:
+            if self.time_series is None:
+                self.time_series = other.time_series.create_empty()
+            self.time_series.merge(other.time_series)
+        if other.latency is not None:
+            if self.latency is None:
+                self.latency = other.latency.create_empty()
+            self.latency.merge(other.latency)
+        if other.heavy_hitters is not None:
+            if self.heavy_hitters is None:
+                self.heavy_hitters = other.heavy_hitters.create_empty()
+            self.heavy_hitters.merge(other.heavy_hitters)
+
+        for status_code, count in other.count_status_codes.items():
+            self.count_status_codes[status_code] += count
+        for resource, count in other.resource_counts.items():
+            self.resource_counts[resource] += count
+        for source, count in other.bad_line_counts.items():
+            self.bad_line_counts[source] += count
+
+        if other.start_time is not None and (self.start_time is None or other.start_time < self.start_time):
+            self.start_time = other.start_time
+        if other.end_time is not None and (self.end_time is None or other.end_time > self.end_time):
+            self.end_time = other.end_time
+
+    def to_bytes(self) -> bytes:
+        """
+        Serializes the analyzer state into a compact binary form.
+
+        The state is struct-packed rather than pickled, so partial results can
+        cross process boundaries cheaply and be stored on disk.
+
+        Returns:
+            bytes: The serialized analyzer state.
+        """
+        writer = BinaryWriter()
+        writer.write_raw(STATE_MAGIC)
+        writer.write_uint32(STATE_VERSION)
+        QuantileEstimatorFactory.write(writer, self.response_sizes)
+        UniqueCounterFactory.write(writer, self.unique_ips)
+
+        writer.write_uint64(self.count_logs)
+        writer.write_float64(self.total_size_logs)
+        writer.write_uint64(self.total_size_count)
+        writer.write_uint64(self.error_count)
+        writer.write_datetime(self.start_time)
+        writer.write_datetime(self.end_time)
+
+        writer.write_uint64(len(self.count_status_codes))
+        for status_code, count in self.count_status_codes.items():
+            writer.write_int32(status_code)
+            writer.write_uint64(count)
+
+        writer.write_uint64(len(self.resource_counts))
+        for resource, count in self.resource_counts.items():
+            writer.write_str(resource)
+            writer.write_uint64(count)
+
+        writer.write_uint8(self.time_series is not None)
+        if self.time_series is not None:
+            self.time_series.write(writer)
+
+        writer.write_uint8(self.latency is not None)
+        if self.latency is not None:
+            self.latency.write(writer)
+
+        writer.write_uint64(len(self.bad_line_counts))
+        for source, count in self.bad_line_counts.items():
+            writer.write_str(source)
+            writer.write_uint64(count)
+
+        writer.write_uint8(self.heavy_hitters is not None)
+        if self.heavy_hitters is not None:
+            self.heavy_hitters.write(writer)
+
+        writer.write_uint8(self.resource_normalizer is not None)
+        if self.resource_normalizer is not None:
+            self.resource_normalizer.write(writer)
+
+        return writer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Analyzer":
+        """
+        Restores an analyzer from the binary form produced by `to_bytes`.
+
+        Args:
+            data (bytes): The serialized analyzer state.
+
+        Returns:
+            Analyzer: The restored analyzer.
+
+        Raises:
+            ValueError: If the data is not a supported analyzer state.
+        """
+        reader = BinaryReader(data)
+        if reader.read_raw(len(STATE_MAGIC)) != STATE_MAGIC:
+            raise ValueError("Data is not a serialized analyzer state")
+
+        version = reader.read_uint32()
+        if version != STATE_VERSION:
+            raise ValueError(f"Unsupported analyzer state version: {version}")
+
+        analyzer = cls(QuantileEstimatorFactory().read(reader), UniqueCounterFactory().read(reader))
+        analyzer.count_logs = reader.read_uint64()
+        analyzer.total_size_logs = reader.read_float64()
+        analyzer.total_size_count = reader.read_uint64()
+        analyzer.error_count = reader.read_uint64()
+        analyzer.start_time = reader.read_datetime()
+        analyzer.end_time = reader.read_datetime()
+
+        for _ in range(reader.read_uint64()):
+            status_code = reader.read_int32()
+            analyzer.count_status_codes[status_code] = reader.read_uint64()
+
+        for _ in range(reader.read_uint64()):
+            resource = reader.read_str()
+            analyzer.resource_counts[resource] = reader.read_uint64()
+
+        if reader.read_uint8():
+            analyzer.time_series = TimeSeries.read(reader)
+
+        if reader.read_uint8():
+            analyzer.latency = LatencyStats.read(reader)
+
+        for _ in range(reader.read_uint64()):
+            source = reader.read_str()
+            analyzer.bad_line_counts[source] = reader.read_uint64()
+
+        if reader.read_uint8():
+            analyzer.heavy_hitters = HeavyHitters.read(reader)
+
+        if reader.read_uint8():
+            analyzer.resource_normalizer = ResourceNormalizer.read(reader)
+
+        if not reader.at_end():
+            raise ValueError("Unexpected trailing data in analyzer state")
+        return analyzer
+
+    def save(self, file_path: str) -> None:
+        """
+        Writes the serialized analyzer state to a file.
+
+        Args:
+            file_path (str): The path of the file to write.
+        """
+        Path(file_path).write_bytes(self.to_bytes())
+
+    @classmethod
+    def load(cls, file_path: str) -> "Analyzer":
+        """
+        Reads an analyzer state previously written by `save`.
+
+        Args:
+            file_path (str): The path of the file to read.
+
+        Returns:
+            Analyzer: The restored analyzer.
+        """
+        return cls.from_bytes(Path(file_path).read_bytes())
+
     def extract_resource_from_request(self, request: str) -> str:
         """
         Extracts the resource path from the request string.
@@ -76,10 +366,12 @@ class Analyzer(IAnalyzer):
             request (str): The request string from which to extract the resource path.
 
         Returns:
-            str: The extracted resource path or the entire request if parsing fails.
+            str: The extracted resource path or the entire request if parsing fails,
+                 normalized if the analyzer has a resource normalizer.
         """
         parts = request.split(" ")
-        return parts[1] if len(parts) >= 2 else request
+        resource = parts[1] if len(parts) >= 2 else request
+        return self.resource_normalizer.normalize(resource) if self.resource_normalizer is not None else resource
 
     def calculate_95th_percentile(self) -> float:
         """
@@ -88,11 +380,19 @@ class Analyzer(IAnalyzer):
         Returns:
             float: The 95th percentile value of response sizes.
         """
-        if not self.response_sizes:
-            return 0.0
-        sorted_sizes = sorted(self.response_sizes)
-        index = int(0.95 * len(sorted_sizes)) - 1
-        return sorted_sizes[index]
+        return self.calculate_percentile(95)
+
+    def calculate_percentile(self, percentile: float) -> float:
+        """
+        Calculates the given percentile of response sizes.
+
+        Args:
+            percentile (float): The percentile to calculate (e.g., `99`).
+
+        Returns:
+            float: The percentile value of response sizes, or 0.0 if no logs are processed.
+        """
+        return self.response_sizes.quantile(percentile / 100)
 
     def get_count_logs(self) -> int:
         """
@@ -119,7 +419,7 @@ class Analyzer(IAnalyzer):
         Returns:
             int: The number of unique IP addresses in the logs.
         """
-        return len(self.unique_ips)
+        return self.unique_ips.get_count()
 
     def get_error_rate(self) -> float:
         """
@@ -153,8 +453,11 @@ class Analyzer(IAnalyzer):
         Returns a dictionary of requested resources and their counts.
 
         Returns:
-            dict: A dictionary mapping resource paths to request counts.
+            dict: A dictionary mapping resource paths to request counts; only the
+                  most requested resources if heavy hitters are tracked.
         """
+        if self.heavy_hitters is not None:
+            return {hitter.value: hitter.count for hitter in self.heavy_hitters.get_top_resources()}
         return dict(self.resource_counts)
 
     def get_status_code_counts(self) -> dict:
@@ -166,6 +469,43 @@ class Analyzer(IAnalyzer):
         """
         return dict(self.count_status_codes)
 
+    def get_time_series(self) -> TimeSeries | None:
+        """
+        Returns the per-interval aggregation of the log entries.
+
+        Returns:
+            TimeSeries or None: The time series, or None if it isn't collected.
+        """
+        return self.time_series
+
+    def get_latency_stats(self) -> LatencyStats | None:
+        """
+        Returns the latency aggregation of the log entries.
+
+        Returns:
+            LatencyStats or None: The latency statistics, or None if they aren't collected.
+        """
+        return self.latency
+
+    def get_heavy_hitters(self) -> HeavyHitters | None:
+        """
+        Returns the counters of the most frequent field values.
+
+        Returns:
+            HeavyHitters or None: The heavy hitters, or None if they aren't tracked.
+        """
+        return self.heavy_hitters
+
+    def get_bad_line_counts(self) -> dict:
+        """
+        Returns a dictionary of sources and the number of their lines that could not be parsed.
+
+        Returns:
+            dict: A dictionary mapping paths or URLs to bad line counts; sources
+                  without bad lines are left out.
+        """
+        return dict(self.bad_line_counts)
+
     def get_status_code_name(self, status_code: int) -> str:
         """
         Retrieves the message associated with a specific HTTP status code.
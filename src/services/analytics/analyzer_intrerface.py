@@ -27,6 +27,10 @@ class IAnalyzer(ABC):
     def calculate_95th_percentile(self) -> float:
         pass
 
+    @abstractmethod
+    def calculate_percentile(self, percentile: float) -> float:
+        pass
+
     @abstractmethod
     def get_unique_ip_count(self) -> int:
         pass
@@ -46,3 +50,44 @@ class IAnalyzer(ABC):
     @abstractmethod
     def get_status_code_name(self, code: int) -> str:
         pass
+
+    @abstractmethod
+    def get_time_series(self):
+        pass
+
+    @abstractmethod
+    def get_latency_stats(self):
+        pass
+
+    @abstractmethod
+    def get_heavy_hitters(self):
+        pass
+
+    @abstractmethod
+    def get_bad_line_counts(self) -> dict:
+        pass
+
+    @abstractmethod
+    def record_bad_line(self, source: str) -> None:
+        pass
+
+    @abstractmethod
+    def merge(self, other: "IAnalyzer") -> None:
+        pass
+
+    @abstractmethod
+    def create_empty(self) -> "IAnalyzer":
+        pass
+
+    @abstractmethod
+    def to_bytes(self) -> bytes:
+        pass
+
+    @classmethod
+    @abstractmethod
+    def from_bytes(cls, data: bytes) -> "IAnalyzer":
+        pass
+
+    @abstractmethod
+    def get_required_fields(self) -> frozenset[str]:
+        pass
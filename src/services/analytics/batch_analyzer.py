@@ -0,0 +1,20 @@
+from abc import abstractmethod
+
+from src.models.log_columns import LogColumns
+from src.services.analytics.analyzer_intrerface import IAnalyzer
+
+
+class IBatchAnalyzer(IAnalyzer):
+    """
+    Interface for analyzers that consume whole batches of log entries.
+
+    Readers hand such an analyzer batches of `batch_size` entries as
+    `LogColumns` together with the indices of the rows that passed the time
+    range and the filter, instead of one `NginxLog` at a time.
+    """
+
+    batch_size: int
+
+    @abstractmethod
+    def update_batch(self, columns: LogColumns, rows=None) -> None:
+        pass
@@ -0,0 +1,225 @@
+import math
+from collections import Counter
+from typing import Iterable
+
+from src.services.analytics.quantile_estimator import IQuantileEstimator
+from src.services.serialization.binary_reader import BinaryReader
+from src.services.serialization.binary_writer import BinaryWriter
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+DEFAULT_MAX_BINS = 2048
+
+
+class DDSketchQuantileEstimator(IQuantileEstimator):
+    """
+    Class for estimating quantiles with a DDSketch in bounded memory.
+
+    The `DDSketchQuantileEstimator` maps each positive value to a logarithmic
+    bucket, so any reported quantile is within the configured relative error
+    of the true value. Memory is capped by `max_bins`: when it is exceeded,
+    the lowest buckets are collapsed, which only affects the smallest quantiles.
+    Sketches with the same relative accuracy merge by adding bucket counts.
+    """
+
+    KIND = 1
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY, max_bins: int = DEFAULT_MAX_BINS):
+        """
+        Initializes the DDSketchQuantileEstimator.
+
+        Args:
+            relative_accuracy (float): The relative error guarantee, in the `(0, 1)` range.
+            max_bins (int): The maximum number of buckets kept in memory.
+
+        Raises:
+            ValueError: If the relative accuracy or the bin limit is out of range.
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError(f"Relative accuracy must be between 0 and 1: {relative_accuracy}")
+        if max_bins < 1:
+            raise ValueError(f"Maximum number of bins must be positive: {max_bins}")
+
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.bins: dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.min_value = 0
+        self.max_value = 0
+
+    def add(self, value: int) -> None:
+        """
+        Records a single value.
+
+        Args:
+            value (int): The value to record.
+        """
+        if self.count == 0 or value < self.min_value:
+            self.min_value = value
+        if self.count == 0 or value > self.max_value:
+            self.max_value = value
+        self.count += 1
+
+        if value <= 0:
+            self.zero_count += 1
+            return
+
+        key = math.ceil(math.log(value) / self.log_gamma)
+        bins = self.bins
+        if key in bins:
+            bins[key] += 1
+        else:
+            bins[key] = 1
+            if len(bins) > self.max_bins:
+                self.collapse_lowest_bins()
+
+    def add_many(self, values: Iterable[int]) -> None:
+        """
+        Records several values at once.
+
+        Equal values are counted first, so every distinct value costs a single
+        logarithm however often it occurs.
+
+        Args:
+            values (Iterable[int]): The values to record.
+        """
+        counts = Counter(values)
+        if not counts:
+            return
+
+        lowest, highest = min(counts), max(counts)
+        if self.count == 0 or lowest < self.min_value:
+            self.min_value = lowest
+        if self.count == 0 or highest > self.max_value:
+            self.max_value = highest
+
+        bins = self.bins
+        for value, count in counts.items():
+            self.count += count
+            if value <= 0:
+                self.zero_count += count
+                continue
+            key = math.ceil(math.log(value) / self.log_gamma)
+            bins[key] = bins.get(key, 0) + count
+        if len(bins) > self.max_bins:
+            self.collapse_lowest_bins()
+
+    def collapse_lowest_bins(self) -> None:
+        """
+        Folds the lowest buckets into their neighbour until the bin limit holds.
+        """
+        keys = sorted(self.bins)
+        while len(self.bins) > self.max_bins:
+            lowest = keys.pop(0)
+            self.bins[keys[0]] += self.bins.pop(lowest)
+
+    def quantile(self, q: float) -> float:
+        """
+        Returns an estimate of the value at the given quantile.
+
+        Args:
+            q (float): The quantile in the `[0, 1]` range (e.g., `0.95`).
+
+        Returns:
+            float: The estimated value, or 0.0 if no values are recorded.
+        """
+        if self.count == 0:
+            return 0.0
+
+        rank = q * (self.count - 1)
+        if rank < self.zero_count:
+            return float(min(self.min_value, 0))
+
+        cumulative = self.zero_count
+        for key in sorted(self.bins):
+            cumulative += self.bins[key]
+            if cumulative > rank:
+                value = 2 * self.gamma ** key / (self.gamma + 1)
+                return float(min(max(value, self.min_value), self.max_value))
+        return float(self.max_value)
+
+    def get_count(self) -> int:
+        """
+        Returns the number of recorded values.
+
+        Returns:
+            int: The number of values.
+        """
+        return self.count
+
+    def merge(self, other: "DDSketchQuantileEstimator") -> None:
+        """
+        Adds the buckets of another sketch with the same relative accuracy.
+
+        Args:
+            other (DDSketchQuantileEstimator): The sketch to merge in.
+
+        Raises:
+            ValueError: If the other estimator is not a compatible sketch.
+        """
+        if not isinstance(other, DDSketchQuantileEstimator) or other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        if other.count == 0:
+            return
+
+        if self.count == 0 or other.min_value < self.min_value:
+            self.min_value = other.min_value
+        if self.count == 0 or other.max_value > self.max_value:
+            self.max_value = other.max_value
+        self.count += other.count
+        self.zero_count += other.zero_count
+
+        for key, count in other.bins.items():
+            self.bins[key] = self.bins.get(key, 0) + count
+        if len(self.bins) > self.max_bins:
+            self.collapse_lowest_bins()
+
+    def create_empty(self) -> "DDSketchQuantileEstimator":
+        """
+        Creates an empty sketch with the same configuration.
+
+        Returns:
+            DDSketchQuantileEstimator: A new empty sketch.
+        """
+        return DDSketchQuantileEstimator(self.relative_accuracy, self.max_bins)
+
+    def write(self, writer: BinaryWriter) -> None:
+        """
+        Writes the sketch configuration and buckets.
+
+        Args:
+            writer (BinaryWriter): The writer to write to.
+        """
+        writer.write_float64(self.relative_accuracy)
+        writer.write_uint32(self.max_bins)
+        writer.write_uint64(self.count)
+        writer.write_uint64(self.zero_count)
+        writer.write_int64(self.min_value)
+        writer.write_int64(self.max_value)
+        writer.write_uint32(len(self.bins))
+        for key, count in self.bins.items():
+            writer.write_int32(key)
+            writer.write_uint64(count)
+
+    @classmethod
+    def read(cls, reader: BinaryReader) -> "DDSketchQuantileEstimator":
+        """
+        Reads a sketch written by `write`.
+
+        Args:
+            reader (BinaryReader): The reader to read from.
+
+        Returns:
+            DDSketchQuantileEstimator: The restored sketch.
+        """
+        estimator = cls(reader.read_float64(), reader.read_uint32())
+        estimator.count = reader.read_uint64()
+        estimator.zero_count = reader.read_uint64()
+        estimator.min_value = reader.read_int64()
+        estimator.max_value = reader.read_int64()
+        for _ in range(reader.read_uint32()):
+            key = reader.read_int32()
+            estimator.bins[key] = reader.read_uint64()
+        return estimator
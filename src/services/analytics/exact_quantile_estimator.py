@@ -0,0 +1,116 @@
+from array import array
+from typing import Iterable
+
+from src.services.analytics.quantile_estimator import IQuantileEstimator
+from src.services.serialization.binary_reader import BinaryReader
+from src.services.serialization.binary_writer import BinaryWriter
+
+
+class ExactQuantileEstimator(IQuantileEstimator):
+    """
+    Class for computing exact quantiles over all observed values.
+
+    The `ExactQuantileEstimator` keeps every value in a compact `array('q')`
+    instead of a list of Python ints. The sorted copy is cached, so several
+    quantile queries after the data is loaded cost a single sort.
+    """
+
+    KIND = 0
+
+    def __init__(self):
+        """
+        Initializes the ExactQuantileEstimator with an empty value array.
+        """
+        self.values = array("q")
+        self.sorted_values: list[int] = []
+
+    def add(self, value: int) -> None:
+        """
+        Records a single value.
+
+        Args:
+            value (int): The value to record.
+        """
+        self.values.append(value)
+
+    def add_many(self, values: Iterable[int]) -> None:
+        """
+        Records several values at once.
+
+        Args:
+            values (Iterable[int]): The values to record.
+        """
+        self.values.extend(values)
+
+    def quantile(self, q: float) -> float:
+        """
+        Returns the value at the given quantile.
+
+        Args:
+            q (float): The quantile in the `[0, 1]` range (e.g., `0.95`).
+
+        Returns:
+            float: The value at the quantile, or 0.0 if no values are recorded.
+        """
+        if not self.values:
+            return 0.0
+        if len(self.sorted_values) != len(self.values):
+            self.sorted_values = sorted(self.values)
+        index = int(q * len(self.sorted_values)) - 1
+        return self.sorted_values[index]
+
+    def get_count(self) -> int:
+        """
+        Returns the number of recorded values.
+
+        Returns:
+            int: The number of values.
+        """
+        return len(self.values)
+
+    def merge(self, other: "ExactQuantileEstimator") -> None:
+        """
+        Adds all values recorded by another exact estimator.
+
+        Args:
+            other (ExactQuantileEstimator): The estimator to merge in.
+
+        Raises:
+            ValueError: If the other estimator is not an exact one.
+        """
+        if not isinstance(other, ExactQuantileEstimator):
+            raise ValueError("Cannot merge an exact quantile estimator with a sketch")
+        self.values.extend(other.values)
+
+    def create_empty(self) -> "ExactQuantileEstimator":
+        """
+        Creates an empty estimator with the same configuration.
+
+        Returns:
+            ExactQuantileEstimator: A new empty estimator.
+        """
+        return ExactQuantileEstimator()
+
+    def write(self, writer: BinaryWriter) -> None:
+        """
+        Writes the recorded values.
+
+        Args:
+            writer (BinaryWriter): The writer to write to.
+        """
+        writer.write_int_array(self.values)
+
+    @classmethod
+    def read(cls, reader: BinaryReader) -> "ExactQuantileEstimator":
+        """
+        Reads an estimator written by `write`.
+
+        Args:
+            reader (BinaryReader): The reader to read from.
+
+        Returns:
+            ExactQuantileEstimator: The restored estimator.
+        """
+        estimator = cls()
+        estimator.values = reader.read_int_array()
+        return estimator
@@ -0,0 +1,158 @@
+from src.models.heavy_hitter import HeavyHitter
+from src.services.analytics.space_saving_counter import SpaceSavingCounter
+from src.services.serialization.binary_reader import BinaryReader
+from src.services.serialization.binary_writer import BinaryWriter
+
+CAPACITY_FACTOR = 10
+MIN_CAPACITY = 100
+
+
+class HeavyHitters:
+    """
+    Class for tracking the most frequent values of several log fields.
+
+    The `HeavyHitters` class keeps one `SpaceSavingCounter` for each of the
+    requested resources, client addresses, user agents and referers, so
+    memory stays bounded however many distinct values the log holds. Each
+    counter tracks `capacity` values, by default ten times the number of
+    reported entries, which keeps the counts of the reported entries close to
+    exact on skewed traffic. Trackers with the same configuration merge by
+    merging their counters.
+    """
+
+    def __init__(self, top: int, capacity: int | None = None):
+        """
+        Initializes empty HeavyHitters.
+
+        Args:
+            top (int): The number of most frequent values reported per field.
+            capacity (int | None): The number of values tracked per field, or
+                                   `None` to derive it from `top`.
+
+        Raises:
+            ValueError: If `top` is not positive or the capacity is smaller than `top`.
+        """
+        if top < 1:
+            raise ValueError(f"Number of top entries must be positive: {top}")
+        if capacity is None:
+            capacity = max(top * CAPACITY_FACTOR, MIN_CAPACITY)
+        if capacity < top:
+            raise ValueError(f"Capacity must not be smaller than the number of top entries: {capacity}")
+
+        self.top = top
+        self.capacity = capacity
+        self.resources = SpaceSavingCounter(capacity)
+        self.addresses = SpaceSavingCounter(capacity)
+        self.user_agents = SpaceSavingCounter(capacity)
+        self.referers = SpaceSavingCounter(capacity)
+
+    def add(self, resource: str, address: str, user_agent: str, referer: str) -> None:
+        """
+        Records the field values of a single request.
+
+        Args:
+            resource (str): The requested resource.
+            address (str): The client address.
+            user_agent (str): The user agent.
+            referer (str): The referer.
+        """
+        self.resources.add(resource)
+        self.addresses.add(address)
+        self.user_agents.add(user_agent)
+        self.referers.add(referer)
+
+    def get_top_resources(self) -> list[HeavyHitter]:
+        """
+        Returns the most requested resources.
+
+        Returns:
+            list[HeavyHitter]: At most `top` resources, most frequent first.
+        """
+        return self.resources.top(self.top)
+
+    def get_top_addresses(self) -> list[HeavyHitter]:
+        """
+        Returns the client addresses with the most requests.
+
+        Returns:
+            list[HeavyHitter]: At most `top` addresses, most frequent first.
+        """
+        return self.addresses.top(self.top)
+
+    def get_top_user_agents(self) -> list[HeavyHitter]:
+        """
+        Returns the user agents with the most requests.
+
+        Returns:
+            list[HeavyHitter]: At most `top` user agents, most frequent first.
+        """
+        return self.user_agents.top(self.top)
+
+    def get_top_referers(self) -> list[HeavyHitter]:
+        """
+        Returns the referers with the most requests.
+
+        Returns:
+            list[HeavyHitter]: At most `top` referers, most frequent first.
+        """
+        return self.referers.top(self.top)
+
+    def merge(self, other: "HeavyHitters") -> None:
+        """
+        Merges the counters of other HeavyHitters with the same configuration.
+
+        Args:
+            other (HeavyHitters): The trackers to merge in.
+
+        Raises:
+            ValueError: If the numbers of top entries or the capacities differ.
+        """
+        if other.top != self.top or other.capacity != self.capacity:
+            raise ValueError("Cannot merge heavy hitters with different configuration")
+
+        self.resources.merge(other.resources)
+        self.addresses.merge(other.addresses)
+        self.user_agents.merge(other.user_agents)
+        self.referers.merge(other.referers)
+
+    def create_empty(self) -> "HeavyHitters":
+        """
+        Creates empty trackers with the same configuration.
+
+        Returns:
+            HeavyHitters: New empty trackers.
+        """
+        return HeavyHitters(self.top, self.capacity)
+
+    def write(self, writer: BinaryWriter) -> None:
+        """
+        Writes the configuration and the counters.
+
+        Args:
+            writer (BinaryWriter): The writer to write to.
+        """
+        writer.write_uint32(self.top)
+        writer.write_uint32(self.capacity)
+        for counter in (self.resources, self.addresses, self.user_agents, self.referers):
+            counter.write(writer)
+
+    @classmethod
+    def read(cls, reader: BinaryReader) -> "HeavyHitters":
+        """
+        Reads trackers written by `write`.
+
+        Args:
+            reader (BinaryReader): The reader to read from.
+
+        Returns:
+            HeavyHitters: The restored trackers.
+
+        Raises:
+            ValueError: If a counter does not match the configuration.
+        """
+        heavy_hitters = cls(reader.read_uint32(), reader.read_uint32())
+        counters = [SpaceSavingCounter.read(reader) for _ in range(4)]
+        if any(counter.capacity != heavy_hitters.capacity for counter in counters):
+            raise ValueError("Heavy hitter counter does not match its capacity")
+        heavy_hitters.resources, heavy_hitters.addresses, heavy_hitters.user_agents, heavy_hitters.referers = counters
+        return heavy_hitters
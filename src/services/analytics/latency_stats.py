@@ -0,0 +1,222 @@
+from src.models.latency_summary import LatencySummary
+from src.services.analytics.ddsketch_quantile_estimator import DEFAULT_RELATIVE_ACCURACY, DDSketchQuantileEstimator
+from src.services.serialization.binary_reader import BinaryReader
+from src.services.serialization.binary_writer import BinaryWriter
+
+DEFAULT_MAX_ENDPOINTS = 1000
+MICROSECONDS = 1_000_000
+
+
+class LatencyStats:
+    """
+    Class for aggregating request latencies into mergeable sketches.
+
+    The `LatencyStats` class keeps DDSketches of `$request_time` and
+    `$upstream_response_time` over the whole log, and of `$request_time` per
+    status code and per endpoint. Latencies are recorded in whole
+    microseconds, so the sketches keep their relative accuracy down to the
+    millisecond resolution of NGINX timings. Status codes are few, but
+    endpoints are not: once more than twice `max_endpoints` endpoints are
+    tracked, only the `max_endpoints` busiest ones are kept, so memory stays
+    bounded whatever the input size. Statistics with the same configuration
+    merge by merging their sketches.
+    """
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+                 max_endpoints: int = DEFAULT_MAX_ENDPOINTS):
+        """
+        Initializes empty LatencyStats.
+
+        Args:
+            relative_accuracy (float): The relative accuracy of the latency sketches.
+            max_endpoints (int): The number of endpoints kept when the endpoint sketches are pruned.
+
+        Raises:
+            ValueError: If the endpoint limit is not positive.
+        """
+        if max_endpoints < 1:
+            raise ValueError(f"Maximum number of endpoints must be positive: {max_endpoints}")
+
+        self.relative_accuracy = relative_accuracy
+        self.max_endpoints = max_endpoints
+        self.request_times = DDSketchQuantileEstimator(relative_accuracy)
+        self.upstream_times = DDSketchQuantileEstimator(relative_accuracy)
+        self.status_times: dict[int, DDSketchQuantileEstimator] = {}
+        self.endpoint_times: dict[str, DDSketchQuantileEstimator] = {}
+
+    def add(self, endpoint: str, status: int, request_time: float | None, upstream_time: float | None) -> None:
+        """
+        Records the latencies of a single request.
+
+        Args:
+            endpoint (str): The requested resource.
+            status (int): The response status code.
+            request_time (float | None): The request processing time in seconds, if logged.
+            upstream_time (float | None): The time spent on upstream servers in seconds, if logged.
+        """
+        if upstream_time is not None:
+            self.upstream_times.add(round(upstream_time * MICROSECONDS))
+        if request_time is None:
+            return
+
+        value = round(request_time * MICROSECONDS)
+        self.request_times.add(value)
+
+        sketch = self.status_times.get(status)
+        if sketch is None:
+            sketch = self.status_times[status] = DDSketchQuantileEstimator(self.relative_accuracy)
+        sketch.add(value)
+
+        sketch = self.endpoint_times.get(endpoint)
+        if sketch is None:
+            sketch = self.endpoint_times[endpoint] = DDSketchQuantileEstimator(self.relative_accuracy)
+            sketch.add(value)
+            if len(self.endpoint_times) > 2 * self.max_endpoints:
+                self.prune_endpoints()
+            return
+        sketch.add(value)
+
+    def prune_endpoints(self) -> None:
+        """
+        Keeps the sketches of the `max_endpoints` endpoints with the most requests.
+
+        Ties keep the endpoints seen first, and surviving endpoints keep their order.
+        """
+        if len(self.endpoint_times) <= self.max_endpoints:
+            return
+        busiest = sorted(self.endpoint_times.items(), key=lambda item: item[1].get_count(), reverse=True)
+        kept = {endpoint for endpoint, _ in busiest[:self.max_endpoints]}
+        self.endpoint_times = {endpoint: sketch for endpoint, sketch in self.endpoint_times.items() if endpoint in kept}
+
+    def merge(self, other: "LatencyStats") -> None:
+        """
+        Adds the sketches of other statistics with the same configuration.
+
+        Args:
+            other (LatencyStats): The statistics to merge in.
+
+        Raises:
+            ValueError: If the sketch accuracies or endpoint limits differ.
+        """
+        if other.relative_accuracy != self.relative_accuracy or other.max_endpoints != self.max_endpoints:
+            raise ValueError("Cannot merge latency statistics with different configuration")
+
+        self.request_times.merge(other.request_times)
+        self.upstream_times.merge(other.upstream_times)
+        for sketches, other_sketches in ((self.status_times, other.status_times),
+                                         (self.endpoint_times, other.endpoint_times)):
+            for key, other_sketch in other_sketches.items():
+                sketch = sketches.get(key)
+                if sketch is None:
+                    sketch = sketches[key] = other_sketch.create_empty()
+                sketch.merge(other_sketch)
+        if len(self.endpoint_times) > 2 * self.max_endpoints:
+            self.prune_endpoints()
+
+    def create_empty(self) -> "LatencyStats":
+        """
+        Creates empty statistics with the same configuration.
+
+        Returns:
+            LatencyStats: New empty statistics.
+        """
+        return LatencyStats(self.relative_accuracy, self.max_endpoints)
+
+    @staticmethod
+    def summarize(label: str, sketch: DDSketchQuantileEstimator) -> LatencySummary:
+        """
+        Summarizes a latency sketch.
+
+        Args:
+            label (str): The label of the summarized group.
+            sketch (DDSketchQuantileEstimator): The sketch of the group latencies in microseconds.
+
+        Returns:
+            LatencySummary: The percentiles of the group in seconds.
+        """
+        return LatencySummary(label, sketch.get_count(), sketch.quantile(0.5) / MICROSECONDS,
+                              sketch.quantile(0.95) / MICROSECONDS, sketch.quantile(0.99) / MICROSECONDS,
+                              sketch.quantile(0.999) / MICROSECONDS)
+
+    def get_request_summary(self) -> LatencySummary:
+        """
+        Returns the request time percentiles over the whole log.
+
+        Returns:
+            LatencySummary: The summary labelled `request_time`.
+        """
+        return self.summarize("request_time", self.request_times)
+
+    def get_upstream_summary(self) -> LatencySummary:
+        """
+        Returns the upstream response time percentiles over the whole log.
+
+        Returns:
+            LatencySummary: The summary labelled `upstream_response_time`.
+        """
+        return self.summarize("upstream_response_time", self.upstream_times)
+
+    def get_status_summaries(self) -> list[LatencySummary]:
+        """
+        Returns the request time percentiles of every status code.
+
+        Returns:
+            list[LatencySummary]: The summaries, ordered by status code.
+        """
+        return [self.summarize(str(status), self.status_times[status]) for status in sorted(self.status_times)]
+
+    def get_slowest_endpoints(self, limit: int) -> list[LatencySummary]:
+        """
+        Returns the endpoints with the highest 99th percentile request time.
+
+        Args:
+            limit (int): The maximum number of endpoints returned.
+
+        Returns:
+            list[LatencySummary]: The summaries, slowest first.
+        """
+        summaries = [self.summarize(endpoint, sketch) for endpoint, sketch in self.endpoint_times.items()]
+        summaries.sort(key=lambda summary: summary.p99, reverse=True)
+        return summaries[:limit]
+
+    def write(self, writer: BinaryWriter) -> None:
+        """
+        Writes the statistics configuration and sketches.
+
+        Args:
+            writer (BinaryWriter): The writer to write to.
+        """
+        writer.write_float64(self.relative_accuracy)
+        writer.write_uint32(self.max_endpoints)
+        self.request_times.write(writer)
+        self.upstream_times.write(writer)
+        writer.write_uint32(len(self.status_times))
+        for status, sketch in self.status_times.items():
+            writer.write_int32(status)
+            sketch.write(writer)
+        writer.write_uint32(len(self.endpoint_times))
+        for endpoint, sketch in self.endpoint_times.items():
+            writer.write_str(endpoint)
+            sketch.write(writer)
+
+    @classmethod
+    def read(cls, reader: BinaryReader) -> "LatencyStats":
+        """
+        Reads statistics written by `write`.
+
+        Args:
+            reader (BinaryReader): The reader to read from.
+
+        Returns:
+            LatencyStats: The restored statistics.
+        """
+        stats = cls(reader.read_float64(), reader.read_uint32())
+        stats.request_times = DDSketchQuantileEstimator.read(reader)
+        stats.upstream_times = DDSketchQuantileEstimator.read(reader)
+        for _ in range(reader.read_uint32()):
+            status = reader.read_int32()
+            stats.status_times[status] = DDSketchQuantileEstimator.read(reader)
+        for _ in range(reader.read_uint32()):
+            endpoint = reader.read_str()
+            stats.endpoint_times[endpoint] = DDSketchQuantileEstimator.read(reader)
+        return stats
@@ -1,5 +1,29 @@
+import ipaddress
+import re
+import socket
+from functools import lru_cache
+
 from src.models.filter_field import FilterField
+from src.models.log_format_preset import LogFormatPreset
 from src.models.nginx_log import NginxLog
+from src.parsers.log_format_compiler import LogFormatCompiler
+from src.services.analytics.log_predicate import LogPredicate
+
+REGEX_PREFIX = "re:"
+STARTS_WITH_PREFIX = "prefix:"
+
+STATUS_COMPARISON_PATTERN = re.compile(r"^(>=|<=|>|<|=)?\s*(\d+)$")
+STATUS_RANGE_PATTERN = re.compile(r"^(\d+)\s*-\s*(\d+)$")
+STATUS_CLASS_PATTERN = re.compile(r"^([1-5])xx$", re.IGNORECASE)
+# Printable ASCII but the quote and the backslash, which NGINX writes to logs unescaped.
+RAW_SAFE_PATTERN = re.compile(r"[ !#-\[\]-~]*")
+
+FIELDS = {
+    FilterField.AGENT: ("http_user_agent", "httpUserAgent"),
+    FilterField.REQUEST: ("request", "request"),
+    FilterField.STATUS: ("status", "status"),
+    FilterField.IP: ("remote_addr", "remoteAddr"),
+}
 
 
 class LogFilter:
@@ -7,7 +31,8 @@ class LogFilter:
     Class for filtering log entries based on specified criteria.
 
     The `LogFilter` class provides a method to check if a log entry matches a
-    specific filter criterion, such as user agent, request, or status code.
+    specific filter criterion, such as user agent, request, or status code, and
+    a method to compile such a criterion into a reusable `LogPredicate`.
     """
 
     def matches_filter(self, log: NginxLog, filter_field: str, filter_value: str) -> bool:
@@ -39,3 +64,187 @@ class LogFilter:
             return str(log.status) == filter_value
         else:
             return False
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def compile(filter_field: str | None, filter_value: str | None,
+                log_format: str | None = None) -> LogPredicate | None:
+        """
+        Compiles a filter field and value into a predicate.
+
+        The value is interpreted once, so the per-line cost is a single call.
+        Every field accepts `re:<pattern>` for a regex search and
+        `prefix:<text>` for a prefix match. Otherwise `agent` and `request`
+        match a substring, `status` matches an exact code, a comparison
+        (`>=500`), a range (`500-599`) or a class (`5xx`), and `ip` matches an
+        address or a CIDR network (`10.0.0.0/8`).
+
+        The raw line needle of an exact or prefix match is wrapped in the
+        literal text the log format writes around the field, so it can't be
+        found inside other fields.
+
+        Args:
+            filter_field (str | None): The field to filter by (e.g., `agent`, `status`, `ip`).
+            filter_value (str | None): The filter expression for the field.
+            log_format (str | None): The log format of the raw lines, or `None` for the combined format.
+
+        Returns:
+            LogPredicate or None: The compiled predicate, or `None` if no
+                                  filtering is applied.
+
+        Raises:
+            ValueError: If the field is not supported or the value is not a
+                        valid expression for the field.
+        """
+        if filter_field is None or filter_value is None:
+            return None
+
+        field = filter_field.lower()
+        if field not in FIELDS:
+            raise ValueError(f"Unsupported filter field '{filter_field}'")
+        attribute, group = FIELDS[field]
+
+        if filter_value.startswith(REGEX_PREFIX):
+            try:
+                pattern = re.compile(filter_value[len(REGEX_PREFIX):])
+            except re.error as error:
+                raise ValueError(f"Invalid filter regex '{filter_value}': {error}")
+            return LogPredicate(attribute, group, lambda value: pattern.search(value) is not None)
+
+        delimiters = LogFilter.get_delimiters(attribute, log_format)
+        if filter_value.startswith(STARTS_WITH_PREFIX):
+            prefix = filter_value[len(STARTS_WITH_PREFIX):]
+            needle = delimiters[0] + prefix if LogFilter.is_raw_safe(prefix) else None
+            return LogPredicate(attribute, group, lambda value: value.startswith(prefix), needle or None)
+
+        if field == FilterField.STATUS:
+            return LogFilter.compile_status(attribute, group, filter_value.strip(), delimiters)
+        if field == FilterField.IP:
+            return LogFilter.compile_ip(attribute, group, filter_value.strip(), delimiters)
+        needle = filter_value if LogFilter.is_raw_safe(filter_value) else None
+        return LogPredicate(attribute, group, lambda value: filter_value in value, needle or None)
+
+    @staticmethod
+    def get_delimiters(attribute: str, log_format: str | None) -> tuple[str, str]:
+        """
+        Returns the literal text a log format writes right before and after a field.
+
+        JSON formats are matched by key rather than verbatim, so their fields
+        have no known delimiters.
+
+        Args:
+            attribute (str): The `NginxLog` attribute of the field.
+            log_format (str | None): The log format, or `None` for the combined format.
+
+        Returns:
+            tuple[str, str]: The text before and after the field, empty if unknown.
+
+        Raises:
+            ValueError: If the log format is invalid.
+        """
+        compiled = LogFormatCompiler.compile(log_format or LogFormatPreset.COMBINED)
+        return compiled.delimiters.get(attribute, ("", ""))
+
+    @staticmethod
+    def is_raw_safe(text: str) -> bool:
+        """
+        Checks that a text appears in raw lines exactly as it appears in field values.
+
+        NGINX escapes quotes, backslashes, control and non-ASCII characters
+        when writing them, so a needle holding them might not be found in a
+        matching line.
+
+        Args:
+            text (str): The text to check.
+
+        Returns:
+            bool: `True` if the text can be used as a raw line needle, `False` otherwise.
+        """
+        return RAW_SAFE_PATTERN.fullmatch(text) is not None
+
+    @staticmethod
+    def compile_status(attribute: str, group: str, expression: str,
+                       delimiters: tuple[str, str] = ("", "")) -> LogPredicate:
+        """
+        Compiles a status code expression into a predicate.
+
+        Args:
+            attribute (str): The `NginxLog` attribute holding the status code.
+            group (str): The parser regex group holding the status code.
+            expression (str): An exact code, a comparison, a range, or a class.
+            delimiters (tuple[str, str]): The literal text around the status code in raw lines.
+
+        Returns:
+            LogPredicate: The compiled predicate.
+
+        Raises:
+            ValueError: If the expression is not a valid status expression.
+        """
+        matcher = STATUS_CLASS_PATTERN.match(expression)
+        if matcher:
+            status_class = matcher.group(1)
+            return LogPredicate(attribute, group, lambda value: value[0] == status_class)
+
+        matcher = STATUS_RANGE_PATTERN.match(expression)
+        if matcher:
+            low, high = int(matcher.group(1)), int(matcher.group(2))
+            return LogPredicate(attribute, group, lambda value: low <= int(value) <= high)
+
+        matcher = STATUS_COMPARISON_PATTERN.match(expression)
+        if not matcher:
+            raise ValueError(f"Invalid status filter '{expression}'")
+
+        operator, code = matcher.group(1), int(matcher.group(2))
+        if operator == ">=":
+            return LogPredicate(attribute, group, lambda value: int(value) >= code)
+        if operator == "<=":
+            return LogPredicate(attribute, group, lambda value: int(value) <= code)
+        if operator == ">":
+            return LogPredicate(attribute, group, lambda value: int(value) > code)
+        if operator == "<":
+            return LogPredicate(attribute, group, lambda value: int(value) < code)
+
+        text = str(code)
+        return LogPredicate(attribute, group, lambda value: value == text, f"{delimiters[0]}{text}{delimiters[1]}")
+
+    @staticmethod
+    def compile_ip(attribute: str, group: str, expression: str,
+                   delimiters: tuple[str, str] = ("", "")) -> LogPredicate:
+        """
+        Compiles an address or a CIDR network into a predicate.
+
+        Candidate addresses are packed with `socket.inet_pton` and compared
+        against the network as integers under the prefix mask.
+
+        Args:
+            attribute (str): The `NginxLog` attribute holding the client address.
+            group (str): The parser regex group holding the client address.
+            expression (str): An IPv4/IPv6 address or network.
+            delimiters (tuple[str, str]): The literal text around the address in raw lines.
+
+        Returns:
+            LogPredicate: The compiled predicate.
+
+        Raises:
+            ValueError: If the expression is not a valid address or network.
+        """
+        try:
+            network = ipaddress.ip_network(expression, strict=False)
+        except ValueError:
+            raise ValueError(f"Invalid IP filter '{expression}'")
+
+        family = socket.AF_INET6 if network.version == 6 else socket.AF_INET
+        mask = int(network.netmask)
+        network_address = int(network.network_address)
+
+        def test(value: str) -> bool:
+            if (":" in value) != (family == socket.AF_INET6):
+                return False
+            try:
+                packed = socket.inet_pton(family, value)
+            except OSError:
+                return False
+            return int.from_bytes(packed, "big") & mask == network_address
+
+        needle = f"{delimiters[0]}{expression}{delimiters[1]}" if network.version == 4 and "/" not in expression else None
+        return LogPredicate(attribute, group, test, needle)
@@ -0,0 +1,97 @@
+from typing import Callable
+
+from src.models.nginx_log import NginxLog
+
+
+class LogPredicate:
+    """
+    Class representing a compiled filter over a single log field.
+
+    A `LogPredicate` is built once per run by `LogFilter.compile` and is then
+    applied at three levels of cost: an optional substring check on the raw
+    line, a check on the raw string captured by the parser regex, and a check
+    on an already parsed `NginxLog`. The raw checks let readers skip
+    non-matching lines before timestamps and `NginxLog` objects are built.
+    """
+
+    def __init__(self, field: str, group: str, test: Callable[[str], bool], needle: str | None = None):
+        """
+        Initializes the LogPredicate.
+
+        Args:
+            field (str): The `NginxLog` attribute the predicate applies to.
+            group (str): The name of the parser regex group holding the raw field.
+            test (Callable[[str], bool]): A function that checks the raw field value.
+            needle (str | None): A substring that every matching line must contain,
+                                 or `None` if no such substring is known.
+        """
+        self.field = field
+        self.group = group
+        self.test = test
+        self.needle = needle
+        self.raw_needle = needle.encode("utf-8") if needle is not None else None
+
+    def matches_line(self, line: str) -> bool:
+        """
+        Performs the cheap raw line check.
+
+        A `False` result means the line cannot match; a `True` result means the
+        line still has to be checked with `matches_value`.
+
+        Args:
+            line (str): The raw log line.
+
+        Returns:
+            bool: `False` if the line certainly doesn't match, `True` otherwise.
+        """
+        return self.needle is None or self.needle in line
+
+    def matches_raw_line(self, line: bytes) -> bool:
+        """
+        Performs the cheap raw line check on an undecoded line.
+
+        Args:
+            line (bytes): The raw log line.
+
+        Returns:
+            bool: `False` if the line certainly doesn't match, `True` otherwise.
+        """
+        return self.raw_needle is None or self.raw_needle in line
+
+    def matches_raw_range(self, buffer, start: int, end: int) -> bool:
+        """
+        Performs the cheap raw line check on a line stored in a buffer slice.
+
+        Args:
+            buffer: A bytes-like object with a `find` method (e.g., an `mmap`).
+            start (int): The offset of the first byte of the line.
+            end (int): The offset right after the last byte of the line.
+
+        Returns:
+            bool: `False` if the line certainly doesn't match, `True` otherwise.
+        """
+        return self.raw_needle is None or buffer.find(self.raw_needle, start, end) != -1
+
+    def matches_value(self, value: str) -> bool:
+        """
+        Checks the raw string value of the filtered field.
+
+        Args:
+            value (str): The field value as captured by the parser regex.
+
+        Returns:
+            bool: `True` if the value matches the predicate, `False` otherwise.
+        """
+        return self.test(value)
+
+    def matches(self, log: NginxLog) -> bool:
+        """
+        Checks a parsed log entry.
+
+        Args:
+            log (NginxLog): The log entry to be checked.
+
+        Returns:
+            bool: `True` if the log entry matches the predicate, `False` otherwise.
+        """
+        return self.test(str(getattr(log, self.field)))
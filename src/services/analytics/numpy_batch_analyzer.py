@@ -0,0 +1,657 @@
+from array import array
+from datetime import datetime, timedelta, timezone
+from http import HTTPStatus
+
+from src.models.log_columns import LogColumns
+from src.models.nginx_log import NginxLog
+from src.services.analytics.analyzer import MAXERRORINDEX, MINERRORINDEX, REQUIRED_FIELDS
+from src.services.analytics.batch_analyzer import IBatchAnalyzer
+from src.services.analytics.exact_unique_counter import ExactUniqueCounter
+from src.services.analytics.quantile_estimator import IQuantileEstimator
+from src.services.analytics.quantile_estimator_factory import QuantileEstimatorFactory
+from src.services.analytics.resource_normalizer import ResourceNormalizer
+from src.services.analytics.time_series import TimeSeries
+from src.services.analytics.unique_counter import IUniqueCounter
+from src.services.analytics.unique_counter_factory import UniqueCounterFactory
+from src.services.columnar.log_columns_builder import LogColumnsBuilder
+from src.services.serialization.binary_reader import BinaryReader
+from src.services.serialization.binary_writer import BinaryWriter
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+DEFAULT_BATCH_SIZE = 1 << 16
+STATUS_CODE_LIMIT = 1000
+
+STATE_MAGIC = b"LGNB"
+STATE_VERSION = 3
+
+
+class NumpyBatchAnalyzer(IBatchAnalyzer):
+    """
+    Class for analyzing log data in column batches with NumPy.
+
+    The `NumpyBatchAnalyzer` computes the same metrics as `Analyzer`, but
+    aggregates whole `LogColumns` batches with array operations instead of
+    updating Python counters once per entry: the status histogram is a
+    `bincount`, resources are counted on dictionary codes, byte sums and time
+    bounds are reductions, and exact percentiles use `partition` rather than a
+    full sort. Entries passed one by one through `update_metrics` are buffered
+    and aggregated in batches of `batch_size`, so every log reader can feed it.
+    Keyed counters keep the order of first appearance, so reports match those
+    of `Analyzer` for the same entries.
+    """
+
+    def __init__(self, response_sizes: IQuantileEstimator | None = None, unique_ips: IUniqueCounter | None = None,
+                 time_series: TimeSeries | None = None, batch_size: int = DEFAULT_BATCH_SIZE,
+                 resource_normalizer: ResourceNormalizer | None = None):
+        """
+        Initializes the NumpyBatchAnalyzer with empty counters.
+
+        Args:
+            response_sizes (IQuantileEstimator | None): The estimator used for response
+                size percentiles, or `None` to keep every size in NumPy arrays and
+                compute exact percentiles.
+            unique_ips (IUniqueCounter | None): The counter used for distinct client
+                addresses. Defaults to an exact counter.
+            time_series (TimeSeries | None): The per-interval aggregation, or `None`
+                to keep only global totals.
+            batch_size (int): The number of buffered entries aggregated at once.
+            resource_normalizer (ResourceNormalizer | None): The normalizer of requested
+                resources, or `None` to count resources as requested.
+
+        Raises:
+            ImportError: If `numpy` is not installed.
+            ValueError: If the batch size is not positive.
+        """
+        if np is None:
+            raise ImportError("The 'numpy' package is required by the NumPy batch analyzer")
+        if batch_size < 1:
+            raise ValueError(f"Batch size must be positive: {batch_size}")
+
+        self.response_sizes = response_sizes
+        self.unique_ips = unique_ips if unique_ips is not None else ExactUniqueCounter()
+        self.time_series = time_series
+        self.batch_size = batch_size
+        self.resource_normalizer = resource_normalizer
+        self.count_logs = 0
+        self.total_size_logs = 0
+        self.error_count = 0
+        self.size_chunks: list[np.ndarray] = []
+        self.status_counts = np.zeros(STATUS_CODE_LIMIT, dtype=np.int64)
+        self.status_order: list[int] = []
+        self.resource_codes: dict[str, int] = {}
+        self.resource_counts = np.zeros(0, dtype=np.int64)
+        self.bad_line_counts: dict[str, int] = {}
+        self.start_time: datetime | None = None
+        self.end_time: datetime | None = None
+        self.builder: LogColumnsBuilder | None = None
+
+    def update_metrics(self, log: NginxLog) -> None:
+        """
+        Buffers a single log entry, aggregating the buffer once it holds a full batch.
+
+        Args:
+            log (NginxLog): A log entry containing data to be analyzed.
+        """
+        if self.builder is None:
+            self.builder = LogColumnsBuilder()
+        self.builder.add(log)
+        if len(self.builder.status) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Aggregates the buffered log entries.
+        """
+        if self.builder is not None:
+            columns = self.builder.build()
+            self.builder = None
+            self.update_batch(columns)
+
+    def update_batch(self, columns: LogColumns, rows: "np.ndarray | None" = None) -> None:
+        """
+        Aggregates a batch of log entries.
+
+        Args:
+            columns (LogColumns): The columns holding the batch.
+            rows (np.ndarray | None): The indices of the rows to aggregate in
+                                      entry order, or `None` to aggregate all rows.
+        """
+        statuses = columns.status if rows is None else columns.status[rows]
+        if len(statuses) == 0:
+            return
+
+        sizes = columns.body_bytes_sent if rows is None else columns.body_bytes_sent[rows]
+        times = columns.time if rows is None else columns.time[rows]
+        statuses = statuses.astype(np.int64)
+        is_error = (statuses >= MINERRORINDEX) & (statuses < MAXERRORINDEX)
+
+        self.count_logs += len(statuses)
+        self.total_size_logs += int(sizes.sum())
+        self.error_count += int(is_error.sum())
+        if self.response_sizes is not None:
+            self.response_sizes.add_many(sizes.tolist())
+        else:
+            self.size_chunks.append(np.array(sizes, dtype=np.int64))
+
+        self.update_status_counts(statuses)
+        self.update_resource_counts(columns.request_values,
+                                    columns.request if rows is None else columns.request[rows])
+
+        addresses = columns.remote_addr if rows is None else columns.remote_addr[rows]
+        for code in self.count_in_order(addresses)[0]:
+            self.unique_ips.add(columns.remote_addr_values[code])
+
+        if self.time_series is not None:
+            self.update_time_series(self.time_series, times, sizes, is_error)
+
+        utc_offsets = columns.utc_offset if rows is None else columns.utc_offset[rows]
+        first, last = int(times.argmin()), int(times.argmax())
+        start_time = self.get_local_time(int(times[first]), int(utc_offsets[first]))
+        end_time = self.get_local_time(int(times[last]), int(utc_offsets[last]))
+        if self.start_time is None or start_time < self.start_time:
+            self.start_time = start_time
+        if self.end_time is None or end_time > self.end_time:
+            self.end_time = end_time
+
+    def update_status_counts(self, statuses: "np.ndarray") -> None:
+        """
+        Adds a batch of status codes to the histogram.
+
+        Args:
+            statuses (np.ndarray): The status codes of the batch.
+        """
+        counts = np.bincount(statuses, minlength=len(self.status_counts))
+        if len(counts) > len(self.status_counts):
+            self.status_counts = np.concatenate(
+                (self.status_counts, np.zeros(len(counts) - len(self.status_counts), dtype=np.int64)))
+
+        new_codes = (counts > 0) & (self.status_counts == 0)
+        if new_codes.any():
+            self.status_order.extend(code for code in self.count_in_order(statuses)[0] if new_codes[code])
+        self.status_counts += counts
+
+    def update_resource_counts(self, request_values: list[str], requests: "np.ndarray") -> None:
+        """
+        Adds a batch of dictionary-encoded requests to the resource counts.
+
+        The resource is extracted once per distinct request, and the batch
+        codes are translated to resource codes with a single lookup.
+
+        Args:
+            request_values (list[str]): The distinct requests of the batch.
+            requests (np.ndarray): The request codes of the batch rows.
+        """
+        distinct, first_indexes, inverse = np.unique(requests, return_index=True, return_inverse=True)
+        lookup = np.empty(len(distinct), dtype=np.int64)
+        for index in np.argsort(first_indexes, kind="stable").tolist():
+            resource = self.extract_resource_from_request(request_values[distinct[index]])
+            lookup[index] = LogColumnsBuilder.encode(self.resource_codes, resource)
+
+        if len(self.resource_codes) > len(self.resource_counts):
+            self.resource_counts = np.concatenate(
+                (self.resource_counts, np.zeros(len(self.resource_codes) - len(self.resource_counts), dtype=np.int64)))
+        self.resource_counts += np.bincount(lookup[inverse.ravel()], minlength=len(self.resource_counts))
+
+    @staticmethod
+    def count_in_order(values: "np.ndarray") -> tuple[list[int], list[int]]:
+        """
+        Counts the occurrences of every distinct value in order of first appearance.
+
+        Args:
+            values (np.ndarray): The values to count.
+
+        Returns:
+            tuple[list[int], list[int]]: The distinct values and their counts.
+        """
+        distinct, first_indexes, counts = np.unique(values, return_index=True, return_counts=True)
+        order = np.argsort(first_indexes, kind="stable")
+        return distinct[order].tolist(), counts[order].tolist()
+
+    @staticmethod
+    def update_time_series(time_series: TimeSeries, times: "np.ndarray", sizes: "np.ndarray",
+                           is_error: "np.ndarray") -> None:
+        """
+        Adds a batch of entries to a time series, one interval at a time.
+
+        Args:
+            time_series (TimeSeries): The series to update.
+            times (np.ndarray): The epoch seconds of the entries.
+            sizes (np.ndarray): The response sizes of the entries.
+            is_error (np.ndarray): Whether each entry has an error status.
+        """
+        bucket_ids = times // time_series.bucket_seconds
+        order = np.argsort(bucket_ids, kind="stable")
+        bucket_ids, sizes, is_error = bucket_ids[order], sizes[order], is_error[order]
+        bounds = [0, *(np.flatnonzero(np.diff(bucket_ids)) + 1).tolist(), len(bucket_ids)]
+
+        for start, end in zip(bounds, bounds[1:]):
+            interval_sizes = sizes[start:end]
+            time_series.add_interval(int(bucket_ids[start]), end - start, int(is_error[start:end].sum()),
+                                     int(interval_sizes.sum()), interval_sizes.tolist())
+
+    @staticmethod
+    def get_local_time(epoch: int, utc_offset: int) -> datetime:
+        """
+        Rebuilds a timezone-aware timestamp.
+
+        Args:
+            epoch (int): The epoch seconds of the entry.
+            utc_offset (int): The UTC offset of the entry in seconds.
+
+        Returns:
+            datetime: The local time of the entry.
+        """
+        return datetime.fromtimestamp(epoch, timezone(timedelta(seconds=utc_offset)))
+
+    def record_bad_line(self, source: str) -> None:
+        """
+        Counts a line of a source that could not be parsed.
+
+        Args:
+            source (str): The path or URL the line was read from.
+        """
+        self.bad_line_counts[source] = self.bad_line_counts.get(source, 0) + 1
+
+    def get_required_fields(self) -> frozenset[str]:
+        """
+        Returns the log entry fields read by `update_metrics`.
+
+        Returns:
+            frozenset[str]: The names of the required `NginxLog` attributes.
+        """
+        return REQUIRED_FIELDS
+
+    def create_empty(self) -> "NumpyBatchAnalyzer":
+        """
+        Creates an empty analyzer with the same configuration as this one.
+
+        Returns:
+            NumpyBatchAnalyzer: A new analyzer without any metrics.
+        """
+        response_sizes = self.response_sizes.create_empty() if self.response_sizes is not None else None
+        time_series = self.time_series.create_empty() if self.time_series is not None else None
+        return NumpyBatchAnalyzer(response_sizes, self.unique_ips.create_empty(), time_series, self.batch_size,
+                                  self.resource_normalizer)
+
+    def merge(self, other: "NumpyBatchAnalyzer") -> None:
+        """
+        Merges the metrics collected by another batch analyzer into this one.
+
+        Args:
+            other (NumpyBatchAnalyzer): The analyzer whose metrics are merged in.
+
+        Raises:
+            ValueError: If only one of the analyzers keeps exact response sizes.
+        """
+        if (self.response_sizes is None) != (other.response_sizes is None):
+            raise ValueError("Cannot merge analyzers with different response size estimators")
+
+        self.flush()
+        other.flush()
+        self.count_logs += other.count_logs
+        self.total_size_logs += other.total_size_logs
+        self.error_count += other.error_count
+        if self.response_sizes is not None:
+            self.response_sizes.merge(other.response_sizes)
+        else:
+            self.size_chunks.extend(other.size_chunks)
+        self.unique_ips.merge(other.unique_ips)
+        if other.time_series is not None:
+            if self.time_series is None:
+                self.time_series = other.time_series.create_empty()
+            self.time_series.merge(other.time_series)
+
+        for status_code in other.status_order:
+            if status_code >= len(self.status_counts) or self.status_counts[status_code] == 0:
+                self.status_order.append(status_code)
+        self.add_status_counts(other.status_counts)
+
+        lookup = np.array([LogColumnsBuilder.encode(self.resource_codes, resource) for resource in other.resource_codes],
+                          dtype=np.int64)
+        self.add_resource_counts(lookup, other.resource_counts)
+        for source, count in other.bad_line_counts.items():
+            self.bad_line_counts[source] = self.bad_line_counts.get(source, 0) + count
+
+        if other.start_time is not None and (self.start_time is None or other.start_time < self.start_time):
+            self.start_time = other.start_time
+        if other.end_time is not None and (self.end_time is None or other.end_time > self.end_time):
+            self.end_time = other.end_time
+
+    def add_status_counts(self, counts: "np.ndarray") -> None:
+        """
+        Adds a status code histogram to this one.
+
+        Args:
+            counts (np.ndarray): The counts indexed by status code.
+        """
+        if len(counts) > len(self.status_counts):
+            counts, self.status_counts = self.status_counts, counts.copy()
+        self.status_counts[:len(counts)] += counts
+
+    def add_resource_counts(self, codes: "np.ndarray", counts: "np.ndarray") -> None:
+        """
+        Adds counts to already encoded resources.
+
+        Args:
+            codes (np.ndarray): The resource codes.
+            counts (np.ndarray): The count of every code.
+        """
+        if len(self.resource_codes) > len(self.resource_counts):
+            self.resource_counts = np.concatenate(
+                (self.resource_counts, np.zeros(len(self.resource_codes) - len(self.resource_counts), dtype=np.int64)))
+        np.add.at(self.resource_counts, codes, counts)
+
+    def get_sizes(self) -> "np.ndarray":
+        """
+        Returns all exact response sizes, joining the stored chunks into one.
+
+        Returns:
+            np.ndarray: The response sizes.
+        """
+        self.flush()
+        if len(self.size_chunks) != 1:
+            self.size_chunks = [np.concatenate(self.size_chunks) if self.size_chunks else np.zeros(0, dtype=np.int64)]
+        return self.size_chunks[0]
+
+    def to_bytes(self) -> bytes:
+        """
+        Serializes the analyzer state into a compact binary form.
+
+        Returns:
+            bytes: The serialized analyzer state.
+        """
+        self.flush()
+        writer = BinaryWriter()
+        writer.write_raw(STATE_MAGIC)
+        writer.write_uint32(STATE_VERSION)
+        writer.write_uint32(self.batch_size)
+        writer.write_uint8(self.response_sizes is not None)
+        if self.response_sizes is not None:
+            QuantileEstimatorFactory.write(writer, self.response_sizes)
+        else:
+            writer.write_int_array(array("q", self.get_sizes().astype(np.int64).tobytes()))
+        UniqueCounterFactory.write(writer, self.unique_ips)
+
+        writer.write_uint64(self.count_logs)
+        writer.write_uint64(self.total_size_logs)
+        writer.write_uint64(self.error_count)
+        writer.write_datetime(self.start_time)
+        writer.write_datetime(self.end_time)
+
+        writer.write_uint64(len(self.status_order))
+        for status_code in self.status_order:
+            writer.write_int32(status_code)
+            writer.write_uint64(int(self.status_counts[status_code]))
+
+        writer.write_uint64(len(self.resource_codes))
+        for resource, code in self.resource_codes.items():
+            writer.write_str(resource)
+            writer.write_uint64(int(self.resource_counts[code]))
+
+        writer.write_uint8(self.time_series is not None)
+        if self.time_series is not None:
+            self.time_series.write(writer)
+
+        writer.write_uint64(len(self.bad_line_counts))
+        for source, count in self.bad_line_counts.items():
+            writer.write_str(source)
+            writer.write_uint64(count)
+
+        writer.write_uint8(self.resource_normalizer is not None)
+        if self.resource_normalizer is not None:
+            self.resource_normalizer.write(writer)
+
+        return writer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "NumpyBatchAnalyzer":
+        """
+        Restores an analyzer from the binary form produced by `to_bytes`.
+
+        Args:
+            data (bytes): The serialized analyzer state.
+
+        Returns:
+            NumpyBatchAnalyzer: The restored analyzer.
+
+        Raises:
+            ValueError: If the data is not a supported batch analyzer state.
+        """
+        reader = BinaryReader(data)
+        if reader.read_raw(len(STATE_MAGIC)) != STATE_MAGIC:
+            raise ValueError("Data is not a serialized batch analyzer state")
+
+        version = reader.read_uint32()
+        if version != STATE_VERSION:
+            raise ValueError(f"Unsupported batch analyzer state version: {version}")
+
+        batch_size = reader.read_uint32()
+        if reader.read_uint8():
+            response_sizes, sizes = QuantileEstimatorFactory().read(reader), None
+        else:
+            response_sizes, sizes = None, np.frombuffer(reader.read_int_array(), dtype=np.int64).copy()
+
+        analyzer = cls(response_sizes, UniqueCounterFactory().read(reader), batch_size=batch_size)
+        if sizes is not None and len(sizes):
+            analyzer.size_chunks.append(sizes)
+        analyzer.count_logs = reader.read_uint64()
+        analyzer.total_size_logs = reader.read_uint64()
+        analyzer.error_count = reader.read_uint64()
+        analyzer.start_time = reader.read_datetime()
+        analyzer.end_time = reader.read_datetime()
+
+        status_counts = np.zeros(STATUS_CODE_LIMIT, dtype=np.int64)
+        for _ in range(reader.read_uint64()):
+            status_code = reader.read_int32()
+            if status_code >= len(status_counts):
+                status_counts = np.concatenate((status_counts, np.zeros(status_code + 1 - len(status_counts), dtype=np.int64)))
+            status_counts[status_code] = reader.read_uint64()
+            analyzer.status_order.append(status_code)
+        analyzer.status_counts = status_counts
+
+        resource_counts = []
+        for _ in range(reader.read_uint64()):
+            analyzer.resource_codes[reader.read_str()] = len(resource_counts)
+            resource_counts.append(reader.read_uint64())
+        analyzer.resource_counts = np.array(resource_counts, dtype=np.int64)
+
+        if reader.read_uint8():
+            analyzer.time_series = TimeSeries.read(reader)
+
+        for _ in range(reader.read_uint64()):
+            source = reader.read_str()
+            analyzer.bad_line_counts[source] = reader.read_uint64()
+
+        if reader.read_uint8():
+            analyzer.resource_normalizer = ResourceNormalizer.read(reader)
+
+        if not reader.at_end():
+            raise ValueError("Unexpected trailing data in batch analyzer state")
+        return analyzer
+
+    def extract_resource_from_request(self, request: str) -> str:
+        """
+        Extracts the resource path from the request string.
+
+        Args:
+            request (str): The request string from which to extract the resource path.
+
+        Returns:
+            str: The extracted resource path or the entire request if parsing fails,
+                 normalized if the analyzer has a resource normalizer.
+        """
+        parts = request.split(" ")
+        resource = parts[1] if len(parts) >= 2 else request
+        return self.resource_normalizer.normalize(resource) if self.resource_normalizer is not None else resource
+
+    def calculate_95th_percentile(self) -> float:
+        """
+        Calculates the 95th percentile of response sizes.
+
+        Returns:
+            float: The 95th percentile value of response sizes.
+        """
+        return self.calculate_percentile(95)
+
+    def calculate_percentile(self, percentile: float) -> float:
+        """
+        Calculates the given percentile of response sizes.
+
+        Exact percentiles pick the same element as `ExactQuantileEstimator`,
+        found with a linear-time partition instead of a sort.
+
+        Args:
+            percentile (float): The percentile to calculate (e.g., `99`).
+
+        Returns:
+            float: The percentile value of response sizes, or 0.0 if no logs are processed.
+        """
+        self.flush()
+        if self.response_sizes is not None:
+            return self.response_sizes.quantile(percentile / 100)
+
+        sizes = self.get_sizes()
+        if len(sizes) == 0:
+            return 0.0
+        index = (int(percentile / 100 * len(sizes)) - 1) % len(sizes)
+        return int(np.partition(sizes, index)[index])
+
+    def get_count_logs(self) -> int:
+        """
+        Returns the total count of log entries processed.
+
+        Returns:
+            int: The number of log entries.
+        """
+        self.flush()
+        return self.count_logs
+
+    def get_average_size_logs(self) -> float:
+        """
+        Calculates the average response size.
+
+        Returns:
+            float: The average size of responses, or 0 if no sizes are available.
+        """
+        self.flush()
+        return 0 if self.count_logs == 0 else self.total_size_logs / self.count_logs
+
+    def get_unique_ip_count(self) -> int:
+        """
+        Returns the count of unique IP addresses.
+
+        Returns:
+            int: The number of unique IP addresses in the logs.
+        """
+        self.flush()
+        return self.unique_ips.get_count()
+
+    def get_error_rate(self) -> float:
+        """
+        Calculates the error rate as a percentage of total requests.
+
+        Returns:
+            float: The error rate in percentage, or 0.0 if no logs are processed.
+        """
+        self.flush()
+        return 0.0 if self.count_logs == 0 else (self.error_count / self.count_logs) * 100
+
+    def get_start_date(self) -> (datetime, None):
+        """
+        Returns the timestamp of the earliest log entry.
+
+        Returns:
+            datetime or None: The start time of the logs, or None if unavailable.
+        """
+        self.flush()
+        return self.start_time
+
+    def get_end_date(self) -> (datetime, None):
+        """
+        Returns the timestamp of the latest log entry.
+
+        Returns:
+            datetime or None: The end time of the logs, or None if unavailable.
+        """
+        self.flush()
+        return self.end_time
+
+    def get_requested_resources(self) -> dict:
+        """
+        Returns a dictionary of requested resources and their counts.
+
+        Returns:
+            dict: A dictionary mapping resource paths to request counts.
+        """
+        self.flush()
+        counts = self.resource_counts.tolist()
+        return {resource: counts[code] for resource, code in self.resource_codes.items()}
+
+    def get_status_code_counts(self) -> dict:
+        """
+        Returns a dictionary of HTTP status codes and their counts.
+
+        Returns:
+            dict: A dictionary mapping status codes to their occurrence counts.
+        """
+        self.flush()
+        return {status_code: int(self.status_counts[status_code]) for status_code in self.status_order}
+
+    def get_time_series(self) -> TimeSeries | None:
+        """
+        Returns the per-interval aggregation of the log entries.
+
+        Returns:
+            TimeSeries or None: The time series, or None if it isn't collected.
+        """
+        self.flush()
+        return self.time_series
+
+    def get_latency_stats(self) -> None:
+        """
+        Returns the latency aggregation of the log entries.
+
+        Log columns carry no request timings, so latencies are not aggregated.
+
+        Returns:
+            None: Always.
+        """
+        return None
+
+    def get_heavy_hitters(self) -> None:
+        """
+        Returns the counters of the most frequent field values.
+
+        Resources are counted exactly on their dictionary codes, so heavy
+        hitters are not tracked.
+
+        Returns:
+            None: Always.
+        """
+        return None
+
+    def get_bad_line_counts(self) -> dict:
+        """
+        Returns a dictionary of sources and the number of their lines that could not be parsed.
+
+        Returns:
+            dict: A dictionary mapping paths or URLs to bad line counts; sources
+                  without bad lines are left out.
+        """
+        return dict(self.bad_line_counts)
+
+    def get_status_code_name(self, status_code: int) -> str:
+        """
+        Retrieves the message associated with a specific HTTP status code.
+
+        Args:
+            status_code (int): The HTTP status code.
+
+        Returns:
+            str: The message for the status code, or "Unknown Status Code" if not found.
+        """
+        return HTTPStatus(status_code).phrase
@@ -0,0 +1,48 @@
+from abc import ABC, abstractmethod
+from typing import Iterable
+
+from src.services.serialization.binary_reader import BinaryReader
+from src.services.serialization.binary_writer import BinaryWriter
+
+
+class IQuantileEstimator(ABC):
+    """
+    Interface for mergeable estimators of value distributions.
+
+    Implementations accept integer values one by one or in bulk and answer
+    quantile queries. Estimators of the same kind and configuration can be merged, and
+    all of them can be written to and read from the binary analyzer state.
+    """
+
+    @abstractmethod
+    def add(self, value: int) -> None:
+        pass
+
+    @abstractmethod
+    def add_many(self, values: Iterable[int]) -> None:
+        pass
+
+    @abstractmethod
+    def quantile(self, q: float) -> float:
+        pass
+
+    @abstractmethod
+    def get_count(self) -> int:
+        pass
+
+    @abstractmethod
+    def merge(self, other: "IQuantileEstimator") -> None:
+        pass
+
+    @abstractmethod
+    def create_empty(self) -> "IQuantileEstimator":
+        pass
+
+    @abstractmethod
+    def write(self, writer: BinaryWriter) -> None:
+        pass
+
+    @classmethod
+    @abstractmethod
+    def read(cls, reader: BinaryReader) -> "IQuantileEstimator":
+        pass
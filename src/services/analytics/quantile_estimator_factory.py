@@ -0,0 +1,74 @@
+from src.models.quantile_mode import QuantileMode
+from src.services.analytics.ddsketch_quantile_estimator import DEFAULT_RELATIVE_ACCURACY, DDSketchQuantileEstimator
+from src.services.analytics.exact_quantile_estimator import ExactQuantileEstimator
+from src.services.analytics.quantile_estimator import IQuantileEstimator
+from src.services.serialization.binary_reader import BinaryReader
+from src.services.serialization.binary_writer import BinaryWriter
+
+
+class QuantileEstimatorFactory:
+    """
+    Factory class to create quantile estimators based on quantile modes.
+
+    The `QuantileEstimatorFactory` returns an exact estimator or a bounded-memory
+    sketch according to the specified mode, and reads and writes estimators of
+    any kind in the binary analyzer state.
+    """
+
+    ESTIMATOR_TYPES = {
+        ExactQuantileEstimator.KIND: ExactQuantileEstimator,
+        DDSketchQuantileEstimator.KIND: DDSketchQuantileEstimator,
+    }
+
+    def get_quantile_estimator(self, quantile_mode: str, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY) -> IQuantileEstimator:
+        """
+        Returns a quantile estimator for the given mode.
+
+        Args:
+            quantile_mode (str): The quantile mode, as defined in `QuantileMode`.
+            relative_accuracy (float): The relative error of the sketch mode.
+
+        Returns:
+            IQuantileEstimator: A new empty estimator.
+
+        Raises:
+            ValueError: If the quantile mode is unsupported.
+        """
+        quantile_mode = quantile_mode.lower()
+        if quantile_mode == QuantileMode.EXACT:
+            return ExactQuantileEstimator()
+        elif quantile_mode == QuantileMode.SKETCH:
+            return DDSketchQuantileEstimator(relative_accuracy)
+        else:
+            raise ValueError(f"Error: Unsupported quantile mode '{quantile_mode}'")
+
+    @staticmethod
+    def write(writer: BinaryWriter, estimator: IQuantileEstimator) -> None:
+        """
+        Writes an estimator preceded by its kind marker.
+
+        Args:
+            writer (BinaryWriter): The writer to write to.
+            estimator (IQuantileEstimator): The estimator to write.
+        """
+        writer.write_uint8(estimator.KIND)
+        estimator.write(writer)
+
+    def read(self, reader: BinaryReader) -> IQuantileEstimator:
+        """
+        Reads an estimator written by `write`.
+
+        Args:
+            reader (BinaryReader): The reader to read from.
+
+        Returns:
+            IQuantileEstimator: The restored estimator.
+
+        Raises:
+            ValueError: If the kind marker is unknown.
+        """
+        kind = reader.read_uint8()
+        estimator_type = self.ESTIMATOR_TYPES.get(kind)
+        if estimator_type is None:
+            raise ValueError(f"Unknown quantile estimator kind: {kind}")
+        return estimator_type.read(reader)
@@ -0,0 +1,130 @@
+import re
+from functools import lru_cache
+
+from src.services.serialization.binary_reader import BinaryReader
+from src.services.serialization.binary_writer import BinaryWriter
+
+DEFAULT_CACHE_SIZE = 1 << 16
+
+# Whole path segments that identify an object rather than a route.
+PLACEHOLDER_PATTERN = re.compile(
+    r"(?<=/)(?:(?P<id>\d+)"
+    r"|(?P<uuid>[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})"
+    r"|(?P<hash>[0-9a-fA-F]{16,}))(?=/|$)"
+)
+TEMPLATE_PARAMETER_PATTERN = re.compile(r"\{\w*\}|\*$")
+
+
+class ResourceNormalizer:
+    """
+    Class for collapsing requested resources into routes.
+
+    The `ResourceNormalizer` drops the query string of a resource and, unless
+    the path matches one of the route templates, replaces path segments that
+    look like object identifiers with placeholders: decimal numbers become
+    `{id}`, UUIDs `{uuid}` and hexadecimal strings of 16 or more digits
+    (hashes, object IDs) `{hash}`. A route template such as
+    `/api/users/{id}/orders` matches paths with any non-empty segment in
+    place of each `{...}` parameter, and a template ending in `*` matches any
+    remainder of the path; a matching path is reported as the template
+    itself, and templates are tried in the given order. All templates are
+    compiled into a single regex, and normalized resources are kept in an LRU
+    cache, so a repeated resource costs one dict lookup.
+    """
+
+    def __init__(self, routes: list[str] | tuple[str, ...] = (), cache_size: int = DEFAULT_CACHE_SIZE):
+        """
+        Initializes the ResourceNormalizer.
+
+        Args:
+            routes (list[str] | tuple[str, ...]): The route templates, in matching order.
+            cache_size (int): The number of normalized resources kept in the cache.
+
+        Raises:
+            ValueError: If a route template does not start with `/`.
+        """
+        self.routes = tuple(routes)
+        self.cache_size = cache_size
+        self.route_pattern = self.compile_routes(self.routes)
+        self.normalize = lru_cache(maxsize=cache_size)(self.normalize_resource)
+
+    @staticmethod
+    def compile_routes(routes: tuple[str, ...]) -> re.Pattern | None:
+        """
+        Compiles route templates into a single regex with one group per template.
+
+        Args:
+            routes (tuple[str, ...]): The route templates, in matching order.
+
+        Returns:
+            re.Pattern | None: The regex matching whole paths, or `None` if there are no templates.
+
+        Raises:
+            ValueError: If a route template does not start with `/`.
+        """
+        alternatives = []
+        for index, route in enumerate(routes):
+            if not route.startswith("/"):
+                raise ValueError(f"Route template must start with '/': {route}")
+            parts = []
+            position = 0
+            for matcher in TEMPLATE_PARAMETER_PATTERN.finditer(route):
+                parts.append(re.escape(route[position:matcher.start()]))
+                parts.append(".*" if matcher.group() == "*" else "[^/]+")
+                position = matcher.end()
+            parts.append(re.escape(route[position:]))
+            alternatives.append(f"(?P<route{index}>{''.join(parts)})")
+        return re.compile("|".join(alternatives)) if alternatives else None
+
+    def normalize_resource(self, resource: str) -> str:
+        """
+        Normalizes a resource without consulting the cache.
+
+        Args:
+            resource (str): The requested resource.
+
+        Returns:
+            str: The matching route template, or the path with identifiers replaced by placeholders.
+        """
+        path = resource.split("?", 1)[0]
+        if self.route_pattern is not None:
+            matcher = self.route_pattern.fullmatch(path)
+            if matcher is not None:
+                return self.routes[int(matcher.lastgroup[len("route"):])]
+        return PLACEHOLDER_PATTERN.sub(lambda matcher: f"{{{matcher.lastgroup}}}", path)
+
+    def write(self, writer: BinaryWriter) -> None:
+        """
+        Writes the cache size and the route templates.
+
+        Args:
+            writer (BinaryWriter): The writer to write to.
+        """
+        writer.write_uint32(self.cache_size)
+        writer.write_uint32(len(self.routes))
+        for route in self.routes:
+            writer.write_str(route)
+
+    @classmethod
+    def read(cls, reader: BinaryReader) -> "ResourceNormalizer":
+        """
+        Reads a normalizer written by `write`.
+
+        Args:
+            reader (BinaryReader): The reader to read from.
+
+        Returns:
+            ResourceNormalizer: The restored normalizer.
+        """
+        cache_size = reader.read_uint32()
+        return cls([reader.read_str() for _ in range(reader.read_uint32())], cache_size)
+
+    def __getstate__(self) -> dict:
+        # Copies sent to worker processes rebuild the cache, which cannot be pickled.
+        state = self.__dict__.copy()
+        del state["normalize"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.normalize = lru_cache(maxsize=self.cache_size)(self.normalize_resource)
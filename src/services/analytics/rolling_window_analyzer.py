@@ -0,0 +1,133 @@
+from collections import defaultdict
+from datetime import datetime
+
+from src.models.nginx_log import NginxLog
+from src.services.analytics.analyzer import Analyzer
+
+DEFAULT_WINDOW_SECONDS = 5 * 60
+BUCKETS_PER_WINDOW = 60
+
+
+class RollingWindowAnalyzer:
+    """
+    Class for keeping metrics over a sliding time window of live log entries.
+
+    The `RollingWindowAnalyzer` spreads log entries over a ring of time buckets,
+    each holding a small `Analyzer`. A bucket is reused as soon as a newer
+    bucket maps to its slot, so expiring old data costs O(1) and never rescans
+    the entries. `snapshot` merges the buckets still inside the window into a
+    regular `Analyzer` that the report converters can render. Lines that could
+    not be parsed have no timestamp, so they are counted since following
+    started rather than per window.
+    """
+
+    def __init__(self, template: Analyzer, window_seconds: int = DEFAULT_WINDOW_SECONDS,
+                 bucket_seconds: int | None = None):
+        """
+        Initializes the RollingWindowAnalyzer with empty buckets.
+
+        Args:
+            template (Analyzer): An analyzer whose configuration (quantile estimator,
+                                 unique IP counter) every bucket copies.
+            window_seconds (int): The length of the sliding window in seconds.
+            bucket_seconds (int | None): The width of one bucket in seconds. Defaults
+                                         to 1/60 of the window, but at least one second.
+
+        Raises:
+            ValueError: If the window or the bucket width is not positive.
+        """
+        bucket_seconds = bucket_seconds if bucket_seconds is not None else max(1, window_seconds // BUCKETS_PER_WINDOW)
+        if window_seconds < 1 or bucket_seconds < 1:
+            raise ValueError(f"Error: Unsupported window '{window_seconds}s' with buckets of '{bucket_seconds}s'")
+
+        self.template = template
+        self.bucket_seconds = bucket_seconds
+        self.bucket_count = -(-window_seconds // bucket_seconds)
+        self.buckets: list[Analyzer | None] = [None] * self.bucket_count
+        self.bucket_ids = [-1] * self.bucket_count
+        self.newest_bucket_id = -1
+        self.last_time: datetime | None = None
+        self.last_bucket_id = -1
+        self.bad_line_counts: dict[str, int] = defaultdict(int)
+
+    def get_required_fields(self) -> frozenset[str]:
+        """
+        Returns the log entry fields read by `update_metrics`.
+
+        Returns:
+            frozenset[str]: The names of the required `NginxLog` attributes.
+        """
+        return self.template.get_required_fields() | {"time_local"}
+
+    def update_metrics(self, log: NginxLog) -> None:
+        """
+        Adds a log entry to the bucket of its timestamp.
+
+        Entries older than the window relative to the newest entry are dropped.
+
+        Args:
+            log (NginxLog): A log entry containing data to be analyzed.
+        """
+        bucket_id = self.get_bucket_id(log.time_local)
+        if bucket_id <= self.newest_bucket_id - self.bucket_count:
+            return
+
+        slot = bucket_id % self.bucket_count
+        if self.bucket_ids[slot] != bucket_id:
+            self.buckets[slot] = self.template.create_empty()
+            self.bucket_ids[slot] = bucket_id
+        self.buckets[slot].update_metrics(log)
+
+        if bucket_id > self.newest_bucket_id:
+            self.newest_bucket_id = bucket_id
+
+    def record_bad_line(self, source: str) -> None:
+        """
+        Counts a line of a source that could not be parsed.
+
+        Args:
+            source (str): The path the line was read from.
+        """
+        self.bad_line_counts[source] += 1
+
+    def get_bucket_id(self, time: datetime) -> int:
+        """
+        Maps a timestamp to the number of its bucket since the epoch.
+
+        Consecutive entries usually share the same parsed `datetime` object, so
+        the last mapping is memoized by identity.
+
+        Args:
+            time (datetime): The timestamp of a log entry.
+
+        Returns:
+            int: The bucket number.
+        """
+        if time is not self.last_time:
+            self.last_time = time
+            self.last_bucket_id = int(time.timestamp()) // self.bucket_seconds
+        return self.last_bucket_id
+
+    def snapshot(self, now: datetime | None = None) -> Analyzer:
+        """
+        Merges the buckets inside the window into a single analyzer.
+
+        The window covers the bucket of `now` and the buckets before it, so its
+        effective length lies between the window size minus one bucket and the
+        window size.
+
+        Args:
+            now (datetime | None): The end of the window. Defaults to the time
+                                   of the newest log entry.
+
+        Returns:
+            Analyzer: A new analyzer holding the metrics of the window.
+        """
+        current = self.newest_bucket_id if now is None else int(now.timestamp()) // self.bucket_seconds
+        live = [slot for slot, bucket_id in enumerate(self.bucket_ids) if current - self.bucket_count < bucket_id <= current]
+
+        result = self.template.create_empty()
+        for slot in sorted(live, key=self.bucket_ids.__getitem__):
+            result.merge(self.buckets[slot])
+        result.bad_line_counts.update(self.bad_line_counts)
+        return result
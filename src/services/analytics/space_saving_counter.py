@@ -0,0 +1,204 @@
+import heapq
+from operator import itemgetter
+
+from src.models.heavy_hitter import HeavyHitter
+from src.services.serialization.binary_reader import BinaryReader
+from src.services.serialization.binary_writer import BinaryWriter
+
+
+class SpaceSavingCounter:
+    """
+    Class for finding the most frequent values with the Space-Saving algorithm.
+
+    The `SpaceSavingCounter` keeps at most `capacity` counters. A value that
+    is already tracked has its counter incremented; an untracked value
+    replaces the value with the smallest counter and inherits that counter as
+    its possible overestimation. Every count is thus an upper bound that
+    exceeds the true count by at most `total / capacity`, and any value
+    occurring more often than that is guaranteed to be tracked. Counts stay
+    exact until the counter is full.
+
+    The smallest counter is found through a lazy min-heap holding one entry
+    per tracked value: increments leave the entries stale, and stale entries
+    are only refreshed when they reach the top during an eviction. Counters
+    with the same capacity merge by adding their counts, where a value
+    missing from a full counter is assumed to have its smallest count.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Initializes an empty SpaceSavingCounter.
+
+        Args:
+            capacity (int): The maximum number of tracked values.
+
+        Raises:
+            ValueError: If the capacity is not positive.
+        """
+        if capacity < 1:
+            raise ValueError(f"Capacity must be positive: {capacity}")
+
+        self.capacity = capacity
+        self.total = 0
+        self.counts: dict[str, int] = {}
+        self.errors: dict[str, int] = {}
+        self.heap: list[tuple[int, str]] = []
+
+    def add(self, value: str, count: int = 1) -> None:
+        """
+        Records occurrences of a value.
+
+        Args:
+            value (str): The value to record.
+            count (int): The number of occurrences.
+        """
+        self.total += count
+        counts = self.counts
+        current = counts.get(value)
+        if current is not None:
+            counts[value] = current + count
+            return
+
+        if len(counts) < self.capacity:
+            counts[value] = count
+            self.errors[value] = 0
+            heapq.heappush(self.heap, (count, value))
+            return
+
+        minimum, evicted = self.pop_minimum()
+        del counts[evicted]
+        del self.errors[evicted]
+        counts[value] = minimum + count
+        self.errors[value] = minimum
+        heapq.heappush(self.heap, (minimum + count, value))
+
+    def pop_minimum(self) -> tuple[int, str]:
+        """
+        Removes the heap entry of the value with the smallest count.
+
+        Returns:
+            tuple[int, str]: The smallest count and its value.
+        """
+        heap = self.heap
+        counts = self.counts
+        while True:
+            count, value = heap[0]
+            current = counts[value]
+            if current == count:
+                heapq.heappop(heap)
+                return count, value
+            heapq.heapreplace(heap, (current, value))
+
+    def get_minimum(self) -> int:
+        """
+        Returns the count assumed for values the counter does not track.
+
+        Returns:
+            int: The smallest count if the counter is full, otherwise 0.
+        """
+        return min(self.counts.values()) if len(self.counts) >= self.capacity else 0
+
+    def top(self, limit: int) -> list[HeavyHitter]:
+        """
+        Returns the values with the highest counts.
+
+        Args:
+            limit (int): The maximum number of values returned.
+
+        Returns:
+            list[HeavyHitter]: The values, most frequent first; ties keep the
+                               values tracked first.
+        """
+        return [HeavyHitter(value, count, self.errors[value])
+                for value, count in heapq.nlargest(limit, self.counts.items(), key=itemgetter(1))]
+
+    def get_total(self) -> int:
+        """
+        Returns the number of recorded occurrences.
+
+        Returns:
+            int: The sum of all recorded counts.
+        """
+        return self.total
+
+    def merge(self, other: "SpaceSavingCounter") -> None:
+        """
+        Merges the counters of another SpaceSavingCounter with the same capacity.
+
+        Args:
+            other (SpaceSavingCounter): The counter to merge in.
+
+        Raises:
+            ValueError: If the capacities differ.
+        """
+        if other.capacity != self.capacity:
+            raise ValueError("Cannot merge Space-Saving counters with different capacity")
+
+        minimum = self.get_minimum()
+        other_minimum = other.get_minimum()
+        counts = {}
+        errors = {}
+        for value in [*self.counts, *(value for value in other.counts if value not in self.counts)]:
+            counts[value] = self.counts.get(value, minimum) + other.counts.get(value, other_minimum)
+            errors[value] = self.errors.get(value, minimum) + other.errors.get(value, other_minimum)
+
+        if len(counts) > self.capacity:
+            kept = {value for value, _ in heapq.nlargest(self.capacity, counts.items(), key=itemgetter(1))}
+            counts = {value: count for value, count in counts.items() if value in kept}
+            errors = {value: errors[value] for value in counts}
+
+        self.total += other.total
+        self.counts = counts
+        self.errors = errors
+        self.heap = [(count, value) for value, count in counts.items()]
+        heapq.heapify(self.heap)
+
+    def create_empty(self) -> "SpaceSavingCounter":
+        """
+        Creates an empty counter with the same capacity.
+
+        Returns:
+            SpaceSavingCounter: A new empty counter.
+        """
+        return SpaceSavingCounter(self.capacity)
+
+    def write(self, writer: BinaryWriter) -> None:
+        """
+        Writes the capacity, the total and the tracked values.
+
+        Args:
+            writer (BinaryWriter): The writer to write to.
+        """
+        writer.write_uint32(self.capacity)
+        writer.write_uint64(self.total)
+        writer.write_uint64(len(self.counts))
+        for value, count in self.counts.items():
+            writer.write_str(value)
+            writer.write_uint64(count)
+            writer.write_uint64(self.errors[value])
+
+    @classmethod
+    def read(cls, reader: BinaryReader) -> "SpaceSavingCounter":
+        """
+        Reads a counter written by `write`.
+
+        Args:
+            reader (BinaryReader): The reader to read from.
+
+        Returns:
+            SpaceSavingCounter: The restored counter.
+
+        Raises:
+            ValueError: If the counter tracks more values than its capacity.
+        """
+        counter = cls(reader.read_uint32())
+        counter.total = reader.read_uint64()
+        for _ in range(reader.read_uint64()):
+            value = reader.read_str()
+            counter.counts[value] = reader.read_uint64()
+            counter.errors[value] = reader.read_uint64()
+        if len(counter.counts) > counter.capacity:
+            raise ValueError("Space-Saving counter tracks more values than its capacity")
+        counter.heap = [(count, value) for value, count in counter.counts.items()]
+        heapq.heapify(counter.heap)
+        return counter
@@ -0,0 +1,217 @@
+from array import array
+from datetime import datetime, timezone
+from typing import Iterable
+
+from src.models.time_bucket import TimeBucket
+from src.models.time_interval import TimeInterval
+from src.services.analytics.ddsketch_quantile_estimator import DEFAULT_RELATIVE_ACCURACY, DDSketchQuantileEstimator
+from src.services.serialization.binary_reader import BinaryReader
+from src.services.serialization.binary_writer import BinaryWriter
+
+BUCKET_SECONDS = {
+    TimeBucket.SECOND: 1,
+    TimeBucket.MINUTE: 60,
+    TimeBucket.HOUR: 60 * 60,
+}
+
+
+class TimeSeries:
+    """
+    Class for pre-aggregating log entries into fixed-width time intervals.
+
+    The `TimeSeries` class keys every log entry by its epoch second truncated
+    to the interval width and keeps, per interval, the request count, the error
+    count, the response byte sum and a DDSketch of response sizes. Counters are
+    stored in parallel integer arrays indexed through a dictionary of interval
+    numbers, so millions of entries only produce one array slot per interval.
+    Series with the same width and sketch accuracy merge by adding intervals.
+    """
+
+    def __init__(self, bucket_seconds: int, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY):
+        """
+        Initializes an empty TimeSeries.
+
+        Args:
+            bucket_seconds (int): The width of an interval in seconds.
+            relative_accuracy (float): The relative accuracy of the per-interval size sketches.
+
+        Raises:
+            ValueError: If the interval width is not positive.
+        """
+        if bucket_seconds < 1:
+            raise ValueError(f"Interval width must be positive: {bucket_seconds}")
+
+        self.bucket_seconds = bucket_seconds
+        self.relative_accuracy = relative_accuracy
+        self.bucket_ids = array("q")
+        self.counts = array("q")
+        self.error_counts = array("q")
+        self.byte_sums = array("q")
+        self.sketches: list[DDSketchQuantileEstimator] = []
+        self.indexes: dict[int, int] = {}
+        self.last_time: datetime | None = None
+        self.last_index = -1
+
+    @classmethod
+    def for_bucket(cls, time_bucket: str, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY) -> "TimeSeries":
+        """
+        Creates an empty series for a named interval width.
+
+        Args:
+            time_bucket (str): The interval width, one of the `TimeBucket` values.
+            relative_accuracy (float): The relative accuracy of the per-interval size sketches.
+
+        Returns:
+            TimeSeries: The new series.
+
+        Raises:
+            ValueError: If the interval width is not supported.
+        """
+        try:
+            return cls(BUCKET_SECONDS[TimeBucket(time_bucket)], relative_accuracy)
+        except ValueError:
+            raise ValueError(f"Error: Unsupported time bucket '{time_bucket}'")
+
+    def add(self, time: datetime, size: int, is_error: bool) -> None:
+        """
+        Records a single log entry.
+
+        Consecutive entries usually share the same parsed `datetime` object, so
+        the interval of the last timestamp is memoized by identity.
+
+        Args:
+            time (datetime): The timestamp of the log entry.
+            size (int): The response size.
+            is_error (bool): Whether the response status is an error.
+        """
+        if time is not self.last_time:
+            self.last_time = time
+            self.last_index = self.get_index(int(time.timestamp()) // self.bucket_seconds)
+
+        index = self.last_index
+        self.counts[index] += 1
+        self.byte_sums[index] += size
+        if is_error:
+            self.error_counts[index] += 1
+        self.sketches[index].add(size)
+
+    def add_interval(self, bucket_id: int, count: int, error_count: int, byte_sum: int, sizes: Iterable[int]) -> None:
+        """
+        Records the pre-aggregated entries of one interval.
+
+        Args:
+            bucket_id (int): The interval number since the epoch.
+            count (int): The number of entries.
+            error_count (int): The number of entries with an error status.
+            byte_sum (int): The sum of the response sizes.
+            sizes (Iterable[int]): The individual response sizes.
+        """
+        index = self.get_index(bucket_id)
+        self.counts[index] += count
+        self.error_counts[index] += error_count
+        self.byte_sums[index] += byte_sum
+        self.sketches[index].add_many(sizes)
+
+    def get_index(self, bucket_id: int) -> int:
+        """
+        Returns the array slot of an interval, allocating it if needed.
+
+        Args:
+            bucket_id (int): The interval number since the epoch.
+
+        Returns:
+            int: The index of the interval in the arrays.
+        """
+        index = self.indexes.get(bucket_id)
+        if index is None:
+            index = len(self.bucket_ids)
+            self.indexes[bucket_id] = index
+            self.bucket_ids.append(bucket_id)
+            self.counts.append(0)
+            self.error_counts.append(0)
+            self.byte_sums.append(0)
+            self.sketches.append(DDSketchQuantileEstimator(self.relative_accuracy))
+        return index
+
+    def merge(self, other: "TimeSeries") -> None:
+        """
+        Adds the intervals of another series with the same configuration.
+
+        Args:
+            other (TimeSeries): The series to merge in.
+
+        Raises:
+            ValueError: If the interval widths or sketch accuracies differ.
+        """
+        if other.bucket_seconds != self.bucket_seconds or other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge time series with different configuration")
+
+        for other_index, bucket_id in enumerate(other.bucket_ids):
+            index = self.get_index(bucket_id)
+            self.counts[index] += other.counts[other_index]
+            self.error_counts[index] += other.error_counts[other_index]
+            self.byte_sums[index] += other.byte_sums[other_index]
+            self.sketches[index].merge(other.sketches[other_index])
+
+    def create_empty(self) -> "TimeSeries":
+        """
+        Creates an empty series with the same configuration.
+
+        Returns:
+            TimeSeries: A new empty series.
+        """
+        return TimeSeries(self.bucket_seconds, self.relative_accuracy)
+
+    def get_intervals(self) -> list[TimeInterval]:
+        """
+        Returns the metrics of every non-empty interval in chronological order.
+
+        Returns:
+            list[TimeInterval]: The intervals, with their start in UTC.
+        """
+        return [
+            TimeInterval(
+                start=datetime.fromtimestamp(self.bucket_ids[index] * self.bucket_seconds, timezone.utc),
+                count=self.counts[index],
+                error_count=self.error_counts[index],
+                byte_sum=self.byte_sums[index],
+                p95=self.sketches[index].quantile(0.95),
+            )
+            for index in sorted(range(len(self.bucket_ids)), key=self.bucket_ids.__getitem__)
+        ]
+
+    def write(self, writer: BinaryWriter) -> None:
+        """
+        Writes the series configuration and intervals.
+
+        Args:
+            writer (BinaryWriter): The writer to write to.
+        """
+        writer.write_uint32(self.bucket_seconds)
+        writer.write_float64(self.relative_accuracy)
+        writer.write_int_array(self.bucket_ids)
+        writer.write_int_array(self.counts)
+        writer.write_int_array(self.error_counts)
+        writer.write_int_array(self.byte_sums)
+        for sketch in self.sketches:
+            sketch.write(writer)
+
+    @classmethod
+    def read(cls, reader: BinaryReader) -> "TimeSeries":
+        """
+        Reads a series written by `write`.
+
+        Args:
+            reader (BinaryReader): The reader to read from.
+
+        Returns:
+            TimeSeries: The restored series.
+        """
+        series = cls(reader.read_uint32(), reader.read_float64())
+        series.bucket_ids = reader.read_int_array()
+        series.counts = reader.read_int_array()
+        series.error_counts = reader.read_int_array()
+        series.byte_sums = reader.read_int_array()
+        series.sketches = [DDSketchQuantileEstimator.read(reader) for _ in series.bucket_ids]
+        series.indexes = {bucket_id: index for index, bucket_id in enumerate(series.bucket_ids)}
+        return series
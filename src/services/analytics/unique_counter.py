@@ -0,0 +1,40 @@
+from abc import ABC, abstractmethod
+
+from src.services.serialization.binary_reader import BinaryReader
+from src.services.serialization.binary_writer import BinaryWriter
+
+
+class IUniqueCounter(ABC):
+    """
+    Interface for mergeable counters of distinct values.
+
+    Implementations accept values one by one and report how many distinct
+    values were seen. Counters of the same kind and configuration can be
+    merged, and all of them can be written to and read from the binary
+    analyzer state.
+    """
+
+    @abstractmethod
+    def add(self, value: str) -> None:
+        pass
+
+    @abstractmethod
+    def get_count(self) -> int:
+        pass
+
+    @abstractmethod
+    def merge(self, other: "IUniqueCounter") -> None:
+        pass
+
+    @abstractmethod
+    def create_empty(self) -> "IUniqueCounter":
+        pass
+
+    @abstractmethod
+    def write(self, writer: BinaryWriter) -> None:
+        pass
+
+    @classmethod
+    @abstractmethod
+    def read(cls, reader: BinaryReader) -> "IUniqueCounter":
+        pass
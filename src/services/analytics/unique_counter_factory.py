@@ -0,0 +1,74 @@
+from src.models.unique_ip_mode import UniqueIpMode
+from src.services.analytics.exact_unique_counter import ExactUniqueCounter
+from src.services.analytics.hyperloglog_unique_counter import DEFAULT_PRECISION, HyperLogLogUniqueCounter
+from src.services.analytics.unique_counter import IUniqueCounter
+from src.services.serialization.binary_reader import BinaryReader
+from src.services.serialization.binary_writer import BinaryWriter
+
+
+class UniqueCounterFactory:
+    """
+    Factory class to create unique value counters based on unique IP modes.
+
+    The `UniqueCounterFactory` returns an exact counter or a HyperLogLog
+    estimate according to the specified mode, and reads and writes counters
+    of any kind in the binary analyzer state.
+    """
+
+    COUNTER_TYPES = {
+        ExactUniqueCounter.KIND: ExactUniqueCounter,
+        HyperLogLogUniqueCounter.KIND: HyperLogLogUniqueCounter,
+    }
+
+    def get_unique_counter(self, unique_ip_mode: str, precision: int = DEFAULT_PRECISION) -> IUniqueCounter:
+        """
+        Returns a unique value counter for the given mode.
+
+        Args:
+            unique_ip_mode (str): The counting mode, as defined in `UniqueIpMode`.
+            precision (int): The HyperLogLog precision used by the `hll` mode.
+
+        Returns:
+            IUniqueCounter: A new empty counter.
+
+        Raises:
+            ValueError: If the mode is unsupported or the precision is out of range.
+        """
+        unique_ip_mode = unique_ip_mode.lower()
+        if unique_ip_mode == UniqueIpMode.EXACT:
+            return ExactUniqueCounter()
+        elif unique_ip_mode == UniqueIpMode.HLL:
+            return HyperLogLogUniqueCounter(precision)
+        else:
+            raise ValueError(f"Error: Unsupported unique IP mode '{unique_ip_mode}'")
+
+    @staticmethod
+    def write(writer: BinaryWriter, counter: IUniqueCounter) -> None:
+        """
+        Writes a counter preceded by its kind marker.
+
+        Args:
+            writer (BinaryWriter): The writer to write to.
+            counter (IUniqueCounter): The counter to write.
+        """
+        writer.write_uint8(counter.KIND)
+        counter.write(writer)
+
+    def read(self, reader: BinaryReader) -> IUniqueCounter:
+        """
+        Reads a counter written by `write`.
+
+        Args:
+            reader (BinaryReader): The reader to read from.
+
+        Returns:
+            IUniqueCounter: The restored counter.
+
+        Raises:
+            ValueError: If the kind marker is unknown.
+        """
+        kind = reader.read_uint8()
+        counter_type = self.COUNTER_TYPES.get(kind)
+        if counter_type is None:
+            raise ValueError(f"Unknown unique counter kind: {kind}")
+        return counter_type.read(reader)
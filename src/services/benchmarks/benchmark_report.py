@@ -0,0 +1,94 @@
+import json
+import platform
+from dataclasses import asdict
+from pathlib import Path
+
+from src.models.benchmark_result import BenchmarkResult
+from src.models.log_profile import LogProfile
+
+REPORT_VERSION = 1
+
+
+class BenchmarkReport:
+    """
+    Class for rendering, saving and loading benchmark results.
+
+    The `BenchmarkReport` renders results as a markdown table, optionally next
+    to a baseline so a regression shows up as a negative change in throughput.
+    Results are saved as JSON together with the log profile and the Python
+    version, so a saved run can serve as the baseline of a later one.
+    """
+
+    def render(self, results: list[BenchmarkResult], baseline: dict[str, BenchmarkResult] | None = None) -> str:
+        """
+        Renders results as a markdown table.
+
+        Args:
+            results (list[BenchmarkResult]): The results to render.
+            baseline (dict[str, BenchmarkResult] | None): Earlier results by benchmark
+                name to compare with, or `None` to render the results alone.
+
+        Returns:
+            str: The markdown table.
+        """
+        header = "| Benchmark | Lines | Best time, s | Lines/s | Peak RSS, MiB |"
+        separator = "|:-|-:|-:|-:|-:|"
+        if baseline is not None:
+            header += " Baseline lines/s | Change |"
+            separator += "-:|-:|"
+
+        rows = [header, separator]
+        for result in results:
+            peak_rss = f"{result.peak_rss / (1 << 20):.1f}" if result.peak_rss is not None else "-"
+            row = (f"| {result.name} | {result.lines} | {result.seconds:.3f} | {result.lines_per_second:,.0f} "
+                   f"| {peak_rss} |")
+            if baseline is not None:
+                previous = baseline.get(result.name)
+                if previous is not None and previous.lines_per_second > 0:
+                    change = (result.lines_per_second / previous.lines_per_second - 1) * 100
+                    row += f" {previous.lines_per_second:,.0f} | {change:+.1f}% |"
+                else:
+                    row += " - | - |"
+            rows.append(row)
+        return "\n".join(rows) + "\n"
+
+    def save(self, file_path: str, profile: LogProfile, results: list[BenchmarkResult]) -> None:
+        """
+        Writes results as JSON.
+
+        Args:
+            file_path (str): The path of the file to write.
+            profile (LogProfile): The profile of the benchmarked log.
+            results (list[BenchmarkResult]): The results to write.
+        """
+        profile_json = asdict(profile)
+        profile_json["start"] = profile.start.isoformat()
+        profile_json["status_mix"] = {str(status): weight for status, weight in profile.status_mix.items()}
+        data = {
+            "version": REPORT_VERSION,
+            "python": platform.python_version(),
+            "profile": profile_json,
+            "results": [asdict(result) for result in results],
+        }
+        Path(file_path).write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+
+    def load(self, file_path: str) -> dict[str, BenchmarkResult]:
+        """
+        Reads results written by `save`.
+
+        Args:
+            file_path (str): The path of the file to read.
+
+        Returns:
+            dict[str, BenchmarkResult]: The results by benchmark name.
+
+        Raises:
+            ValueError: If the file is not a supported benchmark report.
+        """
+        try:
+            data = json.loads(Path(file_path).read_text(encoding="utf-8"))
+            if data["version"] != REPORT_VERSION:
+                raise ValueError(f"Unsupported benchmark report version: {data['version']}")
+            return {result["name"]: BenchmarkResult(**result) for result in data["results"]}
+        except (KeyError, TypeError, json.JSONDecodeError) as error:
+            raise ValueError(f"Not a benchmark report: {file_path}") from error
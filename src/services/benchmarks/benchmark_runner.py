@@ -0,0 +1,212 @@
+import multiprocessing
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable
+
+from src.facades.log_analyzer_facade import LogAnalyzerFacade
+from src.models.analysis_options import AnalysisOptions
+from src.models.analyzer_engine import AnalyzerEngine
+from src.models.benchmark_result import BenchmarkResult
+from src.parsers.nginx_log_parser import NginxLogParser
+from src.services.analytics.analyzer import REQUIRED_FIELDS, Analyzer
+from src.services.readers.file_log_reader import FileLogReader
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+DEFAULT_REPEAT = 3
+
+
+def prepare_parser(file_path: str, fields: frozenset[str] | None = None) -> Callable[[], None]:
+    """
+    Prepares a benchmark of `NginxLogParser.parse` over lines already in memory.
+
+    Args:
+        file_path (str): The path to the log file.
+        fields (frozenset[str] | None): The fields the parser converts, or `None` for all of them.
+
+    Returns:
+        Callable[[], None]: The measured function.
+    """
+    lines = Path(file_path).read_bytes().splitlines()
+    parser = NginxLogParser(fields)
+
+    def run():
+        parse = parser.parse
+        for line in lines:
+            parse(line)
+
+    return run
+
+
+def prepare_reader(file_path: str) -> Callable[[], None]:
+    """
+    Prepares a benchmark of `FileLogReader.read_logs` feeding a fresh `Analyzer`.
+
+    Args:
+        file_path (str): The path to the log file.
+
+    Returns:
+        Callable[[], None]: The measured function.
+    """
+    return lambda: FileLogReader(Analyzer(), REQUIRED_FIELDS).read_logs(file_path, None, None, None, None)
+
+
+def prepare_analyzer(file_path: str) -> Callable[[], None]:
+    """
+    Prepares a benchmark of `Analyzer.update_metrics` over entries already parsed.
+
+    Args:
+        file_path (str): The path to the log file.
+
+    Returns:
+        Callable[[], None]: The measured function.
+    """
+    parser = NginxLogParser(REQUIRED_FIELDS)
+    logs = [parser.parse(line) for line in Path(file_path).read_bytes().splitlines()]
+
+    def run():
+        update_metrics = Analyzer().update_metrics
+        for log in logs:
+            update_metrics(log)
+
+    return run
+
+
+def prepare_facade(file_path: str, engine: str = AnalyzerEngine.PYTHON) -> Callable[[], None]:
+    """
+    Prepares a benchmark of a full `LogAnalyzerFacade.get_result_analyze` run.
+
+    Args:
+        file_path (str): The path to the log file.
+        engine (str): The analyzer engine of the run.
+
+    Returns:
+        Callable[[], None]: The measured function.
+    """
+    facade = LogAnalyzerFacade(None, None)
+    return lambda: facade.get_result_analyze([file_path], None, None, "markdown", None, None,
+                                             AnalysisOptions(engine=engine))
+
+
+BENCHMARKS: dict[str, Callable[[str], Callable[[], None]]] = {
+    "parser": prepare_parser,
+    "parser-projected": lambda file_path: prepare_parser(file_path, REQUIRED_FIELDS),
+    "reader": prepare_reader,
+    "analyzer": prepare_analyzer,
+    "facade": prepare_facade,
+    "facade-numpy": lambda file_path: prepare_facade(file_path, AnalyzerEngine.NUMPY),
+}
+
+
+def run_benchmark(name: str, file_path: str, lines: int, repeat: int) -> BenchmarkResult:
+    """
+    Runs one benchmark in the current process.
+
+    This is a module-level function so that it can be pickled and executed
+    in a fresh worker process.
+
+    Args:
+        name (str): The name of the benchmark, a key of `BENCHMARKS`.
+        file_path (str): The path to the log file.
+        lines (int): The number of lines in the log file.
+        repeat (int): How many times the measured function is run.
+
+    Returns:
+        BenchmarkResult: The best time over the repetitions and the peak RSS.
+    """
+    measured = BENCHMARKS[name](file_path)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        measured()
+        best = min(best, time.perf_counter() - start)
+    return BenchmarkResult(name, lines, best, lines / best if best > 0 else 0.0, BenchmarkRunner.get_peak_rss())
+
+
+class BenchmarkRunner:
+    """
+    Class for measuring the throughput of the log analysis stages.
+
+    The `BenchmarkRunner` times every benchmark several times over the same
+    log file and keeps the best run. By default each benchmark runs in a fresh
+    worker process, so the reported peak resident set size belongs to that
+    benchmark alone and caches warmed by one benchmark don't help the next.
+    """
+
+    def __init__(self, repeat: int = DEFAULT_REPEAT, isolate: bool = True):
+        """
+        Initializes the BenchmarkRunner.
+
+        Args:
+            repeat (int): How many times each benchmark is run.
+            isolate (bool): Whether each benchmark runs in its own worker process.
+
+        Raises:
+            ValueError: If the repeat count is not positive.
+        """
+        if repeat < 1:
+            raise ValueError(f"Repeat count must be positive: {repeat}")
+        self.repeat = repeat
+        self.isolate = isolate
+
+    @staticmethod
+    def get_available_benchmarks() -> list[str]:
+        """
+        Lists the benchmarks that can run in this environment.
+
+        Returns:
+            list[str]: The benchmark names; NumPy ones only if `numpy` is installed.
+        """
+        return [name for name in BENCHMARKS if np is not None or not name.endswith("-numpy")]
+
+    def run(self, names: list[str], file_path: str, lines: int) -> list[BenchmarkResult]:
+        """
+        Runs several benchmarks over a log file.
+
+        Args:
+            names (list[str]): The names of the benchmarks to run, in order.
+            file_path (str): The path to the log file.
+            lines (int): The number of lines in the log file.
+
+        Returns:
+            list[BenchmarkResult]: The results, in the order of `names`.
+
+        Raises:
+            ValueError: If a benchmark name is not supported.
+        """
+        for name in names:
+            if name not in self.get_available_benchmarks():
+                raise ValueError(f"Error: Unsupported benchmark '{name}'")
+
+        if not self.isolate:
+            return [run_benchmark(name, file_path, lines, self.repeat) for name in names]
+
+        results = []
+        for name in names:
+            with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+                results.append(executor.submit(run_benchmark, name, file_path, lines, self.repeat).result())
+        return results
+
+    @staticmethod
+    def get_peak_rss() -> int | None:
+        """
+        Returns the peak resident set size of the current process.
+
+        Returns:
+            int | None: The peak RSS in bytes, or `None` if the platform doesn't report it.
+        """
+        if resource is None:
+            return None
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports kilobytes, macOS reports bytes.
+        return peak_rss if sys.platform == "darwin" else peak_rss * 1024
@@ -0,0 +1,113 @@
+import random
+from datetime import timedelta
+from itertools import accumulate
+from pathlib import Path
+
+from src.models.log_profile import LogProfile
+
+BLOCK_LINES = 10_000
+
+METHODS = ("GET", "GET", "GET", "GET", "POST", "HEAD")
+USER_AGENTS = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15",
+    "Mozilla/5.0 (X11; Linux x86_64; rv:120.0) Gecko/20100101 Firefox/120.0",
+    "curl/8.4.0",
+    "Googlebot/2.1 (+http://www.google.com/bot.html)",
+)
+RESOURCE_TEMPLATES = (
+    "/api/v1/items/{}",
+    "/static/js/bundle-{}.js",
+    "/products/{}?page=2",
+    "/images/{}.png",
+)
+
+
+class SyntheticLogGenerator:
+    """
+    Class for generating reproducible NGINX access logs in the combined format.
+
+    The `SyntheticLogGenerator` draws client addresses uniformly from
+    `ip_count` addresses, resources from a Zipf distribution over
+    `resource_count` paths, statuses from the weighted status mix and response
+    sizes from an exponential distribution. Timestamps grow evenly over the
+    time span. All draws come from a generator seeded by the profile, so the
+    same profile always yields the same bytes.
+    """
+
+    def __init__(self, profile: LogProfile):
+        """
+        Initializes the SyntheticLogGenerator.
+
+        Args:
+            profile (LogProfile): The shape of the generated log.
+
+        Raises:
+            ValueError: If the profile has no addresses, resources or statuses,
+                        or a negative line count or time span.
+        """
+        if profile.lines < 0 or profile.time_span < 0:
+            raise ValueError(f"Unsupported log profile: {profile}")
+        if profile.ip_count < 1 or profile.resource_count < 1 or not profile.status_mix:
+            raise ValueError(f"Unsupported log profile: {profile}")
+
+        self.profile = profile
+        self.resources = [
+            RESOURCE_TEMPLATES[rank % len(RESOURCE_TEMPLATES)].format(rank) for rank in range(profile.resource_count)
+        ]
+        self.resource_weights = list(accumulate(1 / (rank + 1) ** profile.resource_skew
+                                                for rank in range(profile.resource_count)))
+        self.statuses = list(profile.status_mix)
+        self.status_weights = list(accumulate(profile.status_mix.values()))
+
+    def iter_lines(self):
+        """
+        Yields the lines of the log.
+
+        Yields:
+            bytes: The log lines, each terminated by a newline.
+        """
+        profile = self.profile
+        rng = random.Random(profile.seed)
+        last_second = None
+        time_local = ""
+
+        for block_start in range(0, profile.lines, BLOCK_LINES):
+            count = min(BLOCK_LINES, profile.lines - block_start)
+            resources = rng.choices(self.resources, cum_weights=self.resource_weights, k=count)
+            statuses = rng.choices(self.statuses, cum_weights=self.status_weights, k=count)
+
+            for offset in range(count):
+                index = block_start + offset
+                second = profile.time_span * index // profile.lines
+                if second != last_second:
+                    last_second = second
+                    time_local = (profile.start + timedelta(seconds=second)).strftime("%d/%b/%Y:%H:%M:%S %z")
+
+                address = rng.randrange(profile.ip_count)
+                yield (
+                    f"10.{address >> 16 & 255}.{address >> 8 & 255}.{address & 255} - - [{time_local}] "
+                    f"\"{rng.choice(METHODS)} {resources[offset]} HTTP/1.1\" {statuses[offset]} "
+                    f"{int(rng.expovariate(1 / 2048))} \"-\" \"{rng.choice(USER_AGENTS)}\"\n"
+                ).encode("utf-8")
+
+    def write(self, file_path: str) -> int:
+        """
+        Writes the log to a file.
+
+        Args:
+            file_path (str): The path of the file to write.
+
+        Returns:
+            int: The size of the written file in bytes.
+        """
+        size = 0
+        with Path(file_path).open("wb") as writer:
+            lines = []
+            for line in self.iter_lines():
+                lines.append(line)
+                if len(lines) == BLOCK_LINES:
+                    size += writer.write(b"".join(lines))
+                    lines = []
+            size += writer.write(b"".join(lines))
+        return size
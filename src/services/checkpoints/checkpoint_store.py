@@ -0,0 +1,83 @@
+import sqlite3
+
+from src.models.checkpoint import Checkpoint
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    path TEXT NOT NULL,
+    settings TEXT NOT NULL,
+    device INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    offset INTEGER NOT NULL,
+    head_digest BLOB NOT NULL,
+    state BLOB NOT NULL,
+    PRIMARY KEY (path, settings)
+)
+"""
+
+COLUMNS = "path, settings, device, inode, size, mtime_ns, offset, head_digest, state"
+
+
+class CheckpointStore:
+    """
+    Class for persisting per-file analysis checkpoints in a sqlite database.
+
+    Checkpoints are keyed by the file path and by a string describing the
+    analysis settings, because an analyzer state built with one filter or
+    time range cannot be continued with another.
+    """
+
+    def __init__(self, database_path: str):
+        """
+        Opens the checkpoint database, creating it if needed.
+
+        Args:
+            database_path (str): The path of the sqlite database file.
+        """
+        self.connection = sqlite3.connect(database_path)
+        with self.connection:
+            self.connection.execute(SCHEMA)
+
+    def load(self, path: str, settings: str) -> Checkpoint | None:
+        """
+        Looks up the checkpoint of a file.
+
+        Args:
+            path (str): The absolute path of the log file.
+            settings (str): The description of the analysis settings.
+
+        Returns:
+            Checkpoint | None: The stored checkpoint, or `None` if there is none.
+        """
+        row = self.connection.execute(
+            f"SELECT {COLUMNS} FROM checkpoints WHERE path = ? AND settings = ?", (path, settings)
+        ).fetchone()
+        return Checkpoint(*row) if row is not None else None
+
+    def save(self, checkpoint: Checkpoint) -> None:
+        """
+        Stores a checkpoint, replacing the previous one for the same file and settings.
+
+        Args:
+            checkpoint (Checkpoint): The checkpoint to store.
+        """
+        with self.connection:
+            self.connection.execute(
+                f"INSERT OR REPLACE INTO checkpoints ({COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (checkpoint.path, checkpoint.settings, checkpoint.device, checkpoint.inode, checkpoint.size,
+                 checkpoint.mtime_ns, checkpoint.offset, checkpoint.head_digest, checkpoint.state)
+            )
+
+    def close(self) -> None:
+        """
+        Closes the database connection.
+        """
+        self.connection.close()
+
+    def __enter__(self) -> "CheckpointStore":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -0,0 +1,140 @@
+from array import array
+from datetime import datetime
+
+from src.models.log_columns import LogColumns
+from src.models.nginx_log import NginxLog
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+COLUMN_FIELDS = frozenset({"remote_addr", "time_local", "request", "status", "body_bytes_sent", "http_user_agent"})
+
+
+class LogColumnsBuilder:
+    """
+    Class for collecting parsed log entries into `LogColumns`.
+
+    The `LogColumnsBuilder` appends every field to a compact `array` and
+    dictionary-encodes the string fields on the fly, so memory grows with the
+    number of distinct strings rather than with the number of entries. The
+    timestamp conversion is memoized by identity, since consecutive entries
+    usually share the same parsed `datetime` object.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty LogColumnsBuilder.
+
+        Raises:
+            ImportError: If `numpy` is not installed.
+        """
+        if np is None:
+            raise ImportError("The 'numpy' package is required to build log columns")
+
+        self.remote_addr_codes: dict[str | bytes, int] = {}
+        self.request_codes: dict[str | bytes, int] = {}
+        self.http_user_agent_codes: dict[str | bytes, int] = {}
+        self.remote_addr = array("i")
+        self.request = array("i")
+        self.http_user_agent = array("i")
+        self.status = array("h")
+        self.body_bytes_sent = array("q")
+        self.time = array("q")
+        self.utc_offset = array("i")
+        self.last_time: datetime | None = None
+        self.last_epoch = 0
+        self.last_utc_offset = 0
+
+    def add(self, log: NginxLog) -> None:
+        """
+        Appends a single log entry.
+
+        Args:
+            log (NginxLog): A log entry with at least the `COLUMN_FIELDS` parsed.
+        """
+        time = log.time_local
+        if time is not self.last_time:
+            self.last_time = time
+            self.last_epoch = int(time.timestamp())
+            self.last_utc_offset = int(time.utcoffset().total_seconds())
+        http_user_agent = log.http_user_agent if log.http_user_agent is not None else "-"
+        self.append(log.remote_addr, log.request, http_user_agent, log.status, log.body_bytes_sent,
+                    self.last_epoch, self.last_utc_offset)
+
+    def append(self, remote_addr: str | bytes, request: str | bytes, http_user_agent: str | bytes, status: int,
+               body_bytes_sent: int, epoch: int, utc_offset: int) -> None:
+        """
+        Appends the already converted fields of a single log entry.
+
+        String fields may be given as raw UTF-8 `bytes`; they are decoded once
+        per distinct value by `build`.
+
+        Args:
+            remote_addr (str | bytes): The client address.
+            request (str | bytes): The request line.
+            http_user_agent (str | bytes): The user agent.
+            status (int): The response status.
+            body_bytes_sent (int): The response size.
+            epoch (int): The timestamp in epoch seconds.
+            utc_offset (int): The UTC offset of the timestamp in seconds.
+        """
+        self.remote_addr.append(self.encode(self.remote_addr_codes, remote_addr))
+        self.request.append(self.encode(self.request_codes, request))
+        self.http_user_agent.append(self.encode(self.http_user_agent_codes, http_user_agent))
+        self.status.append(status)
+        self.body_bytes_sent.append(body_bytes_sent)
+        self.time.append(epoch)
+        self.utc_offset.append(utc_offset)
+
+    @staticmethod
+    def encode(codes: dict, value: str | bytes) -> int:
+        """
+        Returns the dictionary code of a string, assigning the next code to a new one.
+
+        Args:
+            codes (dict): The codes assigned so far.
+            value (str | bytes): The string to encode.
+
+        Returns:
+            int: The code of the string.
+        """
+        code = codes.get(value)
+        if code is None:
+            code = len(codes)
+            codes[value] = code
+        return code
+
+    @staticmethod
+    def decode(codes: dict) -> list[str]:
+        """
+        Lists the encoded strings in code order, decoding raw values.
+
+        Args:
+            codes (dict): The codes assigned to the strings.
+
+        Returns:
+            list[str]: The strings, with invalid UTF-8 replaced rather than rejected.
+        """
+        return [value.decode("utf-8", errors="replace") if isinstance(value, bytes) else value for value in codes]
+
+    def build(self) -> LogColumns:
+        """
+        Converts the collected entries into NumPy columns.
+
+        Returns:
+            LogColumns: The columns of all added log entries.
+        """
+        return LogColumns(
+            remote_addr=np.array(self.remote_addr, dtype=np.int32),
+            remote_addr_values=self.decode(self.remote_addr_codes),
+            request=np.array(self.request, dtype=np.int32),
+            request_values=self.decode(self.request_codes),
+            http_user_agent=np.array(self.http_user_agent, dtype=np.int32),
+            http_user_agent_values=self.decode(self.http_user_agent_codes),
+            status=np.array(self.status, dtype=np.int16),
+            body_bytes_sent=np.array(self.body_bytes_sent, dtype=np.int64),
+            time=np.array(self.time, dtype=np.int64),
+            utc_offset=np.array(self.utc_offset, dtype=np.int32),
+        )
@@ -0,0 +1,153 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+
+from src.models.log_columns import LogColumns
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+LOGGER = logging.getLogger("LogColumnsCache")
+
+CACHE_VERSION = 2
+MANIFEST_NAME = "manifest.json"
+BAD_LINES_NAME = "bad_lines.json"
+CODE_COLUMNS = ("remote_addr", "request", "http_user_agent")
+VALUE_COLUMNS = ("status", "body_bytes_sent", "time", "utc_offset")
+
+
+class LogColumnsCache:
+    """
+    Class for caching the parsed columns of log files in a directory.
+
+    Every log file gets its own subdirectory, named after a digest of its
+    absolute path, with one `.npy` file per column, one JSON list per string
+    dictionary, the number of bad lines and a manifest. The manifest records
+    the device, inode, size and modification time of the source file and the
+    log format it was parsed with, and the columns are only used while all of
+    them still match. Columns are loaded memory-mapped, so a query touches
+    only the pages of the columns it needs. A new cache entry is
+    written to a temporary directory first and then renamed into place.
+    """
+
+    def __init__(self, directory: str, log_format: str | None = None):
+        """
+        Initializes the LogColumnsCache, creating the directory if needed.
+
+        Args:
+            directory (str): The directory holding the cached columns.
+            log_format (str | None): The format of the log lines, or `None` for
+                                     the NGINX `combined` format.
+
+        Raises:
+            ImportError: If `numpy` is not installed.
+        """
+        if np is None:
+            raise ImportError("The 'numpy' package is required to use the columnar log cache")
+
+        self.directory = directory
+        self.log_format = log_format
+        os.makedirs(directory, exist_ok=True)
+
+    def load(self, path: str, stat: os.stat_result) -> LogColumns | None:
+        """
+        Looks up the cached columns of a file.
+
+        Args:
+            path (str): The absolute path of the log file.
+            stat (os.stat_result): The current status of the log file.
+
+        Returns:
+            LogColumns | None: The memory-mapped columns, or `None` if there are no
+                               columns for the current version of the file.
+        """
+        entry_path = self.get_entry_path(path)
+        try:
+            with open(os.path.join(entry_path, MANIFEST_NAME), encoding="utf-8") as reader:
+                manifest = json.load(reader)
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            LOGGER.info(f"Ignoring a damaged columnar cache entry: {path}")
+            return None
+
+        if manifest != self.get_manifest(path, stat):
+            return None
+
+        try:
+            columns = {name: np.load(os.path.join(entry_path, f"{name}.npy"), mmap_mode="r")
+                       for name in CODE_COLUMNS + VALUE_COLUMNS}
+            for name in CODE_COLUMNS:
+                with open(os.path.join(entry_path, f"{name}.json"), encoding="utf-8") as reader:
+                    columns[f"{name}_values"] = json.load(reader)
+            with open(os.path.join(entry_path, BAD_LINES_NAME), encoding="utf-8") as reader:
+                columns["bad_line_count"] = json.load(reader)
+        except (OSError, ValueError):
+            LOGGER.info(f"Ignoring a damaged columnar cache entry: {path}", exc_info=True)
+            return None
+        return LogColumns(**columns)
+
+    def save(self, path: str, stat: os.stat_result, columns: LogColumns) -> None:
+        """
+        Stores the columns of a file, replacing the previous ones.
+
+        Args:
+            path (str): The absolute path of the log file.
+            stat (os.stat_result): The status of the log file taken before it was parsed.
+            columns (LogColumns): The parsed columns.
+        """
+        entry_path = self.get_entry_path(path)
+        temporary_path = f"{entry_path}.{os.getpid()}.tmp"
+        shutil.rmtree(temporary_path, ignore_errors=True)
+        os.makedirs(temporary_path)
+
+        for name in CODE_COLUMNS + VALUE_COLUMNS:
+            np.save(os.path.join(temporary_path, f"{name}.npy"), getattr(columns, name))
+        for name in CODE_COLUMNS:
+            with open(os.path.join(temporary_path, f"{name}.json"), "w", encoding="utf-8") as writer:
+                json.dump(getattr(columns, f"{name}_values"), writer, ensure_ascii=False)
+        with open(os.path.join(temporary_path, BAD_LINES_NAME), "w", encoding="utf-8") as writer:
+            json.dump(columns.bad_line_count, writer)
+        # The manifest is written last, so an interrupted write never looks complete.
+        with open(os.path.join(temporary_path, MANIFEST_NAME), "w", encoding="utf-8") as writer:
+            json.dump(self.get_manifest(path, stat), writer)
+
+        shutil.rmtree(entry_path, ignore_errors=True)
+        os.replace(temporary_path, entry_path)
+
+    def get_manifest(self, path: str, stat: os.stat_result) -> dict:
+        """
+        Describes the version of a log file that cached columns belong to.
+
+        Args:
+            path (str): The absolute path of the log file.
+            stat (os.stat_result): The status of the log file.
+
+        Returns:
+            dict: The manifest of the cache entry.
+        """
+        return {
+            "version": CACHE_VERSION,
+            "path": path,
+            "device": stat.st_dev,
+            "inode": stat.st_ino,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "log_format": self.log_format,
+        }
+
+    def get_entry_path(self, path: str) -> str:
+        """
+        Returns the cache directory of a log file.
+
+        Args:
+            path (str): The absolute path of the log file.
+
+        Returns:
+            str: The path of the cache entry.
+        """
+        return os.path.join(self.directory, hashlib.blake2b(path.encode("utf-8", "surrogatepass"), digest_size=16).hexdigest())
@@ -0,0 +1,107 @@
+from datetime import datetime
+
+from src.models.log_columns import LogColumns
+from src.services.analytics.log_predicate import LogPredicate
+from src.services.indexes.time_index import TimeIndex
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class LogColumnsFilter:
+    """
+    Class for selecting the rows of `LogColumns` inside a time range that match a filter.
+
+    The `LogColumnsFilter` turns the time range into vectorized comparisons of
+    wall-clock seconds, like `is_within_time_range` compares wall-clock times,
+    and evaluates a filter predicate once per distinct value of the filtered
+    column rather than once per row.
+    """
+
+    def __init__(self, from_time: datetime | None, to_time: datetime | None, predicate: LogPredicate | None):
+        """
+        Initializes the LogColumnsFilter.
+
+        Args:
+            from_time (datetime | None): The starting time for filtering logs.
+            to_time (datetime | None): The ending time for filtering logs.
+            predicate (LogPredicate | None): The compiled filter predicate, if any.
+
+        Raises:
+            ImportError: If `numpy` is not installed.
+        """
+        if np is None:
+            raise ImportError("The 'numpy' package is required to filter log columns")
+
+        # Entries have whole seconds, so a fractional bound excludes its own second.
+        self.lower = None if from_time is None else (
+            TimeIndex.get_wall_clock_seconds(from_time) + (1 if from_time.microsecond else 0))
+        self.upper = None if to_time is None else TimeIndex.get_wall_clock_seconds(to_time)
+        self.predicate = predicate
+
+    def get_mask(self, columns: LogColumns) -> "np.ndarray | None":
+        """
+        Evaluates the time range and the filter for every row.
+
+        Args:
+            columns (LogColumns): The columns of a batch of log entries.
+
+        Returns:
+            np.ndarray | None: A boolean mask with one entry per row, or `None`
+                               if there is nothing to filter on.
+        """
+        mask = None
+
+        if self.lower is not None or self.upper is not None:
+            wall_clock = columns.time + columns.utc_offset
+            mask = np.ones(len(columns), dtype=bool)
+            if self.lower is not None:
+                mask &= wall_clock >= self.lower
+            if self.upper is not None:
+                mask &= wall_clock <= self.upper
+
+        if self.predicate is not None:
+            predicate_mask = self.get_predicate_mask(columns, self.predicate)
+            mask = predicate_mask if mask is None else mask & predicate_mask
+
+        return mask
+
+    def select_rows(self, columns: LogColumns) -> "np.ndarray | None":
+        """
+        Finds the rows inside the time range that match the filter.
+
+        Args:
+            columns (LogColumns): The columns of a batch of log entries.
+
+        Returns:
+            np.ndarray | None: The indices of the selected rows in entry order,
+                               or `None` if every row is selected.
+        """
+        mask = self.get_mask(columns)
+        return None if mask is None else np.flatnonzero(mask)
+
+    @staticmethod
+    def get_predicate_mask(columns: LogColumns, predicate: LogPredicate) -> "np.ndarray":
+        """
+        Evaluates a filter predicate for every row.
+
+        The predicate is applied to each distinct value of the filtered column
+        only, and the per-value results are spread over the rows by their codes.
+
+        Args:
+            columns (LogColumns): The columns of a batch of log entries.
+            predicate (LogPredicate): The compiled filter predicate.
+
+        Returns:
+            np.ndarray: A boolean mask with one entry per row.
+        """
+        if predicate.field == "status":
+            values, codes = np.unique(columns.status, return_inverse=True)
+            values = [str(value) for value in values.tolist()]
+        else:
+            values, codes = getattr(columns, f"{predicate.field}_values"), getattr(columns, predicate.field)
+
+        lookup = np.fromiter((predicate.matches_value(value) for value in values), dtype=bool, count=len(values))
+        return lookup[codes]
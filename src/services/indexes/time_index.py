@@ -0,0 +1,203 @@
+import calendar
+from array import array
+from datetime import datetime
+
+from src.parsers.time_local_parser import TimeLocalParser
+from src.services.serialization.binary_reader import BinaryReader
+from src.services.serialization.binary_writer import BinaryWriter
+
+INDEX_MAGIC = b"LGTI"
+INDEX_VERSION = 1
+
+DEFAULT_SAMPLE_INTERVAL = 1 << 20
+DEFAULT_TOLERANCE_SECONDS = 5 * 60
+MAX_SAMPLE_LINES = 16
+
+
+class TimeIndex:
+    """
+    Class for mapping the timestamps of a roughly time-ordered log file to byte offsets.
+
+    The `TimeIndex` samples one line every `sample_interval` bytes and stores
+    its offset together with its `$time_local` in wall-clock seconds, the clock
+    `LogReader.is_within_time_range` compares on. Building the index reads a
+    single line per sample, so even a file of many gigabytes costs only a few
+    thousand short reads. `find_range` narrows a time range down to the byte
+    range between two samples, assuming that timestamps never go back by more
+    than a tolerance. The index keeps the identity of the indexed file so that
+    a cached copy can be validated and extended when the file grows.
+    """
+
+    def __init__(self, device: int, inode: int, sample_interval: int = DEFAULT_SAMPLE_INTERVAL):
+        """
+        Initializes an empty TimeIndex for a file.
+
+        Args:
+            device (int): The device of the indexed file.
+            inode (int): The inode of the indexed file.
+            sample_interval (int): The distance between two samples in bytes.
+
+        Raises:
+            ValueError: If the sample interval is not positive.
+        """
+        if sample_interval < 1:
+            raise ValueError(f"Sample interval must be positive: {sample_interval}")
+
+        self.device = device
+        self.inode = inode
+        self.sample_interval = sample_interval
+        self.size = 0
+        self.head_digest = b""
+        self.offsets = array("q")
+        self.times = array("q")
+        self.time_parser = TimeLocalParser()
+
+    def extend(self, reader, size: int) -> None:
+        """
+        Samples the part of a file between the indexed size and `size`.
+
+        Only complete lines are sampled, and lines without a parsable
+        timestamp are skipped in favour of the next few lines.
+
+        Args:
+            reader: The binary file object of the indexed file.
+            size (int): The current size of the file.
+        """
+        # The last position is sampled again in case its line was incomplete back then.
+        position = self.size // self.sample_interval * self.sample_interval
+        while position < size:
+            reader.seek(max(position - 1, 0))
+            if position > 0:
+                reader.readline()
+            for _ in range(MAX_SAMPLE_LINES):
+                offset = reader.tell()
+                line = reader.readline()
+                if offset + len(line) > size or not line.endswith(b"\n"):
+                    break
+                if self.offsets and offset <= self.offsets[-1]:
+                    break
+                time = self.get_line_time(line)
+                if time is not None:
+                    self.offsets.append(offset)
+                    self.times.append(time)
+                    break
+            position += self.sample_interval
+        self.size = size
+
+    def get_line_time(self, line: bytes) -> int | None:
+        """
+        Extracts the bracketed `$time_local` of a raw log line.
+
+        Args:
+            line (bytes): The raw log line.
+
+        Returns:
+            int | None: The timestamp in wall-clock seconds, or `None` if the line
+                        has no parsable timestamp.
+        """
+        start = line.find(b"[")
+        end = line.find(b"]", start + 1)
+        if start == -1 or end == -1:
+            return None
+        try:
+            return self.get_wall_clock_seconds(self.time_parser.parse(line[start + 1:end].decode("ascii")))
+        except (ValueError, UnicodeDecodeError):
+            return None
+
+    @staticmethod
+    def get_wall_clock_seconds(time: datetime) -> int:
+        """
+        Converts a datetime into seconds since the epoch, ignoring its timezone.
+
+        Args:
+            time (datetime): The datetime to convert.
+
+        Returns:
+            int: The wall-clock time as seconds since the epoch.
+        """
+        return calendar.timegm(time.timetuple())
+
+    def find_range(self, from_time: datetime | None, to_time: datetime | None, size: int,
+                   tolerance: int = DEFAULT_TOLERANCE_SECONDS) -> tuple[int, int]:
+        """
+        Finds the byte range of a file that can contain log entries of a time range.
+
+        A line before a sample is at most `tolerance` seconds newer than the
+        sample, and a line after it at most `tolerance` seconds older. The range
+        therefore starts at the last sample older than `from_time` by more than
+        the tolerance and ends at the first sample newer than `to_time` by more
+        than the tolerance.
+
+        Args:
+            from_time (datetime | None): The starting time for filtering logs.
+            to_time (datetime | None): The ending time for filtering logs.
+            size (int): The current size of the file.
+            tolerance (int): How many seconds timestamps may go back in the file.
+
+        Returns:
+            tuple[int, int]: The `(start, end)` byte offsets of the lines to read.
+        """
+        start = 0
+        if from_time is not None:
+            lower = self.get_wall_clock_seconds(from_time) - tolerance
+            for offset, time in zip(self.offsets, self.times):
+                if time < lower:
+                    start = offset
+
+        end = size
+        if to_time is not None:
+            upper = self.get_wall_clock_seconds(to_time) + tolerance
+            for offset, time in zip(self.offsets, self.times):
+                if time > upper:
+                    end = offset
+                    break
+
+        return start, max(start, end)
+
+    def to_bytes(self) -> bytes:
+        """
+        Serializes the index into a compact binary form.
+
+        Returns:
+            bytes: The serialized index.
+        """
+        writer = BinaryWriter()
+        writer.write_raw(INDEX_MAGIC)
+        writer.write_uint32(INDEX_VERSION)
+        writer.write_uint64(self.device)
+        writer.write_uint64(self.inode)
+        writer.write_uint64(self.sample_interval)
+        writer.write_uint64(self.size)
+        writer.write_bytes(self.head_digest)
+        writer.write_int_array(self.offsets)
+        writer.write_int_array(self.times)
+        return writer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "TimeIndex":
+        """
+        Restores an index from the binary form produced by `to_bytes`.
+
+        Args:
+            data (bytes): The serialized index.
+
+        Returns:
+            TimeIndex: The restored index.
+
+        Raises:
+            ValueError: If the data is not a supported time index.
+        """
+        reader = BinaryReader(data)
+        if reader.read_raw(len(INDEX_MAGIC)) != INDEX_MAGIC:
+            raise ValueError("Data is not a serialized time index")
+
+        version = reader.read_uint32()
+        if version != INDEX_VERSION:
+            raise ValueError(f"Unsupported time index version: {version}")
+
+        index = cls(reader.read_uint64(), reader.read_uint64(), reader.read_uint64())
+        index.size = reader.read_uint64()
+        index.head_digest = reader.read_bytes()
+        index.offsets = reader.read_int_array()
+        index.times = reader.read_int_array()
+        return index
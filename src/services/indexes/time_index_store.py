@@ -0,0 +1,78 @@
+import hashlib
+import logging
+import os
+
+from src.services.indexes.time_index import TimeIndex
+
+LOGGER = logging.getLogger("TimeIndexStore")
+
+INDEX_SUFFIX = ".tidx"
+
+
+class TimeIndexStore:
+    """
+    Class for caching time indexes of log files in a directory.
+
+    Every index is stored in its own file named after a digest of the absolute
+    path of the indexed log file. Indexes are written to a temporary file first
+    and then renamed, so concurrent runs never see a partially written index.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Initializes the TimeIndexStore, creating the directory if needed.
+
+        Args:
+            directory (str): The directory holding the cached indexes.
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def load(self, path: str) -> TimeIndex | None:
+        """
+        Looks up the cached index of a file.
+
+        Args:
+            path (str): The absolute path of the log file.
+
+        Returns:
+            TimeIndex | None: The cached index, or `None` if there is no usable one.
+        """
+        try:
+            with open(self.get_index_path(path), "rb") as reader:
+                data = reader.read()
+        except FileNotFoundError:
+            return None
+
+        try:
+            return TimeIndex.from_bytes(data)
+        except ValueError:
+            LOGGER.info(f"Ignoring time index in an unsupported format: {path}")
+            return None
+
+    def save(self, path: str, index: TimeIndex) -> None:
+        """
+        Stores the index of a file, replacing the previous one.
+
+        Args:
+            path (str): The absolute path of the log file.
+            index (TimeIndex): The index to store.
+        """
+        index_path = self.get_index_path(path)
+        temporary_path = f"{index_path}.{os.getpid()}.tmp"
+        with open(temporary_path, "wb") as writer:
+            writer.write(index.to_bytes())
+        os.replace(temporary_path, index_path)
+
+    def get_index_path(self, path: str) -> str:
+        """
+        Returns the cache file of the index of a log file.
+
+        Args:
+            path (str): The absolute path of the log file.
+
+        Returns:
+            str: The path of the cached index.
+        """
+        digest = hashlib.blake2b(path.encode("utf-8", "surrogatepass"), digest_size=16).hexdigest()
+        return os.path.join(self.directory, digest + INDEX_SUFFIX)
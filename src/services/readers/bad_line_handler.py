@@ -0,0 +1,198 @@
+import copy
+import logging
+import os
+import threading
+import time
+
+from src.models.error_policy import ErrorPolicy
+
+LOGGER = logging.getLogger("BadLineHandler")
+
+DEFAULT_BUFFER_SIZE = 1 << 16
+DEFAULT_LOG_INTERVAL = 10.0
+LOGGED_LINE_LENGTH = 200
+
+
+class BadLineHandler:
+    """
+    Class for handling log lines that cannot be parsed.
+
+    The `BadLineHandler` applies an `ErrorPolicy` to every rejected line: the
+    line is counted per source in the analyzer and then skipped, copied to a
+    quarantine file, or turned into an error that stops the analysis. Readers
+    call it only after a parser has raised, so lines that parse pay nothing for
+    it. Quarantined lines are buffered and appended to the file in whole lines,
+    so worker processes holding copies of the handler can share one quarantine
+    file; a deferred copy instead keeps its lines until the caller takes them,
+    for work whose result may be thrown away. Warnings are rate-limited to one
+    per `log_interval` seconds, each telling how many bad lines were not logged
+    since the last one.
+    """
+
+    def __init__(self, policy: str = ErrorPolicy.SKIP, quarantine_path: str | None = None,
+                 buffer_size: int = DEFAULT_BUFFER_SIZE, log_interval: float = DEFAULT_LOG_INTERVAL):
+        """
+        Initializes the BadLineHandler.
+
+        Args:
+            policy (str): How bad lines are handled (e.g., skip, quarantine or fail).
+            quarantine_path (str | None): The file bad lines are appended to under
+                                          the quarantine policy.
+            buffer_size (int): The number of buffered bytes that triggers a write
+                               to the quarantine file.
+            log_interval (float): The shortest pause between two warnings in seconds.
+
+        Raises:
+            ValueError: If the policy is not supported, or the quarantine policy
+                        is given no quarantine file.
+        """
+        try:
+            self.policy = ErrorPolicy(policy)
+        except ValueError:
+            raise ValueError(f"Error: Unsupported error policy '{policy}'")
+        if self.policy == ErrorPolicy.QUARANTINE and not quarantine_path:
+            raise ValueError("Error: The quarantine error policy requires a quarantine file")
+
+        self.quarantine_path = quarantine_path
+        self.buffer_size = buffer_size
+        self.log_interval = log_interval
+        self.lock = threading.Lock()
+        self.buffer: list[bytes] = []
+        self.buffered = 0
+        self.deferred = False
+        self.unlogged = 0
+        self.next_log_time = 0.0
+
+    def reject(self, analyzer, source: str, line: bytes, error: ValueError) -> None:
+        """
+        Counts a bad line in the analyzer and applies the policy to it.
+
+        Args:
+            analyzer: The analyzer that counts bad lines per source.
+            source (str): The path or URL the line was read from.
+            line (bytes): The raw line without its line terminator.
+            error (ValueError): The error raised by the parser.
+
+        Raises:
+            ValueError: If the policy is `fail`.
+        """
+        analyzer.record_bad_line(source)
+        if self.policy == ErrorPolicy.FAIL:
+            raise ValueError(f"Error: Cannot parse a line of '{source}': {self.shorten(line)}") from error
+
+        with self.lock:
+            if self.policy == ErrorPolicy.QUARANTINE:
+                self.buffer.append(bytes(line) + b"\n")
+                self.buffered += len(line) + 1
+                if self.buffered >= self.buffer_size and not self.deferred:
+                    self.write_buffer()
+
+            now = time.monotonic()
+            if now < self.next_log_time:
+                self.unlogged += 1
+                return
+            self.next_log_time = now + self.log_interval
+            unlogged, self.unlogged = self.unlogged, 0
+
+        LOGGER.warning(f"Skipping a bad line of {source} ({error}): {self.shorten(line)}"
+                       + (f"; {unlogged} more bad lines were not logged" if unlogged else ""))
+
+    def create_deferred(self) -> "BadLineHandler":
+        """
+        Creates a copy that keeps quarantined lines in memory instead of writing them.
+
+        Returns:
+            BadLineHandler: A copy with an empty buffer that is never written out
+                            on its own; its lines are collected with `take_buffer`.
+        """
+        deferred = copy.copy(self)
+        deferred.deferred = True
+        return deferred
+
+    def take_buffer(self) -> bytes:
+        """
+        Removes the buffered quarantined lines without writing them.
+
+        Returns:
+            bytes: The buffered lines, each terminated by a newline.
+        """
+        with self.lock:
+            data = b"".join(self.buffer)
+            self.buffer = []
+            self.buffered = 0
+        return data
+
+    def add_to_buffer(self, data: bytes) -> None:
+        """
+        Buffers lines quarantined elsewhere, e.g. by a deferred copy.
+
+        Args:
+            data (bytes): Whole lines, each terminated by a newline.
+        """
+        if not data:
+            return
+        with self.lock:
+            self.buffer.append(data)
+            self.buffered += len(data)
+            if self.buffered >= self.buffer_size:
+                self.write_buffer()
+
+    def flush(self) -> None:
+        """
+        Writes the buffered quarantined lines to the quarantine file, unless the handler is deferred.
+        """
+        if self.deferred:
+            return
+        with self.lock:
+            self.write_buffer()
+
+    def write_buffer(self) -> None:
+        """
+        Appends the buffered lines to the quarantine file with a single write.
+
+        The caller must hold the lock.
+        """
+        if not self.buffer:
+            return
+        data = b"".join(self.buffer)
+        self.buffer = []
+        self.buffered = 0
+        descriptor = os.open(self.quarantine_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(descriptor, view):]
+        finally:
+            os.close(descriptor)
+
+    @staticmethod
+    def shorten(line: bytes) -> str:
+        """
+        Renders a line for a log message, cutting it if it is long.
+
+        Args:
+            line (bytes): The raw line.
+
+        Returns:
+            str: The decoded line, at most `LOGGED_LINE_LENGTH` characters long.
+        """
+        text = bytes(line[:LOGGED_LINE_LENGTH + 1]).decode("utf-8", errors="replace")
+        return text if len(text) <= LOGGED_LINE_LENGTH else text[:LOGGED_LINE_LENGTH] + "..."
+
+    def __getstate__(self) -> dict:
+        # Copies sent to worker processes start with an empty buffer and a lock of their own.
+        state = self.__dict__.copy()
+        del state["lock"]
+        state["buffer"] = []
+        state["buffered"] = 0
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.lock = threading.Lock()
+
+    def __enter__(self) -> "BadLineHandler":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.flush()
@@ -0,0 +1,178 @@
+import bz2
+import lzma
+import struct
+import zlib
+
+from src.models.compression_codec import CompressionCodec
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+MAGIC_NUMBERS = {
+    CompressionCodec.GZIP: b"\x1f\x8b\x08",
+    CompressionCodec.BZ2: b"BZh",
+    CompressionCodec.XZ: b"\xfd7zXZ\x00",
+    CompressionCodec.ZSTD: b"\x28\xb5\x2f\xfd",
+}
+
+HEADER_LENGTH = max(len(magic) for magic in MAGIC_NUMBERS.values())
+
+GZIP_RESERVED_FLAGS = 0xE0
+BZ2_BLOCK_MAGICS = (b"\x31\x41\x59\x26\x53\x59", b"\x17\x72\x45\x38\x50\x90")
+
+ZSTD_SKIPPABLE_MAGIC = 0x184D2A50
+ZSTD_SKIPPABLE_MASK = 0xFFFFFFF0
+ZSTD_SKIPPABLE_HEADER_LENGTH = 8
+ZSTD_SEEK_TABLE_FOOTER_MAGIC = 0x8F92EAB1
+ZSTD_SEEK_TABLE_FOOTER_LENGTH = 9
+ZSTD_SEEK_TABLE_CHECKSUM_FLAG = 0x80
+
+DECOMPRESSION_ERRORS = (EOFError, zlib.error, lzma.LZMAError) + ((zstandard.ZstdError,) if zstandard else ())
+
+
+class CodecDetector:
+    """
+    Class for detecting and decoding compressed log files.
+
+    The `CodecDetector` recognizes gzip, bz2, xz and zstd files by their magic
+    bytes, creates incremental decompressors for single members (gzip members,
+    bz2/xz streams, zstd frames), and locates member boundaries so that
+    multi-member files can be decompressed in parallel.
+    """
+
+    @staticmethod
+    def detect(header: bytes) -> CompressionCodec:
+        """
+        Detects the compression codec from the first bytes of a file.
+
+        Args:
+            header (bytes): The first `HEADER_LENGTH` bytes of the file.
+
+        Returns:
+            CompressionCodec: The detected codec, or `CompressionCodec.NONE` for plain files.
+        """
+        for codec, magic in MAGIC_NUMBERS.items():
+            if header.startswith(magic):
+                return codec
+        return CompressionCodec.NONE
+
+    @staticmethod
+    def create_decompressor(codec: CompressionCodec):
+        """
+        Creates an incremental decompressor for a single member of the given codec.
+
+        The returned object provides `decompress(data)` and the `eof` and
+        `unused_data` attributes, so the caller can tell where a member ends.
+
+        Args:
+            codec (CompressionCodec): The compression codec.
+
+        Returns:
+            A decompressor object for one member.
+
+        Raises:
+            ValueError: If the codec is not a compression codec.
+            ImportError: If zstd is requested and `zstandard` is not installed.
+        """
+        if codec == CompressionCodec.GZIP:
+            return zlib.decompressobj(16 + zlib.MAX_WBITS)
+        elif codec == CompressionCodec.BZ2:
+            return bz2.BZ2Decompressor()
+        elif codec == CompressionCodec.XZ:
+            return lzma.LZMADecompressor(lzma.FORMAT_XZ)
+        elif codec == CompressionCodec.ZSTD:
+            if zstandard is None:
+                raise ImportError("The 'zstandard' package is required to read zstd-compressed logs")
+            return zstandard.ZstdDecompressor().decompressobj()
+        else:
+            raise ValueError(f"Error: Unsupported compression codec '{codec}'")
+
+    @staticmethod
+    def get_skippable_frame_length(data: bytes) -> int | None:
+        """
+        Returns the total length of a zstd skippable frame starting at `data`.
+
+        Args:
+            data (bytes): At least `ZSTD_SKIPPABLE_HEADER_LENGTH` bytes at a frame start.
+
+        Returns:
+            int or None: The frame length including its header, or `None` if the
+                         data doesn't start with a skippable frame.
+        """
+        if len(data) < ZSTD_SKIPPABLE_HEADER_LENGTH:
+            return None
+        magic, frame_size = struct.unpack_from("<II", data)
+        if magic & ZSTD_SKIPPABLE_MASK != ZSTD_SKIPPABLE_MAGIC:
+            return None
+        return ZSTD_SKIPPABLE_HEADER_LENGTH + frame_size
+
+    @staticmethod
+    def find_member_start(data, offset: int, codec: CompressionCodec) -> int:
+        """
+        Finds the first offset at or after `offset` that looks like a member start.
+
+        The magic bytes may also occur inside compressed data, so the result is
+        only a candidate; readers verify it by checking that the previous member
+        ends exactly there.
+
+        Args:
+            data: The compressed file contents (e.g., an `mmap`).
+            offset (int): The offset to start searching from.
+            codec (CompressionCodec): The compression codec.
+
+        Returns:
+            int: The candidate offset, or -1 if there is none.
+        """
+        magic = MAGIC_NUMBERS[codec]
+        position = data.find(magic, offset)
+        while position != -1:
+            if codec == CompressionCodec.GZIP:
+                header = data[position + len(magic):position + len(magic) + 1]
+                if header and header[0] & GZIP_RESERVED_FLAGS == 0:
+                    return position
+            elif codec == CompressionCodec.BZ2:
+                header = data[position + len(magic):position + len(magic) + 7]
+                if header[:1] in (b"1", b"2", b"3", b"4", b"5", b"6", b"7", b"8", b"9") and header[1:] in BZ2_BLOCK_MAGICS:
+                    return position
+            else:
+                return position
+            position = data.find(magic, position + 1)
+        return -1
+
+    @staticmethod
+    def read_zstd_seek_table(data) -> list[int] | None:
+        """
+        Reads frame offsets from the seek table of a zstd seekable file.
+
+        Args:
+            data: The compressed file contents (e.g., an `mmap`).
+
+        Returns:
+            list[int] or None: The offsets of the compressed frames, or `None`
+                               if the file has no valid seek table.
+        """
+        size = len(data)
+        if size < ZSTD_SKIPPABLE_HEADER_LENGTH + ZSTD_SEEK_TABLE_FOOTER_LENGTH:
+            return None
+
+        frame_count, descriptor, footer_magic = struct.unpack_from("<IBI", data, size - ZSTD_SEEK_TABLE_FOOTER_LENGTH)
+        if footer_magic != ZSTD_SEEK_TABLE_FOOTER_MAGIC:
+            return None
+
+        entry_length = 12 if descriptor & ZSTD_SEEK_TABLE_CHECKSUM_FLAG else 8
+        table_length = frame_count * entry_length + ZSTD_SEEK_TABLE_FOOTER_LENGTH
+        table_start = size - table_length - ZSTD_SKIPPABLE_HEADER_LENGTH
+        if table_start < 0 or CodecDetector.get_skippable_frame_length(
+            data[table_start:table_start + ZSTD_SKIPPABLE_HEADER_LENGTH]
+        ) != table_length + ZSTD_SKIPPABLE_HEADER_LENGTH:
+            return None
+
+        offsets = []
+        position = 0
+        for index in range(frame_count):
+            offsets.append(position)
+            compressed_size, = struct.unpack_from("<I", data, table_start + ZSTD_SKIPPABLE_HEADER_LENGTH + index * entry_length)
+            position += compressed_size
+        return offsets if position == table_start else None
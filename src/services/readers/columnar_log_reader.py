@@ -0,0 +1,220 @@
+import logging
+import os
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from src.models.compression_codec import CompressionCodec
+from src.models.log_columns import LogColumns
+from src.parsers.log_parser_factory import LogParserFactory
+from src.services.analytics.analyzer import MAXERRORINDEX, MINERRORINDEX, Analyzer
+from src.services.analytics.log_filter import LogFilter
+from src.services.analytics.numpy_batch_analyzer import NumpyBatchAnalyzer
+from src.services.columnar.log_columns_builder import COLUMN_FIELDS, LogColumnsBuilder
+from src.services.columnar.log_columns_cache import LogColumnsCache
+from src.services.columnar.log_columns_filter import LogColumnsFilter
+from src.services.readers.bad_line_handler import BadLineHandler
+from src.services.readers.codec_detector import DECOMPRESSION_ERRORS, HEADER_LENGTH, CodecDetector
+from src.services.readers.compressed_range_reader import CompressedRangeReader
+from src.services.readers.file_log_reader import FileLogReader
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+LOGGER = logging.getLogger("ColumnarLogReader")
+
+
+class ColumnarLogReader(FileLogReader):
+    """
+    Class for analyzing log files through a columnar cache of parsed entries.
+
+    The `ColumnarLogReader` parses a file once into `LogColumns` and stores
+    them in a `LogColumnsCache`; later runs load the memory-mapped columns
+    instead of parsing again. The time range and the filter are turned into a
+    row selection with vectorized comparisons (a filter is evaluated once per
+    distinct string, not once per row), and the selected rows are aggregated
+    into the analyzer with NumPy reductions. The cache always holds whole
+    files, so every filter and time range can be answered from it. The bad
+    lines found while parsing are counted again from the cache on later runs,
+    but only the run that parses a file reports or quarantines them.
+    """
+
+    def __init__(self, analyzer: Analyzer | NumpyBatchAnalyzer, cache: LogColumnsCache, log_format: str | None = None,
+                 bad_lines: BadLineHandler | None = None):
+        """
+        Initializes the ColumnarLogReader.
+
+        Args:
+            analyzer (Analyzer | NumpyBatchAnalyzer): The analyzer that receives the metrics.
+            cache (LogColumnsCache): The cache of parsed columns.
+            log_format (str | None): The format of the log lines, or `None` for
+                                     the NGINX `combined` format.
+            bad_lines (BadLineHandler | None): The handler of lines that cannot be
+                                               parsed, or `None` to skip them.
+        """
+        super().__init__(analyzer, COLUMN_FIELDS, log_format, bad_lines)
+        self.cache = cache
+        self.time_zones: dict[int, timezone] = {}
+
+    def read_logs(self, file_path: str, from_time: datetime | None, to_time: datetime | None, filter_field: str, filter_value: str) -> None:
+        """
+        Analyzes the log entries of a file from its cached columns, building them if needed.
+
+        Args:
+            file_path (str): The path to the log file.
+            from_time (datetime | None): The starting time for filtering logs.
+            to_time (datetime | None): The ending time for filtering logs.
+            filter_field (str): The field to apply filtering on (e.g., `agent`, `request`, `status`).
+            filter_value (str): The value to match within the specified filter field.
+        """
+        path = os.path.abspath(file_path)
+
+        try:
+            stat = os.stat(path)
+            columns = self.cache.load(path, stat)
+            if columns is None:
+                columns = self.parse_columns(path, file_path)
+                self.save_columns(path, stat, columns)
+            else:
+                for _ in range(columns.bad_line_count):
+                    self.analyzer.record_bad_line(file_path)
+        except (IOError, *DECOMPRESSION_ERRORS):
+            LOGGER.error(f"Error reading logs from file: {file_path}", exc_info=True)
+            return
+
+        self.update_analyzer(columns, self.select_rows(columns, from_time, to_time, filter_field, filter_value))
+
+    def parse_columns(self, path: str, source: str = "-") -> LogColumns:
+        """
+        Parses every valid line of a log file into columns.
+
+        Args:
+            path (str): The path to the log file.
+            source (str): The path the file was given as, used to count bad lines.
+
+        Returns:
+            LogColumns: The columns of all log entries of the file, with the number of bad lines.
+
+        Raises:
+            ValueError: If a line cannot be parsed under the `fail` error policy.
+        """
+        parser = LogParserFactory().get_parser(self.fields, self.log_format)
+        builder = LogColumnsBuilder()
+        with Path(path).open("rb") as reader:
+            codec = CodecDetector.detect(reader.read(HEADER_LENGTH))
+            reader.seek(0)
+            if codec != CompressionCodec.NONE:
+                reader = CompressedRangeReader(reader, codec)
+            lines = self.iter_block_lines(reader)
+            line = None
+            bad_line_count = 0
+            while True:
+                try:
+                    for line in lines:
+                        builder.add(parser.parse(line))
+                    break
+                except ValueError as error:
+                    self.bad_lines.reject(self.analyzer, source, line, error)
+                    bad_line_count += 1
+        return replace(builder.build(), bad_line_count=bad_line_count)
+
+    def save_columns(self, path: str, stat: os.stat_result, columns: LogColumns) -> None:
+        """
+        Stores freshly parsed columns, keeping the analysis going if the cache cannot be written.
+
+        Args:
+            path (str): The absolute path of the log file.
+            stat (os.stat_result): The status of the log file taken before it was parsed.
+            columns (LogColumns): The parsed columns.
+        """
+        try:
+            self.cache.save(path, stat, columns)
+        except OSError:
+            LOGGER.warning(f"Could not cache the columns of: {path}", exc_info=True)
+
+    def select_rows(self, columns: LogColumns, from_time: datetime | None, to_time: datetime | None,
+                    filter_field: str, filter_value: str) -> "np.ndarray":
+        """
+        Finds the rows inside the time range that match the filter.
+
+        Args:
+            columns (LogColumns): The columns of a log file.
+            from_time (datetime | None): The starting time for filtering logs.
+            to_time (datetime | None): The ending time for filtering logs.
+            filter_field (str): The field to apply filtering on (e.g., `agent`, `request`, `status`).
+            filter_value (str): The value to match within the specified filter field.
+
+        Returns:
+            np.ndarray: The indices of the selected rows in file order.
+        """
+        rows = LogColumnsFilter(from_time, to_time, LogFilter().compile(filter_field, filter_value)).select_rows(columns)
+        return np.arange(len(columns)) if rows is None else rows
+
+    def update_analyzer(self, columns: LogColumns, rows: "np.ndarray") -> None:
+        """
+        Aggregates the selected rows into the analyzer.
+
+        Keyed counters are filled in order of first appearance, so the analyzer
+        ends up identical to one fed the same entries line by line. A
+        `NumpyBatchAnalyzer` receives the rows as a single batch.
+
+        Args:
+            columns (LogColumns): The columns of a log file.
+            rows (np.ndarray): The indices of the rows to aggregate.
+        """
+        if len(rows) == 0:
+            return
+        if isinstance(self.analyzer, NumpyBatchAnalyzer):
+            self.analyzer.update_batch(columns, rows)
+            return
+
+        analyzer = self.analyzer
+        sizes = columns.body_bytes_sent[rows]
+        statuses = columns.status[rows]
+        times = columns.time[rows]
+        is_error = (statuses >= MINERRORINDEX) & (statuses < MAXERRORINDEX)
+
+        analyzer.count_logs += len(rows)
+        analyzer.total_size_logs += float(sizes.sum())
+        analyzer.total_size_count += len(rows)
+        analyzer.error_count += int(is_error.sum())
+        analyzer.response_sizes.add_many(sizes.tolist())
+
+        for status, count in zip(*NumpyBatchAnalyzer.count_in_order(statuses)):
+            analyzer.count_status_codes[status] += count
+
+        resources = [analyzer.extract_resource_from_request(request) for request in columns.request_values]
+        for code, count in zip(*NumpyBatchAnalyzer.count_in_order(columns.request[rows])):
+            analyzer.resource_counts[resources[code]] += count
+
+        for code in NumpyBatchAnalyzer.count_in_order(columns.remote_addr[rows])[0]:
+            analyzer.unique_ips.add(columns.remote_addr_values[code])
+
+        if analyzer.time_series is not None:
+            NumpyBatchAnalyzer.update_time_series(analyzer.time_series, times, sizes, is_error)
+
+        start_time = self.get_row_time(columns, rows[times.argmin()])
+        end_time = self.get_row_time(columns, rows[times.argmax()])
+        if analyzer.start_time is None or start_time < analyzer.start_time:
+            analyzer.start_time = start_time
+        if analyzer.end_time is None or end_time > analyzer.end_time:
+            analyzer.end_time = end_time
+
+    def get_row_time(self, columns: LogColumns, row: int) -> datetime:
+        """
+        Rebuilds the timezone-aware timestamp of a row.
+
+        Args:
+            columns (LogColumns): The columns of a log file.
+            row (int): The index of the row.
+
+        Returns:
+            datetime: The local time of the entry.
+        """
+        utc_offset = int(columns.utc_offset[row])
+        time_zone = self.time_zones.get(utc_offset)
+        if time_zone is None:
+            time_zone = self.time_zones[utc_offset] = timezone(timedelta(seconds=utc_offset))
+        return datetime.fromtimestamp(int(columns.time[row]), time_zone)
@@ -0,0 +1,134 @@
+from src.models.compression_codec import CompressionCodec
+from src.services.readers.codec_detector import ZSTD_SKIPPABLE_HEADER_LENGTH, CodecDetector
+
+CHUNK_SIZE = 1 << 20
+
+
+class CompressedRangeReader:
+    """
+    Class providing a decompressed binary stream over compressed file members.
+
+    The `CompressedRangeReader` wraps an open binary file and decompresses the
+    members (gzip members, bz2/xz streams, zstd frames) that start inside a
+    byte range, one after another. It exposes a file-like `read` method, and
+    after reading it reports the offset where the last member ended, so that
+    parallel readers can verify that their ranges join up.
+    """
+
+    def __init__(self, reader, codec: CompressionCodec, start: int = 0, end: int | None = None,
+                 chunk_size: int = CHUNK_SIZE):
+        """
+        Initializes the CompressedRangeReader.
+
+        Args:
+            reader: A binary file object holding the compressed data.
+            codec (CompressionCodec): The compression codec of the file.
+            start (int): The offset of the first member.
+            end (int | None): Members starting at or after this offset are not read.
+                              `None` reads to the end of the file.
+            chunk_size (int): The number of compressed bytes read at once.
+        """
+        self.reader = reader
+        self.codec = codec
+        self.end = end
+        self.chunk_size = chunk_size
+        self.reader.seek(start)
+        self.file_offset = start
+        self.position = start
+        self.pending = b""
+        self.decompressor = None
+        self.ends_with_newline = True
+
+    def __enter__(self) -> "CompressedRangeReader":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes the underlying file.
+        """
+        self.reader.close()
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Returns the next chunk of decompressed data.
+
+        Args:
+            size (int): Ignored; the chunk size follows the compressed chunk size.
+
+        Returns:
+            bytes: Decompressed data, or an empty bytes object at the end of the range.
+
+        Raises:
+            EOFError: If the file ends in the middle of a member.
+        """
+        while True:
+            if self.decompressor is None:
+                self.position = self.file_offset - len(self.pending)
+                if self.end is not None and self.position >= self.end:
+                    return b""
+                if not self.fill(ZSTD_SKIPPABLE_HEADER_LENGTH):
+                    return b""
+                if self.codec == CompressionCodec.ZSTD:
+                    skippable_length = CodecDetector.get_skippable_frame_length(self.pending)
+                    if skippable_length is not None:
+                        self.skip(skippable_length)
+                        continue
+                self.decompressor = CodecDetector.create_decompressor(self.codec)
+
+            data = self.pending or self.read_chunk()
+            self.pending = b""
+            if not data:
+                raise EOFError("Compressed file ended before the end of a member")
+
+            output = self.decompressor.decompress(data)
+            if self.decompressor.eof:
+                self.pending = self.decompressor.unused_data
+                self.decompressor = None
+            if output:
+                self.ends_with_newline = output.endswith(b"\n")
+                return output
+
+    def read_chunk(self) -> bytes:
+        """
+        Reads the next chunk of compressed data from the file.
+
+        Returns:
+            bytes: The compressed chunk, empty at the end of the file.
+        """
+        chunk = self.reader.read(self.chunk_size)
+        self.file_offset += len(chunk)
+        return chunk
+
+    def fill(self, length: int) -> bool:
+        """
+        Reads compressed data until at least `length` bytes are pending or the file ends.
+
+        Args:
+            length (int): The number of bytes wanted.
+
+        Returns:
+            bool: `True` if any compressed data is pending.
+        """
+        while len(self.pending) < length:
+            chunk = self.read_chunk()
+            if not chunk:
+                break
+            self.pending += chunk
+        return bool(self.pending)
+
+    def skip(self, length: int) -> None:
+        """
+        Skips compressed bytes without decompressing them.
+
+        Args:
+            length (int): The number of bytes to skip.
+        """
+        if length <= len(self.pending):
+            self.pending = self.pending[length:]
+            return
+        self.reader.seek(length - len(self.pending), 1)
+        self.file_offset += length - len(self.pending)
+        self.pending = b""
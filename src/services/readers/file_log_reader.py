@@ -1,14 +1,17 @@
 from datetime import datetime
 from pathlib import Path
 
-from src.models.nginx_log import NginxLog
-from src.parsers.nginx_log_parser import NginxLogParser
-from src.services.analytics.log_filter import LogFilter
+from src.models.compression_codec import CompressionCodec
+from src.services.readers.bad_line_handler import BadLineHandler
+from src.services.readers.codec_detector import DECOMPRESSION_ERRORS, HEADER_LENGTH, CodecDetector
+from src.services.readers.compressed_range_reader import CompressedRangeReader
 from src.services.readers.log_reader import LogReader
 import logging
 
 LOGGER = logging.getLogger("FileLogReader")
 
+BLOCK_SIZE = 1 << 20
+
 
 class FileLogReader(LogReader):
     """
@@ -19,15 +22,25 @@ class FileLogReader(LogReader):
     metrics.
     """
 
-    def __init__(self, analyzer):
+    def __init__(self, analyzer, fields: frozenset[str] | None = None, log_format: str | None = None,
+                 bad_lines: BadLineHandler | None = None):
         """
         Initializes the FileLogReader with a provided analyzer.
 
         Args:
             analyzer: An object responsible for processing and storing metrics
                       from each log entry.
+            fields (frozenset[str] | None): The log entry fields to extract, or
+                                            `None` to extract all of them.
+            log_format (str | None): The format of the log lines, or `None` for
+                                     the NGINX `combined` format.
+            bad_lines (BadLineHandler | None): The handler of lines that cannot be
+                                               parsed, or `None` to skip them.
         """
         self.analyzer = analyzer
+        self.fields = fields
+        self.log_format = log_format
+        self.bad_lines = bad_lines if bad_lines is not None else BadLineHandler()
 
     def read_logs(self, file_path: str, from_time: datetime | None, to_time: datetime | None, filter_field: str, filter_value: str) -> None:
         """
@@ -35,6 +48,8 @@ class FileLogReader(LogReader):
 
         This method opens the log file, parses each line, filters entries by time
         and additional filter criteria, and updates the analyzer with valid log data.
+        Compressed files (gzip, bz2, xz, zstd) are detected by their magic bytes
+        and decompressed on the fly.
 
         Args:
             file_path (str): The path to the log file.
@@ -44,36 +59,94 @@ class FileLogReader(LogReader):
             filter_value (str): The value to match within the specified filter field.
         """
         path = Path(file_path)
-        parser = NginxLogParser()
-        log_filter = LogFilter()
 
         try:
-            with path.open("r", encoding="utf-8") as reader:
-                for line in reader:
-                    nginx_log = parser.parse(line)
-
-                    if (
-                        self.is_within_time_range(nginx_log, from_time, to_time)
-                        and log_filter.matches_filter(nginx_log, filter_field, filter_value)
-                    ):
-                        self.analyzer.update_metrics(nginx_log)
+            with path.open("rb") as reader:
+                codec = CodecDetector.detect(reader.read(HEADER_LENGTH))
+                reader.seek(0)
+                if codec != CompressionCodec.NONE:
+                    reader = CompressedRangeReader(reader, codec)
+                self.process_lines(self.iter_block_lines(reader), from_time, to_time, filter_field, filter_value,
+                                   file_path)
+        except (IOError, *DECOMPRESSION_ERRORS):
+            LOGGER.error(f"Error reading logs from file: {file_path}", exc_info=True)
+
+    def read_range(self, file_path: str, start: int, end: int, from_time: datetime | None, to_time: datetime | None, filter_field: str, filter_value: str) -> None:
+        """
+        Reads and processes the log lines that start inside a byte range of a file.
+
+        The range is expected to be newline-aligned: `start` points at the beginning
+        of a line, and every line starting before `end` is processed.
+
+        Args:
+            file_path (str): The path to the log file.
+            start (int): The offset of the first line in the range.
+            end (int): The offset right after the last line in the range.
+            from_time (datetime | None): The starting time for filtering logs.
+            to_time (datetime | None): The ending time for filtering logs.
+            filter_field (str): The field to apply filtering on (e.g., `agent`, `request`, `status`).
+            filter_value (str): The value to match within the specified filter field.
+        """
+        path = Path(file_path)
+
+        try:
+            with path.open("rb") as reader:
+                reader.seek(start)
+                self.process_lines(self.iter_block_lines(reader, end - start), from_time, to_time, filter_field,
+                                   filter_value, file_path)
         except IOError:
             LOGGER.error(f"Error reading logs from file: {file_path}", exc_info=True)
 
-    def is_within_time_range(self, nginx_log: NginxLog, from_time: datetime | None, to_time: datetime | None) -> bool:
+    def read_members(self, file_path: str, codec: CompressionCodec, start: int, end: int, from_time: datetime | None,
+                     to_time: datetime | None, filter_field: str, filter_value: str) -> tuple[int, bool]:
         """
-        Checks if the log entry falls within the specified time range.
+        Reads and processes the compressed members that start inside a byte range of a file.
+
+        Unlike `read_logs`, errors are not logged here but raised, so that a
+        parallel caller can fall back to a serial read.
 
         Args:
-            nginx_log: The log entry object with a `time_local` field.
+            file_path (str): The path to the compressed log file.
+            codec (CompressionCodec): The compression codec of the file.
+            start (int): The offset of the first member in the range.
+            end (int): Members starting at or after this offset are not read.
             from_time (datetime | None): The starting time for filtering logs.
             to_time (datetime | None): The ending time for filtering logs.
+            filter_field (str): The field to apply filtering on (e.g., `agent`, `request`, `status`).
+            filter_value (str): The value to match within the specified filter field.
 
         Returns:
-            bool: True if the log entry falls within the range, False otherwise.
+            tuple[int, bool]: The offset where the last member ended, and whether
+                              the decompressed data ended with a newline.
+        """
+        with CompressedRangeReader(Path(file_path).open("rb"), codec, start, end) as reader:
+            self.process_lines(self.iter_block_lines(reader), from_time, to_time, filter_field, filter_value,
+                               file_path)
+            return reader.position, reader.ends_with_newline
+
+    @staticmethod
+    def iter_block_lines(reader, limit: int | None = None, block_size: int = BLOCK_SIZE):
         """
-        if from_time and nginx_log.time_local < from_time.replace(tzinfo=nginx_log.time_local.tzinfo):
-            return False
-        if to_time and nginx_log.time_local > to_time.replace(tzinfo=nginx_log.time_local.tzinfo):
-            return False
-        return True
+        Yields raw lines from a binary reader, reading it in large blocks.
+
+        Args:
+            reader: A binary file object.
+            limit (int | None): The number of bytes to read, or `None` to read to the end.
+            block_size (int): The size of each read.
+
+        Yields:
+            bytes: The log lines without their line terminators.
+        """
+        remaining = limit
+
+        def read_blocks():
+            nonlocal remaining
+            while remaining is None or remaining > 0:
+                block = reader.read(block_size if remaining is None else min(block_size, remaining))
+                if not block:
+                    return
+                if remaining is not None:
+                    remaining -= len(block)
+                yield block
+
+        return LogReader.iter_chunk_lines(read_blocks())
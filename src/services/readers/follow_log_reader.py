@@ -0,0 +1,154 @@
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Callable
+
+from src.services.readers.bad_line_handler import BadLineHandler
+from src.services.readers.file_log_reader import BLOCK_SIZE, FileLogReader
+
+LOGGER = logging.getLogger("FollowLogReader")
+
+DEFAULT_POLL_INTERVAL = 0.5
+DEFAULT_REFRESH_INTERVAL = 10.0
+
+
+class FollowLogReader(FileLogReader):
+    """
+    Class for following a growing log file like `tail -F`.
+
+    The `FollowLogReader` keeps the file open, feeds complete lines to the
+    analyzer as soon as they are written, and calls a refresh callback at a
+    fixed interval. When the file is rotated (the path now names another
+    inode) it switches to the new file, reading it from the start, and when
+    the file is truncated it starts over from its beginning.
+    """
+
+    def __init__(self, analyzer, fields: frozenset[str] | None = None, poll_interval: float = DEFAULT_POLL_INTERVAL,
+                 log_format: str | None = None, bad_lines: BadLineHandler | None = None):
+        """
+        Initializes the FollowLogReader.
+
+        Args:
+            analyzer: An object responsible for processing and storing metrics
+                      from each log entry.
+            fields (frozenset[str] | None): The log entry fields to extract, or
+                                            `None` to extract all of them.
+            poll_interval (float): The pause in seconds between checks for new data.
+            log_format (str | None): The format of the log lines, or `None` for
+                                     the NGINX `combined` format.
+            bad_lines (BadLineHandler | None): The handler of lines that cannot be
+                                               parsed, or `None` to skip them.
+        """
+        super().__init__(analyzer, fields, log_format, bad_lines)
+        self.poll_interval = poll_interval
+
+    def follow(self, file_path: str, from_time: datetime | None, to_time: datetime | None, filter_field: str,
+               filter_value: str, on_refresh: Callable[[], None], refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+               stop_event: threading.Event | None = None, from_start: bool = False) -> None:
+        """
+        Follows a log file until `stop_event` is set.
+
+        Quarantined lines are written out at every refresh.
+
+        Args:
+            file_path (str): The path to the log file.
+            from_time (datetime | None): The starting time for filtering logs.
+            to_time (datetime | None): The ending time for filtering logs.
+            filter_field (str): The field to apply filtering on (e.g., `agent`, `request`, `status`).
+            filter_value (str): The value to match within the specified filter field.
+            on_refresh (Callable[[], None]): The function called every `refresh_interval` seconds.
+            refresh_interval (float): The pause in seconds between refreshes.
+            stop_event (threading.Event | None): The event that ends following, or
+                                                 `None` to follow until interrupted.
+            from_start (bool): Whether to read the lines already in the file
+                               instead of starting at its end.
+        """
+        stop_event = stop_event if stop_event is not None else threading.Event()
+        reader = self.open_log(file_path, from_start)
+        remainder = b""
+        next_refresh = time.monotonic() + refresh_interval
+
+        try:
+            while not stop_event.is_set():
+                block = reader.read(BLOCK_SIZE) if reader is not None else b""
+                if block:
+                    lines = (remainder + block).split(b"\n")
+                    remainder = lines.pop()
+                    self.process_lines(lines, from_time, to_time, filter_field, filter_value, file_path)
+                else:
+                    position = reader.tell() if reader is not None else None
+                    reopened = self.reopen_if_rotated(reader, file_path)
+                    if reopened is not reader:
+                        # The rotated file is complete, so its unterminated last line is final.
+                        if remainder:
+                            self.process_lines([remainder], from_time, to_time, filter_field, filter_value,
+                                               file_path)
+                        remainder = b""
+                        reader = reopened
+                    elif reader is not None and reader.tell() != position:
+                        remainder = b""
+                    else:
+                        stop_event.wait(self.poll_interval)
+
+                if time.monotonic() >= next_refresh:
+                    self.bad_lines.flush()
+                    on_refresh()
+                    next_refresh = time.monotonic() + refresh_interval
+        finally:
+            self.bad_lines.flush()
+            if reader is not None:
+                reader.close()
+
+    def open_log(self, file_path: str, from_start: bool):
+        """
+        Opens the followed file.
+
+        Args:
+            file_path (str): The path to the log file.
+            from_start (bool): Whether to position the reader at the start of the
+                               file instead of at its end.
+
+        Returns:
+            The binary file object, or `None` if the file doesn't exist yet.
+        """
+        try:
+            reader = open(file_path, "rb")
+        except FileNotFoundError:
+            return None
+        if not from_start:
+            reader.seek(0, os.SEEK_END)
+        return reader
+
+    def reopen_if_rotated(self, reader, file_path: str):
+        """
+        Checks a drained reader for rotation and truncation of the followed file.
+
+        Args:
+            reader: The current binary file object, or `None`.
+            file_path (str): The path to the log file.
+
+        Returns:
+            The reader to continue with: a new reader positioned at the start of
+            the file if it was rotated, otherwise `reader` itself (rewound if the
+            file was truncated).
+        """
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            return reader
+
+        if reader is None:
+            return self.open_log(file_path, from_start=True)
+
+        current = os.fstat(reader.fileno())
+        if (stat.st_dev, stat.st_ino) != (current.st_dev, current.st_ino):
+            LOGGER.info(f"Log file was rotated, following the new file: {file_path}")
+            reader.close()
+            return self.open_log(file_path, from_start=True)
+
+        if stat.st_size < reader.tell():
+            LOGGER.info(f"Log file was truncated, reading it from the start: {file_path}")
+            reader.seek(0)
+        return reader
@@ -0,0 +1,57 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_MAX_CONNECTIONS = 4
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+RETRY_METHODS = frozenset({"HEAD", "GET"})
+
+
+class HttpSessionFactory:
+    """
+    Factory class for creating pooled HTTP sessions used by the network readers.
+
+    Every session keeps its connections alive in a pool sized for the number of
+    concurrent downloads, and retries failed connections and transient server
+    errors with exponential backoff.
+    """
+
+    @staticmethod
+    def create_session(max_connections: int = DEFAULT_MAX_CONNECTIONS, retries: int = DEFAULT_RETRIES,
+                       backoff_factor: float = DEFAULT_BACKOFF_FACTOR) -> requests.Session:
+        """
+        Creates a `requests.Session` with connection pooling and retries.
+
+        Args:
+            max_connections (int): The number of connections kept open per host.
+            retries (int): The number of retries for a failed request.
+            backoff_factor (float): The base delay in seconds of the exponential backoff.
+
+        Returns:
+            requests.Session: The configured session.
+
+        Raises:
+            ValueError: If `max_connections` is not positive or `retries` is negative.
+        """
+        if max_connections < 1:
+            raise ValueError(f"Error: Unsupported number of connections '{max_connections}'")
+        if retries < 0:
+            raise ValueError(f"Error: Unsupported number of retries '{retries}'")
+
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=RETRY_METHODS,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=max_connections, pool_maxsize=max_connections, max_retries=retry)
+
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
@@ -0,0 +1,176 @@
+import hashlib
+import logging
+import os
+from datetime import datetime
+
+from src.models.checkpoint import Checkpoint
+from src.models.compression_codec import CompressionCodec
+from src.services.checkpoints.checkpoint_store import CheckpointStore
+from src.services.readers.bad_line_handler import BadLineHandler
+from src.services.readers.codec_detector import HEADER_LENGTH, CodecDetector
+from src.services.readers.file_log_reader import BLOCK_SIZE, FileLogReader
+
+LOGGER = logging.getLogger("IncrementalLogReader")
+
+HEAD_DIGEST_LENGTH = 4096
+
+
+class IncrementalLogReader(FileLogReader):
+    """
+    Class for reading a growing log file incrementally using stored checkpoints.
+
+    The `IncrementalLogReader` restores the analyzer state stored for a file
+    and parses only the lines appended since the previous run. A file is read
+    from the start again if it was rotated (another inode), truncated, or
+    rewritten in place (its head no longer matches). Only complete lines are
+    consumed, so a line still being written is picked up by the next run.
+    Compressed files are always read in full and are not checkpointed.
+    """
+
+    def __init__(self, analyzer, store: CheckpointStore, settings: str, fields: frozenset[str] | None = None,
+                 log_format: str | None = None, bad_lines: BadLineHandler | None = None):
+        """
+        Initializes the IncrementalLogReader.
+
+        Args:
+            analyzer: An object responsible for processing and storing metrics
+                      from each log entry.
+            store (CheckpointStore): The store holding the checkpoints.
+            settings (str): The description of the analysis settings; checkpoints
+                            made with other settings are ignored.
+            fields (frozenset[str] | None): The log entry fields to extract, or
+                                            `None` to extract all of them.
+            log_format (str | None): The format of the log lines, or `None` for
+                                     the NGINX `combined` format.
+            bad_lines (BadLineHandler | None): The handler of lines that cannot be
+                                               parsed, or `None` to skip them.
+        """
+        super().__init__(analyzer, fields, log_format, bad_lines)
+        self.store = store
+        self.settings = settings
+
+    def read_logs(self, file_path: str, from_time: datetime | None, to_time: datetime | None, filter_field: str, filter_value: str) -> None:
+        """
+        Reads the part of a log file not covered by its checkpoint and updates the checkpoint.
+
+        Args:
+            file_path (str): The path to the log file.
+            from_time (datetime | None): The starting time for filtering logs.
+            to_time (datetime | None): The ending time for filtering logs.
+            filter_field (str): The field to apply filtering on (e.g., `agent`, `request`, `status`).
+            filter_value (str): The value to match within the specified filter field.
+        """
+        path = os.path.abspath(file_path)
+
+        try:
+            with open(path, "rb") as reader:
+                stat = os.fstat(reader.fileno())
+                if CodecDetector.detect(reader.read(HEADER_LENGTH)) != CompressionCodec.NONE:
+                    super().read_logs(file_path, from_time, to_time, filter_field, filter_value)
+                    return
+
+                checkpoint = self.store.load(path, self.settings)
+                partial = self.restore_state(checkpoint) if checkpoint is not None else None
+                if partial is not None and self.can_resume(reader, stat, checkpoint):
+                    start = checkpoint.offset
+                else:
+                    if partial is not None:
+                        LOGGER.info(f"Log file was rotated or truncated, reading it again: {file_path}")
+                    partial = self.analyzer.create_empty()
+                    start = 0
+
+                end = self.find_last_line_end(reader, start, stat.st_size)
+                if end > start:
+                    reader.seek(start)
+                    FileLogReader(partial, self.fields, self.log_format, self.bad_lines).process_lines(
+                        self.iter_block_lines(reader, end - start), from_time, to_time, filter_field, filter_value,
+                        file_path
+                    )
+
+                head_digest = self.get_head_digest(reader, end)
+        except IOError:
+            LOGGER.error(f"Error reading logs from file: {file_path}", exc_info=True)
+            return
+
+        self.analyzer.merge(partial)
+        self.store.save(Checkpoint(path, self.settings, stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns,
+                                   end, head_digest, partial.to_bytes()))
+
+    def restore_state(self, checkpoint: Checkpoint):
+        """
+        Restores the analyzer state stored in a checkpoint.
+
+        Args:
+            checkpoint (Checkpoint): The stored checkpoint.
+
+        Returns:
+            The restored analyzer, or `None` if the state was written in an
+            unsupported format (e.g., by an older version).
+        """
+        try:
+            return type(self.analyzer).from_bytes(checkpoint.state)
+        except ValueError:
+            LOGGER.info(f"Ignoring checkpoint in an unsupported format: {checkpoint.path}")
+            return None
+
+    def can_resume(self, reader, stat: os.stat_result, checkpoint: Checkpoint) -> bool:
+        """
+        Checks whether a checkpoint still describes the beginning of a file.
+
+        Args:
+            reader: The binary file object of the log file.
+            stat (os.stat_result): The current status of the file.
+            checkpoint (Checkpoint): The stored checkpoint.
+
+        Returns:
+            bool: `True` if the file only grew since the checkpoint, `False` if
+                  it was replaced, truncated or rewritten.
+        """
+        if (stat.st_dev, stat.st_ino) != (checkpoint.device, checkpoint.inode) or stat.st_size < checkpoint.offset:
+            return False
+        return self.get_head_digest(reader, checkpoint.offset) == checkpoint.head_digest
+
+    @staticmethod
+    def get_head_digest(reader, offset: int) -> bytes:
+        """
+        Hashes the head of a file together with the last line before an offset.
+
+        Args:
+            reader: The binary file object of the log file.
+            offset (int): The offset up to which the file was analyzed.
+
+        Returns:
+            bytes: The digest of the file head.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        reader.seek(0)
+        digest.update(reader.read(min(offset, HEAD_DIGEST_LENGTH)))
+        tail_start = max(offset - HEAD_DIGEST_LENGTH, HEAD_DIGEST_LENGTH)
+        if tail_start < offset:
+            reader.seek(tail_start)
+            digest.update(reader.read(offset - tail_start))
+        return digest.digest()
+
+    @staticmethod
+    def find_last_line_end(reader, start: int, size: int) -> int:
+        """
+        Finds the offset right after the last newline between `start` and `size`.
+
+        Args:
+            reader: The binary file object of the log file.
+            start (int): The offset where the unread part of the file begins.
+            size (int): The size of the file.
+
+        Returns:
+            int: The offset right after the last complete line, or `start` if
+                 no line was completed since `start`.
+        """
+        position = size
+        while position > start:
+            block_start = max(start, position - BLOCK_SIZE)
+            reader.seek(block_start)
+            newline = reader.read(position - block_start).rfind(b"\n")
+            if newline != -1:
+                return block_start + newline + 1
+            position = block_start
+        return start
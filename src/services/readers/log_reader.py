@@ -1,5 +1,13 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
+from itertools import islice
+
+from src.models.nginx_log import NginxLog
+from src.parsers.nginx_log_batch_parser import NginxLogBatchParser
+from src.parsers.log_parser_factory import LogParserFactory
+from src.services.analytics.batch_analyzer import IBatchAnalyzer
+from src.services.analytics.log_filter import LogFilter
+from src.services.columnar.log_columns_filter import LogColumnsFilter
 
 
 class LogReader(ABC):
@@ -9,7 +17,11 @@ class LogReader(ABC):
     The `LogReader` class defines an interface for reading log entries from a source
     and applying filters based on time range and specific field values.
     Subclasses must implement the `read_logs` method to define the source and
-    behavior of log reading.
+    behavior of log reading. Subclasses that set the `analyzer`, `fields`,
+    `log_format` and `bad_lines` attributes can reuse the shared line pipeline in
+    `process_lines`, which switches to the batch pipeline of `process_batches` for
+    an `IBatchAnalyzer`. Lines that cannot be parsed are handed to the
+    `BadLineHandler` of `bad_lines`.
     """
 
     @abstractmethod
@@ -29,3 +41,183 @@ class LogReader(ABC):
             filter_value (str): The value to match within the specified filter field.
         """
         pass
+
+    @staticmethod
+    def iter_chunk_lines(chunks):
+        """
+        Splits a stream of raw byte chunks into lines.
+
+        Chunks are split on `b"\\n"` without decoding, and a line cut by a chunk
+        boundary is carried over to the next chunk.
+
+        Args:
+            chunks: An iterable of `bytes` chunks.
+
+        Yields:
+            bytes: The log lines without their line terminators.
+        """
+        remainder = b""
+        for chunk in chunks:
+            lines = (remainder + chunk).split(b"\n")
+            remainder = lines.pop()
+            yield from lines
+
+        if remainder:
+            yield remainder
+
+    def process_lines(self, lines, from_time: datetime | None, to_time: datetime | None, filter_field: str,
+                      filter_value: str, source: str = "-") -> None:
+        """
+        Parses and filters log lines and updates the analyzer with matching entries.
+
+        The filter is compiled once into a predicate. Lines are rejected by the
+        cheap raw line and raw field checks before their timestamps are parsed.
+        Lines for an `IBatchAnalyzer` are handed over to `process_batches`.
+        A line the parser rejects interrupts the loop; it is handed to
+        `bad_lines` and the loop resumes on the same iterator, so valid lines
+        don't pay for a `try` block each. Lines dropped by the raw checks are
+        never parsed, so they are not counted as bad.
+
+        Args:
+            lines: An iterable of raw `bytes` log lines.
+            from_time (datetime | None): The starting time for filtering logs.
+            to_time (datetime | None): The ending time for filtering logs.
+            filter_field (str): The field to apply filtering on (e.g., `agent`, `request`, `status`).
+            filter_value (str): The value to match within the specified filter field.
+            source (str): The path or URL the lines were read from, used to count bad lines.
+
+        Raises:
+            ValueError: If a line cannot be parsed under the `fail` error policy.
+        """
+        if isinstance(self.analyzer, IBatchAnalyzer):
+            self.process_batches(lines, from_time, to_time, filter_field, filter_value, source)
+            return
+
+        predicate = LogFilter().compile(filter_field, filter_value, self.log_format)
+        lines = iter(lines)
+        line = None
+
+        if predicate is None:
+            parser = LogParserFactory().get_parser(self.fields, self.log_format)
+            while True:
+                try:
+                    for line in lines:
+                        nginx_log = parser.parse(line)
+                        if self.is_within_time_range(nginx_log, from_time, to_time):
+                            self.analyzer.update_metrics(nginx_log)
+                    return
+                except ValueError as error:
+                    self.bad_lines.reject(self.analyzer, source, line, error)
+
+        parser = LogParserFactory().get_parser(None if self.fields is None else self.fields | {predicate.field},
+                                               self.log_format)
+        while True:
+            try:
+                for line in lines:
+                    if not predicate.matches_raw_line(line):
+                        continue
+                    nginx_log = parser.parse_matching(line, predicate)
+                    if nginx_log is not None and self.is_within_time_range(nginx_log, from_time, to_time):
+                        self.analyzer.update_metrics(nginx_log)
+                return
+            except ValueError as error:
+                self.bad_lines.reject(self.analyzer, source, line, error)
+
+    def process_batches(self, lines, from_time: datetime | None, to_time: datetime | None, filter_field: str,
+                        filter_value: str, source: str = "-") -> None:
+        """
+        Parses and filters log lines in batches and hands every batch to the analyzer.
+
+        Each batch of `batch_size` lines is parsed into `LogColumns` at once,
+        the time range becomes a row selection, and the analyzer aggregates the
+        selected rows in a single call. Lines failing the cheap raw line check
+        are dropped before parsing, and lines failing the raw field check before
+        their timestamps are parsed. A batch the parser rejects is parsed again
+        without its bad lines, which are found by `split_bad_lines`.
+
+        Args:
+            lines: An iterable of raw `bytes` log lines.
+            from_time (datetime | None): The starting time for filtering logs.
+            to_time (datetime | None): The ending time for filtering logs.
+            filter_field (str): The field to apply filtering on (e.g., `agent`, `request`, `status`).
+            filter_value (str): The value to match within the specified filter field.
+            source (str): The path or URL the lines were read from, used to count bad lines.
+
+        Raises:
+            ValueError: If a line cannot be parsed under the `fail` error policy.
+        """
+        predicate = LogFilter().compile(filter_field, filter_value, self.log_format)
+        parser = NginxLogBatchParser(self.log_format)
+        columns_filter = LogColumnsFilter(from_time, to_time, None)
+        needle = predicate.raw_needle if predicate is not None else None
+
+        for batch in self.iter_batches(lines, self.analyzer.batch_size):
+            if needle is not None:
+                batch = [line for line in batch if needle in line]
+            if not batch:
+                continue
+            try:
+                columns = parser.parse(batch, predicate)
+            except ValueError:
+                batch = self.split_bad_lines(parser, batch, predicate, source)
+                if not batch:
+                    continue
+                columns = parser.parse(batch, predicate)
+            self.analyzer.update_batch(columns, columns_filter.select_rows(columns))
+
+    def split_bad_lines(self, parser: NginxLogBatchParser, batch: list, predicate, source: str) -> list:
+        """
+        Hands the lines of a batch that cannot be parsed to `bad_lines`.
+
+        Args:
+            parser (NginxLogBatchParser): The parser that rejected the batch.
+            batch (list): The raw lines of the batch.
+            predicate: The compiled filter the batch was parsed with, or `None`.
+            source (str): The path or URL the lines were read from.
+
+        Returns:
+            list: The lines of the batch that can be parsed, in their order.
+        """
+        valid = []
+        for line in batch:
+            try:
+                parser.parse([line], predicate)
+            except ValueError as error:
+                self.bad_lines.reject(self.analyzer, source, line, error)
+            else:
+                valid.append(line)
+        return valid
+
+    @staticmethod
+    def iter_batches(lines, batch_size: int):
+        """
+        Groups log lines into lists of at most `batch_size` lines.
+
+        Args:
+            lines: An iterable of log lines.
+            batch_size (int): The maximum number of lines per batch.
+
+        Yields:
+            list: The lines of each batch.
+        """
+        lines = iter(lines)
+        while batch := list(islice(lines, batch_size)):
+            yield batch
+
+    def is_within_time_range(self, nginx_log: NginxLog, from_time: datetime | None, to_time: datetime | None) -> bool:
+        """
+        Checks if the log entry falls within the specified time range.
+
+        Args:
+            nginx_log: The log entry object with a `time_local` field.
+            from_time (datetime | None): The starting time for filtering logs.
+            to_time (datetime | None): The ending time for filtering logs.
+
+        Returns:
+            bool: True if the log entry falls within the range, False otherwise.
+        """
+        if from_time and nginx_log.time_local < from_time.replace(tzinfo=nginx_log.time_local.tzinfo):
+            return False
+        if to_time and nginx_log.time_local > to_time.replace(tzinfo=nginx_log.time_local.tzinfo):
+            return False
+        return True
@@ -1,8 +1,57 @@
+import copy
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime
 
+import requests
+
+from src.models.log_format_preset import LogFormatPreset
+from src.parsers.log_format_compiler import LogFormatCompiler
 from src.services.analytics.analyzer_intrerface import IAnalyzer
+from src.services.checkpoints.checkpoint_store import CheckpointStore
+from src.services.columnar.log_columns_cache import LogColumnsCache
+from src.services.indexes.time_index_store import TimeIndexStore
+from src.services.readers.bad_line_handler import BadLineHandler
+from src.services.readers.columnar_log_reader import ColumnarLogReader
 from src.services.readers.file_log_reader import FileLogReader
+from src.services.readers.http_session_factory import (DEFAULT_MAX_CONNECTIONS, DEFAULT_RETRIES, DEFAULT_TIMEOUT,
+                                                       HttpSessionFactory)
+from src.services.readers.incremental_log_reader import IncrementalLogReader
+from src.services.readers.mmap_log_reader import MmapLogReader
 from src.services.readers.network_log_reader import NetworkLogReader
+from src.services.readers.parallel_file_log_reader import ParallelFileLogReader
+from src.services.readers.time_indexed_log_reader import TimeIndexedLogReader
+
+MMAP_THRESHOLD = 64 << 20
+TIME_INDEX_THRESHOLD = 16 << 20
+
+
+def read_local_file(service: "LogReaderService", file_path: str, from_time: datetime | None,
+                    to_time: datetime | None, analyzer: IAnalyzer, filter_field: str, filter_value: str) -> bytes:
+    """
+    Reads one local log file into an empty partial analyzer.
+
+    This function runs inside a worker process, so it is kept at module level
+    to be picklable by `ProcessPoolExecutor`. The service is a single-worker
+    copy, so the reader it selects doesn't start processes of its own. Lines
+    the worker quarantines are flushed before it returns.
+
+    Args:
+        service (LogReaderService): A copy of the service that reads with one worker.
+        file_path (str): The path to the log file.
+        from_time (datetime | None): The start time for filtering logs.
+        to_time (datetime | None): The end time for filtering logs.
+        analyzer (IAnalyzer): An empty analyzer configured like the target one.
+        filter_field (str): The field used for filtering logs (e.g., `agent`, `request`, `status`).
+        filter_value (str): The value to match within the specified filter field.
+
+    Returns:
+        bytes: The serialized partial analyzer holding metrics for the file.
+    """
+    with service.bad_lines:
+        service.read_logs(file_path, from_time, to_time, analyzer, filter_field, filter_value)
+    return analyzer.to_bytes()
 
 
 class LogReaderService:
@@ -11,16 +60,139 @@ class LogReaderService:
 
     The `LogReaderService` determines whether to use a file-based log reader or
     a network-based log reader based on the file path prefix and initiates
-    the log reading process with the specified filters and analyzer.
+    the log reading process with the specified filters and analyzer. Local files
+    are read by several worker processes when more than one worker is requested,
+    and regular files above a size threshold are memory-mapped. Several sources
+    are read by `read_all`, which downloads remote ones concurrently over a
+    shared connection pool and, with several workers, reads local files in a
+    shared process pool, one file per task. When a checkpoint store is given, local files are
+    read incrementally from where the previous run stopped. When a columnar
+    cache is given, local files are parsed once and later analyzed from their
+    cached columns. Large local files queried for a time range are narrowed
+    down through a sparse time index, provided their format keeps the
+    timestamp in square brackets.
     """
 
-    def read_logs(self, file_path: str, from_time: datetime, to_time: datetime, analyzer: IAnalyzer, filter_field: str, filter_value: str) -> None:
+    def __init__(self, workers: int = 1, fields: frozenset[str] | None = None, mmap_threshold: int = MMAP_THRESHOLD,
+                 max_connections: int = DEFAULT_MAX_CONNECTIONS, timeout: float = DEFAULT_TIMEOUT,
+                 retries: int = DEFAULT_RETRIES, checkpoint_store: CheckpointStore | None = None,
+                 checkpoint_settings: str = "", time_index_store: TimeIndexStore | None = None,
+                 time_index_threshold: int = TIME_INDEX_THRESHOLD,
+                 column_cache: LogColumnsCache | None = None, log_format: str | None = None,
+                 bad_lines: BadLineHandler | None = None):
+        """
+        Initializes the LogReaderService.
+
+        Args:
+            workers (int): The number of worker processes used for local files.
+            fields (frozenset[str] | None): The log entry fields the readers should
+                                            extract, or `None` to extract all of them.
+            mmap_threshold (int): The size from which regular files are memory-mapped.
+            max_connections (int): The number of remote sources downloaded at once.
+            timeout (float): The connect and read timeout for remote sources in seconds.
+            retries (int): The number of retries for a failed request.
+            checkpoint_store (CheckpointStore | None): The store of per-file checkpoints,
+                                                       or `None` to always read files in full.
+            checkpoint_settings (str): The description of the analysis settings the
+                                       checkpoints are valid for.
+            time_index_store (TimeIndexStore | None): The cache of time indexes, or
+                                                      `None` to build them on every run.
+            time_index_threshold (int): The size from which files queried for a time
+                                        range are read through a time index.
+            column_cache (LogColumnsCache | None): The cache of parsed columns, or
+                                                   `None` to parse files on every run.
+            log_format (str | None): The format of the log lines, or `None` for
+                                     the NGINX `combined` format.
+            bad_lines (BadLineHandler | None): The handler of lines that cannot be
+                                               parsed, shared by all readers, or
+                                               `None` to skip them.
+        """
+        self.workers = workers
+        self.fields = fields
+        self.mmap_threshold = mmap_threshold
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.retries = retries
+        self.checkpoint_store = checkpoint_store
+        self.checkpoint_settings = checkpoint_settings
+        self.time_index_store = time_index_store
+        self.time_index_threshold = time_index_threshold
+        self.column_cache = column_cache
+        self.log_format = log_format
+        self.bad_lines = bad_lines if bad_lines is not None else BadLineHandler()
+
+    def read_all(self, file_paths: list[str], from_time: datetime, to_time: datetime, analyzer: IAnalyzer, filter_field: str, filter_value: str) -> None:
+        """
+        Reads logs from several sources into one analyzer.
+
+        Remote sources are downloaded and parsed in a bounded thread pool that
+        shares one pooled session. Meanwhile, several local files are read in a
+        process pool of `workers` processes, one file per task; a single local
+        file, or any local file when there is one worker or a checkpoint store,
+        is read in the calling thread, where a large file can still be split
+        between the workers. Every source fills its own partial analyzer, and
+        the partial analyzers are merged in the order of `file_paths`.
+
+        Args:
+            file_paths (list[str]): The paths or URLs of the log sources.
+            from_time (datetime): The start time for filtering logs.
+            to_time (datetime): The end time for filtering logs.
+            analyzer: An object responsible for analyzing the log data.
+            filter_field (str): The field used for filtering logs (e.g., `agent`, `request`, `status`).
+            filter_value (str): The value to match within the specified filter field.
+        """
+        if len(file_paths) == 1:
+            self.read_logs(file_paths[0], from_time, to_time, analyzer, filter_field, filter_value)
+            return
+
+        partials = [analyzer.create_empty() for _ in file_paths]
+        local_indexes = [index for index, file_path in enumerate(file_paths) if not file_path.startswith("http")]
+        # Checkpoint stores hold a database connection, which cannot be sent to worker processes.
+        use_processes = self.workers > 1 and len(local_indexes) > 1 and self.checkpoint_store is None
+
+        with HttpSessionFactory.create_session(self.max_connections, self.retries) as session, \
+                ThreadPoolExecutor(max_workers=self.max_connections) as executor, \
+                ProcessPoolExecutor(max_workers=min(self.workers, len(local_indexes))) if use_processes \
+                else nullcontext() as process_executor:
+            futures = [
+                executor.submit(self.read_logs, file_path, from_time, to_time, partial, filter_field, filter_value,
+                                session)
+                for file_path, partial in zip(file_paths, partials)
+                if file_path.startswith("http")
+            ]
+            if process_executor is None:
+                for index in local_indexes:
+                    self.read_logs(file_paths[index], from_time, to_time, partials[index], filter_field, filter_value)
+            else:
+                # Lines quarantined earlier go first, since the workers append to the same file.
+                self.bad_lines.flush()
+                service = copy.copy(self)
+                service.workers = 1
+                local_futures = {
+                    index: process_executor.submit(read_local_file, service, file_paths[index], from_time, to_time,
+                                                   partials[index], filter_field, filter_value)
+                    for index in local_indexes
+                }
+                for index, future in local_futures.items():
+                    partials[index] = type(analyzer).from_bytes(future.result())
+            for future in futures:
+                future.result()
+
+        for partial in partials:
+            analyzer.merge(partial)
+
+    def read_logs(self, file_path: str, from_time: datetime, to_time: datetime, analyzer: IAnalyzer, filter_field: str, filter_value: str,
+                  session: requests.Session | None = None) -> None:
         """
         Reads logs from the specified source, selecting the appropriate reader.
 
-        This method chooses between a `FileLogReader` or `NetworkLogReader` based
-        on whether the file path starts with "http". It then reads logs from the
-        source and applies the specified filters and time range.
+        This method chooses between a `FileLogReader`, an `MmapLogReader`, a
+        `ParallelFileLogReader`, an `IncrementalLogReader`, a `ColumnarLogReader`,
+        a `TimeIndexedLogReader` or a `NetworkLogReader` based on whether the file
+        path starts with "http", on the checkpoint store, on the columnar cache,
+        on the time range, on the number of workers and on the file size.
+        It then reads logs from the source and applies the specified filters and
+        time range.
 
         Args:
             file_path (str): The path or URL to the log source.
@@ -29,6 +201,43 @@ class LogReaderService:
             analyzer: An object responsible for analyzing the log data.
             filter_field (str): The field used for filtering logs (e.g., `agent`, `request`, `status`).
             filter_value (str): The value to match within the specified filter field.
+            session (requests.Session | None): The session for remote sources, or
+                                               `None` to open one for this source only.
         """
-        reader = NetworkLogReader(analyzer) if file_path.startswith("http") else FileLogReader(analyzer)
+        if file_path.startswith("http") and session is None:
+            with HttpSessionFactory.create_session(self.max_connections, self.retries) as session:
+                self.read_logs(file_path, from_time, to_time, analyzer, filter_field, filter_value, session)
+            return
+
+        if file_path.startswith("http"):
+            reader = NetworkLogReader(analyzer, fields=self.fields, workers=self.workers, session=session,
+                                      timeout=self.timeout, retries=self.retries, log_format=self.log_format,
+                                      bad_lines=self.bad_lines)
+        elif self.checkpoint_store is not None:
+            reader = IncrementalLogReader(analyzer, self.checkpoint_store, self.checkpoint_settings, fields=self.fields,
+                                          log_format=self.log_format, bad_lines=self.bad_lines)
+        elif self.column_cache is not None:
+            reader = ColumnarLogReader(analyzer, self.column_cache, log_format=self.log_format,
+                                       bad_lines=self.bad_lines)
+        elif (from_time is not None or to_time is not None) and self.has_bracketed_time() \
+                and os.path.isfile(file_path) and os.path.getsize(file_path) >= self.time_index_threshold:
+            reader = TimeIndexedLogReader(analyzer, fields=self.fields, workers=self.workers,
+                                          store=self.time_index_store, log_format=self.log_format,
+                                          bad_lines=self.bad_lines)
+        elif self.workers > 1:
+            reader = ParallelFileLogReader(analyzer, self.workers, fields=self.fields, log_format=self.log_format,
+                                           bad_lines=self.bad_lines)
+        elif os.path.isfile(file_path) and os.path.getsize(file_path) >= self.mmap_threshold:
+            reader = MmapLogReader(analyzer, fields=self.fields, log_format=self.log_format, bad_lines=self.bad_lines)
+        else:
+            reader = FileLogReader(analyzer, fields=self.fields, log_format=self.log_format, bad_lines=self.bad_lines)
         reader.read_logs(file_path, from_time, to_time, filter_field, filter_value)
+
+    def has_bracketed_time(self) -> bool:
+        """
+        Tells whether the time index can locate the timestamps of the log lines.
+
+        Returns:
+            bool: `True` if every line holds its `$time_local` between square brackets.
+        """
+        return LogFormatCompiler.compile(self.log_format or LogFormatPreset.COMBINED).has_bracketed_time
@@ -0,0 +1,162 @@
+import logging
+import mmap
+from datetime import datetime
+from pathlib import Path
+
+from src.models.compression_codec import CompressionCodec
+from src.parsers.log_parser_factory import LogParserFactory
+from src.services.analytics.batch_analyzer import IBatchAnalyzer
+from src.services.analytics.log_filter import LogFilter
+from src.services.readers.codec_detector import HEADER_LENGTH, CodecDetector
+from src.services.readers.file_log_reader import FileLogReader
+
+LOGGER = logging.getLogger("MmapLogReader")
+
+
+class MmapLogReader(FileLogReader):
+    """
+    Class for reading log entries from a memory-mapped file.
+
+    The `MmapLogReader` maps the file into memory, finds line boundaries with
+    `mmap.find`, and matches each line in place with `pos`/`endpos`, so lines
+    are neither copied into Python objects nor read through a line iterator.
+    Compressed files cannot be mapped usefully and are handed over to
+    `FileLogReader`.
+    """
+
+    def read_logs(self, file_path: str, from_time: datetime | None, to_time: datetime | None, filter_field: str, filter_value: str) -> None:
+        """
+        Reads and processes log entries from a memory-mapped file.
+
+        Args:
+            file_path (str): The path to the log file.
+            from_time (datetime | None): The starting time for filtering logs.
+            to_time (datetime | None): The ending time for filtering logs.
+            filter_field (str): The field to apply filtering on (e.g., `agent`, `request`, `status`).
+            filter_value (str): The value to match within the specified filter field.
+        """
+        try:
+            with Path(file_path).open("rb") as reader:
+                codec = CodecDetector.detect(reader.read(HEADER_LENGTH))
+        except IOError:
+            LOGGER.error(f"Error reading logs from file: {file_path}", exc_info=True)
+            return
+
+        if codec != CompressionCodec.NONE:
+            super().read_logs(file_path, from_time, to_time, filter_field, filter_value)
+            return
+
+        self.read_range(file_path, 0, None, from_time, to_time, filter_field, filter_value)
+
+    def read_range(self, file_path: str, start: int, end: int | None, from_time: datetime | None, to_time: datetime | None, filter_field: str, filter_value: str) -> None:
+        """
+        Reads and processes the log lines inside a newline-aligned byte range of a file.
+
+        Args:
+            file_path (str): The path to the log file.
+            start (int): The offset of the first line in the range.
+            end (int | None): The offset right after the last line in the range,
+                              or `None` for the end of the file.
+            from_time (datetime | None): The starting time for filtering logs.
+            to_time (datetime | None): The ending time for filtering logs.
+            filter_field (str): The field to apply filtering on (e.g., `agent`, `request`, `status`).
+            filter_value (str): The value to match within the specified filter field.
+        """
+        try:
+            with Path(file_path).open("rb") as reader:
+                size = reader.seek(0, 2)
+                if size == 0:
+                    return
+                with mmap.mmap(reader.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+                    self.process_buffer(mapping, start, size if end is None else min(end, size),
+                                        from_time, to_time, filter_field, filter_value, file_path)
+        except IOError:
+            LOGGER.error(f"Error reading logs from file: {file_path}", exc_info=True)
+
+    def process_buffer(self, buffer, start: int, end: int, from_time: datetime | None, to_time: datetime | None,
+                       filter_field: str, filter_value: str, source: str = "-") -> None:
+        """
+        Parses and filters the log lines stored in a slice of a buffer.
+
+        Lines for an `IBatchAnalyzer` are copied out of the buffer and handed
+        over to `process_batches`. A line the parser rejects is copied out and
+        handed to `bad_lines`, and the loop resumes at the next line.
+
+        Args:
+            buffer: A bytes-like object with a `find` method (e.g., an `mmap`).
+            start (int): The offset of the first line.
+            end (int): The offset right after the last line.
+            from_time (datetime | None): The starting time for filtering logs.
+            to_time (datetime | None): The ending time for filtering logs.
+            filter_field (str): The field to apply filtering on (e.g., `agent`, `request`, `status`).
+            filter_value (str): The value to match within the specified filter field.
+            source (str): The path the buffer was read from, used to count bad lines.
+
+        Raises:
+            ValueError: If a line cannot be parsed under the `fail` error policy.
+        """
+        if isinstance(self.analyzer, IBatchAnalyzer):
+            self.process_batches(self.iter_buffer_lines(buffer, start, end), from_time, to_time, filter_field,
+                                 filter_value, source)
+            return
+
+        predicate = LogFilter().compile(filter_field, filter_value, self.log_format)
+        find = buffer.find
+        position = start
+        line_end = start
+
+        if predicate is None:
+            parser = LogParserFactory().get_parser(self.fields, self.log_format)
+            while position < end:
+                try:
+                    while position < end:
+                        line_end = find(b"\n", position, end)
+                        if line_end == -1:
+                            line_end = end
+                        nginx_log = parser.parse_range(buffer, position, line_end)
+                        if self.is_within_time_range(nginx_log, from_time, to_time):
+                            self.analyzer.update_metrics(nginx_log)
+                        position = line_end + 1
+                except ValueError as error:
+                    self.bad_lines.reject(self.analyzer, source, buffer[position:line_end], error)
+                    position = line_end + 1
+            return
+
+        parser = LogParserFactory().get_parser(None if self.fields is None else self.fields | {predicate.field},
+                                               self.log_format)
+        while position < end:
+            try:
+                while position < end:
+                    line_end = find(b"\n", position, end)
+                    if line_end == -1:
+                        line_end = end
+                    if predicate.matches_raw_range(buffer, position, line_end):
+                        nginx_log = parser.parse_range_matching(buffer, position, line_end, predicate)
+                        if nginx_log is not None and self.is_within_time_range(nginx_log, from_time, to_time):
+                            self.analyzer.update_metrics(nginx_log)
+                    position = line_end + 1
+            except ValueError as error:
+                self.bad_lines.reject(self.analyzer, source, buffer[position:line_end], error)
+                position = line_end + 1
+
+    @staticmethod
+    def iter_buffer_lines(buffer, start: int, end: int):
+        """
+        Yields the log lines stored in a slice of a buffer.
+
+        Args:
+            buffer: A bytes-like object with a `find` method (e.g., an `mmap`).
+            start (int): The offset of the first line.
+            end (int): The offset right after the last line.
+
+        Yields:
+            bytes: The log lines without their line terminators.
+        """
+        find = buffer.find
+        position = start
+        while position < end:
+            line_end = find(b"\n", position, end)
+            if line_end == -1:
+                line_end = end
+            yield buffer[position:line_end]
+            position = line_end + 1
@@ -1,39 +1,112 @@
 import logging
 import requests
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
-from src.parsers.nginx_log_parser import NginxLogParser
 from src.services.analytics.analyzer_intrerface import IAnalyzer
-from src.services.analytics.log_filter import LogFilter
+from src.services.readers.bad_line_handler import BadLineHandler
+from src.services.readers.http_session_factory import DEFAULT_RETRIES, DEFAULT_TIMEOUT, HttpSessionFactory
 from src.services.readers.log_reader import LogReader
 
 LOGGER = logging.getLogger("NetworkLogReader")
 
+CHUNK_SIZE = 1 << 16
+MIN_RANGE_SIZE = 8 << 20
+
+
+def read_url_range(analyzer: IAnalyzer, url: str, start: int, end: int, from_time: datetime | None,
+                   to_time: datetime | None, filter_field: str, filter_value: str,
+                   fields: frozenset[str] | None = None, timeout: float = DEFAULT_TIMEOUT,
+                   retries: int = DEFAULT_RETRIES, log_format: str | None = None,
+                   bad_lines: BadLineHandler | None = None) -> bytes:
+    """
+    Downloads and processes the log lines that start inside one byte range of a URL.
+
+    This function runs inside a worker process, so it is kept at module level
+    to be picklable by `ProcessPoolExecutor`. Sessions cannot be shared across
+    processes, so each worker opens its own.
+
+    Args:
+        analyzer (IAnalyzer): An empty analyzer configured like the target one.
+        url (str): The URL of the log file.
+        start (int): The first byte of the range.
+        end (int): The byte right after the range.
+        from_time (datetime | None): The starting time for filtering logs.
+        to_time (datetime | None): The ending time for filtering logs.
+        filter_field (str): The field to apply filtering on (e.g., `agent`, `request`, `status`).
+        filter_value (str): The value to match within the specified filter field.
+        fields (frozenset[str] | None): The log entry fields to extract, or `None` for all.
+        timeout (float): The connect and read timeout in seconds.
+        retries (int): The number of retries for a failed request.
+        log_format (str | None): The format of the log lines, or `None` for combined.
+        bad_lines (BadLineHandler | None): A copy of the handler of lines that cannot
+                                           be parsed, or `None` to skip them.
+
+    Returns:
+        bytes: The serialized partial analyzer holding metrics for the range.
+    """
+    with HttpSessionFactory.create_session(max_connections=1, retries=retries) as session, \
+            bad_lines if bad_lines is not None else BadLineHandler() as handler:
+        reader = NetworkLogReader(analyzer, fields, session=session, timeout=timeout, retries=retries,
+                                  log_format=log_format, bad_lines=handler)
+        reader.read_range(url, start, end, from_time, to_time, filter_field, filter_value)
+    return analyzer.to_bytes()
+
 
 class NetworkLogReader(LogReader):
     """
     Class for reading log entries from a network source (URL) and analyzing them.
 
-    The `NetworkLogReader` reads logs from a specified URL, applies filters, and updates
-    the provided analyzer with relevant metrics. If a network error occurs, it logs an error.
+    The `NetworkLogReader` streams logs from a specified URL and parses them while
+    the download runs, applies filters, and updates the provided analyzer with
+    relevant metrics. When several workers are allowed and the server supports
+    range requests, large files are downloaded as parallel byte ranges that are
+    re-aligned at line boundaries. Requests go through a pooled session with
+    retries and a timeout. If a network error occurs, it logs an error.
     """
 
-    def __init__(self, analyzer: IAnalyzer):
+    def __init__(self, analyzer: IAnalyzer, fields: frozenset[str] | None = None, workers: int = 1,
+                 min_range_size: int = MIN_RANGE_SIZE, session: requests.Session | None = None,
+                 timeout: float = DEFAULT_TIMEOUT, retries: int = DEFAULT_RETRIES, log_format: str | None = None,
+                 bad_lines: BadLineHandler | None = None):
         """
         Initializes the NetworkLogReader with a provided analyzer.
 
         Args:
             analyzer: An object responsible for processing and storing metrics
                       from each log entry.
+            fields (frozenset[str] | None): The log entry fields to extract, or
+                                            `None` to extract all of them.
+            workers (int): The number of worker processes used for range downloads.
+            min_range_size (int): The smallest byte range worth handing to a worker.
+            session (requests.Session | None): The session used for requests, shared
+                                               between readers to reuse connections.
+                                               A new one is created if `None`.
+            timeout (float): The connect and read timeout in seconds.
+            retries (int): The number of retries for a failed request, used
+                           when the reader creates its own sessions.
+            log_format (str | None): The format of the log lines, or `None` for
+                                     the NGINX `combined` format.
+            bad_lines (BadLineHandler | None): The handler of lines that cannot be
+                                               parsed, or `None` to skip them.
         """
         self.analyzer = analyzer
+        self.fields = fields
+        self.log_format = log_format
+        self.bad_lines = bad_lines if bad_lines is not None else BadLineHandler()
+        self.workers = workers
+        self.min_range_size = min_range_size
+        self.session = session if session is not None else HttpSessionFactory.create_session(retries=retries)
+        self.timeout = timeout
+        self.retries = retries
 
     def read_logs(self, file_path: str, from_time: datetime, to_time: datetime, filter_field: str, filter_value: str) -> None:
         """
         Reads and processes log entries from a specified URL.
 
-        This method fetches logs from the URL, parses each line, filters entries by
-        time and additional filter criteria, and updates the analyzer with valid log data.
+        This method streams the log from the URL, parses each line as soon as it
+        arrives, filters entries by time and additional filter criteria, and
+        updates the analyzer with valid log data.
 
         Args:
             file_path (str): The URL to fetch log data from.
@@ -43,19 +116,133 @@ class NetworkLogReader(LogReader):
             filter_value (str): The value to match within the specified filter field.
         """
         try:
-            response = requests.get(file_path)
+            ranges = self.split_into_ranges(file_path) if self.workers > 1 else []
+            if len(ranges) > 1:
+                try:
+                    self.read_ranges(file_path, ranges, from_time, to_time, filter_field, filter_value)
+                    return
+                except requests.RequestException:
+                    LOGGER.warning(f"Range download failed, streaming the whole file: {file_path}", exc_info=True)
+
+            with self.session.get(file_path, stream=True, timeout=self.timeout) as response:
+                response.raise_for_status()
+                self.process_lines(self.iter_chunk_lines(response.iter_content(CHUNK_SIZE)),
+                                   from_time, to_time, filter_field, filter_value, file_path)
+
+        except requests.RequestException:
+            LOGGER.error(f"Error during network connection to URL: {file_path}", exc_info=True)
+
+    def read_ranges(self, url: str, ranges: list[tuple[int, int]], from_time: datetime | None, to_time: datetime | None,
+                    filter_field: str, filter_value: str) -> None:
+        """
+        Downloads and processes byte ranges of a URL in worker processes.
+
+        The partial analyzers are merged in range order once every range has
+        been read, so a failed range leaves the analyzer untouched (though lines
+        already quarantined by the workers stay in the quarantine file).
+
+        Args:
+            url (str): The URL of the log file.
+            ranges (list[tuple[int, int]]): The `(start, end)` byte ranges.
+            from_time (datetime | None): The starting time for filtering logs.
+            to_time (datetime | None): The ending time for filtering logs.
+            filter_field (str): The field to apply filtering on (e.g., `agent`, `request`, `status`).
+            filter_value (str): The value to match within the specified filter field.
+        """
+        self.bad_lines.flush()
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(ranges))) as executor:
+            futures = [
+                executor.submit(read_url_range, self.analyzer.create_empty(), url, start, end,
+                                from_time, to_time, filter_field, filter_value, self.fields,
+                                self.timeout, self.retries, self.log_format, self.bad_lines)
+                for start, end in ranges
+            ]
+            partials = [future.result() for future in futures]
+
+        for partial in partials:
+            self.analyzer.merge(type(self.analyzer).from_bytes(partial))
+
+    def read_range(self, url: str, start: int, end: int, from_time: datetime | None, to_time: datetime | None,
+                   filter_field: str, filter_value: str) -> None:
+        """
+        Downloads and processes the log lines that start inside a byte range of a URL.
+
+        The download starts one byte before the range, so the reader can tell
+        whether the range begins at a line start, and continues past the range
+        end until the last line that started inside the range is complete.
+
+        Args:
+            url (str): The URL of the log file.
+            start (int): The first byte of the range.
+            end (int): The byte right after the range.
+            from_time (datetime | None): The starting time for filtering logs.
+            to_time (datetime | None): The ending time for filtering logs.
+            filter_field (str): The field to apply filtering on (e.g., `agent`, `request`, `status`).
+            filter_value (str): The value to match within the specified filter field.
+
+        Raises:
+            requests.RequestException: If the download fails or the server ignores the range.
+        """
+        offset = max(start - 1, 0)
+        with self.session.get(url, headers={"Range": f"bytes={offset}-"}, stream=True, timeout=self.timeout) as response:
             response.raise_for_status()
+            if response.status_code != requests.codes.partial_content:
+                raise requests.RequestException(f"Server ignored the range request for URL: {url}")
 
-            parser = NginxLogParser()
-            log_filter = LogFilter()
+            lines = self.iter_range_lines(response.iter_content(CHUNK_SIZE), offset, start, end)
+            self.process_lines(lines, from_time, to_time, filter_field, filter_value, url)
 
-            for line in response.text.splitlines():
-                nginx_log = parser.parse(line)
-                after_from = (from_time is None) or (nginx_log.time_local >= from_time)
-                before_to = (to_time is None) or (nginx_log.time_local <= to_time)
+    @classmethod
+    def iter_range_lines(cls, chunks, offset: int, start: int, end: int):
+        """
+        Yields the lines that start inside `[start, end)` from chunks starting at `offset`.
 
-                if log_filter.matches_filter(nginx_log, filter_field, filter_value) and after_from and before_to:
-                    self.analyzer.update_metrics(nginx_log)
+        Args:
+            chunks: An iterable of `bytes` chunks, the first one starting at `offset`.
+            offset (int): The position of the first chunk byte, `start - 1` or 0.
+            start (int): The first byte of the range.
+            end (int): The byte right after the range.
 
-        except requests.RequestException:
-            LOGGER.error(f"Error during network connection to URL: {file_path}", exc_info=True)
+        Yields:
+            bytes: The log lines without their line terminators.
+        """
+        position = offset
+        lines = cls.iter_chunk_lines(chunks)
+        if offset < start:
+            # The byte before the range is a newline exactly when the range begins at a line start.
+            position += len(next(lines, b"")) + 1
+
+        for line in lines:
+            if position >= end:
+                break
+            position += len(line) + 1
+            yield line
+
+    def split_into_ranges(self, url: str) -> list[tuple[int, int]]:
+        """
+        Splits a remote file into byte ranges, one per worker.
+
+        The file is split only if the server advertises byte range support and
+        sends the body without a content encoding.
+
+        Args:
+            url (str): The URL of the log file.
+
+        Returns:
+            list[tuple[int, int]]: A list of `(start, end)` byte offsets, empty if
+                                   the file cannot be downloaded in ranges.
+        """
+        response = self.session.head(url, allow_redirects=True, timeout=self.timeout)
+        response.raise_for_status()
+
+        headers = response.headers
+        if headers.get("Accept-Ranges", "").lower() != "bytes" or headers.get("Content-Encoding", "identity") != "identity":
+            return []
+        try:
+            size = int(headers["Content-Length"])
+        except (KeyError, ValueError):
+            return []
+
+        parts = max(1, min(self.workers, size // self.min_range_size))
+        boundaries = [size * part // parts for part in range(parts + 1)]
+        return [(start, end) for start, end in zip(boundaries, boundaries[1:]) if end > start]
@@ -0,0 +1,328 @@
+import logging
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from src.models.compression_codec import CompressionCodec
+from src.services.analytics.analyzer_intrerface import IAnalyzer
+from src.services.readers.bad_line_handler import BadLineHandler
+from src.services.readers.codec_detector import DECOMPRESSION_ERRORS, HEADER_LENGTH, CodecDetector
+from src.services.readers.file_log_reader import FileLogReader
+from src.services.readers.log_reader import LogReader
+from src.services.readers.mmap_log_reader import MmapLogReader
+
+LOGGER = logging.getLogger("ParallelFileLogReader")
+
+MIN_RANGE_SIZE = 1 << 20
+
+
+def read_file_range(analyzer: IAnalyzer, file_path: str, start: int, end: int, from_time: datetime | None,
+                    to_time: datetime | None, filter_field: str, filter_value: str,
+                    fields: frozenset[str] | None = None, log_format: str | None = None,
+                    bad_lines: BadLineHandler | None = None) -> bytes:
+    """
+    Reads one byte range of a log file into an empty partial analyzer.
+
+    This function runs inside a worker process, so it is kept at module level
+    to be picklable by `ProcessPoolExecutor`. Each worker maps the file and
+    parses its range in place, and the partial analyzer is returned in its
+    compact serialized form to keep inter-process transfer cheap. Lines the
+    worker quarantines are flushed before it returns.
+
+    Args:
+        analyzer (IAnalyzer): An empty analyzer configured like the target one.
+        file_path (str): The path to the log file.
+        start (int): The offset of the first line in the range.
+        end (int): The offset right after the last line in the range.
+        from_time (datetime | None): The starting time for filtering logs.
+        to_time (datetime | None): The ending time for filtering logs.
+        filter_field (str): The field to apply filtering on (e.g., `agent`, `request`, `status`).
+        filter_value (str): The value to match within the specified filter field.
+        fields (frozenset[str] | None): The log entry fields to extract, or `None` for all.
+        log_format (str | None): The format of the log lines, or `None` for combined.
+        bad_lines (BadLineHandler | None): A copy of the handler of lines that cannot
+                                           be parsed, or `None` to skip them.
+
+    Returns:
+        bytes: The serialized partial analyzer holding metrics for the range.
+    """
+    with bad_lines if bad_lines is not None else BadLineHandler() as handler:
+        MmapLogReader(analyzer, fields, log_format, handler).read_range(file_path, start, end, from_time, to_time,
+                                                                        filter_field, filter_value)
+    return analyzer.to_bytes()
+
+
+def read_compressed_range(analyzer: IAnalyzer, file_path: str, codec: CompressionCodec, start: int, end: int,
+                          from_time: datetime | None, to_time: datetime | None, filter_field: str, filter_value: str,
+                          fields: frozenset[str] | None = None, log_format: str | None = None,
+                          bad_lines: BadLineHandler | None = None) -> tuple[int, bool, bytes, bytes]:
+    """
+    Decompresses the members starting inside one byte range into an empty partial analyzer.
+
+    The lines the worker quarantines are returned rather than written, since
+    the parent discards the whole attempt if the ranges don't join up.
+
+    Args:
+        analyzer (IAnalyzer): An empty analyzer configured like the target one.
+        file_path (str): The path to the compressed log file.
+        codec (CompressionCodec): The compression codec of the file.
+        start (int): The offset of the first member in the range.
+        end (int): Members starting at or after this offset belong to the next range.
+        from_time (datetime | None): The starting time for filtering logs.
+        to_time (datetime | None): The ending time for filtering logs.
+        filter_field (str): The field to apply filtering on (e.g., `agent`, `request`, `status`).
+        filter_value (str): The value to match within the specified filter field.
+        fields (frozenset[str] | None): The log entry fields to extract, or `None` for all.
+        log_format (str | None): The format of the log lines, or `None` for combined.
+        bad_lines (BadLineHandler | None): A copy of the handler of lines that cannot
+                                           be parsed, or `None` to skip them.
+
+    Returns:
+        tuple[int, bool, bytes, bytes]: The offset where the last member ended, whether
+                                        the decompressed data ended with a newline, the
+                                        serialized partial analyzer and the quarantined lines.
+    """
+    handler = (bad_lines if bad_lines is not None else BadLineHandler()).create_deferred()
+    position, ends_with_newline = FileLogReader(analyzer, fields, log_format, handler).read_members(
+        file_path, codec, start, end, from_time, to_time, filter_field, filter_value
+    )
+    return position, ends_with_newline, analyzer.to_bytes(), handler.take_buffer()
+
+
+class ParallelFileLogReader(LogReader):
+    """
+    Class for reading a large log file with several worker processes.
+
+    The `ParallelFileLogReader` splits a file into newline-aligned byte ranges,
+    parses and filters each range in a separate `ProcessPoolExecutor` worker,
+    and merges the partial analyzers into the provided analyzer in file order,
+    so the result is identical to a serial read. Compressed files are split at
+    member boundaries instead (gzip members, bz2/xz streams, zstd frames); the
+    boundaries are verified after decompression, and files that cannot be
+    split this way are decompressed serially.
+    """
+
+    def __init__(self, analyzer: IAnalyzer, workers: int, min_range_size: int = MIN_RANGE_SIZE,
+                 fields: frozenset[str] | None = None, log_format: str | None = None,
+                 bad_lines: BadLineHandler | None = None):
+        """
+        Initializes the ParallelFileLogReader.
+
+        Args:
+            analyzer (IAnalyzer): The analyzer that receives the merged metrics.
+            workers (int): The number of worker processes.
+            min_range_size (int): The smallest byte range worth handing to a worker.
+            fields (frozenset[str] | None): The log entry fields to extract, or `None` for all.
+            log_format (str | None): The format of the log lines, or `None` for combined.
+            bad_lines (BadLineHandler | None): The handler of lines that cannot be
+                                               parsed, or `None` to skip them.
+        """
+        self.analyzer = analyzer
+        self.workers = workers
+        self.min_range_size = min_range_size
+        self.fields = fields
+        self.log_format = log_format
+        self.bad_lines = bad_lines if bad_lines is not None else BadLineHandler()
+
+    def read_logs(self, file_path: str, from_time: datetime | None, to_time: datetime | None, filter_field: str, filter_value: str) -> None:
+        """
+        Reads and processes log entries from a file using worker processes.
+
+        Args:
+            file_path (str): The path to the log file.
+            from_time (datetime | None): The starting time for filtering logs.
+            to_time (datetime | None): The ending time for filtering logs.
+            filter_field (str): The field to apply filtering on (e.g., `agent`, `request`, `status`).
+            filter_value (str): The value to match within the specified filter field.
+        """
+        try:
+            with open(file_path, "rb") as reader:
+                codec = CodecDetector.detect(reader.read(HEADER_LENGTH))
+            if codec != CompressionCodec.NONE:
+                self.read_compressed_logs(file_path, codec, from_time, to_time, filter_field, filter_value)
+                return
+            size = os.path.getsize(file_path)
+        except IOError:
+            LOGGER.error(f"Error reading logs from file: {file_path}", exc_info=True)
+            return
+
+        self.read_range(file_path, 0, size, from_time, to_time, filter_field, filter_value)
+
+    def read_range(self, file_path: str, start: int, end: int, from_time: datetime | None, to_time: datetime | None,
+                   filter_field: str, filter_value: str) -> None:
+        """
+        Reads and processes the log lines inside a newline-aligned byte range of an uncompressed file.
+
+        Args:
+            file_path (str): The path to the log file.
+            start (int): The offset of the first line in the range.
+            end (int): The offset right after the last line in the range.
+            from_time (datetime | None): The starting time for filtering logs.
+            to_time (datetime | None): The ending time for filtering logs.
+            filter_field (str): The field to apply filtering on (e.g., `agent`, `request`, `status`).
+            filter_value (str): The value to match within the specified filter field.
+        """
+        try:
+            ranges = self.split_into_ranges(file_path, start, end)
+        except IOError:
+            LOGGER.error(f"Error reading logs from file: {file_path}", exc_info=True)
+            return
+
+        if len(ranges) <= 1:
+            FileLogReader(self.analyzer, self.fields, self.log_format, self.bad_lines).read_range(
+                file_path, start, end, from_time, to_time, filter_field, filter_value
+            )
+            return
+
+        # Lines quarantined earlier go first, since the workers append to the same file.
+        self.bad_lines.flush()
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(ranges))) as executor:
+            futures = [
+                executor.submit(read_file_range, self.analyzer.create_empty(), file_path, range_start, range_end,
+                                from_time, to_time, filter_field, filter_value, self.fields, self.log_format,
+                                self.bad_lines)
+                for range_start, range_end in ranges
+            ]
+            # Merging in range order keeps first-seen key order identical to a serial read.
+            for future in futures:
+                self.analyzer.merge(type(self.analyzer).from_bytes(future.result()))
+
+    def read_compressed_logs(self, file_path: str, codec: CompressionCodec, from_time: datetime | None,
+                             to_time: datetime | None, filter_field: str, filter_value: str) -> None:
+        """
+        Reads a compressed log file, decompressing its members in worker processes.
+
+        Every worker decompresses the members starting in its range. The split is
+        accepted only if each range ends exactly where the next one starts and on
+        a line boundary; otherwise the partial results are discarded and the file
+        is decompressed serially. The workers hand their quarantined lines back,
+        and they are quarantined only once the split is accepted, so the serial
+        read never quarantines a line twice.
+
+        Args:
+            file_path (str): The path to the compressed log file.
+            codec (CompressionCodec): The compression codec of the file.
+            from_time (datetime | None): The starting time for filtering logs.
+            to_time (datetime | None): The ending time for filtering logs.
+            filter_field (str): The field to apply filtering on (e.g., `agent`, `request`, `status`).
+            filter_value (str): The value to match within the specified filter field.
+        """
+        ranges = self.split_into_members(file_path, codec)
+        if len(ranges) > 1:
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(ranges))) as executor:
+                futures = [
+                    executor.submit(read_compressed_range, self.analyzer.create_empty(), file_path, codec, start, end,
+                                    from_time, to_time, filter_field, filter_value, self.fields, self.log_format,
+                                    self.bad_lines)
+                    for start, end in ranges
+                ]
+                partials = self.collect_verified_partials(ranges, futures)
+
+            if partials is not None:
+                for partial, quarantined in partials:
+                    self.analyzer.merge(type(self.analyzer).from_bytes(partial))
+                    self.bad_lines.add_to_buffer(quarantined)
+                return
+            LOGGER.warning(f"Could not split compressed file into members, reading it serially: {file_path}")
+
+        FileLogReader(self.analyzer, self.fields, self.log_format, self.bad_lines).read_logs(
+            file_path, from_time, to_time, filter_field, filter_value
+        )
+
+    @staticmethod
+    def collect_verified_partials(ranges: list[tuple[int, int]], futures) -> list[tuple[bytes, bytes]] | None:
+        """
+        Collects the results of compressed range workers and verifies that the ranges join up.
+
+        Args:
+            ranges (list[tuple[int, int]]): The `(start, end)` offsets given to the workers.
+            futures: The futures of the workers, in range order.
+
+        Returns:
+            list[tuple[bytes, bytes]] or None: The serialized partial analyzers with
+                                               the lines their workers quarantined, or
+                                               `None` if a worker failed or the member
+                                               chain is broken.
+        """
+        partials = []
+        for index, ((start, end), future) in enumerate(zip(ranges, futures)):
+            try:
+                position, ends_with_newline, partial, quarantined = future.result()
+            except (IOError, ValueError, *DECOMPRESSION_ERRORS):
+                LOGGER.debug("Compressed range %d-%d could not be read on its own", start, end, exc_info=True)
+                return None
+            is_last = index == len(ranges) - 1
+            if position != end or not (ends_with_newline or is_last):
+                return None
+            partials.append((partial, quarantined))
+        return partials
+
+    def split_into_members(self, file_path: str, codec: CompressionCodec) -> list[tuple[int, int]]:
+        """
+        Splits a compressed file into byte ranges that start at member boundaries.
+
+        Zstd seekable files list their frames in a seek table; for other files
+        the magic bytes of the codec are searched for near evenly spaced offsets.
+
+        Args:
+            file_path (str): The path to the compressed log file.
+            codec (CompressionCodec): The compression codec of the file.
+
+        Returns:
+            list[tuple[int, int]]: A list of `(start, end)` byte offsets.
+        """
+        size = os.path.getsize(file_path)
+        parts = max(1, min(self.workers, size // self.min_range_size))
+        if parts == 1:
+            return [(0, size)]
+
+        boundaries = [0]
+        with open(file_path, "rb") as reader, mmap.mmap(reader.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+            frame_offsets = CodecDetector.read_zstd_seek_table(mapping) if codec == CompressionCodec.ZSTD else None
+            for part in range(1, parts):
+                target = max(size * part // parts, boundaries[-1] + 1)
+                if frame_offsets is not None:
+                    boundary = next((offset for offset in frame_offsets if offset >= target), -1)
+                else:
+                    boundary = CodecDetector.find_member_start(mapping, target, codec)
+                if boundary == -1:
+                    break
+                boundaries.append(boundary)
+        boundaries.append(size)
+
+        return list(zip(boundaries, boundaries[1:]))
+
+    def split_into_ranges(self, file_path: str, start: int = 0, end: int | None = None) -> list[tuple[int, int]]:
+        """
+        Splits a file, or a newline-aligned part of it, into newline-aligned byte ranges, one per worker.
+
+        Each range starts at the beginning of a line and ends right after a
+        newline (or at the end of the part), so no line is cut in two.
+
+        Args:
+            file_path (str): The path to the log file.
+            start (int): The offset where the part to split begins.
+            end (int | None): The offset where the part ends, or `None` for the end of the file.
+
+        Returns:
+            list[tuple[int, int]]: A list of `(start, end)` byte offsets.
+        """
+        end = os.path.getsize(file_path) if end is None else end
+        size = end - start
+        parts = max(1, min(self.workers, size // self.min_range_size))
+
+        boundaries = [start]
+        with open(file_path, "rb") as reader:
+            for part in range(1, parts):
+                reader.seek(max(start + size * part // parts, boundaries[-1]))
+                reader.readline()
+                boundary = reader.tell()
+                if boundary >= end:
+                    break
+                if boundary > boundaries[-1]:
+                    boundaries.append(boundary)
+        boundaries.append(end)
+
+        return [(range_start, range_end) for range_start, range_end in zip(boundaries, boundaries[1:])
+                if range_end > range_start]
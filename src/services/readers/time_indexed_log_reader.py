@@ -0,0 +1,149 @@
+import logging
+import os
+from datetime import datetime
+
+from src.models.compression_codec import CompressionCodec
+from src.services.indexes.time_index import DEFAULT_SAMPLE_INTERVAL, DEFAULT_TOLERANCE_SECONDS, TimeIndex
+from src.services.indexes.time_index_store import TimeIndexStore
+from src.services.readers.bad_line_handler import BadLineHandler
+from src.services.readers.codec_detector import HEADER_LENGTH, CodecDetector
+from src.services.readers.file_log_reader import FileLogReader
+from src.services.readers.incremental_log_reader import IncrementalLogReader
+from src.services.readers.mmap_log_reader import MmapLogReader
+from src.services.readers.parallel_file_log_reader import ParallelFileLogReader
+
+LOGGER = logging.getLogger("TimeIndexedLogReader")
+
+
+class TimeIndexedLogReader(FileLogReader):
+    """
+    Class for reading only the part of a log file that can match a time range.
+
+    The `TimeIndexedLogReader` looks up or builds a sparse `TimeIndex` of the
+    file, seeks straight to the last sample before `from_time` and stops at the
+    first sample past `to_time`, allowing timestamps to go back by a tolerance.
+    Lines inside that byte range are still filtered exactly. Cached indexes are
+    reused while the file keeps its identity and only grows, and are extended
+    by the newly appended part. Compressed files cannot be sought and are read
+    in full.
+    """
+
+    def __init__(self, analyzer, fields: frozenset[str] | None = None, workers: int = 1,
+                 store: TimeIndexStore | None = None, sample_interval: int = DEFAULT_SAMPLE_INTERVAL,
+                 tolerance: int = DEFAULT_TOLERANCE_SECONDS, log_format: str | None = None,
+                 bad_lines: BadLineHandler | None = None):
+        """
+        Initializes the TimeIndexedLogReader.
+
+        Args:
+            analyzer: An object responsible for processing and storing metrics
+                      from each log entry.
+            fields (frozenset[str] | None): The log entry fields to extract, or
+                                            `None` to extract all of them.
+            workers (int): The number of worker processes reading the selected range.
+            store (TimeIndexStore | None): The cache of time indexes, or `None` to
+                                           build the index on every read.
+            sample_interval (int): The distance between two index samples in bytes.
+            tolerance (int): How many seconds timestamps may go back in the file.
+            log_format (str | None): The format of the log lines, or `None` for
+                                     the NGINX `combined` format.
+            bad_lines (BadLineHandler | None): The handler of lines that cannot be
+                                               parsed, or `None` to skip them.
+        """
+        super().__init__(analyzer, fields, log_format, bad_lines)
+        self.workers = workers
+        self.store = store
+        self.sample_interval = sample_interval
+        self.tolerance = tolerance
+
+    def read_logs(self, file_path: str, from_time: datetime | None, to_time: datetime | None, filter_field: str, filter_value: str) -> None:
+        """
+        Reads and processes the log entries of a file that lie inside a time range.
+
+        Args:
+            file_path (str): The path to the log file.
+            from_time (datetime | None): The starting time for filtering logs.
+            to_time (datetime | None): The ending time for filtering logs.
+            filter_field (str): The field to apply filtering on (e.g., `agent`, `request`, `status`).
+            filter_value (str): The value to match within the specified filter field.
+        """
+        path = os.path.abspath(file_path)
+
+        try:
+            with open(path, "rb") as reader:
+                stat = os.fstat(reader.fileno())
+                codec = CodecDetector.detect(reader.read(HEADER_LENGTH))
+                index = self.load_index(path, reader, stat) if codec == CompressionCodec.NONE else None
+        except IOError:
+            LOGGER.error(f"Error reading logs from file: {file_path}", exc_info=True)
+            return
+
+        if index is None:
+            if self.workers > 1:
+                ParallelFileLogReader(self.analyzer, self.workers, fields=self.fields, log_format=self.log_format,
+                                      bad_lines=self.bad_lines).read_logs(
+                    file_path, from_time, to_time, filter_field, filter_value
+                )
+            else:
+                super().read_logs(file_path, from_time, to_time, filter_field, filter_value)
+            return
+
+        start, end = index.find_range(from_time, to_time, stat.st_size, self.tolerance)
+        LOGGER.debug(f"Time index selected bytes {start}-{end} of {stat.st_size}: {file_path}")
+        if end <= start:
+            return
+
+        if self.workers > 1:
+            ParallelFileLogReader(self.analyzer, self.workers, fields=self.fields, log_format=self.log_format,
+                                  bad_lines=self.bad_lines).read_range(
+                file_path, start, end, from_time, to_time, filter_field, filter_value
+            )
+        else:
+            MmapLogReader(self.analyzer, self.fields, self.log_format, self.bad_lines).read_range(
+                file_path, start, end, from_time, to_time, filter_field, filter_value
+            )
+
+    def load_index(self, path: str, reader, stat: os.stat_result) -> TimeIndex:
+        """
+        Returns an up-to-date time index of a file, reusing the cached one if possible.
+
+        Args:
+            path (str): The absolute path of the log file.
+            reader: The binary file object of the log file.
+            stat (os.stat_result): The current status of the file.
+
+        Returns:
+            TimeIndex: The index covering the whole file.
+        """
+        index = self.store.load(path) if self.store is not None else None
+        if index is None or not self.can_extend(index, reader, stat):
+            index = TimeIndex(stat.st_dev, stat.st_ino, self.sample_interval)
+
+        if index.size != stat.st_size:
+            index.extend(reader, stat.st_size)
+            index.head_digest = IncrementalLogReader.get_head_digest(reader, stat.st_size)
+            if self.store is not None:
+                try:
+                    self.store.save(path, index)
+                except OSError:
+                    LOGGER.warning(f"Could not cache the time index of: {path}", exc_info=True)
+        return index
+
+    def can_extend(self, index: TimeIndex, reader, stat: os.stat_result) -> bool:
+        """
+        Checks whether a cached index still describes the beginning of a file.
+
+        Args:
+            index (TimeIndex): The cached index.
+            reader: The binary file object of the log file.
+            stat (os.stat_result): The current status of the file.
+
+        Returns:
+            bool: `True` if the file only grew since it was indexed with the same
+                  sample interval, `False` if it was replaced, truncated or rewritten.
+        """
+        if (stat.st_dev, stat.st_ino) != (index.device, index.inode) or stat.st_size < index.size:
+            return False
+        if index.sample_interval != self.sample_interval:
+            return False
+        return IncrementalLogReader.get_head_digest(reader, index.size) == index.head_digest
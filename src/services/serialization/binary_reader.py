@@ -0,0 +1,196 @@
+import sys
+from array import array
+from datetime import datetime, timedelta, timezone
+
+from src.services.serialization.binary_writer import (
+    DATETIME_AWARE,
+    DATETIME_NAIVE,
+    DATETIME_NONE,
+    EPOCH,
+    FLOAT64,
+    INT32,
+    INT64,
+    UINT8,
+    UINT32,
+    UINT64,
+)
+
+
+class BinaryReader:
+    """
+    Class for reading values written by `BinaryWriter`.
+
+    The `BinaryReader` walks a byte buffer sequentially and decodes values in the
+    same order and layout they were written. It raises `ValueError` when the
+    buffer ends prematurely or contains an unknown marker.
+    """
+
+    def __init__(self, data: bytes):
+        """
+        Initializes the BinaryReader over a byte buffer.
+
+        Args:
+            data (bytes): The buffer to read from.
+        """
+        self.data = memoryview(data)
+        self.offset = 0
+
+    def read_struct(self, packer):
+        """
+        Reads a single value with a precompiled `struct.Struct`.
+
+        Args:
+            packer (struct.Struct): The struct describing the value layout.
+
+        Returns:
+            The unpacked value.
+
+        Raises:
+            ValueError: If the buffer is too short.
+        """
+        end = self.offset + packer.size
+        if end > len(self.data):
+            raise ValueError("Unexpected end of binary data")
+        (value,) = packer.unpack_from(self.data, self.offset)
+        self.offset = end
+        return value
+
+    def read_raw(self, length: int) -> bytes:
+        """
+        Reads a fixed number of bytes without a length prefix.
+
+        Args:
+            length (int): The number of bytes to read.
+
+        Returns:
+            bytes: The bytes read.
+
+        Raises:
+            ValueError: If the buffer is too short.
+        """
+        end = self.offset + length
+        if end > len(self.data):
+            raise ValueError("Unexpected end of binary data")
+        value = self.data[self.offset:end].tobytes()
+        self.offset = end
+        return value
+
+    def read_uint8(self) -> int:
+        """
+        Reads an unsigned 8-bit integer.
+
+        Returns:
+            int: The value read.
+        """
+        return self.read_struct(UINT8)
+
+    def read_uint32(self) -> int:
+        """
+        Reads an unsigned 32-bit integer.
+
+        Returns:
+            int: The value read.
+        """
+        return self.read_struct(UINT32)
+
+    def read_int32(self) -> int:
+        """
+        Reads a signed 32-bit integer.
+
+        Returns:
+            int: The value read.
+        """
+        return self.read_struct(INT32)
+
+    def read_uint64(self) -> int:
+        """
+        Reads an unsigned 64-bit integer.
+
+        Returns:
+            int: The value read.
+        """
+        return self.read_struct(UINT64)
+
+    def read_int64(self) -> int:
+        """
+        Reads a signed 64-bit integer.
+
+        Returns:
+            int: The value read.
+        """
+        return self.read_struct(INT64)
+
+    def read_float64(self) -> float:
+        """
+        Reads a 64-bit floating point number.
+
+        Returns:
+            float: The value read.
+        """
+        return self.read_struct(FLOAT64)
+
+    def read_bytes(self) -> bytes:
+        """
+        Reads a length-prefixed byte string.
+
+        Returns:
+            bytes: The bytes read.
+
+        Raises:
+            ValueError: If the buffer is too short.
+        """
+        return self.read_raw(self.read_uint64())
+
+    def read_str(self) -> str:
+        """
+        Reads a length-prefixed UTF-8 string.
+
+        Returns:
+            str: The string read.
+        """
+        return self.read_bytes().decode("utf-8", "surrogatepass")
+
+    def read_int_array(self) -> array:
+        """
+        Reads a length-prefixed array of signed 64-bit integers.
+
+        Returns:
+            array: An `array('q')` with the values read.
+        """
+        values = array("q")
+        values.frombytes(self.read_bytes())
+        if sys.byteorder != "little":
+            values.byteswap()
+        return values
+
+    def read_datetime(self) -> datetime | None:
+        """
+        Reads an optional datetime written by `BinaryWriter.write_datetime`.
+
+        Returns:
+            datetime or None: The datetime read.
+
+        Raises:
+            ValueError: If the datetime marker is unknown.
+        """
+        kind = self.read_uint8()
+        if kind == DATETIME_NONE:
+            return None
+
+        microseconds = self.read_int64()
+        offset_seconds = self.read_int32()
+        value = EPOCH + timedelta(microseconds=microseconds)
+        if kind == DATETIME_NAIVE:
+            return value.replace(tzinfo=None)
+        if kind == DATETIME_AWARE:
+            return value.astimezone(timezone(timedelta(seconds=offset_seconds)))
+        raise ValueError(f"Unknown datetime marker: {kind}")
+
+    def at_end(self) -> bool:
+        """
+        Checks whether the whole buffer has been consumed.
+
+        Returns:
+            bool: True if no unread bytes remain.
+        """
+        return self.offset == len(self.data)
@@ -0,0 +1,160 @@
+import struct
+import sys
+from array import array
+from datetime import datetime, timedelta, timezone
+
+UINT8 = struct.Struct("<B")
+UINT32 = struct.Struct("<I")
+INT32 = struct.Struct("<i")
+UINT64 = struct.Struct("<Q")
+INT64 = struct.Struct("<q")
+FLOAT64 = struct.Struct("<d")
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+MICROSECOND = timedelta(microseconds=1)
+
+DATETIME_NONE = 0
+DATETIME_NAIVE = 1
+DATETIME_AWARE = 2
+
+
+class BinaryWriter:
+    """
+    Class for building a compact little-endian binary representation of values.
+
+    The `BinaryWriter` collects struct-packed numbers, length-prefixed strings and
+    raw integer arrays into a buffer, so analysis state can be sent between
+    processes or written to disk without pickling Python objects one by one.
+    """
+
+    def __init__(self):
+        """
+        Initializes the BinaryWriter with an empty buffer.
+        """
+        self.parts: list[bytes] = []
+
+    def write_raw(self, value: bytes) -> None:
+        """
+        Writes bytes as they are, without a length prefix.
+
+        Args:
+            value (bytes): The bytes to write.
+        """
+        self.parts.append(bytes(value))
+
+    def write_uint8(self, value: int) -> None:
+        """
+        Writes an unsigned 8-bit integer.
+
+        Args:
+            value (int): The value to write.
+        """
+        self.parts.append(UINT8.pack(value))
+
+    def write_uint32(self, value: int) -> None:
+        """
+        Writes an unsigned 32-bit integer.
+
+        Args:
+            value (int): The value to write.
+        """
+        self.parts.append(UINT32.pack(value))
+
+    def write_int32(self, value: int) -> None:
+        """
+        Writes a signed 32-bit integer.
+
+        Args:
+            value (int): The value to write.
+        """
+        self.parts.append(INT32.pack(value))
+
+    def write_uint64(self, value: int) -> None:
+        """
+        Writes an unsigned 64-bit integer.
+
+        Args:
+            value (int): The value to write.
+        """
+        self.parts.append(UINT64.pack(value))
+
+    def write_int64(self, value: int) -> None:
+        """
+        Writes a signed 64-bit integer.
+
+        Args:
+            value (int): The value to write.
+        """
+        self.parts.append(INT64.pack(value))
+
+    def write_float64(self, value: float) -> None:
+        """
+        Writes a 64-bit floating point number.
+
+        Args:
+            value (float): The value to write.
+        """
+        self.parts.append(FLOAT64.pack(value))
+
+    def write_bytes(self, value: bytes) -> None:
+        """
+        Writes a length-prefixed byte string.
+
+        Args:
+            value (bytes): The bytes to write.
+        """
+        self.parts.append(UINT64.pack(len(value)))
+        self.parts.append(bytes(value))
+
+    def write_str(self, value: str) -> None:
+        """
+        Writes a length-prefixed UTF-8 string.
+
+        Lone surrogates (e.g., from undecodable log bytes) are preserved.
+
+        Args:
+            value (str): The string to write.
+        """
+        self.write_bytes(value.encode("utf-8", "surrogatepass"))
+
+    def write_int_array(self, values: array) -> None:
+        """
+        Writes a length-prefixed array of signed 64-bit integers.
+
+        Args:
+            values (array): An `array('q')` of values to write.
+        """
+        if sys.byteorder != "little":
+            values = array("q", values)
+            values.byteswap()
+        self.write_bytes(values.tobytes())
+
+    def write_datetime(self, value: datetime | None) -> None:
+        """
+        Writes an optional datetime as microseconds since the epoch plus its UTC offset.
+
+        Args:
+            value (datetime | None): The datetime to write.
+        """
+        if value is None:
+            self.write_uint8(DATETIME_NONE)
+            return
+
+        offset = value.utcoffset()
+        if offset is None:
+            self.write_uint8(DATETIME_NAIVE)
+            self.write_int64((value.replace(tzinfo=timezone.utc) - EPOCH) // MICROSECOND)
+            self.write_int32(0)
+        else:
+            self.write_uint8(DATETIME_AWARE)
+            self.write_int64((value - EPOCH) // MICROSECOND)
+            self.write_int32(int(offset.total_seconds()))
+
+    def getvalue(self) -> bytes:
+        """
+        Returns the written data.
+
+        Returns:
+            bytes: The concatenated binary representation.
+        """
+        return b"".join(self.parts)
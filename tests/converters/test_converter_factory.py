@@ -1,6 +1,8 @@
 import unittest
 from src.converters.from_nginx_log_to_markdown_converter import FromNginxLogToMarkDownConverter
 from src.converters.from_nginx_logs_to_adoc_converter import FromNginxLogsToAdocConverter
+from src.converters.from_nginx_logs_to_csv_converter import FromNginxLogsToCsvConverter
+from src.converters.from_nginx_logs_to_json_converter import FromNginxLogsToJsonConverter
 from src.models.format_option import FormatOption
 from src.converters.converter_factory import ConverterFactory
 
@@ -17,6 +19,10 @@ class TestConverterFactory(unittest.TestCase):
         converter = self.factory.get_converter(FormatOption.ADOC)
         self.assertIsInstance(converter, FromNginxLogsToAdocConverter)
 
+    def test_csv_and_json_converter_creation(self):
+        self.assertIsInstance(self.factory.get_converter(FormatOption.CSV), FromNginxLogsToCsvConverter)
+        self.assertIsInstance(self.factory.get_converter(FormatOption.JSON), FromNginxLogsToJsonConverter)
+
     def test_unsupported_format(self):
         with self.assertRaises(ValueError) as context:
             self.factory.get_converter("unsupported_format")
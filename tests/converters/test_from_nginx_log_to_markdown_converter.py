@@ -5,6 +5,9 @@ from datetime import datetime, timezone
 from src.converters.from_nginx_log_to_markdown_converter import FromNginxLogToMarkDownConverter
 from src.services.readers.file_log_reader import FileLogReader
 from src.services.analytics.analyzer import Analyzer
+from src.services.analytics.heavy_hitters import HeavyHitters
+from src.services.analytics.latency_stats import LatencyStats
+from src.services.analytics.time_series import TimeSeries
 import os
 
 
@@ -75,6 +78,54 @@ class TestFromNginxLogToMarkDownConverterWithFile(unittest.TestCase):
         self.assertIn("| 404 | Not Found |       1 |", report)
         self.assertIn("| 500 | Internal Server Error |       1 |", report)
 
+    def test_convert_logs_to_markdown_with_time_series(self):
+        analyzer = Analyzer(time_series=TimeSeries(3600))
+        FileLogReader(analyzer).read_logs(self.temp_file.name, None, None, filter_field=None, filter_value=None)
+
+        report = self.converter.create_a_report(analyzer)
+
+        self.assertIn("#### Временной ряд (UTC)", report)
+        self.assertIn("| 2023-11-19 10:00:00 | 3 | 66.67% | 2_691b | 889b |", report)
+
+    def test_convert_logs_to_markdown_with_latency(self):
+        latency = LatencyStats()
+        latency.add("/slow", 504, 2.5, 2.0)
+        latency.add("/fast", 200, 0.01, None)
+        analyzer = Analyzer(latency=latency)
+
+        report = self.converter.create_a_report(analyzer)
+
+        self.assertIn("#### Время ответа", report)
+        self.assertIn("| request_time | 2 |", report)
+        self.assertIn("| upstream_response_time | 1 |", report)
+        self.assertLess(report.index("| `/slow` | 1 |"), report.index("| `/fast` | 1 |"))
+        self.assertIn("| 504 | 1 |", report)
+        self.assertNotIn("Время ответа", self.converter.create_a_report(Analyzer()))
+
+    def test_convert_logs_to_markdown_with_heavy_hitters(self):
+        analyzer = Analyzer(heavy_hitters=HeavyHitters(1))
+        FileLogReader(analyzer, analyzer.get_required_fields()).read_logs(self.temp_file.name, None, None,
+                                                                          filter_field=None, filter_value=None)
+
+        report = self.converter.create_a_report(analyzer)
+
+        self.assertEqual(report.count("|  `/"), 1)
+        self.assertIn("#### Самые активные IP-адреса", report)
+        self.assertIn("#### Самые частые User-Agent", report)
+        self.assertIn("#### Самые частые Referer", report)
+        self.assertNotIn("Самые активные IP-адреса", self.converter.create_a_report(Analyzer()))
+
+    def test_convert_logs_to_markdown_with_bad_lines(self):
+        analyzer = Analyzer()
+        analyzer.record_bad_line("access.log")
+        analyzer.record_bad_line("access.log")
+
+        report = self.converter.create_a_report(analyzer)
+
+        self.assertIn("#### Некорректные строки", report)
+        self.assertIn("|  `access.log`  |      2 |", report)
+        self.assertNotIn("Некорректные строки", self.converter.create_a_report(Analyzer()))
+
     def tearDown(self):
         os.remove(self.temp_file.name)
 
@@ -3,6 +3,9 @@ from tempfile import NamedTemporaryFile
 from src.converters.from_nginx_logs_to_adoc_converter import FromNginxLogsToAdocConverter
 from src.services.readers.file_log_reader import FileLogReader
 from src.services.analytics.analyzer import Analyzer
+from src.services.analytics.heavy_hitters import HeavyHitters
+from src.services.analytics.latency_stats import LatencyStats
+from src.services.analytics.time_series import TimeSeries
 import os
 
 
@@ -32,6 +35,9 @@ class TestFromNginxLogsToAdocConverterWithFile(unittest.TestCase):
         self.assertIn("| Конечная дата | 19.11.2023", report)
         self.assertIn("| Количество запросов | 3", report)
         self.assertIn("| Средний размер ответа | 897b", report)
+        self.assertIn("| 50p размера ответа | 567b", report)
+        self.assertIn("| 95p размера ответа | 890b", report)
+        self.assertIn("| 99p размера ответа | 890b", report)
         self.assertIn("| Процент ошибок (4xx и 5xx) | 66.67%", report)
 
         self.assertIn("== Запрашиваемые ресурсы", report)
@@ -43,6 +49,56 @@ class TestFromNginxLogsToAdocConverterWithFile(unittest.TestCase):
         self.assertIn("| 200 | OK | 1", report)
         self.assertIn("| 404 | Not Found | 1", report)
         self.assertIn("| 500 | Internal Server Error | 1", report)
+        self.assertNotIn("== Временной ряд", report)
+
+    def test_convert_logs_to_adoc_with_time_series(self):
+        analyzer = Analyzer(time_series=TimeSeries(300))
+        FileLogReader(analyzer).read_logs(self.temp_file.name, None, None, filter_field=None, filter_value=None)
+
+        report = self.converter.create_a_report(analyzer)
+
+        self.assertIn("== Временной ряд (UTC)", report)
+        self.assertIn("| 2023-11-19 10:00:00 | 1 | 0.00% | 1234b | 1234b", report)
+        self.assertIn("| 2023-11-19 10:05:00 | 1 | 100.00% | 567b | 567b", report)
+
+    def test_convert_logs_to_adoc_with_latency(self):
+        analyzer = Analyzer(latency=LatencyStats())
+        with open(self.temp_file.name, "w") as log_file:
+            log_file.write("127.0.0.1 [19/Nov/2023:10:00:00 +0000] \"GET /home HTTP/1.1\" 200 12 0.250\n"
+                           "127.0.0.1 [19/Nov/2023:10:00:01 +0000] \"GET /api HTTP/1.1\" 504 0 3.000\n")
+        FileLogReader(analyzer, analyzer.get_required_fields(),
+                      "$remote_addr [$time_local] \"$request\" $status $body_bytes_sent $request_time"
+                      ).read_logs(self.temp_file.name, None, None, filter_field=None, filter_value=None)
+
+        report = self.converter.create_a_report(analyzer)
+
+        self.assertIn("== Время ответа", report)
+        self.assertIn("| request_time | 2 |", report)
+        self.assertNotIn("| upstream_response_time |", report)
+        self.assertLess(report.index("| /api | 1 |"), report.index("| /home | 1 |"))
+        self.assertIn("| 504 | 1 | 3.000s", report)
+
+    def test_convert_logs_to_adoc_with_heavy_hitters(self):
+        analyzer = Analyzer(heavy_hitters=HeavyHitters(1))
+        FileLogReader(analyzer, analyzer.get_required_fields()).read_logs(self.temp_file.name, None, None,
+                                                                          filter_field=None, filter_value=None)
+
+        report = self.converter.create_a_report(analyzer)
+
+        self.assertIn("== Самые активные IP-адреса", report)
+        self.assertIn("| IP-адрес | Количество | Погрешность", report)
+        self.assertIn("== Самые частые Referer", report)
+        self.assertNotIn("== Самые частые User-Agent", self.converter.create_a_report(Analyzer()))
+
+    def test_convert_logs_to_adoc_with_bad_lines(self):
+        analyzer = Analyzer()
+        analyzer.record_bad_line("access.log")
+
+        report = self.converter.create_a_report(analyzer)
+
+        self.assertIn("== Некорректные строки", report)
+        self.assertIn("| access.log | 1", report)
+        self.assertNotIn("== Некорректные строки", self.converter.create_a_report(Analyzer()))
 
     def tearDown(self):
         os.remove(self.temp_file.name)
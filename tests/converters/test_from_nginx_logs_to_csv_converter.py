@@ -0,0 +1,47 @@
+import unittest
+from datetime import datetime, timezone
+
+from src.converters.from_nginx_logs_to_csv_converter import FromNginxLogsToCsvConverter
+from src.models.nginx_log import NginxLog
+from src.services.analytics.analyzer import Analyzer
+from src.services.analytics.time_series import TimeSeries
+
+
+def build_log(minute: int, status: int, size: int) -> NginxLog:
+    return NginxLog("10.0.0.1", "-", datetime(2023, 11, 19, 10, minute, 0, tzinfo=timezone.utc), "GET / HTTP/1.1",
+                    status, size, "-", "curl")
+
+
+class TestFromNginxLogsToCsvConverter(unittest.TestCase):
+    def setUp(self):
+        self.converter = FromNginxLogsToCsvConverter()
+
+    def test_create_a_report_with_time_series(self):
+        analyzer = Analyzer(time_series=TimeSeries(60))
+        for minute, status, size in [(0, 200, 100), (0, 500, 300), (2, 200, 50)]:
+            analyzer.update_metrics(build_log(minute, status, size))
+
+        report = self.converter.create_a_report(analyzer)
+
+        self.assertEqual(report.splitlines(), [
+            "interval_start,requests,errors,error_rate,bytes,p95_size",
+            "2023-11-19T10:00:00+00:00,2,1,50.00,400,100",
+            "2023-11-19T10:02:00+00:00,1,0,0.00,50,50",
+        ])
+
+    def test_create_a_report_without_time_series(self):
+        analyzer = Analyzer()
+        for minute, status, size in [(0, 200, 100), (5, 404, 300)]:
+            analyzer.update_metrics(build_log(minute, status, size))
+
+        report = self.converter.create_a_report(analyzer)
+
+        self.assertEqual(report.splitlines()[1], "2023-11-19T10:00:00+00:00,2,1,50.00,400,100")
+
+    def test_create_a_report_empty(self):
+        self.assertEqual(self.converter.create_a_report(Analyzer()),
+                         "interval_start,requests,errors,error_rate,bytes,p95_size\n")
+
+
+if __name__ == '__main__':
+    unittest.main()
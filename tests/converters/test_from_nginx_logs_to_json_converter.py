@@ -0,0 +1,80 @@
+import json
+import unittest
+from datetime import datetime, timezone
+
+from src.converters.from_nginx_logs_to_json_converter import FromNginxLogsToJsonConverter
+from src.models.nginx_log import NginxLog
+from src.services.analytics.analyzer import Analyzer
+from src.services.analytics.heavy_hitters import HeavyHitters
+from src.services.analytics.latency_stats import LatencyStats
+from src.services.analytics.time_series import TimeSeries
+
+
+class TestFromNginxLogsToJsonConverter(unittest.TestCase):
+    def setUp(self):
+        self.converter = FromNginxLogsToJsonConverter()
+
+    def test_create_a_report(self):
+        analyzer = Analyzer(time_series=TimeSeries(3600))
+        for hour, status, resource in [(10, 200, "/a"), (10, 404, "/b"), (11, 200, "/a")]:
+            analyzer.update_metrics(NginxLog("10.0.0.1", "-", datetime(2023, 11, 19, hour, 0, 0, tzinfo=timezone.utc),
+                                             f"GET {resource} HTTP/1.1", status, 100, "-", "curl"))
+
+        report = json.loads(self.converter.create_a_report(analyzer))
+
+        self.assertEqual(report["summary"]["requests"], 3)
+        self.assertEqual(report["summary"]["start_date"], "2023-11-19T10:00:00+00:00")
+        self.assertEqual(report["summary"]["size_percentiles"]["p95"], 100)
+        self.assertEqual(report["resources"], {"/a": 2, "/b": 1})
+        self.assertEqual(report["status_codes"]["404"], {"name": "Not Found", "count": 1})
+        self.assertEqual([interval["requests"] for interval in report["time_series"]], [2, 1])
+        self.assertEqual(report["time_series"][0]["error_rate"], 50.0)
+
+    def test_create_a_report_without_time_series(self):
+        report = json.loads(self.converter.create_a_report(Analyzer()))
+
+        self.assertIsNone(report["time_series"])
+        self.assertIsNone(report["summary"]["start_date"])
+        self.assertEqual(report["bad_lines"], {})
+        self.assertIsNone(report["top"])
+        self.assertIsNone(report["latency"])
+
+    def test_create_a_report_with_heavy_hitters(self):
+        analyzer = Analyzer(heavy_hitters=HeavyHitters(1))
+        for resource, agent in [("/a", "curl"), ("/b", "bot"), ("/b", "bot")]:
+            analyzer.update_metrics(NginxLog("10.0.0.1", "-", datetime(2023, 11, 19, 10, 0, 0, tzinfo=timezone.utc),
+                                             f"GET {resource} HTTP/1.1", 200, 100, "-", agent))
+
+        report = json.loads(self.converter.create_a_report(analyzer))
+
+        self.assertEqual(report["resources"], {"/b": 2})
+        self.assertEqual(report["top"]["resources"], [{"value": "/b", "count": 2, "error": 0}])
+        self.assertEqual(report["top"]["addresses"], [{"value": "10.0.0.1", "count": 3, "error": 0}])
+        self.assertEqual(report["top"]["user_agents"][0]["value"], "bot")
+        self.assertEqual(report["top"]["referers"][0]["value"], "-")
+
+    def test_create_a_report_with_latency(self):
+        latency = LatencyStats()
+        latency.add("/slow", 504, 2.5, 2.0)
+        latency.add("/fast", 200, 0.01, None)
+
+        report = json.loads(self.converter.create_a_report(Analyzer(latency=latency)))
+
+        self.assertEqual([(summary["label"], summary["count"]) for summary in report["latency"]["overall"]],
+                         [("request_time", 2), ("upstream_response_time", 1)])
+        self.assertAlmostEqual(report["latency"]["overall"][1]["p50"], 2.0, delta=0.05)
+        self.assertEqual([summary["label"] for summary in report["latency"]["slowest_endpoints"]], ["/slow", "/fast"])
+        self.assertEqual([summary["label"] for summary in report["latency"]["status_codes"]], ["200", "504"])
+
+    def test_create_a_report_with_bad_lines(self):
+        analyzer = Analyzer()
+        analyzer.record_bad_line("a.log")
+        analyzer.record_bad_line("b.log")
+
+        report = json.loads(self.converter.create_a_report(analyzer))
+
+        self.assertEqual(report["bad_lines"], {"a.log": 1, "b.log": 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.facades.benchmark_facade import BenchmarkFacade
+from src.models.log_profile import LogProfile
+
+
+class TestBenchmarkFacade(unittest.TestCase):
+
+    def setUp(self):
+        self.arguments_parser = MagicMock()
+        self.facade = BenchmarkFacade(self.arguments_parser, [])
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    @patch("src.facades.benchmark_facade.BenchmarkFacade.get_result_benchmarks", return_value="table")
+    def test_run_benchmarks(self, mock_get_result_benchmarks):
+        self.arguments_parser.parse.return_value = {
+            "lines": 1000, "ip-count": 10, "status-mix": {200: 1.0}, "benchmark": ["parser"], "repeat": 2,
+        }
+
+        with self.assertLogs("BenchmarkFacade", level="INFO") as logs:
+            self.facade.run_benchmarks()
+
+        mock_get_result_benchmarks.assert_called_once_with(
+            LogProfile(lines=1000, ip_count=10, status_mix={200: 1.0}), ["parser"], 2, None, None
+        )
+        self.assertIn("INFO:BenchmarkFacade:table", logs.output)
+
+    def test_run_benchmarks_invalid_arguments(self):
+        self.arguments_parser.parse.return_value = "Error: --lines option must be a positive integer."
+
+        with self.assertLogs("BenchmarkFacade", level="ERROR") as logs:
+            self.facade.run_benchmarks()
+
+        self.assertEqual(logs.output, ["ERROR:BenchmarkFacade:Error: --lines option must be a positive integer."])
+
+    def test_get_result_benchmarks_with_output_and_baseline(self):
+        output = os.path.join(self.directory, "results.json")
+        profile = LogProfile(lines=200)
+
+        result = self.facade.get_result_benchmarks(profile, ["parser", "facade"], 1, output, isolate=False)
+
+        self.assertTrue(result.startswith("| Benchmark |"))
+        with open(output, encoding="utf-8") as report_file:
+            self.assertEqual([item["name"] for item in json.load(report_file)["results"]], ["parser", "facade"])
+
+        compared = self.facade.get_result_benchmarks(profile, ["parser"], 1, baseline=output, isolate=False)
+        self.assertIn("| Baseline lines/s | Change |", compared)
+        self.assertRegex(compared.splitlines()[2], r"\| [+-]\d+\.\d% \|$")
+
+    def test_get_result_benchmarks_invalid_baseline(self):
+        baseline = os.path.join(self.directory, "missing.json")
+
+        result = self.facade.get_result_benchmarks(LogProfile(lines=10), ["parser"], baseline=baseline)
+
+        self.assertEqual(result, f"Error: cannot read baseline '{baseline}'")
+
+    def test_get_result_benchmarks_unsupported_benchmark(self):
+        result = self.facade.get_result_benchmarks(LogProfile(lines=10), ["compiler"], isolate=False)
+
+        self.assertEqual(result, "Error: Unsupported benchmark 'compiler'")
+
+
+if __name__ == "__main__":
+    unittest.main()
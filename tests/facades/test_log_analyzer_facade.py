@@ -1,8 +1,16 @@
+import json
+import os
+import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
 from datetime import datetime
 
+import zstandard
+
 from src.facades.log_analyzer_facade import LogAnalyzerFacade
+from src.models.analysis_options import AnalysisOptions
+from src.services.analytics.analyzer import Analyzer
+from src.services.analytics.log_filter import LogFilter
 
 
 class TestLogAnalyzerFacade(unittest.TestCase):
@@ -78,6 +86,23 @@ class TestLogAnalyzerFacade(unittest.TestCase):
 
         mock_logger.info.assert_called_once_with("Mocked Console Report")
 
+    @patch("src.facades.log_analyzer_facade.LOGGER")
+    def test_analyze_logs_builds_analysis_options(self, mock_logger):
+        self.arguments_parser.parse.return_value = {"path": ["access.log"], "bucket": "minute", "route": ["/a/*"],
+                                                    "on-error": "fail", "workers": 4}
+
+        with patch.object(self.facade, "get_result_analyze", return_value="Report") as mock_get_result_analyze:
+            self.facade.analyze_logs()
+
+        self.assertEqual(mock_get_result_analyze.call_args[0][6],
+                         AnalysisOptions(workers=4, time_bucket="minute", on_error="fail", routes=["/a/*"]))
+
+        self.arguments_parser.parse.return_value = {"path": ["access.log"], "follow": True, "window": 15}
+        with patch.object(self.facade, "follow_logs", return_value=None) as mock_follow_logs:
+            self.facade.analyze_logs()
+
+        self.assertEqual(mock_follow_logs.call_args[0][7], AnalysisOptions(window_minutes=15))
+
     def test_get_result_analyze_with_invalid_converter(self):
         self.arguments_parser.parse.return_value = {
             "path": ["log1.txt"],
@@ -92,6 +117,319 @@ class TestLogAnalyzerFacade(unittest.TestCase):
 
             self.assertEqual(result, "Error: no such converter")
 
+    def test_get_result_analyze_with_invalid_quantile_mode(self):
+        result = self.facade.get_result_analyze(["log1.txt"], None, None, "markdown", None, None,
+                                                AnalysisOptions(quantile_mode="invalid_mode"))
+
+        self.assertEqual(result, "Error: no such quantile mode")
+
+    def test_get_result_analyze_with_invalid_unique_ip_mode(self):
+        result = self.facade.get_result_analyze(["log1.txt"], None, None, "markdown", None, None,
+                                                AnalysisOptions(unique_ip_mode="invalid_mode"))
+
+        self.assertEqual(result, "Error: no such unique IP mode")
+
+    def test_get_result_analyze_with_invalid_filter(self):
+        result = self.facade.get_result_analyze(["log1.txt"], None, None, "markdown", "status", "not-a-status")
+
+        self.assertEqual(result, "Error: invalid filter")
+
+    def test_get_required_fields(self):
+        analyzer = Analyzer()
+        predicate = LogFilter.compile("agent", "Mozilla")
+
+        fields = self.facade.get_required_fields(analyzer, None, None, None)
+        self.assertEqual(fields, analyzer.get_required_fields())
+        self.assertNotIn("http_user_agent", fields)
+
+        fields = self.facade.get_required_fields(analyzer, predicate, datetime(2023, 1, 1), None)
+        self.assertIn("http_user_agent", fields)
+        self.assertIn("time_local", fields)
+
+    def test_get_result_analyze_with_time_series(self):
+        with tempfile.TemporaryDirectory() as directory:
+            log_path = os.path.join(directory, "access.log")
+            with open(log_path, "w") as log_file:
+                for minute in [0, 0, 1]:
+                    log_file.write(f"10.0.0.1 - - [19/Nov/2023:15:{minute:02d}:45 +0000] "
+                                   f"\"GET /a HTTP/1.1\" 200 10 \"-\" \"curl\"\n")
+
+            result = self.facade.get_result_analyze([log_path], None, None, "csv", None, None,
+                                                    AnalysisOptions(time_bucket="minute"))
+
+        self.assertEqual(result.splitlines()[1:], ["2023-11-19T15:00:00+00:00,2,0,0.00,20,10",
+                                                   "2023-11-19T15:01:00+00:00,1,0,0.00,10,10"])
+
+    def test_get_result_analyze_with_invalid_time_bucket(self):
+        result = self.facade.get_result_analyze(["log1.txt"], None, None, "markdown", None, None,
+                                                AnalysisOptions(time_bucket="week"))
+
+        self.assertEqual(result, "Error: no such time bucket")
+
+    def test_get_checkpoint_settings(self):
+        settings = self.facade.get_checkpoint_settings(datetime(2023, 1, 1), None, "status", "500", AnalysisOptions())
+
+        self.assertEqual(settings, self.facade.get_checkpoint_settings(
+            datetime(2023, 1, 1), None, "status", "500", AnalysisOptions(quantile_error=0.05, hll_precision=12)))
+        self.assertNotEqual(settings, self.facade.get_checkpoint_settings(datetime(2023, 1, 2), None, "status", "500",
+                                                                          AnalysisOptions()))
+        self.assertNotEqual(settings, self.facade.get_checkpoint_settings(datetime(2023, 1, 1), None, "status", "500",
+                                                                          AnalysisOptions(quantile_mode="sketch")))
+        self.assertNotEqual(settings, self.facade.get_checkpoint_settings(datetime(2023, 1, 1), None, "status", "500",
+                                                                          AnalysisOptions(latency=True)))
+        latency_settings = self.facade.get_checkpoint_settings(None, None, None, None, AnalysisOptions(latency=True))
+        self.assertNotEqual(latency_settings, self.facade.get_checkpoint_settings(
+            None, None, None, None, AnalysisOptions(quantile_error=0.05, latency=True)))
+
+    def test_get_result_analyze_with_state_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            log_path = os.path.join(directory, "access.log")
+            state_path = os.path.join(directory, "state.sqlite")
+            line = "10.0.0.1 - - [19/Nov/2023:15:30:45 +0000] \"GET /a HTTP/1.1\" 200 10 \"-\" \"curl\"\n"
+            with open(log_path, "w") as log_file:
+                log_file.write(line)
+            self.facade.get_result_analyze([log_path], None, None, "markdown", None, None,
+                                           AnalysisOptions(state_file=state_path))
+
+            with open(log_path, "a") as log_file:
+                log_file.write(line)
+            with patch("src.facades.log_analyzer_facade.ConverterFactory") as mock_converter_factory:
+                self.facade.get_result_analyze([log_path], None, None, "markdown", None, None,
+                                               AnalysisOptions(state_file=state_path))
+
+            analyzer = mock_converter_factory.return_value.get_converter.return_value.create_a_report.call_args[0][0]
+            self.assertEqual(analyzer.get_count_logs(), 2)
+
+    @patch("src.facades.log_analyzer_facade.LogReaderService")
+    def test_get_result_analyze_with_date_range_and_index_dir(self, mock_log_reader_service):
+        with tempfile.TemporaryDirectory() as directory:
+            index_dir = os.path.join(directory, "indexes")
+
+            self.facade.get_result_analyze(["access.log"], "2023-11-19", "2023-11-20", "markdown", None, None,
+                                           AnalysisOptions(index_dir=index_dir))
+
+            self.assertTrue(os.path.isdir(index_dir))
+        self.assertIsNotNone(mock_log_reader_service.call_args.kwargs["time_index_store"])
+        read_all_args = mock_log_reader_service.return_value.read_all.call_args[0]
+        self.assertEqual(read_all_args[1:3], (datetime(2023, 11, 19), datetime(2023, 11, 20)))
+
+    def test_get_result_analyze_with_cache_dir(self):
+        with tempfile.TemporaryDirectory() as directory:
+            log_path = os.path.join(directory, "access.log")
+            cache_dir = os.path.join(directory, "cache")
+            with open(log_path, "w") as log_file:
+                log_file.write("10.0.0.1 - - [19/Nov/2023:15:30:45 +0000] \"GET /a HTTP/1.1\" 200 10 \"-\" \"curl\"\n")
+                log_file.write("10.0.0.2 - - [19/Nov/2023:15:30:46 +0000] \"GET /b HTTP/1.1\" 500 20 \"-\" \"curl\"\n")
+
+            expected = self.facade.get_result_analyze([log_path], None, None, "markdown", "status", "500")
+            self.assertEqual(self.facade.get_result_analyze([log_path], None, None, "markdown", "status", "500",
+                                                            AnalysisOptions(cache_dir=cache_dir)), expected)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+            self.assertEqual(self.facade.get_result_analyze([log_path], None, None, "markdown", "status", "500",
+                                                            AnalysisOptions(cache_dir=cache_dir)), expected)
+
+    def test_get_result_analyze_with_numpy_engine(self):
+        with tempfile.TemporaryDirectory() as directory:
+            log_path = os.path.join(directory, "access.log")
+            with open(log_path, "w") as log_file:
+                log_file.write("10.0.0.1 - - [19/Nov/2023:15:30:45 +0000] \"GET /a HTTP/1.1\" 200 10 \"-\" \"curl\"\n")
+                log_file.write("10.0.0.2 - - [19/Nov/2023:15:30:46 +0000] \"GET /b HTTP/1.1\" 500 20 \"-\" \"curl\"\n")
+                log_file.write("10.0.0.1 - - [19/Nov/2023:15:30:47 +0000] \"GET /a HTTP/1.1\" 404 30 \"-\" \"curl\"\n")
+
+            for quantile_mode in ("exact", "sketch"):
+                with self.subTest(quantile_mode=quantile_mode):
+                    expected = self.facade.get_result_analyze([log_path], None, None, "markdown", None, None,
+                                                              AnalysisOptions(quantile_mode=quantile_mode,
+                                                                              time_bucket="minute"))
+                    self.assertEqual(self.facade.get_result_analyze([log_path], None, None, "markdown", None, None,
+                                                                    AnalysisOptions(quantile_mode=quantile_mode,
+                                                                                    time_bucket="minute",
+                                                                                    engine="numpy")), expected)
+
+    def test_get_result_analyze_with_error_policies(self):
+        with tempfile.TemporaryDirectory() as directory:
+            log_path = os.path.join(directory, "access.log")
+            quarantine_path = os.path.join(directory, "rejected.log")
+            with open(log_path, "w") as log_file:
+                log_file.write("10.0.0.1 - - [19/Nov/2023:15:30:45 +0000] \"GET /a HTTP/1.1\" 200 10 \"-\" \"curl\"\n")
+                log_file.write("garbage\n")
+
+            result = self.facade.get_result_analyze([log_path], None, None, "json", None, None,
+                                                    AnalysisOptions(on_error="quarantine",
+                                                                    quarantine_file=quarantine_path))
+            with open(quarantine_path) as quarantine_file:
+                self.assertEqual(quarantine_file.read(), "garbage\n")
+            self.assertIn(f"\"{log_path}\": 1", result)
+
+            result = self.facade.get_result_analyze([log_path], None, None, "json", None, None,
+                                                    AnalysisOptions(on_error="fail"))
+            self.assertEqual(result, f"Error: Cannot parse a line of '{log_path}': garbage")
+
+            result = self.facade.get_result_analyze([log_path], None, None, "json", None, None,
+                                                    AnalysisOptions(on_error="quarantine"))
+            self.assertEqual(result, "Error: The quarantine error policy requires a quarantine file")
+
+    def test_get_result_analyze_with_top(self):
+        with tempfile.TemporaryDirectory() as directory:
+            log_path = os.path.join(directory, "access.log")
+            with open(log_path, "w") as log_file:
+                for index in range(5):
+                    log_file.write(f"10.0.0.{index % 2} - - [19/Nov/2023:15:30:45 +0000] \"GET /{index} HTTP/1.1\" "
+                                   f"200 10 \"-\" \"agent-{index % 3}\"\n")
+
+            result = self.facade.get_result_analyze([log_path], None, None, "json", None, None, AnalysisOptions(top=1))
+            report = json.loads(result)
+            self.assertEqual(len(report["resources"]), 1)
+            self.assertEqual(report["top"]["addresses"], [{"value": "10.0.0.0", "count": 3, "error": 0}])
+            self.assertEqual(report["top"]["user_agents"][0]["value"], "agent-0")
+
+            result = self.facade.get_result_analyze([log_path], None, None, "json", None, None,
+                                                    AnalysisOptions(top=1, cache_dir=os.path.join(directory, "cache")))
+            self.assertEqual(result, "Error: --top option cannot be combined with --cache-dir")
+
+        result = self.facade.get_result_analyze(["access.log"], None, None, "json", None, None,
+                                                AnalysisOptions(top=1, log_format="apache-common"))
+        self.assertEqual(result, "Error: log format lacks fields: http_referer, http_user_agent")
+
+    def test_create_analyzer_with_top(self):
+        analyzer = self.facade.create_analyzer(AnalysisOptions(top=5))
+        self.assertEqual(analyzer.get_heavy_hitters().top, 5)
+
+        with self.assertRaises(ValueError) as context:
+            self.facade.create_analyzer(AnalysisOptions(engine="numpy", top=5))
+        self.assertEqual(str(context.exception), "Error: --top option requires --engine python")
+
+        with self.assertRaises(ValueError) as context:
+            self.facade.create_analyzer(AnalysisOptions(top=0))
+        self.assertEqual(str(context.exception), "Error: invalid number of top entries")
+
+    def test_get_result_analyze_with_url_normalization(self):
+        with tempfile.TemporaryDirectory() as directory:
+            log_path = os.path.join(directory, "access.log")
+            with open(log_path, "w") as log_file:
+                for resource in ["/api/users/1?tab=2", "/api/users/2", "/api/users/3/orders", "/static/app.js"]:
+                    log_file.write(f"10.0.0.1 - - [19/Nov/2023:15:30:45 +0000] \"GET {resource} HTTP/1.1\" "
+                                   f"200 10 \"-\" \"curl\"\n")
+
+            for engine in ("python", "numpy"):
+                with self.subTest(engine=engine):
+                    result = self.facade.get_result_analyze([log_path], None, None, "json", None, None,
+                                                            AnalysisOptions(engine=engine, routes=["/static/*"]))
+                    self.assertEqual(json.loads(result)["resources"],
+                                     {"/api/users/{id}": 2, "/api/users/{id}/orders": 1, "/static/*": 1})
+
+            result = self.facade.get_result_analyze([log_path], None, None, "json", None, None,
+                                                    AnalysisOptions(normalize_urls=True))
+            self.assertEqual(json.loads(result)["resources"]["/static/app.js"], 1)
+
+        result = self.facade.get_result_analyze(["access.log"], None, None, "json", None, None,
+                                                AnalysisOptions(routes=["static"]))
+        self.assertEqual(result, "Error: invalid route template")
+
+    def test_create_analyzer_with_batch_size(self):
+        analyzer = self.facade.create_analyzer(AnalysisOptions(engine="numpy", batch_size=128))
+
+        self.assertEqual(analyzer.batch_size, 128)
+        with self.assertRaises(ValueError) as context:
+            self.facade.create_analyzer(AnalysisOptions(engine="numpy", batch_size=0))
+        self.assertEqual(str(context.exception), "Error: invalid batch size")
+
+    def test_create_analyzer_with_invalid_engine(self):
+        with self.assertRaises(ValueError) as context:
+            self.facade.create_analyzer(AnalysisOptions(engine="cython"))
+
+        self.assertEqual(str(context.exception), "Error: no such analyzer engine")
+
+    @patch("src.facades.log_analyzer_facade.NumpyBatchAnalyzer", side_effect=ImportError)
+    def test_get_result_analyze_with_numpy_engine_without_numpy(self, mock_numpy_batch_analyzer):
+        result = self.facade.get_result_analyze(["access.log"], None, None, "markdown", None, None,
+                                                AnalysisOptions(engine="numpy"))
+
+        self.assertEqual(result, "Error: --engine numpy option requires the 'numpy' package")
+
+    @patch("src.facades.log_analyzer_facade.LogColumnsCache", side_effect=ImportError)
+    def test_get_result_analyze_with_cache_dir_without_numpy(self, mock_log_columns_cache):
+        result = self.facade.get_result_analyze(["access.log"], None, None, "markdown", None, None,
+                                                AnalysisOptions(cache_dir="cache"))
+
+        self.assertEqual(result, "Error: --cache-dir option requires the 'numpy' package")
+
+    @patch("src.services.readers.codec_detector.zstandard", None)
+    def test_get_result_analyze_with_zstd_file_without_zstandard(self):
+        with tempfile.TemporaryDirectory() as directory:
+            log_path = os.path.join(directory, "access.log.zst")
+            with open(log_path, "wb") as log_file:
+                log_file.write(zstandard.ZstdCompressor().compress(
+                    b"10.0.0.1 - - [19/Nov/2023:15:30:45 +0000] \"GET /a HTTP/1.1\" 200 10 \"-\" \"curl\"\n"))
+
+            result = self.facade.get_result_analyze([log_path], None, None, "markdown", None, None)
+
+        self.assertEqual(result, "Error: reading zstd logs requires the 'zstandard' package")
+
+    @patch("src.facades.log_analyzer_facade.FollowLogReader")
+    def test_follow_logs_reports_window_snapshots(self, mock_follow_log_reader):
+        reports = []
+
+        result = self.facade.follow_logs(["access.log"], None, None, "markdown", "status", ">=500", reports.append,
+                                         AnalysisOptions(window_minutes=15, refresh_interval=2.0))
+
+        self.assertIsNone(result)
+        analyzer = mock_follow_log_reader.call_args[0][0]
+        self.assertEqual(analyzer.bucket_count * analyzer.bucket_seconds, 15 * 60)
+        self.assertIn("status", mock_follow_log_reader.call_args.kwargs["fields"])
+
+        args, kwargs = mock_follow_log_reader.return_value.follow.call_args
+        self.assertEqual(args[:5], ("access.log", None, None, "status", ">=500"))
+        self.assertEqual(kwargs["refresh_interval"], 2.0)
+        args[5]()
+        self.assertEqual(len(reports), 1)
+        self.assertIn("0", reports[0])
+
+    def test_get_result_analyze_with_invalid_log_format(self):
+        result = self.facade.get_result_analyze(["access.log"], None, None, "markdown", None, None,
+                                                AnalysisOptions(log_format="no variables here"))
+        self.assertEqual(result, "Error: invalid log format")
+
+        result = self.facade.get_result_analyze(["access.log"], None, None, "markdown", "agent", "curl",
+                                                AnalysisOptions(log_format="apache-common"))
+        self.assertEqual(result, "Error: log format lacks fields: http_user_agent")
+
+    def test_create_analyzer_with_latency(self):
+        analyzer = self.facade.create_analyzer(AnalysisOptions(quantile_mode="sketch", quantile_error=0.02, latency=True))
+        self.assertEqual(analyzer.get_latency_stats().relative_accuracy, 0.02)
+        self.assertIn("request_time", analyzer.get_required_fields())
+
+        with self.assertRaises(ValueError) as context:
+            self.facade.create_analyzer(AnalysisOptions(engine="numpy", latency=True))
+        self.assertEqual(str(context.exception), "Error: --latency option requires --engine python")
+
+    def test_get_result_analyze_with_latency(self):
+        log_format = ("$remote_addr [$time_local] \"$request\" $status $body_bytes_sent "
+                      "$request_time $upstream_response_time")
+        with tempfile.TemporaryDirectory() as directory:
+            log_path = os.path.join(directory, "access.log")
+            with open(log_path, "w") as log_file:
+                log_file.write("10.0.0.1 [19/Nov/2023:15:30:45 +0000] \"GET /a HTTP/1.1\" 200 10 0.250 0.200\n")
+
+            result = self.facade.get_result_analyze([log_path], None, None, "json", None, None,
+                                                    AnalysisOptions(log_format=log_format, latency=True))
+            self.assertEqual(json.loads(result)["latency"]["slowest_endpoints"][0]["label"], "/a")
+
+            result = self.facade.get_result_analyze([log_path], None, None, "csv", None, None,
+                                                    AnalysisOptions(log_format=log_format, latency=True))
+            self.assertEqual(result, "Error: --latency option cannot be combined with --format csv")
+
+    def test_check_log_format_allows_optional_fields(self):
+        fields = frozenset({"status", "request_time", "upstream_response_time"})
+
+        self.assertIsNone(self.facade.check_log_format("$status $request_time", fields))
+        self.assertEqual(self.facade.check_log_format(None, fields), "Error: log format lacks fields: request_time")
+
+    def test_follow_logs_with_invalid_filter(self):
+        result = self.facade.follow_logs(["access.log"], None, None, "markdown", "status", "bad", print)
+
+        self.assertEqual(result, "Error: invalid filter")
+
     @patch("src.facades.log_analyzer_facade.LogReaderService")
     @patch("src.facades.log_analyzer_facade.DateParser")
     def test_get_result_analyze_valid_case(self, mock_date_parser, mock_log_reader_service):
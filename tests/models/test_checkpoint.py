@@ -0,0 +1,21 @@
+import unittest
+
+from src.models.checkpoint import Checkpoint
+
+
+class TestCheckpoint(unittest.TestCase):
+    def test_attributes(self):
+        checkpoint = Checkpoint("/var/log/access.log", "{}", 1, 2, 300, 4, 250, b"digest", b"state")
+
+        self.assertEqual(checkpoint.path, "/var/log/access.log")
+        self.assertEqual(checkpoint.settings, "{}")
+        self.assertEqual((checkpoint.device, checkpoint.inode), (1, 2))
+        self.assertEqual(checkpoint.size, 300)
+        self.assertEqual(checkpoint.mtime_ns, 4)
+        self.assertEqual(checkpoint.offset, 250)
+        self.assertEqual(checkpoint.head_digest, b"digest")
+        self.assertEqual(checkpoint.state, b"state")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,20 @@
+import unittest
+
+from src.models.compression_codec import CompressionCodec
+
+
+class TestCompressionCodec(unittest.TestCase):
+    def test_enum_values(self):
+        self.assertEqual(CompressionCodec.NONE.value, "none")
+        self.assertEqual(CompressionCodec.GZIP.value, "gzip")
+        self.assertEqual(CompressionCodec.BZ2.value, "bz2")
+        self.assertEqual(CompressionCodec.XZ.value, "xz")
+        self.assertEqual(CompressionCodec.ZSTD.value, "zstd")
+
+    def test_invalid_value(self):
+        with self.assertRaises(ValueError):
+            CompressionCodec("zip")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,18 @@
+import unittest
+
+from src.models.error_policy import ErrorPolicy
+
+
+class TestErrorPolicy(unittest.TestCase):
+    def test_enum_values(self):
+        self.assertEqual(ErrorPolicy.SKIP.value, "skip")
+        self.assertEqual(ErrorPolicy.QUARANTINE.value, "quarantine")
+        self.assertEqual(ErrorPolicy.FAIL.value, "fail")
+
+    def test_invalid_value(self):
+        with self.assertRaises(ValueError):
+            ErrorPolicy("invalid")
+
+
+if __name__ == '__main__':
+    unittest.main()
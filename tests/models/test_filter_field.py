@@ -8,11 +8,13 @@ class TestFilterField(unittest.TestCase):
         self.assertEqual(FilterField.AGENT.value, "agent")
         self.assertEqual(FilterField.REQUEST.value, "request")
         self.assertEqual(FilterField.STATUS.value, "status")
+        self.assertEqual(FilterField.IP.value, "ip")
 
     def test_enum_membership(self):
         self.assertIn("agent", FilterField._value2member_map_)
         self.assertIn("request", FilterField._value2member_map_)
         self.assertIn("status", FilterField._value2member_map_)
+        self.assertIn("ip", FilterField._value2member_map_)
 
     def test_invalid_value(self):
         with self.assertRaises(ValueError):
@@ -7,6 +7,8 @@ class TestFormatOption(unittest.TestCase):
     def test_enum_values(self):
         self.assertEqual(FormatOption.MARKDOWN.value, "markdown")
         self.assertEqual(FormatOption.ADOC.value, "adoc")
+        self.assertEqual(FormatOption.CSV.value, "csv")
+        self.assertEqual(FormatOption.JSON.value, "json")
 
     def test_enum_membership(self):
         self.assertIn("markdown", FormatOption._value2member_map_)
@@ -0,0 +1,20 @@
+import unittest
+
+import numpy as np
+
+from src.models.log_columns import LogColumns
+
+
+class TestLogColumns(unittest.TestCase):
+    def test_length_is_number_of_rows(self):
+        codes = np.zeros(2, dtype=np.int32)
+        columns = LogColumns(codes, ["10.0.0.1"], codes, ["GET / HTTP/1.1"], codes, ["curl"],
+                             np.array([200, 404], dtype=np.int16), np.array([1, 2]), np.array([0, 60]),
+                             np.zeros(2, dtype=np.int32))
+
+        self.assertEqual(len(columns), 2)
+        self.assertEqual(columns.request_values, ["GET / HTTP/1.1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,16 @@
+import unittest
+
+from src.models.log_profile import LogProfile
+
+
+class TestLogProfile(unittest.TestCase):
+    def test_default_status_mix_is_not_shared(self):
+        first, second = LogProfile(), LogProfile()
+        first.status_mix[418] = 1.0
+
+        self.assertNotIn(418, second.status_mix)
+        self.assertEqual(second.status_mix[200], 80.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,17 @@
+import unittest
+
+from src.models.quantile_mode import QuantileMode
+
+
+class TestQuantileMode(unittest.TestCase):
+    def test_enum_values(self):
+        self.assertEqual(QuantileMode.EXACT.value, "exact")
+        self.assertEqual(QuantileMode.SKETCH.value, "sketch")
+
+    def test_invalid_value(self):
+        with self.assertRaises(ValueError):
+            QuantileMode("invalid")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,18 @@
+import unittest
+
+from src.models.time_bucket import TimeBucket
+
+
+class TestTimeBucket(unittest.TestCase):
+    def test_enum_values(self):
+        self.assertEqual(TimeBucket.SECOND.value, "second")
+        self.assertEqual(TimeBucket.MINUTE.value, "minute")
+        self.assertEqual(TimeBucket.HOUR.value, "hour")
+
+    def test_invalid_value(self):
+        with self.assertRaises(ValueError):
+            TimeBucket("invalid")
+
+
+if __name__ == '__main__':
+    unittest.main()
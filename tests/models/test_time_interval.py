@@ -0,0 +1,18 @@
+import unittest
+from datetime import datetime, timezone
+
+from src.models.time_interval import TimeInterval
+
+
+class TestTimeInterval(unittest.TestCase):
+    def test_get_error_rate(self):
+        interval = TimeInterval(datetime(2023, 1, 1, tzinfo=timezone.utc), 8, 2, 800, 150.0)
+        self.assertEqual(interval.get_error_rate(), 25.0)
+
+    def test_get_error_rate_empty(self):
+        interval = TimeInterval(datetime(2023, 1, 1, tzinfo=timezone.utc), 0, 0, 0, 0.0)
+        self.assertEqual(interval.get_error_rate(), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
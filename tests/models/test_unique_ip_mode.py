@@ -0,0 +1,17 @@
+import unittest
+
+from src.models.unique_ip_mode import UniqueIpMode
+
+
+class TestUniqueIpMode(unittest.TestCase):
+    def test_enum_values(self):
+        self.assertEqual(UniqueIpMode.EXACT.value, "exact")
+        self.assertEqual(UniqueIpMode.HLL.value, "hll")
+
+    def test_invalid_value(self):
+        with self.assertRaises(ValueError):
+            UniqueIpMode("invalid")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -59,6 +59,141 @@ class TestArgumentsParser(unittest.TestCase):
             "Error: Invalid date format for --to option. Expected format is yyyy-MM-dd."
         )
 
+    def test_parse_filter_options(self):
+        args = ["--path", "log1.txt", "--filter-field", "status", "--filter-value", ">=500"]
+        result = self.parser.parse(args)
+        self.assertEqual(result["filter-field"], "status")
+        self.assertEqual(result["filter-value"], ">=500")
+
+    def test_parse_workers(self):
+        args = ["--path", "log1.txt", "--workers", "4"]
+        result = self.parser.parse(args)
+        self.assertEqual(result["workers"], 4)
+
+    def test_parse_invalid_workers(self):
+        args = ["--path", "log1.txt", "--workers", "0"]
+        result = self.parser.parse(args)
+        self.assertEqual(result, "Error: --workers option must be a positive integer.")
+
+    def test_parse_quantile_options(self):
+        args = ["--path", "log1.txt", "--quantile-mode", "sketch", "--quantile-error", "0.02"]
+        result = self.parser.parse(args)
+        self.assertEqual(result["quantile-mode"], "sketch")
+        self.assertEqual(result["quantile-error"], 0.02)
+
+    def test_parse_invalid_quantile_error(self):
+        args = ["--path", "log1.txt", "--quantile-error", "1.5"]
+        result = self.parser.parse(args)
+        self.assertEqual(result, "Error: --quantile-error option must be between 0 and 1.")
+
+    def test_parse_unique_ip_options(self):
+        args = ["--path", "log1.txt", "--unique-ip-mode", "hll", "--hll-precision", "12"]
+        result = self.parser.parse(args)
+        self.assertEqual(result["unique-ip-mode"], "hll")
+        self.assertEqual(result["hll-precision"], 12)
+
+    def test_parse_invalid_hll_precision(self):
+        args = ["--path", "log1.txt", "--hll-precision", "30"]
+        result = self.parser.parse(args)
+        self.assertEqual(result, "Error: --hll-precision option must be between 4 and 18.")
+
+    def test_parse_network_options(self):
+        args = ["--path", "http://example.com/log", "--max-connections", "8", "--timeout", "2.5", "--retries", "0"]
+        result = self.parser.parse(args)
+        self.assertEqual(result["max-connections"], 8)
+        self.assertEqual(result["timeout"], 2.5)
+        self.assertEqual(result["retries"], 0)
+
+    def test_parse_invalid_network_options(self):
+        result = self.parser.parse(["--path", "log1.txt", "--max-connections", "0"])
+        self.assertEqual(result, "Error: --max-connections option must be a positive integer.")
+
+        result = self.parser.parse(["--path", "log1.txt", "--timeout", "0"])
+        self.assertEqual(result, "Error: --timeout option must be positive.")
+
+        result = self.parser.parse(["--path", "log1.txt", "--retries", "-1"])
+        self.assertEqual(result, "Error: --retries option must not be negative.")
+
+    def test_parse_state_file(self):
+        result = self.parser.parse(["--path", "access.log", "--state-file", "state.sqlite"])
+        self.assertEqual(result["state-file"], "state.sqlite")
+
+    def test_parse_index_dir(self):
+        result = self.parser.parse(["--path", "access.log", "--from", "2023-11-19", "--index-dir", "indexes"])
+        self.assertEqual(result["index-dir"], "indexes")
+
+    def test_parse_cache_dir(self):
+        result = self.parser.parse(["--path", "access.log", "--cache-dir", "cache"])
+        self.assertEqual(result["cache-dir"], "cache")
+
+    def test_parse_engine(self):
+        result = self.parser.parse(["--path", "access.log", "--engine", "numpy", "--batch-size", "4096"])
+        self.assertEqual(result["engine"], "numpy")
+        self.assertEqual(result["batch-size"], 4096)
+
+    def test_parse_log_format(self):
+        result = self.parser.parse(["--path", "access.log", "--log-format", "$remote_addr $status"])
+        self.assertEqual(result["log-format"], "$remote_addr $status")
+
+    def test_parse_latency(self):
+        result = self.parser.parse(["--path", "access.log", "--latency"])
+        self.assertTrue(result["latency"])
+
+    def test_parse_top(self):
+        result = self.parser.parse(["--path", "access.log", "--top", "20"])
+        self.assertEqual(result["top"], 20)
+
+        result = self.parser.parse(["--path", "access.log", "--top", "0"])
+        self.assertEqual(result, "Error: --top option must be a positive integer.")
+
+    def test_parse_url_normalization_options(self):
+        result = self.parser.parse(["--path", "access.log", "--normalize-urls", "--route", "/api/users/{id}",
+                                    "--route", "/static/*"])
+        self.assertTrue(result["normalize-urls"])
+        self.assertEqual(result["route"], ["/api/users/{id}", "/static/*"])
+
+        result = self.parser.parse(["--path", "access.log", "--route", "api/users"])
+        self.assertEqual(result, "Error: --route option must start with '/': api/users")
+
+    def test_parse_follow_options(self):
+        result = self.parser.parse(["--path", "access.log", "--follow", "--window", "15", "--refresh", "2"])
+        self.assertTrue(result["follow"])
+        self.assertEqual(result["window"], 15)
+        self.assertEqual(result["refresh"], 2.0)
+
+    def test_parse_invalid_follow_options(self):
+        result = self.parser.parse(["--path", "a.log", "--path", "b.log", "--follow"])
+        self.assertEqual(result, "Error: --follow option requires a single local --path.")
+
+        result = self.parser.parse(["--path", "http://example.com/log", "--follow"])
+        self.assertEqual(result, "Error: --follow option requires a single local --path.")
+
+        result = self.parser.parse(["--path", "access.log", "--follow", "--window", "0"])
+        self.assertEqual(result, "Error: --window option must be a positive integer.")
+
+        result = self.parser.parse(["--path", "access.log", "--follow", "--refresh", "0"])
+        self.assertEqual(result, "Error: --refresh option must be positive.")
+
+    def test_parse_error_policy_options(self):
+        result = self.parser.parse(["--path", "access.log", "--on-error", "quarantine",
+                                    "--quarantine-file", "rejected.log"])
+        self.assertEqual(result["on-error"], "quarantine")
+        self.assertEqual(result["quarantine-file"], "rejected.log")
+
+    def test_parse_invalid_error_policy_options(self):
+        result = self.parser.parse(["--path", "access.log", "--on-error", "quarantine"])
+        self.assertEqual(result, "Error: --on-error quarantine requires a --quarantine-file option.")
+
+        result = self.parser.parse(["--path", "access.log", "--quarantine-file", "rejected.log"])
+        self.assertEqual(result, "Error: --quarantine-file option requires --on-error quarantine.")
+
+    def test_parse_report_options(self):
+        result = self.parser.parse(["--path", "access.log", "--format", "csv", "--output", "report.csv",
+                                    "--bucket", "minute"])
+        self.assertEqual(result["format"], "csv")
+        self.assertEqual(result["output"], "report.csv")
+        self.assertEqual(result["bucket"], "minute")
+
     def test_parse_valid_multiple_paths(self):
         args = ["--path", "log1.txt", "--path", "log2.txt", "--from", "2023-11-01"]
         result = self.parser.parse(args)
@@ -0,0 +1,56 @@
+import unittest
+
+from src.parsers.bench_arguments_parser import BenchArgumentsParser
+
+
+class TestBenchArgumentsParser(unittest.TestCase):
+    def setUp(self):
+        self.parser = BenchArgumentsParser()
+
+    def test_parse_valid_arguments(self):
+        args = ["--lines", "1000", "--ip-count", "10", "--resource-skew", "0.5", "--status-mix", "200=90,404=10",
+                "--benchmark", "parser", "--benchmark", "facade", "--repeat", "2", "--output", "results.json"]
+        result = self.parser.parse(args)
+        expected = {
+            "lines": 1000,
+            "ip-count": 10,
+            "resource-skew": 0.5,
+            "status-mix": {200: 90.0, 404: 10.0},
+            "benchmark": ["parser", "facade"],
+            "repeat": 2,
+            "output": "results.json",
+        }
+        self.assertEqual(result, expected)
+
+    def test_parse_no_arguments(self):
+        self.assertEqual(self.parser.parse([]), {})
+
+    def test_parse_invalid_counts(self):
+        for option in ("--lines", "--ip-count", "--resources", "--repeat"):
+            with self.subTest(option=option):
+                self.assertEqual(self.parser.parse([option, "0"]),
+                                 f"Error: {option} option must be a positive integer.")
+
+    def test_parse_negative_values(self):
+        self.assertEqual(self.parser.parse(["--resource-skew", "-1"]),
+                         "Error: --resource-skew option must not be negative.")
+        self.assertEqual(self.parser.parse(["--time-span", "-1"]),
+                         "Error: --time-span option must not be negative.")
+
+    def test_parse_invalid_status_mix(self):
+        self.assertEqual(self.parser.parse(["--status-mix", "200:90"]),
+                         "Error: Invalid --status-mix option. Expected format is '200=90,404=8,500=2'.")
+
+    def test_parse_status_mix(self):
+        self.assertEqual(BenchArgumentsParser.parse_status_mix("200=9.5,500=0.5"), {200: 9.5, 500: 0.5})
+        for value in ("", "200", "200=x", "99=1", "200=-1", "200=0,404=0"):
+            with self.subTest(value=value):
+                self.assertIsNone(BenchArgumentsParser.parse_status_mix(value))
+
+    def test_parse_unknown_benchmark(self):
+        with self.assertRaises(SystemExit):
+            self.parser.parse(["--benchmark", "compiler"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -19,6 +19,10 @@ class TestDateParser(unittest.TestCase):
         result = self.date_parser.parse(date_str)
         self.assertEqual(result, expected_date)
 
+    def test_parse_command_line_date(self):
+        result = self.date_parser.parse("2023-11-19")
+        self.assertEqual(result, datetime(2023, 11, 19))
+
     def test_parse_invalid_date(self):
         date_str = "Invalid Date String"
         result = self.date_parser.parse(date_str)
@@ -0,0 +1,60 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from src.parsers.json_log_parser import JsonLogParser
+from src.services.analytics.log_filter import LogFilter
+
+LINE = (
+    "{\"time_local\":\"19/Nov/2023:15:30:45 +0300\",\"remote_addr\":\"10.0.0.1\",\"remote_user\":\"-\","
+    "\"request\":\"GET /a HTTP/1.1\",\"status\":\"404\",\"body_bytes_sent\":\"-\",\"request_time\":\"0.010\","
+    "\"http_referer\":\"-\",\"http_user_agent\":\"curl \\\"x\\\"\"}"
+)
+
+
+class TestJsonLogParser(unittest.TestCase):
+    def setUp(self):
+        self.parser = JsonLogParser()
+
+    def test_parse(self):
+        result = self.parser.parse(LINE)
+
+        self.assertEqual(result.remote_addr, "10.0.0.1")
+        self.assertEqual(result.time_local, datetime(2023, 11, 19, 15, 30, 45, tzinfo=timezone(timedelta(hours=3))))
+        self.assertEqual(result.request, "GET /a HTTP/1.1")
+        self.assertEqual(result.status, 404)
+        self.assertEqual(result.body_bytes_sent, 0)
+        self.assertEqual(result.request_time, 0.01)
+        self.assertEqual(result.http_user_agent, "curl \"x\"")
+
+    def test_parse_bytes_and_range(self):
+        buffer = b"garbage\n" + LINE.encode("utf-8") + b"\n"
+
+        self.assertEqual(self.parser.parse(LINE.encode("utf-8")).status, 404)
+        self.assertEqual(self.parser.parse_range(buffer, 8, len(buffer) - 1).remote_addr, "10.0.0.1")
+
+    def test_parse_custom_keys_and_numbers(self):
+        parser = JsonLogParser(log_format="{\"ts\":\"$time_iso8601\",\"code\":$status,\"bytes\":$body_bytes_sent}")
+        result = parser.parse("{\"ts\":\"2023-11-19T15:30:45+00:00\",\"code\":200,\"bytes\":12}")
+
+        self.assertEqual(result.time_local, datetime(2023, 11, 19, 15, 30, 45, tzinfo=timezone.utc))
+        self.assertEqual(result.status, 200)
+        self.assertEqual(result.body_bytes_sent, 12)
+        self.assertIsNone(result.request)
+
+    def test_parse_matching(self):
+        self.assertIsNone(self.parser.parse_matching(LINE, LogFilter.compile("status", "5xx", "json")))
+        self.assertEqual(self.parser.parse_matching(LINE, LogFilter.compile("status", "404", "json")).status, 404)
+
+    def test_parse_invalid_line(self):
+        for line in ("not json", "[1, 2]", "{\"status\":\"200\"}"):
+            with self.assertNoLogs(level="ERROR"), self.assertRaises(ValueError) as context:
+                self.parser.parse(line)
+            self.assertEqual(str(context.exception), "Incorrect format of log string")
+
+    def test_text_format_is_rejected(self):
+        with self.assertRaises(ValueError):
+            JsonLogParser(log_format="combined")
+
+
+if __name__ == "__main__":
+    unittest.main()
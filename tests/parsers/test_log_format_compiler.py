@@ -0,0 +1,90 @@
+import unittest
+
+from src.models.log_format_preset import LogFormatPreset
+from src.parsers.log_format_compiler import LogFormatCompiler
+
+COMBINED_LINE = (
+    "127.0.0.1 - john [19/Nov/2023:15:30:45 +0000] "
+    "\"GET /index.html HTTP/1.1\" 200 1234 \"-\" \"Mozilla/5.0\""
+)
+
+
+class TestLogFormatCompiler(unittest.TestCase):
+    def test_compile_combined_preset(self):
+        log_format = LogFormatCompiler.compile(LogFormatPreset.COMBINED)
+
+        self.assertFalse(log_format.is_json)
+        self.assertTrue(log_format.has_bracketed_time)
+        self.assertEqual(log_format.fields, frozenset({"remote_addr", "remote_user", "time_local", "request", "status",
+                                                       "body_bytes_sent", "http_referer", "http_user_agent"}))
+        matcher = log_format.pattern.match(COMBINED_LINE)
+        self.assertEqual(matcher.group("request"), "GET /index.html HTTP/1.1")
+        self.assertEqual(matcher.group("httpUserAgent"), "Mozilla/5.0")
+        self.assertEqual(log_format.raw_pattern.match(COMBINED_LINE.encode()).group("status"), b"200")
+
+    def test_compile_with_projection(self):
+        log_format = LogFormatCompiler.compile(LogFormatPreset.COMBINED, frozenset({"status"}))
+
+        self.assertEqual(set(log_format.pattern.groupindex), {"status"})
+        self.assertIsNone(log_format.pattern.match(COMBINED_LINE.replace("1234", "INVALID")))
+
+    def test_compile_custom_format_skips_unknown_variables(self):
+        log_format = LogFormatCompiler.compile(
+            "$remote_addr [$time_iso8601] $host \"$request\" $status $request_time $upstream_response_time $pipe"
+        )
+
+        self.assertFalse(log_format.has_bracketed_time)
+        self.assertEqual(log_format.time_variable, "time_iso8601")
+        matcher = log_format.pattern.match(
+            "10.0.0.1 [2023-11-19T15:30:45+00:00] example.com \"GET / HTTP/1.1\" 502 0.250 0.100, 0.150 p"
+        )
+        self.assertEqual(matcher.group("host"), "example.com")
+        self.assertEqual(matcher.group("requestTime"), "0.250")
+        self.assertEqual(matcher.group("upstreamResponseTime"), "0.100, 0.150")
+
+    def test_compile_directive(self):
+        log_format = LogFormatCompiler.compile(
+            "log_format main '$remote_addr - $remote_user [$time_local] '\n"
+            "                '\"$request\" $status $body_bytes_sent';"
+        )
+
+        self.assertEqual(log_format.source, "$remote_addr - $remote_user [$time_local] \"$request\" $status $body_bytes_sent")
+        self.assertIsNotNone(log_format.pattern.match(COMBINED_LINE.rsplit(" \"-\"", 1)[0]))
+        self.assertIsNone(log_format.pattern.match(COMBINED_LINE))
+
+    def test_compile_records_delimiters(self):
+        log_format = LogFormatCompiler.compile(LogFormatPreset.APACHE_COMMON)
+
+        self.assertEqual(log_format.delimiters["remote_addr"], ("", " "))
+        self.assertEqual(log_format.delimiters["status"], ("\" ", " "))
+        self.assertEqual(log_format.delimiters["body_bytes_sent"], (" ", ""))
+        self.assertNotIn("http_user_agent", log_format.fields)
+
+    def test_compile_json_preset(self):
+        log_format = LogFormatCompiler.compile(LogFormatPreset.JSON, frozenset({"status", "request_time"}))
+
+        self.assertTrue(log_format.is_json)
+        self.assertFalse(log_format.has_bracketed_time)
+        self.assertIsNone(log_format.pattern)
+        self.assertEqual(log_format.json_keys, {"status": "status", "requestTime": "request_time"})
+        self.assertEqual(log_format.delimiters, {})
+
+    def test_compile_json_directive_with_custom_keys(self):
+        log_format = LogFormatCompiler.compile(
+            "log_format json escape=json '{\"ts\":\"$time_iso8601\",\"code\":$status,\"uri\":\"$request\"}';"
+        )
+
+        self.assertEqual(log_format.json_keys, {"timeLocal": "ts", "status": "code", "request": "uri"})
+        self.assertEqual(log_format.time_variable, "time_iso8601")
+
+    def test_compile_invalid(self):
+        with self.assertRaises(ValueError):
+            LogFormatCompiler.compile("no variables here")
+        with self.assertRaises(ValueError):
+            LogFormatCompiler.compile("{\"a\":\"$unknown\"}")
+        with self.assertRaises(ValueError):
+            LogFormatCompiler.compile("log_format main '$status")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,23 @@
+import unittest
+
+from src.parsers.json_log_parser import JsonLogParser
+from src.parsers.log_parser_factory import LogParserFactory
+from src.parsers.nginx_log_parser import NginxLogParser
+
+
+class TestLogParserFactory(unittest.TestCase):
+    def setUp(self):
+        self.factory = LogParserFactory()
+
+    def test_get_parser(self):
+        self.assertIs(type(self.factory.get_parser()), NginxLogParser)
+        self.assertIs(type(self.factory.get_parser(frozenset({"status"}), "apache-common")), NginxLogParser)
+        self.assertIsInstance(self.factory.get_parser(None, "json"), JsonLogParser)
+
+    def test_get_parser_with_invalid_format(self):
+        with self.assertRaises(ValueError):
+            self.factory.get_parser(None, "no variables here")
+
+
+if __name__ == "__main__":
+    unittest.main()
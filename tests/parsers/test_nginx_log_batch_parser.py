@@ -0,0 +1,78 @@
+import unittest
+from datetime import datetime, timezone
+
+from src.parsers.nginx_log_batch_parser import NginxLogBatchParser
+from src.services.analytics.log_filter import LogFilter
+
+LINES = [
+    b"10.0.0.2 - - [19/Nov/2023:15:30:45 +0300] \"GET /b HTTP/1.1\" 200 10 \"-\" \"curl\"",
+    b"10.0.0.1 - - [19/Nov/2023:15:30:45 +0300] \"GET /a HTTP/1.1\" 404 20 \"-\" \"Mozilla/5.0\"",
+    b"10.0.0.2 - - [19/Nov/2023:15:30:47 +0000] \"GET /a HTTP/1.1\" 500 30 \"-\" \"caf\xc3\xa9 \xff\"",
+]
+
+
+class TestNginxLogBatchParser(unittest.TestCase):
+    def setUp(self):
+        self.parser = NginxLogBatchParser()
+
+    def test_parse_builds_dictionary_encoded_columns(self):
+        columns = self.parser.parse(LINES)
+
+        self.assertEqual(len(columns), 3)
+        self.assertEqual(columns.remote_addr_values, ["10.0.0.2", "10.0.0.1"])
+        self.assertEqual(columns.remote_addr.tolist(), [0, 1, 0])
+        self.assertEqual(columns.request_values, ["GET /b HTTP/1.1", "GET /a HTTP/1.1"])
+        self.assertEqual(columns.request.tolist(), [0, 1, 1])
+        self.assertEqual(columns.http_user_agent_values, ["curl", "Mozilla/5.0", "café �"])
+        self.assertEqual(columns.status.tolist(), [200, 404, 500])
+        self.assertEqual(columns.body_bytes_sent.tolist(), [10, 20, 30])
+
+    def test_parse_stores_epoch_seconds_and_utc_offsets(self):
+        columns = self.parser.parse(LINES)
+
+        expected = int(datetime(2023, 11, 19, 12, 30, 45, tzinfo=timezone.utc).timestamp())
+        self.assertEqual(columns.time.tolist(), [expected, expected, expected + 3 * 60 * 60 + 2])
+        self.assertEqual(columns.utc_offset.tolist(), [10800, 10800, 0])
+
+    def test_parse_drops_lines_not_matching_predicate(self):
+        columns = self.parser.parse(LINES, LogFilter().compile("status", ">=400"))
+
+        self.assertEqual(columns.status.tolist(), [404, 500])
+        self.assertEqual(columns.remote_addr_values, ["10.0.0.1", "10.0.0.2"])
+
+    def test_parse_empty_batch(self):
+        self.assertEqual(len(self.parser.parse([])), 0)
+
+    def test_parse_invalid_line(self):
+        with self.assertRaises(ValueError):
+            self.parser.parse([LINES[0], b"not a log line"])
+
+    def test_parse_invalid_time(self):
+        with self.assertRaises(ValueError):
+            self.parser.parse([LINES[0].replace(b"19/Nov/2023", b"19/Foo/2023")])
+
+    def test_parse_apache_common_format(self):
+        parser = NginxLogBatchParser("apache-common")
+        columns = parser.parse([
+            b"127.0.0.1 - frank [10/Oct/2000:13:55:36 -0700] \"GET /a.gif HTTP/1.0\" 200 2326",
+            b"127.0.0.1 - - [10/Oct/2000:13:55:37 -0700] \"HEAD / HTTP/1.0\" 304 -",
+        ])
+
+        self.assertEqual(columns.status.tolist(), [200, 304])
+        self.assertEqual(columns.body_bytes_sent.tolist(), [2326, 0])
+        self.assertEqual(columns.http_user_agent_values, ["-"])
+
+    def test_parse_json_format(self):
+        parser = NginxLogBatchParser("json")
+        line = (b"{\"time_local\":\"19/Nov/2023:15:30:45 +0300\",\"remote_addr\":\"10.0.0.1\",\"request\":\"GET /a\","
+                b"\"status\":\"404\",\"body_bytes_sent\":\"7\",\"http_user_agent\":\"curl\"}")
+        columns = parser.parse([line, line.replace(b"404", b"200")], LogFilter().compile("status", "404", "json"))
+
+        self.assertEqual(columns.status.tolist(), [404])
+        self.assertEqual(columns.remote_addr_values, ["10.0.0.1"])
+        self.assertEqual(columns.body_bytes_sent.tolist(), [7])
+        self.assertEqual(columns.utc_offset.tolist(), [10800])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,6 +3,7 @@ from unittest.mock import patch
 from datetime import datetime
 from src.parsers.nginx_log_parser import NginxLogParser
 from src.models.nginx_log import NginxLog
+from src.services.analytics.log_filter import LogFilter
 
 
 class TestNginxLogParser(unittest.TestCase):
@@ -76,13 +77,105 @@ class TestNginxLogParser(unittest.TestCase):
 
         self.assertEqual(str(context.exception), "Incorrect time format: Invalid Date")
 
-    @patch("src.parsers.nginx_log_parser.LOGGER.error")
-    def test_parse_logs_error_on_invalid_log(self, mock_logger_error):
-        invalid_log_line = "Invalid log line"
+    @patch("src.parsers.nginx_log_parser.DateParser.check_time_pattern")
+    def test_parse_matching_skips_time_parsing_on_mismatch(self, mock_date_parser):
+        mock_date_parser.return_value = datetime(2023, 11, 19, 15, 30, 45)
+
+        self.assertIsNone(self.parser.parse_matching(self.valid_log_line, LogFilter.compile("status", "5xx")))
+        mock_date_parser.assert_not_called()
+
+        result = self.parser.parse_matching(self.valid_log_line, LogFilter.compile("status", "2xx"))
+        self.assertEqual(result.status, 200)
+        mock_date_parser.assert_called_once()
+
+    @patch("src.parsers.nginx_log_parser.DateParser.check_time_pattern")
+    def test_parse_with_projection(self, mock_date_parser):
+        parser = NginxLogParser(frozenset({"status", "body_bytes_sent", "request"}))
+        result = parser.parse(self.valid_log_line)
+
+        self.assertEqual(result.status, 200)
+        self.assertEqual(result.body_bytes_sent, 1234)
+        self.assertEqual(result.request, "GET /index.html HTTP/1.1")
+        self.assertIsNone(result.remote_addr)
+        self.assertIsNone(result.time_local)
+        self.assertIsNone(result.http_user_agent)
+        mock_date_parser.assert_not_called()
+
+    def test_parse_with_projection_still_validates_format(self):
+        parser = NginxLogParser(frozenset({"status"}))
         with self.assertRaises(ValueError):
+            parser.parse("127.0.0.1 - john [19/Nov/2023:15:30:45 +0000] \"GET / HTTP/1.1\" 200 INVALID \"-\" \"-\"")
+
+    @patch("src.parsers.nginx_log_parser.DateParser.check_time_pattern")
+    def test_parse_bytes_line(self, mock_date_parser):
+        mock_date_parser.return_value = datetime(2023, 11, 19, 15, 30, 45)
+        result = self.parser.parse(self.valid_log_line.replace("Mozilla/5.0", "Mozilla\udcff").encode("utf-8", "surrogateescape"))
+
+        self.assertEqual(result.remote_addr, "127.0.0.1")
+        self.assertEqual(result.status, 200)
+        self.assertEqual(result.http_user_agent, "Mozilla\ufffd")
+        mock_date_parser.assert_called_once_with("19/Nov/2023:15:30:45 +0000")
+
+    @patch("src.parsers.nginx_log_parser.DateParser.check_time_pattern")
+    def test_parse_range(self, mock_date_parser):
+        mock_date_parser.return_value = datetime(2023, 11, 19, 15, 30, 45)
+        line = self.valid_log_line.encode("utf-8")
+        buffer = b"garbage\n" + line + b"\nmore garbage"
+
+        result = self.parser.parse_range(buffer, 8, 8 + len(line))
+        self.assertEqual(result.remote_addr, "127.0.0.1")
+        self.assertEqual(result.http_user_agent, "Mozilla/5.0")
+
+        self.assertIsNone(self.parser.parse_range_matching(buffer, 8, 8 + len(line), LogFilter.compile("status", "404")))
+        with self.assertRaises(ValueError):
+            self.parser.parse_range(buffer, 0, 7)
+
+    def test_parse_custom_format(self):
+        parser = NginxLogParser(log_format="$remote_addr $host [$time_iso8601] \"$request\" $status "
+                                           "$request_time $upstream_response_time")
+        result = parser.parse("10.0.0.1 example.com [2023-11-19T15:30:45+00:00] \"GET / HTTP/1.1\" 502 "
+                              "0.250 0.100, - : 0.050")
+
+        self.assertEqual(result.host, "example.com")
+        self.assertEqual(result.time_local, datetime.fromisoformat("2023-11-19T15:30:45+00:00"))
+        self.assertEqual(result.status, 502)
+        self.assertEqual(result.request_time, 0.25)
+        self.assertAlmostEqual(result.upstream_response_time, 0.15)
+        self.assertIsNone(result.body_bytes_sent)
+        self.assertIsNone(result.http_user_agent)
+
+    def test_parse_upstream_time(self):
+        self.assertEqual(NginxLogParser.parse_upstream_time("0.5"), 0.5)
+        self.assertAlmostEqual(NginxLogParser.parse_upstream_time("0.1, 0.2 : 0.3"), 0.6)
+        self.assertIsNone(NginxLogParser.parse_upstream_time("-"))
+
+    def test_parse_json_format_is_rejected(self):
+        with self.assertRaises(ValueError):
+            NginxLogParser(log_format="json")
+
+    def test_parse_with_unknown_field(self):
+        with self.assertRaises(ValueError):
+            NginxLogParser(frozenset({"unknown"}))
+
+    def test_projected_parser_leaves_out_unrequested_fields(self):
+        parser = NginxLogParser(frozenset({"status", "body_bytes_sent"}))
+
+        result = parser.parse(self.valid_log_line)
+
+        self.assertEqual(result.status, 200)
+        self.assertEqual(result.body_bytes_sent, 1234)
+        self.assertIsNone(result.remote_addr)
+        self.assertIsNone(result.time_local)
+        self.assertIsNone(result.request)
+        self.assertIsNone(result.http_referer)
+        self.assertIsNone(result.http_user_agent)
+
+    def test_parse_logs_error_on_invalid_log(self):
+        invalid_log_line = "Invalid log line"
+        with self.assertNoLogs(level="ERROR"), self.assertRaises(ValueError) as context:
             self.parser.parse(invalid_log_line)
 
-        mock_logger_error.assert_called_once_with("Incorrect format of log string")
+        self.assertEqual(str(context.exception), "Incorrect format of log string")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,58 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from src.parsers.time_local_parser import TimeLocalParser
+
+
+class TestTimeLocalParser(unittest.TestCase):
+    def setUp(self):
+        self.parser = TimeLocalParser()
+
+    def test_parse_fixed_layout_matches_strptime(self):
+        for time_local in [
+            "19/Nov/2023:15:30:45 +0000",
+            "01/Jan/2024:00:00:00 +0530",
+            "29/Feb/2024:23:59:59 -0800",
+        ]:
+            expected = datetime.strptime(time_local, "%d/%b/%Y:%H:%M:%S %z")
+            result = self.parser.parse(time_local)
+            self.assertEqual(result, expected)
+            self.assertEqual(result.utcoffset(), expected.utcoffset())
+
+    def test_parse_negative_offset(self):
+        result = self.parser.parse("19/Nov/2023:15:30:45 -0130")
+        self.assertEqual(result.utcoffset(), -timedelta(hours=1, minutes=30))
+
+    def test_parse_caches_timezone_per_offset(self):
+        first = self.parser.parse("19/Nov/2023:15:30:45 +0300")
+        second = self.parser.parse("19/Nov/2023:15:30:46 +0300")
+        self.assertIs(first.tzinfo, second.tzinfo)
+        self.assertEqual(first.tzinfo, timezone(timedelta(hours=3)))
+
+    def test_parse_memoizes_same_second(self):
+        first = self.parser.parse("19/Nov/2023:15:30:45 +0000")
+        with patch.object(self.parser, "parse_fixed_layout") as mock_fixed_layout:
+            second = self.parser.parse("19/Nov/2023:15:30:45 +0000")
+        mock_fixed_layout.assert_not_called()
+        self.assertIs(first, second)
+
+    def test_parse_full_month_falls_back_to_strptime(self):
+        result = self.parser.parse("19/November/2023:15:30:45 +0000")
+        self.assertEqual(result, datetime(2023, 11, 19, 15, 30, 45, tzinfo=timezone.utc))
+
+    def test_parse_fixed_layout_rejects_odd_inputs(self):
+        self.assertIsNone(self.parser.parse_fixed_layout("19/November/2023:15:30:45 +0000"))
+        self.assertIsNone(self.parser.parse_fixed_layout("19/Foo/2023:15:30:45 +0000"))
+        self.assertIsNone(self.parser.parse_fixed_layout("1_/Nov/2023:15:30:45 +0000"))
+        self.assertIsNone(self.parser.parse_fixed_layout("31/Feb/2023:15:30:45 +0000"))
+        self.assertIsNone(self.parser.parse_fixed_layout("19/Nov/2023:15:30:45 *0000"))
+
+    def test_parse_invalid(self):
+        with self.assertRaises(ValueError) as context:
+            self.parser.parse("Invalid Date Format")
+        self.assertEqual(str(context.exception), "Incorrect date format: Invalid Date Format")
+
+
+if __name__ == "__main__":
+    unittest.main()
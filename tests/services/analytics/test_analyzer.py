@@ -1,7 +1,15 @@
+import os
 import unittest
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from tempfile import TemporaryDirectory
 from unittest.mock import Mock
-from src.services.analytics.analyzer import Analyzer
+from src.services.analytics.analyzer import LATENCY_FIELDS, REQUIRED_FIELDS, TOP_FIELDS, Analyzer
+from src.services.analytics.heavy_hitters import HeavyHitters
+from src.services.analytics.latency_stats import LatencyStats
+from src.services.analytics.resource_normalizer import ResourceNormalizer
+from src.services.analytics.time_series import TimeSeries
+from src.services.analytics.ddsketch_quantile_estimator import DDSketchQuantileEstimator
+from src.services.analytics.hyperloglog_unique_counter import HyperLogLogUniqueCounter
 from src.models.nginx_log import NginxLog
 
 
@@ -70,6 +78,7 @@ class TestAnalyzer(unittest.TestCase):
         for size in sizes:
             log = Mock()
             log.body_bytes_sent = size
+            log.remote_addr = "127.0.0.1"
             log.request = "GET /test HTTP/1.1"
             log.status = 200
             log.time_local = datetime(2023, 1, 1, 12, 0, 0)
@@ -77,6 +86,261 @@ class TestAnalyzer(unittest.TestCase):
 
         self.assertEqual(self.analyzer.calculate_95th_percentile(), 500)
 
+    def test_merge(self):
+        log1 = NginxLog(
+            remote_addr="192.168.0.1",
+            remote_user="user123",
+            time_local=datetime(2023, 1, 1, 12, 0, 0),
+            request="GET /index.html HTTP/1.1",
+            status=200,
+            body_bytes_sent=1024,
+            http_referer="http://example.com",
+            http_user_agent="Mozilla/5.0"
+        )
+        log2 = NginxLog(
+            remote_addr="192.168.0.2",
+            remote_user="user456",
+            time_local=datetime(2023, 1, 1, 11, 0, 0),
+            request="POST /submit HTTP/1.1",
+            status=404,
+            body_bytes_sent=2048,
+            http_referer="http://example.com",
+            http_user_agent="Mozilla/5.0"
+        )
+        other = Analyzer()
+        self.analyzer.update_metrics(log1)
+        other.update_metrics(log1)
+        other.update_metrics(log2)
+
+        self.analyzer.merge(other)
+
+        self.assertEqual(self.analyzer.get_count_logs(), 3)
+        self.assertAlmostEqual(self.analyzer.get_average_size_logs(), 4096 / 3)
+        self.assertEqual(self.analyzer.get_unique_ip_count(), 2)
+        self.assertAlmostEqual(self.analyzer.get_error_rate(), 100 / 3)
+        self.assertEqual(self.analyzer.get_start_date(), datetime(2023, 1, 1, 11, 0, 0))
+        self.assertEqual(self.analyzer.get_end_date(), datetime(2023, 1, 1, 12, 0, 0))
+        self.assertEqual(self.analyzer.get_status_code_counts(), {200: 2, 404: 1})
+        self.assertEqual(self.analyzer.get_requested_resources(), {"/index.html": 2, "/submit": 1})
+        self.assertEqual(self.analyzer.calculate_95th_percentile(), 1024)
+
+    def test_merge_into_empty(self):
+        other = Analyzer()
+        self.analyzer.merge(other)
+
+        self.assertEqual(self.analyzer.get_count_logs(), 0)
+        self.assertIsNone(self.analyzer.get_start_date())
+        self.assertIsNone(self.analyzer.get_end_date())
+
+    def test_combine(self):
+        log = NginxLog(
+            remote_addr="192.168.0.1",
+            remote_user="user123",
+            time_local=datetime(2023, 1, 1, 12, 0, 0),
+            request="GET /index.html HTTP/1.1",
+            status=500,
+            body_bytes_sent=100,
+            http_referer="http://example.com",
+            http_user_agent="Mozilla/5.0"
+        )
+        first = Analyzer()
+        second = Analyzer()
+        first.update_metrics(log)
+        second.update_metrics(log)
+
+        combined = Analyzer.combine([first, second])
+
+        self.assertEqual(combined.get_count_logs(), 2)
+        self.assertEqual(combined.get_error_rate(), 100.0)
+        self.assertEqual(first.get_count_logs(), 1)
+
+    def test_to_bytes_round_trip(self):
+        log1 = NginxLog(
+            remote_addr="192.168.0.1",
+            remote_user="user123",
+            time_local=datetime(2023, 1, 1, 12, 0, 0, tzinfo=timezone(timedelta(hours=3))),
+            request="GET /index.html HTTP/1.1",
+            status=200,
+            body_bytes_sent=1024,
+            http_referer="http://example.com",
+            http_user_agent="Mozilla/5.0"
+        )
+        log2 = NginxLog(
+            remote_addr="2001:db8::1",
+            remote_user="user456",
+            time_local=datetime(2023, 1, 1, 13, 0, 0, tzinfo=timezone.utc),
+            request="POST /submit HTTP/1.1",
+            status=404,
+            body_bytes_sent=2048,
+            http_referer="http://example.com",
+            http_user_agent="Mozilla/5.0"
+        )
+        self.analyzer.update_metrics(log1)
+        self.analyzer.update_metrics(log2)
+
+        restored = Analyzer.from_bytes(self.analyzer.to_bytes())
+
+        self.assertEqual(restored.get_count_logs(), 2)
+        self.assertEqual(restored.get_average_size_logs(), 1536.0)
+        self.assertEqual(restored.get_unique_ip_count(), 2)
+        self.assertAlmostEqual(restored.get_error_rate(), 50.0)
+        self.assertEqual(restored.get_start_date(), log1.time_local)
+        self.assertEqual(restored.get_end_date(), log2.time_local)
+        self.assertEqual(restored.get_status_code_counts(), {200: 1, 404: 1})
+        self.assertEqual(restored.get_requested_resources(), {"/index.html": 1, "/submit": 1})
+        self.assertEqual(restored.calculate_95th_percentile(), self.analyzer.calculate_95th_percentile())
+
+    def test_from_bytes_rejects_invalid_data(self):
+        with self.assertRaises(ValueError):
+            Analyzer.from_bytes(b"not an analyzer state")
+
+    def test_save_and_load(self):
+        self.analyzer.update_metrics(NginxLog(
+            remote_addr="192.168.0.1",
+            remote_user="user123",
+            time_local=datetime(2023, 1, 1, 12, 0, 0),
+            request="GET /index.html HTTP/1.1",
+            status=200,
+            body_bytes_sent=1024,
+            http_referer="http://example.com",
+            http_user_agent="Mozilla/5.0"
+        ))
+
+        with TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "state.bin")
+            self.analyzer.save(file_path)
+            restored = Analyzer.load(file_path)
+
+        self.assertEqual(restored.get_count_logs(), 1)
+        self.assertEqual(restored.get_start_date(), datetime(2023, 1, 1, 12, 0, 0))
+
+    def test_calculate_percentile_with_sketch(self):
+        analyzer = Analyzer(DDSketchQuantileEstimator(relative_accuracy=0.01))
+        for size in range(1, 1001):
+            log = Mock()
+            log.body_bytes_sent = size
+            log.remote_addr = "127.0.0.1"
+            log.request = "GET /test HTTP/1.1"
+            log.status = 200
+            log.time_local = datetime(2023, 1, 1, 12, 0, 0)
+            analyzer.update_metrics(log)
+
+        self.assertAlmostEqual(analyzer.calculate_percentile(50), 500, delta=10)
+        self.assertAlmostEqual(analyzer.calculate_95th_percentile(), 950, delta=19)
+
+        restored = Analyzer.from_bytes(analyzer.to_bytes())
+        self.assertIsInstance(restored.response_sizes, DDSketchQuantileEstimator)
+        self.assertEqual(restored.calculate_percentile(99), analyzer.calculate_percentile(99))
+
+    def test_time_series_survives_merge_and_round_trip(self):
+        first = Analyzer(time_series=TimeSeries(60))
+        second = first.create_empty()
+        for analyzer, minute, status in [(first, 0, 200), (first, 1, 500), (second, 1, 404), (second, 2, 200)]:
+            analyzer.update_metrics(NginxLog("10.0.0.1", "-", datetime(2023, 1, 1, 12, minute, 30, tzinfo=timezone.utc),
+                                             "GET / HTTP/1.1", status, 100 * (minute + 1), "-", "curl"))
+
+        combined = Analyzer.combine([first, second])
+        restored = Analyzer.from_bytes(combined.to_bytes())
+
+        intervals = restored.get_time_series().get_intervals()
+        self.assertEqual([interval.start.minute for interval in intervals], [0, 1, 2])
+        self.assertEqual([interval.count for interval in intervals], [1, 2, 1])
+        self.assertEqual([interval.error_count for interval in intervals], [0, 2, 0])
+        self.assertEqual([interval.byte_sum for interval in intervals], [100, 400, 300])
+        self.assertIsNone(Analyzer().get_time_series())
+
+    def test_latency_survives_merge_and_round_trip(self):
+        first = Analyzer(latency=LatencyStats())
+        second = first.create_empty()
+        for analyzer, status, request_time in [(first, 200, 0.1), (first, 504, 3.0), (second, 200, None),
+                                               (second, 200, 0.2)]:
+            analyzer.update_metrics(NginxLog("10.0.0.1", "-", datetime(2023, 1, 1, 12, 0, 30, tzinfo=timezone.utc),
+                                             "GET /api HTTP/1.1", status, 100, "-", "curl",
+                                             request_time=request_time, upstream_response_time=request_time))
+
+        restored = Analyzer.from_bytes(Analyzer.combine([first, second]).to_bytes())
+
+        latency = restored.get_latency_stats()
+        self.assertEqual(latency.get_request_summary().count, 3)
+        self.assertEqual(latency.get_upstream_summary().count, 3)
+        self.assertEqual([summary.label for summary in latency.get_status_summaries()], ["200", "504"])
+        self.assertEqual([summary.label for summary in latency.get_slowest_endpoints(10)], ["/api"])
+        self.assertEqual(restored.get_required_fields(), REQUIRED_FIELDS | LATENCY_FIELDS)
+        self.assertIsNone(Analyzer().get_latency_stats())
+        self.assertEqual(Analyzer().get_required_fields(), REQUIRED_FIELDS)
+
+    def test_heavy_hitters_replace_resource_counts(self):
+        first = Analyzer(heavy_hitters=HeavyHitters(1, 10))
+        second = first.create_empty()
+        for analyzer, resource, agent in [(first, "/a", "curl"), (first, "/b", "bot"), (second, "/b", "bot")]:
+            analyzer.update_metrics(NginxLog("10.0.0.1", "-", datetime(2023, 1, 1, tzinfo=timezone.utc),
+                                             f"GET {resource} HTTP/1.1", 200, 100, "-", agent))
+
+        restored = Analyzer.from_bytes(Analyzer.combine([first, second]).to_bytes())
+
+        self.assertEqual(restored.resource_counts, {})
+        self.assertEqual(restored.get_requested_resources(), {"/b": 2})
+        self.assertEqual(restored.get_heavy_hitters().get_top_user_agents()[0].value, "bot")
+        self.assertEqual(restored.get_heavy_hitters().get_top_addresses()[0].count, 3)
+        self.assertEqual(restored.get_required_fields(), REQUIRED_FIELDS | TOP_FIELDS)
+        self.assertIsNone(Analyzer().get_heavy_hitters())
+
+    def test_resource_normalizer_collapses_resources(self):
+        analyzer = Analyzer(resource_normalizer=ResourceNormalizer(["/api/users/{id}/orders"]))
+        for request in ["GET /api/users/1?x=1 HTTP/1.1", "GET /api/users/2 HTTP/1.1",
+                        "POST /api/users/3/orders HTTP/1.1"]:
+            analyzer.update_metrics(NginxLog("10.0.0.1", "-", datetime(2023, 1, 1, tzinfo=timezone.utc), request,
+                                             200, 100, "-", "curl"))
+
+        restored = Analyzer.from_bytes(analyzer.to_bytes())
+        restored.update_metrics(NginxLog("10.0.0.1", "-", datetime(2023, 1, 1, tzinfo=timezone.utc),
+                                         "GET /api/users/4 HTTP/1.1", 200, 100, "-", "curl"))
+
+        self.assertEqual(analyzer.get_requested_resources(), {"/api/users/{id}": 2, "/api/users/{id}/orders": 1})
+        self.assertEqual(restored.get_requested_resources(), {"/api/users/{id}": 3, "/api/users/{id}/orders": 1})
+        self.assertIs(analyzer.create_empty().resource_normalizer, analyzer.resource_normalizer)
+
+    def test_bad_lines_survive_merge_and_round_trip(self):
+        first = Analyzer()
+        second = first.create_empty()
+        first.record_bad_line("a.log")
+        second.record_bad_line("a.log")
+        second.record_bad_line("b.log")
+
+        restored = Analyzer.from_bytes(Analyzer.combine([first, second]).to_bytes())
+
+        self.assertEqual(restored.get_bad_line_counts(), {"a.log": 2, "b.log": 1})
+        self.assertEqual(Analyzer().get_bad_line_counts(), {})
+
+    def test_create_empty_keeps_configuration(self):
+        analyzer = Analyzer(DDSketchQuantileEstimator(relative_accuracy=0.05), HyperLogLogUniqueCounter(10))
+        empty = analyzer.create_empty()
+
+        self.assertIsInstance(empty.response_sizes, DDSketchQuantileEstimator)
+        self.assertEqual(empty.response_sizes.relative_accuracy, 0.05)
+        self.assertIsInstance(empty.unique_ips, HyperLogLogUniqueCounter)
+        self.assertEqual(empty.unique_ips.precision, 10)
+        self.assertEqual(empty.get_count_logs(), 0)
+
+    def test_unique_ips_with_hyperloglog(self):
+        analyzer = Analyzer(unique_ips=HyperLogLogUniqueCounter())
+        for index in range(50):
+            analyzer.update_metrics(NginxLog(
+                remote_addr=f"10.0.0.{index % 20}",
+                remote_user="-",
+                time_local=datetime(2023, 1, 1, 12, 0, 0),
+                request="GET /index.html HTTP/1.1",
+                status=200,
+                body_bytes_sent=100,
+                http_referer="-",
+                http_user_agent="Mozilla/5.0"
+            ))
+
+        self.assertEqual(analyzer.get_unique_ip_count(), 20)
+        restored = Analyzer.from_bytes(analyzer.to_bytes())
+        self.assertIsInstance(restored.unique_ips, HyperLogLogUniqueCounter)
+        self.assertEqual(restored.get_unique_ip_count(), 20)
+
     def test_extract_resource_from_request(self):
         request = "GET /test/resource HTTP/1.1"
         resource = self.analyzer.extract_resource_from_request(request)
@@ -0,0 +1,95 @@
+import random
+import unittest
+
+from src.services.analytics.ddsketch_quantile_estimator import DDSketchQuantileEstimator
+from src.services.analytics.exact_quantile_estimator import ExactQuantileEstimator
+from src.services.serialization.binary_reader import BinaryReader
+from src.services.serialization.binary_writer import BinaryWriter
+
+
+class TestDDSketchQuantileEstimator(unittest.TestCase):
+    def setUp(self):
+        self.sketch = DDSketchQuantileEstimator(relative_accuracy=0.01)
+        generator = random.Random(42)
+        self.values = [int(generator.lognormvariate(8, 2)) for _ in range(20000)]
+
+    def test_invalid_configuration(self):
+        with self.assertRaises(ValueError):
+            DDSketchQuantileEstimator(relative_accuracy=0)
+        with self.assertRaises(ValueError):
+            DDSketchQuantileEstimator(max_bins=0)
+
+    def test_quantile_empty(self):
+        self.assertEqual(self.sketch.quantile(0.95), 0.0)
+
+    def test_quantile_within_relative_error(self):
+        for value in self.values:
+            self.sketch.add(value)
+
+        ordered = sorted(self.values)
+        for q in (0.5, 0.9, 0.95, 0.99):
+            expected = ordered[int(q * (len(ordered) - 1))]
+            self.assertAlmostEqual(self.sketch.quantile(q), expected, delta=expected * 0.01 + 1)
+        self.assertEqual(self.sketch.get_count(), len(self.values))
+
+    def test_zero_values(self):
+        for value in [0, 0, 0, 10]:
+            self.sketch.add(value)
+        self.assertEqual(self.sketch.quantile(0.5), 0.0)
+        self.assertAlmostEqual(self.sketch.quantile(1.0), 10, delta=0.1)
+
+    def test_add_many_matches_single_adds(self):
+        for value in self.values + [0, 0]:
+            self.sketch.add(value)
+        bulk = self.sketch.create_empty()
+
+        bulk.add_many(self.values + [0, 0])
+
+        self.assertEqual(bulk.bins, self.sketch.bins)
+        self.assertEqual((bulk.count, bulk.zero_count), (self.sketch.count, self.sketch.zero_count))
+        self.assertEqual((bulk.min_value, bulk.max_value), (self.sketch.min_value, self.sketch.max_value))
+        bulk.add_many([])
+        self.assertEqual(bulk.count, self.sketch.count)
+
+    def test_merge_matches_single_sketch(self):
+        first = self.sketch.create_empty()
+        second = self.sketch.create_empty()
+        for index, value in enumerate(self.values):
+            self.sketch.add(value)
+            (first if index % 2 else second).add(value)
+
+        first.merge(second)
+
+        self.assertEqual(first.bins, self.sketch.bins)
+        self.assertEqual(first.quantile(0.95), self.sketch.quantile(0.95))
+
+    def test_merge_with_different_accuracy(self):
+        with self.assertRaises(ValueError):
+            self.sketch.merge(DDSketchQuantileEstimator(relative_accuracy=0.05))
+        with self.assertRaises(ValueError):
+            self.sketch.merge(ExactQuantileEstimator())
+
+    def test_bins_are_bounded(self):
+        sketch = DDSketchQuantileEstimator(relative_accuracy=0.01, max_bins=256)
+        for value in self.values:
+            sketch.add(value)
+
+        self.assertLessEqual(len(sketch.bins), 256)
+        expected = sorted(self.values)[int(0.99 * (len(self.values) - 1))]
+        self.assertAlmostEqual(sketch.quantile(0.99), expected, delta=expected * 0.01 + 1)
+
+    def test_write_and_read(self):
+        for value in self.values[:100]:
+            self.sketch.add(value)
+        writer = BinaryWriter()
+        self.sketch.write(writer)
+
+        restored = DDSketchQuantileEstimator.read(BinaryReader(writer.getvalue()))
+
+        self.assertEqual(restored.relative_accuracy, self.sketch.relative_accuracy)
+        self.assertEqual(restored.bins, self.sketch.bins)
+        self.assertEqual(restored.quantile(0.9), self.sketch.quantile(0.9))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+from array import array
+
+from src.services.analytics.ddsketch_quantile_estimator import DDSketchQuantileEstimator
+from src.services.analytics.exact_quantile_estimator import ExactQuantileEstimator
+from src.services.serialization.binary_reader import BinaryReader
+from src.services.serialization.binary_writer import BinaryWriter
+
+
+class TestExactQuantileEstimator(unittest.TestCase):
+    def setUp(self):
+        self.estimator = ExactQuantileEstimator()
+
+    def test_quantile_empty(self):
+        self.assertEqual(self.estimator.quantile(0.95), 0.0)
+
+    def test_quantile_matches_sorted_index(self):
+        for value in [600, 100, 500, 200, 400, 300]:
+            self.estimator.add(value)
+
+        self.assertEqual(self.estimator.quantile(0.95), 500)
+        self.assertEqual(self.estimator.quantile(0.5), 300)
+        self.assertEqual(self.estimator.get_count(), 6)
+        self.assertIsInstance(self.estimator.values, array)
+
+    def test_quantile_after_more_values(self):
+        self.estimator.add(100)
+        self.assertEqual(self.estimator.quantile(0.5), 100)
+        self.estimator.add(50)
+        self.estimator.add(10)
+        self.assertEqual(self.estimator.quantile(0.5), 10)
+
+    def test_add_many(self):
+        self.estimator.add(3)
+        self.estimator.add_many([1, 2])
+        self.assertEqual(list(self.estimator.values), [3, 1, 2])
+
+    def test_merge(self):
+        other = ExactQuantileEstimator()
+        self.estimator.add(1)
+        other.add(2)
+        self.estimator.merge(other)
+        self.assertEqual(list(self.estimator.values), [1, 2])
+
+    def test_merge_with_sketch(self):
+        with self.assertRaises(ValueError):
+            self.estimator.merge(DDSketchQuantileEstimator())
+
+    def test_write_and_read(self):
+        self.estimator.add(5)
+        self.estimator.add(7)
+        writer = BinaryWriter()
+        self.estimator.write(writer)
+
+        restored = ExactQuantileEstimator.read(BinaryReader(writer.getvalue()))
+        self.assertEqual(list(restored.values), [5, 7])
+        self.assertIsInstance(self.estimator.create_empty(), ExactQuantileEstimator)
+        self.assertEqual(self.estimator.create_empty().get_count(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
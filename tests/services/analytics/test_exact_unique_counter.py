@@ -0,0 +1,51 @@
+import unittest
+
+from src.services.analytics.exact_unique_counter import ExactUniqueCounter
+from src.services.analytics.hyperloglog_unique_counter import HyperLogLogUniqueCounter
+from src.services.serialization.binary_reader import BinaryReader
+from src.services.serialization.binary_writer import BinaryWriter
+
+
+class TestExactUniqueCounter(unittest.TestCase):
+    def setUp(self):
+        self.counter = ExactUniqueCounter()
+
+    def test_add_packs_addresses(self):
+        for value in ["192.168.0.1", "192.168.0.1", "10.0.0.1", "2001:db8::1", "2001:0db8:0::1", "unknown"]:
+            self.counter.add(value)
+
+        self.assertEqual(self.counter.ipv4, {0xC0A80001, 0x0A000001})
+        self.assertEqual(self.counter.ipv6, {0x20010DB8000000000000000000000001})
+        self.assertEqual(self.counter.others, {"unknown"})
+        self.assertEqual(self.counter.get_count(), 4)
+
+    def test_merge(self):
+        other = ExactUniqueCounter()
+        self.counter.add("192.168.0.1")
+        other.add("192.168.0.1")
+        other.add("::1")
+
+        self.counter.merge(other)
+
+        self.assertEqual(self.counter.get_count(), 2)
+
+    def test_merge_with_estimate(self):
+        with self.assertRaises(ValueError):
+            self.counter.merge(HyperLogLogUniqueCounter())
+
+    def test_write_and_read(self):
+        for value in ["192.168.0.1", "255.255.255.255", "2001:db8::1", "-"]:
+            self.counter.add(value)
+        writer = BinaryWriter()
+        self.counter.write(writer)
+
+        restored = ExactUniqueCounter.read(BinaryReader(writer.getvalue()))
+
+        self.assertEqual(restored.ipv4, self.counter.ipv4)
+        self.assertEqual(restored.ipv6, self.counter.ipv6)
+        self.assertEqual(restored.others, self.counter.others)
+        self.assertEqual(self.counter.create_empty().get_count(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+
+from src.models.heavy_hitter import HeavyHitter
+from src.services.analytics.heavy_hitters import HeavyHitters
+from src.services.serialization.binary_reader import BinaryReader
+from src.services.serialization.binary_writer import BinaryWriter
+
+
+class TestHeavyHitters(unittest.TestCase):
+    def setUp(self):
+        self.heavy_hitters = HeavyHitters(2)
+
+    def test_add_tracks_every_field(self):
+        for resource, address, user_agent, referer in [("/a", "10.0.0.1", "curl", "-"), ("/a", "10.0.0.2", "curl", "-"),
+                                                       ("/b", "10.0.0.1", "bot", "https://example.com"),
+                                                       ("/c", "10.0.0.3", "wget", "-")]:
+            self.heavy_hitters.add(resource, address, user_agent, referer)
+
+        self.assertEqual(self.heavy_hitters.get_top_resources(), [HeavyHitter("/a", 2, 0), HeavyHitter("/b", 1, 0)])
+        self.assertEqual([hitter.value for hitter in self.heavy_hitters.get_top_addresses()], ["10.0.0.1", "10.0.0.2"])
+        self.assertEqual(self.heavy_hitters.get_top_user_agents()[0], HeavyHitter("curl", 2, 0))
+        self.assertEqual(self.heavy_hitters.get_top_referers()[0], HeavyHitter("-", 3, 0))
+
+    def test_capacity_defaults_to_multiple_of_top(self):
+        self.assertEqual(self.heavy_hitters.capacity, 100)
+        self.assertEqual(HeavyHitters(50).capacity, 500)
+        self.assertEqual(HeavyHitters(50).resources.capacity, 500)
+
+    def test_merge_and_round_trip(self):
+        other = self.heavy_hitters.create_empty()
+        self.heavy_hitters.add("/a", "10.0.0.1", "curl", "-")
+        other.add("/b", "10.0.0.1", "curl", "-")
+        other.add("/b", "10.0.0.2", "curl", "-")
+
+        self.heavy_hitters.merge(other)
+        writer = BinaryWriter()
+        self.heavy_hitters.write(writer)
+        restored = HeavyHitters.read(BinaryReader(writer.getvalue()))
+
+        self.assertEqual(restored.top, 2)
+        self.assertEqual(restored.get_top_resources(), [HeavyHitter("/b", 2, 0), HeavyHitter("/a", 1, 0)])
+        self.assertEqual(restored.get_top_addresses()[0], HeavyHitter("10.0.0.1", 2, 0))
+        self.assertEqual(restored.get_top_user_agents(), [HeavyHitter("curl", 3, 0)])
+
+    def test_merge_rejects_different_configuration(self):
+        with self.assertRaises(ValueError):
+            self.heavy_hitters.merge(HeavyHitters(3))
+        with self.assertRaises(ValueError):
+            self.heavy_hitters.merge(HeavyHitters(2, 10))
+
+    def test_invalid_configuration(self):
+        with self.assertRaises(ValueError):
+            HeavyHitters(0)
+        with self.assertRaises(ValueError):
+            HeavyHitters(10, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+
+from src.services.analytics.exact_unique_counter import ExactUniqueCounter
+from src.services.analytics.hyperloglog_unique_counter import HyperLogLogUniqueCounter
+from src.services.serialization.binary_reader import BinaryReader
+from src.services.serialization.binary_writer import BinaryWriter
+
+
+class TestHyperLogLogUniqueCounter(unittest.TestCase):
+    def setUp(self):
+        self.counter = HyperLogLogUniqueCounter(precision=14)
+
+    def test_invalid_precision(self):
+        with self.assertRaises(ValueError):
+            HyperLogLogUniqueCounter(precision=3)
+        with self.assertRaises(ValueError):
+            HyperLogLogUniqueCounter(precision=19)
+
+    def test_empty_count(self):
+        self.assertEqual(self.counter.get_count(), 0)
+
+    def test_small_cardinality_is_exact_enough(self):
+        for index in range(100):
+            self.counter.add(f"10.0.0.{index}")
+            self.counter.add(f"10.0.0.{index}")
+        self.assertAlmostEqual(self.counter.get_count(), 100, delta=2)
+
+    def test_large_cardinality_within_error(self):
+        for index in range(100000):
+            self.counter.add(f"10.{index >> 16}.{(index >> 8) & 255}.{index & 255}")
+        self.assertAlmostEqual(self.counter.get_count(), 100000, delta=100000 * 0.03)
+        self.assertEqual(len(self.counter.registers), 1 << 14)
+
+    def test_merge_matches_single_counter(self):
+        first = self.counter.create_empty()
+        second = self.counter.create_empty()
+        for index in range(5000):
+            value = f"2001:db8::{index:x}"
+            self.counter.add(value)
+            (first if index % 3 else second).add(value)
+
+        first.merge(second)
+
+        self.assertEqual(first.registers, self.counter.registers)
+        self.assertEqual(first.get_count(), self.counter.get_count())
+
+    def test_merge_with_different_precision(self):
+        with self.assertRaises(ValueError):
+            self.counter.merge(HyperLogLogUniqueCounter(precision=10))
+        with self.assertRaises(ValueError):
+            self.counter.merge(ExactUniqueCounter())
+
+    def test_write_and_read(self):
+        for index in range(1000):
+            self.counter.add(f"192.168.{index // 256}.{index % 256}")
+        writer = BinaryWriter()
+        self.counter.write(writer)
+
+        restored = HyperLogLogUniqueCounter.read(BinaryReader(writer.getvalue()))
+
+        self.assertEqual(restored.precision, 14)
+        self.assertEqual(restored.get_count(), self.counter.get_count())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+
+from src.services.analytics.latency_stats import LatencyStats
+from src.services.serialization.binary_reader import BinaryReader
+from src.services.serialization.binary_writer import BinaryWriter
+
+
+class TestLatencyStats(unittest.TestCase):
+    def setUp(self):
+        self.stats = LatencyStats()
+
+    def test_add_aggregates_request_and_upstream_times(self):
+        for millisecond in range(1, 1001):
+            self.stats.add("/a", 200, millisecond / 1000, millisecond / 2000 if millisecond % 2 else None)
+
+        summary = self.stats.get_request_summary()
+        self.assertEqual(summary.label, "request_time")
+        self.assertEqual(summary.count, 1000)
+        self.assertAlmostEqual(summary.p50, 0.5, delta=0.5 * 0.02)
+        self.assertAlmostEqual(summary.p99, 0.99, delta=0.99 * 0.02)
+        self.assertAlmostEqual(summary.p999, 0.999, delta=0.999 * 0.02)
+        self.assertEqual(self.stats.get_upstream_summary().count, 500)
+
+    def test_add_skips_entries_without_request_time(self):
+        self.stats.add("/a", 200, None, 0.5)
+
+        self.assertEqual(self.stats.get_request_summary().count, 0)
+        self.assertEqual(self.stats.get_upstream_summary().count, 1)
+        self.assertEqual(self.stats.get_status_summaries(), [])
+        self.assertEqual(self.stats.get_slowest_endpoints(10), [])
+
+    def test_status_summaries_and_slowest_endpoints(self):
+        for endpoint, status, request_time in [("/fast", 200, 0.01), ("/slow", 200, 2.0), ("/slow", 504, 5.0),
+                                               ("/medium", 404, 0.5)]:
+            self.stats.add(endpoint, status, request_time, None)
+
+        self.assertEqual([(summary.label, summary.count) for summary in self.stats.get_status_summaries()],
+                         [("200", 2), ("404", 1), ("504", 1)])
+        slowest = self.stats.get_slowest_endpoints(2)
+        self.assertEqual([summary.label for summary in slowest], ["/slow", "/medium"])
+        self.assertAlmostEqual(slowest[1].p99, 0.5, delta=0.5 * 0.02)
+
+    def test_endpoint_sketches_stay_bounded(self):
+        stats = LatencyStats(max_endpoints=10)
+        for index in range(1000):
+            stats.add("/busy", 200, 0.1, None)
+            stats.add(f"/rare/{index}", 200, 0.2, None)
+
+        self.assertLessEqual(len(stats.endpoint_times), 20)
+        self.assertIn("/busy", stats.endpoint_times)
+        self.assertEqual(stats.endpoint_times["/busy"].get_count(), 1000)
+        self.assertEqual(stats.get_request_summary().count, 2000)
+
+    def test_merge_and_round_trip(self):
+        other = self.stats.create_empty()
+        self.stats.add("/a", 200, 0.1, 0.05)
+        other.add("/a", 500, 0.3, None)
+        other.add("/b", 200, 0.2, 0.1)
+
+        self.stats.merge(other)
+        writer = BinaryWriter()
+        self.stats.write(writer)
+        restored = LatencyStats.read(BinaryReader(writer.getvalue()))
+
+        self.assertEqual(restored.get_request_summary(), self.stats.get_request_summary())
+        self.assertEqual(restored.get_upstream_summary().count, 2)
+        self.assertEqual([summary.count for summary in restored.get_status_summaries()], [2, 1])
+        self.assertEqual(restored.get_slowest_endpoints(10), self.stats.get_slowest_endpoints(10))
+
+    def test_merge_with_different_configuration(self):
+        with self.assertRaises(ValueError):
+            self.stats.merge(LatencyStats(0.05))
+        with self.assertRaises(ValueError):
+            self.stats.merge(LatencyStats(max_endpoints=5))
+
+    def test_invalid_endpoint_limit(self):
+        with self.assertRaises(ValueError):
+            LatencyStats(max_endpoints=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
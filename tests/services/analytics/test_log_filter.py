@@ -39,6 +39,69 @@ class TestLogFilter(unittest.TestCase):
     def test_matches_filter_invalid_field(self):
         self.assertFalse(self.log_filter.matches_filter(self.log, "invalid_field", "value"))
 
+    def test_compile_no_filter(self):
+        self.assertIsNone(self.log_filter.compile(None, None))
+        self.assertIsNone(self.log_filter.compile("status", None))
+
+    def test_compile_substring(self):
+        predicate = self.log_filter.compile("AGENT", "Mozilla")
+        self.assertTrue(predicate.matches(self.log))
+        self.assertFalse(predicate.matches_line("1.2.3.4 - - \"curl/8.0\""))
+        self.assertFalse(self.log_filter.compile("agent", "Chrome").matches(self.log))
+
+    def test_compile_regex_and_prefix(self):
+        self.assertTrue(self.log_filter.compile("request", r"re:^GET /index\.").matches(self.log))
+        self.assertFalse(self.log_filter.compile("request", "re:^POST").matches(self.log))
+        self.assertTrue(self.log_filter.compile("request", "prefix:GET /").matches(self.log))
+        self.assertFalse(self.log_filter.compile("request", "prefix:/index").matches(self.log))
+
+    def test_compile_status_expressions(self):
+        self.assertTrue(self.log_filter.compile("status", "404").matches(self.log))
+        self.assertFalse(self.log_filter.compile("status", "200").matches(self.log))
+        self.assertTrue(self.log_filter.compile("status", ">=400").matches(self.log))
+        self.assertFalse(self.log_filter.compile("status", ">=500").matches(self.log))
+        self.assertTrue(self.log_filter.compile("status", "<405").matches(self.log))
+        self.assertTrue(self.log_filter.compile("status", "400-499").matches(self.log))
+        self.assertTrue(self.log_filter.compile("status", "4xx").matches(self.log))
+        self.assertFalse(self.log_filter.compile("status", "5XX").matches(self.log))
+
+    def test_compile_status_needle(self):
+        predicate = self.log_filter.compile("status", "404")
+        self.assertFalse(predicate.matches_line('1.2.3.4 - - [x] "GET /404 HTTP/1.1" 200 12 "-" "-"'))
+        self.assertTrue(predicate.matches_line('1.2.3.4 - - [x] "GET / HTTP/1.1" 404 0 "-" "-"'))
+
+    def test_compile_needles_follow_log_format(self):
+        line = '1.2.3.4 - - [x] "GET / HTTP/1.1" 404 0'
+        self.assertEqual(self.log_filter.compile("status", "404", "apache-common").needle, '" 404 ')
+        self.assertTrue(self.log_filter.compile("ip", "1.2.3.4", "apache-common").matches_line(line))
+        self.assertFalse(self.log_filter.compile("ip", "1.2.3.40", "apache-common").matches_line(line + "1.2.3.40"))
+        self.assertEqual(self.log_filter.compile("status", "404", "json").needle, "404")
+        self.assertEqual(self.log_filter.compile("request", "prefix:GET", "json").needle, "GET")
+
+    def test_compile_needles_skip_escaped_text(self):
+        self.assertEqual(self.log_filter.compile("agent", "Mozilla").needle, "Mozilla")
+        self.assertIsNone(self.log_filter.compile("agent", "caf\u00e9").needle)
+        self.assertIsNone(self.log_filter.compile("agent", 'say "hi"').needle)
+        self.assertIsNone(self.log_filter.compile("request", "prefix:\\").needle)
+
+    def test_compile_ip(self):
+        self.assertTrue(self.log_filter.compile("ip", "192.168.0.0/16").matches(self.log))
+        self.assertFalse(self.log_filter.compile("ip", "10.0.0.0/8").matches(self.log))
+        self.assertTrue(self.log_filter.compile("ip", "192.168.0.1").matches(self.log))
+        self.assertFalse(self.log_filter.compile("ip", "2001:db8::/32").matches(self.log))
+        self.assertTrue(self.log_filter.compile("ip", "2001:db8::/32").matches_value("2001:db8::1"))
+        self.assertFalse(self.log_filter.compile("ip", "10.0.0.0/8").matches_value("not-an-ip"))
+
+    def test_compile_invalid(self):
+        with self.assertRaises(ValueError):
+            self.log_filter.compile("invalid_field", "value")
+        with self.assertRaises(ValueError):
+            self.log_filter.compile("status", "abc")
+        with self.assertRaises(ValueError):
+            self.log_filter.compile("ip", "10.0.0.0/99")
+        with self.assertRaises(ValueError):
+            self.log_filter.compile("agent", "re:(")
+
 
 if __name__ == '__main__':
     unittest.main()
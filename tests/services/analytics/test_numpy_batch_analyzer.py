@@ -0,0 +1,146 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from src.models.nginx_log import NginxLog
+from src.services.analytics.analyzer import Analyzer
+from src.services.analytics.ddsketch_quantile_estimator import DDSketchQuantileEstimator
+from src.services.analytics.hyperloglog_unique_counter import HyperLogLogUniqueCounter
+from src.services.analytics.numpy_batch_analyzer import NumpyBatchAnalyzer
+from src.services.analytics.resource_normalizer import ResourceNormalizer
+from src.services.analytics.time_series import TimeSeries
+from src.services.columnar.log_columns_builder import LogColumnsBuilder
+
+
+def build_log(index: int) -> NginxLog:
+    time_zone = timezone(timedelta(hours=3 if index % 7 else -5))
+    return NginxLog(
+        remote_addr=f"10.0.{index % 3}.{index % 11}",
+        remote_user="-",
+        time_local=(datetime(2023, 11, 19, tzinfo=timezone.utc) + timedelta(seconds=(37 * index) % 9000)).astimezone(time_zone),
+        request=f"GET /page/{index % 13}?id={index % 4} HTTP/1.1" if index % 17 else "garbage",
+        status=[200, 404, 500, 301, 503][index % 5],
+        body_bytes_sent=index * 17 % 5000,
+        http_referer="-",
+        http_user_agent=f"agent-{index % 5}",
+    )
+
+
+class TestNumpyBatchAnalyzer(unittest.TestCase):
+    def setUp(self):
+        self.logs = [build_log(index) for index in range(1000)]
+
+    def feed(self, analyzer, logs=None):
+        for log in self.logs if logs is None else logs:
+            analyzer.update_metrics(log)
+        return analyzer
+
+    def assert_same_metrics(self, analyzer, expected):
+        self.assertEqual(analyzer.get_count_logs(), expected.get_count_logs())
+        self.assertAlmostEqual(analyzer.get_average_size_logs(), expected.get_average_size_logs())
+        self.assertEqual(analyzer.get_unique_ip_count(), expected.get_unique_ip_count())
+        self.assertEqual(analyzer.get_error_rate(), expected.get_error_rate())
+        self.assertEqual(analyzer.get_start_date(), expected.get_start_date())
+        self.assertEqual(analyzer.get_end_date(), expected.get_end_date())
+        self.assertEqual(list(analyzer.get_status_code_counts().items()), list(expected.get_status_code_counts().items()))
+        self.assertEqual(list(analyzer.get_requested_resources().items()), list(expected.get_requested_resources().items()))
+        for percentile in (0.01, 1, 50, 95, 99, 100):
+            self.assertEqual(analyzer.calculate_percentile(percentile), expected.calculate_percentile(percentile))
+
+    def test_update_metrics_matches_analyzer(self):
+        for batch_size in (1, 64, 1000, 4096):
+            with self.subTest(batch_size=batch_size):
+                self.assert_same_metrics(self.feed(NumpyBatchAnalyzer(batch_size=batch_size)), self.feed(Analyzer()))
+
+    def test_update_batch_with_selected_rows(self):
+        builder = LogColumnsBuilder()
+        for log in self.logs:
+            builder.add(log)
+        columns = builder.build()
+        rows = (columns.status == 500).nonzero()[0]
+
+        analyzer = NumpyBatchAnalyzer()
+        analyzer.update_batch(columns, rows)
+
+        expected = self.feed(Analyzer(), [log for log in self.logs if log.status == 500])
+        self.assert_same_metrics(analyzer, expected)
+
+    def test_update_metrics_with_sketches_and_time_series(self):
+        analyzer = self.feed(NumpyBatchAnalyzer(DDSketchQuantileEstimator(), HyperLogLogUniqueCounter(),
+                                                TimeSeries(60 * 60), batch_size=100))
+        expected = self.feed(Analyzer(DDSketchQuantileEstimator(), HyperLogLogUniqueCounter(), TimeSeries(60 * 60)))
+
+        self.assert_same_metrics(analyzer, expected)
+        self.assertEqual(analyzer.get_time_series().get_intervals(), expected.get_time_series().get_intervals())
+
+    def test_empty_analyzer(self):
+        analyzer = NumpyBatchAnalyzer()
+
+        self.assertEqual(analyzer.get_count_logs(), 0)
+        self.assertEqual(analyzer.get_average_size_logs(), 0)
+        self.assertEqual(analyzer.calculate_95th_percentile(), 0.0)
+        self.assertEqual(analyzer.get_error_rate(), 0.0)
+        self.assertIsNone(analyzer.get_start_date())
+        self.assertEqual(analyzer.get_status_code_counts(), {})
+        self.assertEqual(analyzer.get_requested_resources(), {})
+
+    def test_merge_matches_single_analyzer(self):
+        first = self.feed(NumpyBatchAnalyzer(batch_size=128), self.logs[:300])
+        second = self.feed(first.create_empty(), self.logs[300:])
+
+        first.merge(second)
+
+        self.assert_same_metrics(first, self.feed(Analyzer()))
+
+    def test_merge_rejects_different_size_estimators(self):
+        with self.assertRaises(ValueError):
+            NumpyBatchAnalyzer().merge(NumpyBatchAnalyzer(DDSketchQuantileEstimator()))
+
+    def test_to_bytes_round_trip(self):
+        for analyzer in (NumpyBatchAnalyzer(batch_size=100),
+                         NumpyBatchAnalyzer(DDSketchQuantileEstimator(), HyperLogLogUniqueCounter(), TimeSeries(60))):
+            with self.subTest(analyzer=analyzer):
+                self.feed(analyzer)
+
+                restored = NumpyBatchAnalyzer.from_bytes(analyzer.to_bytes())
+
+                self.assert_same_metrics(restored, analyzer)
+                self.assertEqual(restored.batch_size, analyzer.batch_size)
+                self.assertEqual(restored.to_bytes(), analyzer.to_bytes())
+
+    def test_bad_lines_survive_merge_and_round_trip(self):
+        first = NumpyBatchAnalyzer()
+        second = first.create_empty()
+        first.record_bad_line("a.log")
+        second.record_bad_line("a.log")
+        second.record_bad_line("b.log")
+
+        first.merge(second)
+        restored = NumpyBatchAnalyzer.from_bytes(first.to_bytes())
+
+        self.assertEqual(restored.get_bad_line_counts(), {"a.log": 2, "b.log": 1})
+
+    def test_resource_normalizer_matches_analyzer(self):
+        normalizer = ResourceNormalizer(["/page/1"])
+        analyzer = self.feed(NumpyBatchAnalyzer(batch_size=64, resource_normalizer=normalizer))
+
+        self.assert_same_metrics(analyzer, self.feed(Analyzer(resource_normalizer=normalizer)))
+        self.assertEqual(len(analyzer.get_requested_resources()), 3)
+        self.assertEqual(NumpyBatchAnalyzer.from_bytes(analyzer.to_bytes()).resource_normalizer.routes, ("/page/1",))
+
+    def test_from_bytes_rejects_other_states(self):
+        with self.assertRaises(ValueError):
+            NumpyBatchAnalyzer.from_bytes(Analyzer().to_bytes())
+
+    def test_invalid_batch_size(self):
+        with self.assertRaises(ValueError):
+            NumpyBatchAnalyzer(batch_size=0)
+
+    @patch("src.services.analytics.numpy_batch_analyzer.np", None)
+    def test_requires_numpy(self):
+        with self.assertRaises(ImportError):
+            NumpyBatchAnalyzer()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import unittest
+
+from src.models.quantile_mode import QuantileMode
+from src.services.analytics.ddsketch_quantile_estimator import DDSketchQuantileEstimator
+from src.services.analytics.exact_quantile_estimator import ExactQuantileEstimator
+from src.services.analytics.quantile_estimator_factory import QuantileEstimatorFactory
+from src.services.serialization.binary_reader import BinaryReader
+from src.services.serialization.binary_writer import BinaryWriter
+
+
+class TestQuantileEstimatorFactory(unittest.TestCase):
+    def setUp(self):
+        self.factory = QuantileEstimatorFactory()
+
+    def test_exact_estimator_creation(self):
+        estimator = self.factory.get_quantile_estimator(QuantileMode.EXACT)
+        self.assertIsInstance(estimator, ExactQuantileEstimator)
+
+    def test_sketch_estimator_creation(self):
+        estimator = self.factory.get_quantile_estimator(QuantileMode.SKETCH, 0.02)
+        self.assertIsInstance(estimator, DDSketchQuantileEstimator)
+        self.assertEqual(estimator.relative_accuracy, 0.02)
+
+    def test_unsupported_mode(self):
+        with self.assertRaises(ValueError) as context:
+            self.factory.get_quantile_estimator("unsupported_mode")
+        self.assertEqual(str(context.exception), "Error: Unsupported quantile mode 'unsupported_mode'")
+
+    def test_write_and_read(self):
+        writer = BinaryWriter()
+        QuantileEstimatorFactory.write(writer, DDSketchQuantileEstimator())
+        QuantileEstimatorFactory.write(writer, ExactQuantileEstimator())
+
+        reader = BinaryReader(writer.getvalue())
+        self.assertIsInstance(self.factory.read(reader), DDSketchQuantileEstimator)
+        self.assertIsInstance(self.factory.read(reader), ExactQuantileEstimator)
+
+    def test_read_unknown_kind(self):
+        with self.assertRaises(ValueError):
+            self.factory.read(BinaryReader(b"\x09"))
+
+
+if __name__ == '__main__':
+    unittest.main()
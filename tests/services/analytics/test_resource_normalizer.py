@@ -0,0 +1,67 @@
+import pickle
+import unittest
+
+from src.services.analytics.resource_normalizer import ResourceNormalizer
+from src.services.serialization.binary_reader import BinaryReader
+from src.services.serialization.binary_writer import BinaryWriter
+
+
+class TestResourceNormalizer(unittest.TestCase):
+    def setUp(self):
+        self.normalizer = ResourceNormalizer(["/api/users/{id}/orders", "/static/*"])
+
+    def test_strips_query_and_replaces_identifiers(self):
+        for resource, expected in [
+            ("/api/users/123?x=1", "/api/users/{id}"),
+            ("/api/users/456", "/api/users/{id}"),
+            ("/o/550e8400-e29b-41d4-a716-446655440000/items", "/o/{uuid}/items"),
+            ("/files/d41d8cd98f00b204e9800998ecf8427e", "/files/{hash}"),
+            ("/12/34", "/{id}/{id}"),
+            ("/v1/a1b2", "/v1/a1b2"),
+            ("/page-2", "/page-2"),
+            ("garbage", "garbage"),
+        ]:
+            with self.subTest(resource=resource):
+                self.assertEqual(self.normalizer.normalize(resource), expected)
+
+    def test_route_templates_match_in_order(self):
+        normalizer = ResourceNormalizer(["/api/{version}/health", "/api/*"])
+
+        self.assertEqual(self.normalizer.normalize("/api/users/42/orders?page=2"), "/api/users/{id}/orders")
+        self.assertEqual(self.normalizer.normalize("/static/js/app.1234.js"), "/static/*")
+        self.assertEqual(self.normalizer.normalize("/api/users//orders"), "/api/users//orders")
+        self.assertEqual(normalizer.normalize("/api/v2/health"), "/api/{version}/health")
+        self.assertEqual(normalizer.normalize("/api/v2/users/7"), "/api/*")
+
+    def test_repeated_resources_hit_the_cache(self):
+        for _ in range(3):
+            self.normalizer.normalize("/api/users/1")
+
+        cache_info = self.normalizer.normalize.cache_info()
+        self.assertEqual((cache_info.hits, cache_info.misses), (2, 1))
+
+    def test_pickled_copy_rebuilds_cache(self):
+        self.normalizer.normalize("/api/users/1")
+
+        copy = pickle.loads(pickle.dumps(self.normalizer))
+
+        self.assertEqual(copy.normalize("/static/x"), "/static/*")
+        self.assertEqual(copy.normalize.cache_info().currsize, 1)
+
+    def test_write_and_read_round_trip(self):
+        writer = BinaryWriter()
+        self.normalizer.write(writer)
+
+        restored = ResourceNormalizer.read(BinaryReader(writer.getvalue()))
+
+        self.assertEqual(restored.routes, self.normalizer.routes)
+        self.assertEqual(restored.cache_size, self.normalizer.cache_size)
+        self.assertEqual(restored.normalize("/api/users/5/orders"), "/api/users/{id}/orders")
+
+    def test_invalid_route_template(self):
+        with self.assertRaises(ValueError):
+            ResourceNormalizer(["api/users/{id}"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from src.models.nginx_log import NginxLog
+from src.services.analytics.analyzer import Analyzer
+from src.services.analytics.ddsketch_quantile_estimator import DDSketchQuantileEstimator
+from src.services.analytics.exact_unique_counter import ExactUniqueCounter
+from src.services.analytics.rolling_window_analyzer import RollingWindowAnalyzer
+
+START = datetime(2023, 11, 19, 15, 0, 0, tzinfo=timezone.utc)
+
+
+def build_log(seconds: int, status: int = 200, size: int = 100, address: str = "10.0.0.1") -> NginxLog:
+    return NginxLog(address, "-", START + timedelta(seconds=seconds), "GET /a HTTP/1.1", status, size, "-", "curl")
+
+
+class TestRollingWindowAnalyzer(unittest.TestCase):
+    def setUp(self):
+        self.analyzer = RollingWindowAnalyzer(Analyzer(), window_seconds=60, bucket_seconds=10)
+
+    def test_snapshot_covers_window(self):
+        for seconds in range(0, 120, 5):
+            self.analyzer.update_metrics(build_log(seconds, size=seconds))
+
+        snapshot = self.analyzer.snapshot()
+
+        self.assertEqual(snapshot.get_count_logs(), 12)
+        self.assertEqual(snapshot.get_start_date(), START + timedelta(seconds=60))
+        self.assertEqual(snapshot.get_end_date(), START + timedelta(seconds=115))
+
+    def test_snapshot_expires_buckets_by_clock(self):
+        self.analyzer.update_metrics(build_log(0, status=500))
+        self.analyzer.update_metrics(build_log(35))
+
+        self.assertEqual(self.analyzer.snapshot(START + timedelta(seconds=40)).get_count_logs(), 2)
+        self.assertEqual(self.analyzer.snapshot(START + timedelta(seconds=60)).get_count_logs(), 1)
+        self.assertEqual(self.analyzer.snapshot(START + timedelta(seconds=60)).get_error_rate(), 0.0)
+        self.assertEqual(self.analyzer.snapshot(START + timedelta(seconds=100)).get_count_logs(), 0)
+
+    def test_update_metrics_drops_entries_older_than_window(self):
+        self.analyzer.update_metrics(build_log(100))
+        self.analyzer.update_metrics(build_log(30))
+        self.analyzer.update_metrics(build_log(50))
+
+        self.assertEqual(self.analyzer.snapshot().get_count_logs(), 2)
+
+    def test_snapshot_matches_analyzer_over_same_entries(self):
+        logs = [build_log(seconds, status=[200, 404][seconds % 2], size=seconds * 3, address=f"10.0.0.{seconds % 7}")
+                for seconds in range(0, 200)]
+        for log in logs:
+            self.analyzer.update_metrics(log)
+
+        expected = Analyzer()
+        for log in logs:
+            if log.time_local >= START + timedelta(seconds=140):
+                expected.update_metrics(log)
+
+        snapshot = self.analyzer.snapshot()
+        self.assertEqual(snapshot.get_count_logs(), expected.get_count_logs())
+        self.assertEqual(snapshot.get_unique_ip_count(), expected.get_unique_ip_count())
+        self.assertEqual(snapshot.calculate_95th_percentile(), expected.calculate_95th_percentile())
+        self.assertEqual(snapshot.get_status_code_counts(), expected.get_status_code_counts())
+
+    def test_buckets_copy_template_configuration(self):
+        template = Analyzer(DDSketchQuantileEstimator(0.05), ExactUniqueCounter())
+        analyzer = RollingWindowAnalyzer(template, window_seconds=60)
+        analyzer.update_metrics(build_log(0))
+
+        self.assertIsInstance(analyzer.snapshot().response_sizes, DDSketchQuantileEstimator)
+        self.assertEqual(analyzer.bucket_seconds, 1)
+        self.assertEqual(analyzer.bucket_count, 60)
+        self.assertIn("time_local", analyzer.get_required_fields())
+
+    def test_invalid_window(self):
+        with self.assertRaises(ValueError):
+            RollingWindowAnalyzer(Analyzer(), window_seconds=0)
+
+
+    def test_snapshot_includes_bad_lines(self):
+        self.analyzer.record_bad_line("access.log")
+        self.analyzer.update_metrics(build_log(0))
+
+        self.assertEqual(self.analyzer.snapshot(START + timedelta(seconds=600)).get_bad_line_counts(),
+                         {"access.log": 1})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+import random
+import unittest
+from collections import Counter
+
+from src.models.heavy_hitter import HeavyHitter
+from src.services.analytics.space_saving_counter import SpaceSavingCounter
+from src.services.serialization.binary_reader import BinaryReader
+from src.services.serialization.binary_writer import BinaryWriter
+
+
+def build_values(count: int, seed: int) -> list[str]:
+    generator = random.Random(seed)
+    return [f"/hot/{int(generator.paretovariate(1.0)) % 20}" if generator.random() < 0.4
+            else f"/rare/{generator.randrange(5000)}" for _ in range(count)]
+
+
+class TestSpaceSavingCounter(unittest.TestCase):
+    def assert_bounds(self, counter, exact):
+        for hitter in counter.top(counter.capacity):
+            self.assertGreaterEqual(hitter.count, exact[hitter.value])
+            self.assertLessEqual(hitter.count - hitter.error, exact[hitter.value])
+            self.assertLessEqual(hitter.error, counter.get_total() / counter.capacity)
+
+    def test_counts_are_exact_until_full(self):
+        counter = SpaceSavingCounter(3)
+        for value in ["/a", "/b", "/a", "/c", "/a", "/b"]:
+            counter.add(value)
+
+        self.assertEqual(counter.top(2), [HeavyHitter("/a", 3, 0), HeavyHitter("/b", 2, 0)])
+        self.assertEqual(counter.get_total(), 6)
+
+    def test_new_value_replaces_smallest_counter(self):
+        counter = SpaceSavingCounter(2)
+        for value in ["/a", "/a", "/a", "/b", "/c"]:
+            counter.add(value)
+
+        self.assertEqual(counter.top(2), [HeavyHitter("/a", 3, 0), HeavyHitter("/c", 2, 1)])
+
+    def test_add_with_count(self):
+        counter = SpaceSavingCounter(2)
+        counter.add("/a", 5)
+        counter.add("/b", 2)
+        counter.add("/c", 4)
+
+        self.assertEqual(counter.top(2), [HeavyHitter("/c", 6, 2), HeavyHitter("/a", 5, 0)])
+
+    def test_bounds_hold_on_skewed_stream(self):
+        values = build_values(20000, 1)
+        counter = SpaceSavingCounter(100)
+        for value in values:
+            counter.add(value)
+
+        exact = Counter(values)
+        self.assert_bounds(counter, exact)
+        self.assertEqual([hitter.value for hitter in counter.top(3)], [value for value, _ in exact.most_common(3)])
+        self.assertLessEqual(len(counter.counts), 100)
+        self.assertEqual(len(counter.heap), len(counter.counts))
+
+    def test_merge_keeps_bounds(self):
+        values = build_values(20000, 2)
+        counters = [SpaceSavingCounter(100) for _ in range(4)]
+        for index, value in enumerate(values):
+            counters[index % 4].add(value)
+
+        merged = counters[0]
+        for counter in counters[1:]:
+            merged.merge(counter)
+
+        exact = Counter(values)
+        self.assert_bounds(merged, exact)
+        self.assertEqual(merged.get_total(), len(values))
+        self.assertEqual([hitter.value for hitter in merged.top(3)], [value for value, _ in exact.most_common(3)])
+        self.assertLessEqual(len(merged.counts), 100)
+
+    def test_merge_of_small_counters_is_exact(self):
+        first = SpaceSavingCounter(10)
+        second = first.create_empty()
+        first.add("/a", 2)
+        second.add("/a")
+        second.add("/b")
+
+        first.merge(second)
+        first.add("/b", 3)
+
+        self.assertEqual(first.top(10), [HeavyHitter("/b", 4, 0), HeavyHitter("/a", 3, 0)])
+
+    def test_merge_rejects_different_capacity(self):
+        with self.assertRaises(ValueError):
+            SpaceSavingCounter(10).merge(SpaceSavingCounter(20))
+
+    def test_write_and_read_round_trip(self):
+        counter = SpaceSavingCounter(50)
+        for value in build_values(2000, 3):
+            counter.add(value)
+
+        writer = BinaryWriter()
+        counter.write(writer)
+        restored = SpaceSavingCounter.read(BinaryReader(writer.getvalue()))
+        restored.add("/new")
+        counter.add("/new")
+
+        self.assertEqual(restored.top(50), counter.top(50))
+        self.assertEqual(restored.get_total(), counter.get_total())
+
+    def test_invalid_capacity(self):
+        with self.assertRaises(ValueError):
+            SpaceSavingCounter(0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from src.services.analytics.time_series import TimeSeries
+from src.services.serialization.binary_reader import BinaryReader
+from src.services.serialization.binary_writer import BinaryWriter
+
+START = datetime(2023, 11, 19, 15, 0, 0, tzinfo=timezone.utc)
+
+
+class TestTimeSeries(unittest.TestCase):
+    def setUp(self):
+        self.series = TimeSeries(60)
+
+    def test_add_groups_entries_by_interval(self):
+        for seconds in range(0, 180, 10):
+            self.series.add(START + timedelta(seconds=seconds), seconds, seconds % 30 == 0)
+
+        intervals = self.series.get_intervals()
+
+        self.assertEqual([interval.start for interval in intervals],
+                         [START, START + timedelta(minutes=1), START + timedelta(minutes=2)])
+        self.assertEqual([interval.count for interval in intervals], [6, 6, 6])
+        self.assertEqual([interval.error_count for interval in intervals], [2, 2, 2])
+        self.assertEqual(intervals[0].byte_sum, sum(range(0, 60, 10)))
+        self.assertAlmostEqual(intervals[2].p95, 160, delta=160 * 0.02)
+
+    def test_add_normalizes_time_zones(self):
+        self.series.add(datetime(2023, 11, 19, 18, 0, 30, tzinfo=timezone(timedelta(hours=3))), 10, False)
+        self.series.add(START + timedelta(seconds=45), 20, False)
+
+        intervals = self.series.get_intervals()
+        self.assertEqual(len(intervals), 1)
+        self.assertEqual(intervals[0].start, START)
+
+    def test_add_interval_matches_single_adds(self):
+        for seconds in (0, 10, 20):
+            self.series.add(START + timedelta(seconds=seconds), seconds, seconds == 10)
+        bulk = self.series.create_empty()
+
+        bulk.add_interval(int(START.timestamp()) // 60, 3, 1, 30, [0, 10, 20])
+
+        self.assertEqual(bulk.get_intervals(), self.series.get_intervals())
+
+    def test_intervals_are_sorted_and_stored_once(self):
+        for minute in [5, 1, 3, 1, 5]:
+            self.series.add(START + timedelta(minutes=minute), 1, False)
+
+        self.assertEqual(len(self.series.bucket_ids), 3)
+        self.assertEqual([interval.start.minute for interval in self.series.get_intervals()], [1, 3, 5])
+
+    def test_merge(self):
+        other = self.series.create_empty()
+        self.series.add(START, 100, True)
+        other.add(START + timedelta(seconds=5), 200, False)
+        other.add(START + timedelta(minutes=1), 300, False)
+
+        self.series.merge(other)
+
+        intervals = self.series.get_intervals()
+        self.assertEqual([interval.count for interval in intervals], [2, 1])
+        self.assertEqual([interval.byte_sum for interval in intervals], [300, 300])
+        self.assertEqual(intervals[0].error_count, 1)
+
+    def test_merge_rejects_other_width(self):
+        with self.assertRaises(ValueError):
+            self.series.merge(TimeSeries(3600))
+
+    def test_write_and_read(self):
+        for seconds in range(0, 600, 7):
+            self.series.add(START + timedelta(seconds=seconds), seconds * 3, seconds % 2 == 0)
+
+        writer = BinaryWriter()
+        self.series.write(writer)
+        restored = TimeSeries.read(BinaryReader(writer.getvalue()))
+
+        self.assertEqual(restored.get_intervals(), self.series.get_intervals())
+        restored.add(START, 1, False)
+        self.assertEqual(restored.get_intervals()[0].count, self.series.get_intervals()[0].count + 1)
+
+    def test_for_bucket(self):
+        self.assertEqual(TimeSeries.for_bucket("second").bucket_seconds, 1)
+        self.assertEqual(TimeSeries.for_bucket("hour", 0.05).relative_accuracy, 0.05)
+        with self.assertRaises(ValueError) as context:
+            TimeSeries.for_bucket("week")
+        self.assertEqual(str(context.exception), "Error: Unsupported time bucket 'week'")
+
+
+if __name__ == "__main__":
+    unittest.main()
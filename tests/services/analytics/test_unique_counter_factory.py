@@ -0,0 +1,43 @@
+import unittest
+
+from src.models.unique_ip_mode import UniqueIpMode
+from src.services.analytics.exact_unique_counter import ExactUniqueCounter
+from src.services.analytics.hyperloglog_unique_counter import HyperLogLogUniqueCounter
+from src.services.analytics.unique_counter_factory import UniqueCounterFactory
+from src.services.serialization.binary_reader import BinaryReader
+from src.services.serialization.binary_writer import BinaryWriter
+
+
+class TestUniqueCounterFactory(unittest.TestCase):
+    def setUp(self):
+        self.factory = UniqueCounterFactory()
+
+    def test_exact_counter_creation(self):
+        self.assertIsInstance(self.factory.get_unique_counter(UniqueIpMode.EXACT), ExactUniqueCounter)
+
+    def test_hll_counter_creation(self):
+        counter = self.factory.get_unique_counter(UniqueIpMode.HLL, 12)
+        self.assertIsInstance(counter, HyperLogLogUniqueCounter)
+        self.assertEqual(counter.precision, 12)
+
+    def test_unsupported_mode(self):
+        with self.assertRaises(ValueError) as context:
+            self.factory.get_unique_counter("unsupported_mode")
+        self.assertEqual(str(context.exception), "Error: Unsupported unique IP mode 'unsupported_mode'")
+
+    def test_write_and_read(self):
+        writer = BinaryWriter()
+        UniqueCounterFactory.write(writer, HyperLogLogUniqueCounter(8))
+        UniqueCounterFactory.write(writer, ExactUniqueCounter())
+
+        reader = BinaryReader(writer.getvalue())
+        self.assertIsInstance(self.factory.read(reader), HyperLogLogUniqueCounter)
+        self.assertIsInstance(self.factory.read(reader), ExactUniqueCounter)
+
+    def test_read_unknown_kind(self):
+        with self.assertRaises(ValueError):
+            self.factory.read(BinaryReader(b"\x09"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import json
+import os
+import tempfile
+import unittest
+
+from src.models.benchmark_result import BenchmarkResult
+from src.models.log_profile import LogProfile
+from src.services.benchmarks.benchmark_report import BenchmarkReport
+
+RESULTS = [
+    BenchmarkResult("parser", 1000, 0.5, 2000.0, 64 << 20),
+    BenchmarkResult("facade", 1000, 1.0, 1000.0, None),
+]
+
+
+class TestBenchmarkReport(unittest.TestCase):
+    def setUp(self):
+        self.report = BenchmarkReport()
+
+    def test_render(self):
+        self.assertEqual(
+            self.report.render(RESULTS),
+            "| Benchmark | Lines | Best time, s | Lines/s | Peak RSS, MiB |\n"
+            "|:-|-:|-:|-:|-:|\n"
+            "| parser | 1000 | 0.500 | 2,000 | 64.0 |\n"
+            "| facade | 1000 | 1.000 | 1,000 | - |\n"
+        )
+
+    def test_render_with_baseline(self):
+        baseline = {"parser": BenchmarkResult("parser", 1000, 0.4, 2500.0, 60 << 20)}
+
+        rows = self.report.render(RESULTS, baseline).splitlines()
+
+        self.assertTrue(rows[0].endswith("| Baseline lines/s | Change |"))
+        self.assertTrue(rows[2].endswith("| 2,500 | -20.0% |"))
+        self.assertTrue(rows[3].endswith("| - | - |"))
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "baseline.json")
+
+            self.report.save(file_path, LogProfile(lines=1000), RESULTS)
+
+            self.assertEqual(self.report.load(file_path), {result.name: result for result in RESULTS})
+            with open(file_path, encoding="utf-8") as report_file:
+                data = json.load(report_file)
+        self.assertEqual(data["profile"]["lines"], 1000)
+        self.assertEqual(data["profile"]["status_mix"]["200"], 80.0)
+
+    def test_load_invalid_report(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "baseline.json")
+            for content in ("not json", "{}", '{"version": 2, "results": []}'):
+                with self.subTest(content=content):
+                    with open(file_path, "w", encoding="utf-8") as report_file:
+                        report_file.write(content)
+                    with self.assertRaises(ValueError):
+                        self.report.load(file_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.models.log_profile import LogProfile
+from src.services.benchmarks.benchmark_runner import BenchmarkRunner
+from src.services.benchmarks.synthetic_log_generator import SyntheticLogGenerator
+
+
+class TestBenchmarkRunner(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.file_path = os.path.join(directory.name, "access.log")
+        SyntheticLogGenerator(LogProfile(lines=300)).write(self.file_path)
+
+    def test_run_in_process(self):
+        names = BenchmarkRunner.get_available_benchmarks()
+
+        results = BenchmarkRunner(repeat=2, isolate=False).run(names, self.file_path, 300)
+
+        self.assertEqual([result.name for result in results], names)
+        for result in results:
+            self.assertEqual(result.lines, 300)
+            self.assertGreater(result.seconds, 0)
+            self.assertAlmostEqual(result.lines_per_second, 300 / result.seconds)
+            self.assertGreater(result.peak_rss, 0)
+
+    def test_run_isolated(self):
+        results = BenchmarkRunner(repeat=1).run(["parser"], self.file_path, 300)
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0].name, "parser")
+
+    def test_parser_benchmarks_include_projection(self):
+        names = BenchmarkRunner.get_available_benchmarks()
+
+        self.assertLess(names.index("parser"), names.index("parser-projected"))
+
+    def test_run_unsupported_benchmark(self):
+        with self.assertRaises(ValueError):
+            BenchmarkRunner(isolate=False).run(["parser", "compiler"], self.file_path, 300)
+
+    def test_invalid_repeat(self):
+        with self.assertRaises(ValueError):
+            BenchmarkRunner(repeat=0)
+
+    @patch("src.services.benchmarks.benchmark_runner.np", None)
+    def test_get_available_benchmarks_without_numpy(self):
+        self.assertNotIn("facade-numpy", BenchmarkRunner.get_available_benchmarks())
+
+    @patch("src.services.benchmarks.benchmark_runner.resource", None)
+    def test_get_peak_rss_unavailable(self):
+        self.assertIsNone(BenchmarkRunner.get_peak_rss())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import os
+import tempfile
+import unittest
+from collections import Counter
+
+from src.models.log_profile import LogProfile
+from src.parsers.nginx_log_parser import NginxLogParser
+from src.services.benchmarks.synthetic_log_generator import SyntheticLogGenerator
+
+
+class TestSyntheticLogGenerator(unittest.TestCase):
+    def generate(self, **kwargs) -> list[bytes]:
+        return list(SyntheticLogGenerator(LogProfile(**kwargs)).iter_lines())
+
+    def test_iter_lines_is_deterministic(self):
+        self.assertEqual(self.generate(lines=500), self.generate(lines=500))
+        self.assertNotEqual(self.generate(lines=500), self.generate(lines=500, seed=7))
+
+    def test_iter_lines_follows_profile(self):
+        lines = self.generate(lines=20_000, ip_count=50, resource_count=30, status_mix={200: 3, 500: 1}, time_span=600)
+        logs = [NginxLogParser().parse(line.rstrip(b"\n")) for line in lines]
+
+        self.assertEqual(len(logs), 20_000)
+        self.assertLessEqual(len({log.remote_addr for log in logs}), 50)
+        self.assertLessEqual(len({log.request.split(" ")[1] for log in logs}), 30)
+        statuses = Counter(log.status for log in logs)
+        self.assertEqual(set(statuses), {200, 500})
+        self.assertAlmostEqual(statuses[200] / len(logs), 0.75, delta=0.02)
+        self.assertLess((logs[-1].time_local - logs[0].time_local).total_seconds(), 600)
+        self.assertEqual(logs, sorted(logs, key=lambda log: log.time_local))
+
+    def test_iter_lines_skews_resources(self):
+        def get_top_share(resource_skew: float) -> float:
+            lines = self.generate(lines=5000, resource_count=100, resource_skew=resource_skew)
+            resources = Counter(line.split(b" ")[6] for line in lines)
+            return resources.most_common(1)[0][1] / len(lines)
+
+        self.assertLess(get_top_share(0), 0.05)
+        self.assertGreater(get_top_share(1.5), 0.3)
+
+    def test_write(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "access.log")
+
+            size = SyntheticLogGenerator(LogProfile(lines=25_000)).write(file_path)
+
+            with open(file_path, "rb") as log_file:
+                data = log_file.read()
+        self.assertEqual(size, len(data))
+        self.assertEqual(data.count(b"\n"), 25_000)
+        self.assertEqual(data, b"".join(self.generate(lines=25_000)))
+
+    def test_invalid_profile(self):
+        for kwargs in ({"lines": -1}, {"ip_count": 0}, {"resource_count": 0}, {"status_mix": {}}):
+            with self.subTest(kwargs=kwargs):
+                with self.assertRaises(ValueError):
+                    SyntheticLogGenerator(LogProfile(**kwargs))
+
+
+if __name__ == "__main__":
+    unittest.main()
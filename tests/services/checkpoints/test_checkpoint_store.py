@@ -0,0 +1,38 @@
+import os
+import tempfile
+import unittest
+
+from src.models.checkpoint import Checkpoint
+from src.services.checkpoints.checkpoint_store import CheckpointStore
+
+
+class TestCheckpointStore(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.database_path = os.path.join(directory.name, "state.sqlite")
+
+    def test_save_and_load(self):
+        checkpoint = Checkpoint("/logs/access.log", "{}", 1, 2, 300, 4, 250, b"digest", b"state")
+
+        with CheckpointStore(self.database_path) as store:
+            self.assertIsNone(store.load("/logs/access.log", "{}"))
+            store.save(checkpoint)
+
+        with CheckpointStore(self.database_path) as store:
+            self.assertEqual(store.load("/logs/access.log", "{}"), checkpoint)
+            self.assertIsNone(store.load("/logs/access.log", "{\"filter-field\": \"status\"}"))
+            self.assertIsNone(store.load("/logs/other.log", "{}"))
+
+    def test_save_replaces_checkpoint(self):
+        with CheckpointStore(self.database_path) as store:
+            store.save(Checkpoint("/logs/access.log", "{}", 1, 2, 300, 4, 250, b"digest", b"state"))
+            store.save(Checkpoint("/logs/access.log", "{}", 1, 2, 600, 5, 600, b"digest", b"newer"))
+
+            checkpoint = store.load("/logs/access.log", "{}")
+            self.assertEqual(checkpoint.offset, 600)
+            self.assertEqual(checkpoint.state, b"newer")
+
+
+if __name__ == "__main__":
+    unittest.main()
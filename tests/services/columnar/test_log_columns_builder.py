@@ -0,0 +1,63 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from src.models.nginx_log import NginxLog
+from src.services.columnar.log_columns_builder import LogColumnsBuilder
+
+MOSCOW = timezone(timedelta(hours=3))
+
+
+def build_log(remote_addr: str, request: str, status: int, minute: int) -> NginxLog:
+    return NginxLog(remote_addr, "-", datetime(2023, 11, 19, 15, minute, tzinfo=MOSCOW), request, status, minute * 10,
+                    "-", "curl")
+
+
+class TestLogColumnsBuilder(unittest.TestCase):
+    def test_build_encodes_strings_in_order_of_appearance(self):
+        builder = LogColumnsBuilder()
+        for log in [build_log("10.0.0.2", "GET /b HTTP/1.1", 200, 0),
+                    build_log("10.0.0.1", "GET /a HTTP/1.1", 404, 1),
+                    build_log("10.0.0.2", "GET /a HTTP/1.1", 500, 2)]:
+            builder.add(log)
+
+        columns = builder.build()
+
+        self.assertEqual(len(columns), 3)
+        self.assertEqual(columns.remote_addr_values, ["10.0.0.2", "10.0.0.1"])
+        self.assertEqual(columns.remote_addr.tolist(), [0, 1, 0])
+        self.assertEqual(columns.request_values, ["GET /b HTTP/1.1", "GET /a HTTP/1.1"])
+        self.assertEqual(columns.request.tolist(), [0, 1, 1])
+        self.assertEqual(columns.http_user_agent_values, ["curl"])
+        self.assertEqual(columns.status.tolist(), [200, 404, 500])
+        self.assertEqual(columns.body_bytes_sent.tolist(), [0, 10, 20])
+
+    def test_build_stores_epoch_seconds_and_utc_offsets(self):
+        builder = LogColumnsBuilder()
+        builder.add(build_log("10.0.0.1", "GET / HTTP/1.1", 200, 30))
+
+        columns = builder.build()
+
+        self.assertEqual(columns.time.tolist(), [int(datetime(2023, 11, 19, 12, 30, tzinfo=timezone.utc).timestamp())])
+        self.assertEqual(columns.utc_offset.tolist(), [3 * 60 * 60])
+
+    def test_append_decodes_raw_strings_once_per_value(self):
+        builder = LogColumnsBuilder()
+        builder.append(b"10.0.0.1", b"GET /\xff HTTP/1.1", b"curl", 200, 10, 1700000000, 0)
+        builder.append(b"10.0.0.1", b"GET /\xff HTTP/1.1", b"curl", 404, 20, 1700000001, 0)
+
+        columns = builder.build()
+
+        self.assertEqual(columns.remote_addr_values, ["10.0.0.1"])
+        self.assertEqual(columns.request_values, ["GET /\ufffd HTTP/1.1"])
+        self.assertEqual(columns.request.tolist(), [0, 0])
+        self.assertEqual(columns.time.tolist(), [1700000000, 1700000001])
+
+    def test_build_empty(self):
+        columns = LogColumnsBuilder().build()
+
+        self.assertEqual(len(columns), 0)
+        self.assertEqual(columns.request_values, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import json
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from src.models.nginx_log import NginxLog
+from src.services.columnar.log_columns_builder import LogColumnsBuilder
+from src.services.columnar.log_columns_cache import MANIFEST_NAME, LogColumnsCache
+from src.parsers.time_local_parser import TimeLocalParser
+
+
+class TestLogColumnsCache(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.cache = LogColumnsCache(os.path.join(directory.name, "cache"))
+        self.log_path = os.path.join(directory.name, "access.log")
+        with open(self.log_path, "w") as log_file:
+            log_file.write("log\n")
+
+        builder = LogColumnsBuilder()
+        builder.add(NginxLog("10.0.0.1", "-", TimeLocalParser().parse("19/Nov/2023:15:30:45 +0300"),
+                             "GET /ünïcode HTTP/1.1", 200, 10, "-", "curl"))
+        self.columns = builder.build()
+
+    def test_load_missing_entry(self):
+        self.assertIsNone(self.cache.load(self.log_path, os.stat(self.log_path)))
+
+    def test_save_and_load_memory_mapped_columns(self):
+        self.cache.save(self.log_path, os.stat(self.log_path), self.columns)
+
+        loaded = self.cache.load(self.log_path, os.stat(self.log_path))
+
+        self.assertIsInstance(loaded.time, np.memmap)
+        self.assertEqual(loaded.request_values, ["GET /ünïcode HTTP/1.1"])
+        for name in ("remote_addr", "request", "http_user_agent", "status", "body_bytes_sent", "time", "utc_offset"):
+            self.assertEqual(getattr(loaded, name).tolist(), getattr(self.columns, name).tolist())
+        self.assertEqual(os.listdir(self.cache.directory), [os.path.basename(self.cache.get_entry_path(self.log_path))])
+
+    def test_save_and_load_bad_line_count(self):
+        self.columns.bad_line_count = 3
+        self.cache.save(self.log_path, os.stat(self.log_path), self.columns)
+
+        self.assertEqual(self.cache.load(self.log_path, os.stat(self.log_path)).bad_line_count, 3)
+
+    def test_load_ignores_entry_of_changed_file(self):
+        self.cache.save(self.log_path, os.stat(self.log_path), self.columns)
+        with open(self.log_path, "a") as log_file:
+            log_file.write("more\n")
+
+        self.assertIsNone(self.cache.load(self.log_path, os.stat(self.log_path)))
+
+    def test_load_ignores_entry_of_other_log_format(self):
+        self.cache.save(self.log_path, os.stat(self.log_path), self.columns)
+
+        cache = LogColumnsCache(self.cache.directory, "json")
+        self.assertIsNone(cache.load(self.log_path, os.stat(self.log_path)))
+
+    def test_load_ignores_damaged_entry(self):
+        self.cache.save(self.log_path, os.stat(self.log_path), self.columns)
+        entry_path = self.cache.get_entry_path(self.log_path)
+        os.remove(os.path.join(entry_path, "status.npy"))
+        self.assertIsNone(self.cache.load(self.log_path, os.stat(self.log_path)))
+
+        with open(os.path.join(entry_path, MANIFEST_NAME), "w") as manifest_file:
+            manifest_file.write("{")
+        self.assertIsNone(self.cache.load(self.log_path, os.stat(self.log_path)))
+
+    def test_save_replaces_previous_entry(self):
+        self.cache.save(self.log_path, os.stat(self.log_path), self.columns)
+        self.cache.save(self.log_path, os.stat(self.log_path), LogColumnsBuilder().build())
+
+        loaded = self.cache.load(self.log_path, os.stat(self.log_path))
+
+        self.assertEqual(len(loaded), 0)
+        with open(os.path.join(self.cache.get_entry_path(self.log_path), MANIFEST_NAME)) as manifest_file:
+            self.assertEqual(json.load(manifest_file)["path"], self.log_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
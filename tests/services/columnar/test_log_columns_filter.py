@@ -0,0 +1,46 @@
+import unittest
+from datetime import datetime
+
+from src.parsers.nginx_log_batch_parser import NginxLogBatchParser
+from src.services.analytics.log_filter import LogFilter
+from src.services.columnar.log_columns_filter import LogColumnsFilter
+
+LINES = [
+    b"10.0.0.1 - - [19/Nov/2023:15:30:45 +0300] \"GET /a HTTP/1.1\" 200 10 \"-\" \"curl\"",
+    b"10.0.0.2 - - [19/Nov/2023:15:30:46 +0000] \"GET /b HTTP/1.1\" 404 20 \"-\" \"Mozilla/5.0\"",
+    b"10.1.0.3 - - [19/Nov/2023:15:30:47 -0500] \"GET /c HTTP/1.1\" 500 30 \"-\" \"Mozilla/5.0\"",
+]
+
+
+class TestLogColumnsFilter(unittest.TestCase):
+    def setUp(self):
+        self.columns = NginxLogBatchParser().parse(LINES)
+
+    def test_select_rows_without_conditions(self):
+        self.assertIsNone(LogColumnsFilter(None, None, None).select_rows(self.columns))
+
+    def test_select_rows_compares_wall_clock_times(self):
+        columns_filter = LogColumnsFilter(datetime(2023, 11, 19, 15, 30, 46), datetime(2023, 11, 19, 15, 30, 46), None)
+
+        self.assertEqual(columns_filter.select_rows(self.columns).tolist(), [1])
+
+    def test_select_rows_excludes_second_of_fractional_lower_bound(self):
+        columns_filter = LogColumnsFilter(datetime(2023, 11, 19, 15, 30, 45, 500), None, None)
+
+        self.assertEqual(columns_filter.select_rows(self.columns).tolist(), [1, 2])
+
+    def test_select_rows_applies_predicate(self):
+        for filter_field, filter_value, expected in [("agent", "Mozilla", [1, 2]), ("status", "5xx", [2]),
+                                                     ("ip", "10.0.0.0/16", [0, 1]), ("request", "/a", [0])]:
+            with self.subTest(filter_field=filter_field):
+                columns_filter = LogColumnsFilter(None, None, LogFilter().compile(filter_field, filter_value))
+                self.assertEqual(columns_filter.select_rows(self.columns).tolist(), expected)
+
+    def test_select_rows_combines_time_range_and_predicate(self):
+        columns_filter = LogColumnsFilter(None, datetime(2023, 11, 19, 15, 30, 46), LogFilter().compile("status", ">=400"))
+
+        self.assertEqual(columns_filter.select_rows(self.columns).tolist(), [1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+import io
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from src.services.indexes.time_index import TimeIndex
+
+
+def build_line(minute: int) -> bytes:
+    time = datetime(2023, 11, 19, tzinfo=timezone(timedelta(hours=3))) + timedelta(minutes=minute)
+    return (
+        f"10.0.0.1 - - [{time.strftime('%d/%b/%Y:%H:%M:%S %z')}] "
+        f"\"GET /page HTTP/1.1\" 200 {minute} \"-\" \"curl\"\n"
+    ).encode("utf-8")
+
+
+class TestTimeIndex(unittest.TestCase):
+    def setUp(self):
+        self.lines = [build_line(minute) for minute in range(100)]
+        self.data = b"".join(self.lines)
+        self.offsets = [sum(map(len, self.lines[:index])) for index in range(len(self.lines))]
+
+    def build_index(self, data: bytes, sample_interval: int = 500) -> TimeIndex:
+        index = TimeIndex(1, 2, sample_interval)
+        index.extend(io.BytesIO(data), len(data))
+        return index
+
+    def test_extend_samples_line_starts_with_wall_clock_times(self):
+        index = self.build_index(self.data)
+
+        self.assertEqual(index.size, len(self.data))
+        self.assertEqual(len(index.offsets), -(-len(self.data) // 500))
+        self.assertEqual(index.offsets[0], 0)
+        for offset, time in zip(index.offsets, index.times):
+            minute = self.offsets.index(offset)
+            self.assertEqual(time, TimeIndex.get_wall_clock_seconds(datetime(2023, 11, 19) + timedelta(minutes=minute)))
+
+    def test_extend_skips_lines_without_timestamp_and_incomplete_lines(self):
+        data = b"garbage\n" + self.data[:-10]
+        index = self.build_index(data, sample_interval=len(data) - 5)
+
+        self.assertEqual(list(index.offsets), [len(b"garbage\n")])
+
+    def test_extend_continues_from_indexed_size(self):
+        index = self.build_index(self.data[:self.offsets[50]])
+        index.extend(io.BytesIO(self.data), len(self.data))
+
+        full_index = self.build_index(self.data)
+        self.assertEqual(index.offsets, full_index.offsets)
+        self.assertEqual(index.times, full_index.times)
+
+    def test_find_range_selects_samples_around_time_range(self):
+        index = self.build_index(self.data)
+        from_time = datetime(2023, 11, 19, 0, 40)
+        to_time = datetime(2023, 11, 19, 1, 0)
+
+        start, end = index.find_range(from_time, to_time, len(self.data), tolerance=0)
+
+        self.assertLessEqual(start, self.offsets[40])
+        self.assertGreater(start, self.offsets[40] - 500)
+        self.assertGreater(end, self.offsets[60])
+        self.assertLess(end, self.offsets[61] + 500)
+
+    def test_find_range_widens_range_by_tolerance(self):
+        index = self.build_index(self.data)
+        from_time = datetime(2023, 11, 19, 0, 40)
+        to_time = datetime(2023, 11, 19, 1, 0)
+
+        start, end = index.find_range(from_time, to_time, len(self.data), tolerance=10 * 60)
+
+        self.assertLessEqual(start, self.offsets[30])
+        self.assertGreater(end, self.offsets[70])
+
+    def test_find_range_without_bounds_covers_file(self):
+        index = self.build_index(self.data)
+
+        self.assertEqual(index.find_range(None, None, len(self.data)), (0, len(self.data)))
+
+    def test_find_range_after_last_sample_reads_tail(self):
+        index = self.build_index(self.data)
+
+        start, end = index.find_range(datetime(2024, 1, 1), None, len(self.data), tolerance=0)
+
+        self.assertEqual((start, end), (index.offsets[-1], len(self.data)))
+
+    def test_find_range_before_file_is_empty(self):
+        index = self.build_index(self.data)
+
+        self.assertEqual(index.find_range(None, datetime(2023, 1, 1), len(self.data), tolerance=0), (0, 0))
+
+    def test_round_trip_preserves_index(self):
+        index = self.build_index(self.data)
+        index.head_digest = b"digest"
+
+        restored = TimeIndex.from_bytes(index.to_bytes())
+
+        self.assertEqual((restored.device, restored.inode, restored.sample_interval), (1, 2, 500))
+        self.assertEqual(restored.size, index.size)
+        self.assertEqual(restored.head_digest, b"digest")
+        self.assertEqual(restored.offsets, index.offsets)
+        self.assertEqual(restored.times, index.times)
+
+    def test_from_bytes_rejects_other_data(self):
+        with self.assertRaises(ValueError):
+            TimeIndex.from_bytes(b"not an index")
+
+    def test_invalid_sample_interval(self):
+        with self.assertRaises(ValueError):
+            TimeIndex(1, 2, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
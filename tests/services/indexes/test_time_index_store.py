@@ -0,0 +1,39 @@
+import os
+import tempfile
+import unittest
+
+from src.services.indexes.time_index import TimeIndex
+from src.services.indexes.time_index_store import TimeIndexStore
+
+
+class TestTimeIndexStore(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.store = TimeIndexStore(os.path.join(directory.name, "indexes"))
+
+    def test_load_missing_index(self):
+        self.assertIsNone(self.store.load("/var/log/nginx/access.log"))
+
+    def test_save_and_load(self):
+        index = TimeIndex(1, 2, 1024)
+        index.size = 4096
+        index.offsets.extend([0, 1100])
+        index.times.extend([100, 160])
+
+        self.store.save("/var/log/nginx/access.log", index)
+        loaded = self.store.load("/var/log/nginx/access.log")
+
+        self.assertEqual(loaded.to_bytes(), index.to_bytes())
+        self.assertIsNone(self.store.load("/var/log/nginx/other.log"))
+        self.assertEqual(os.listdir(self.store.directory), [os.path.basename(self.store.get_index_path("/var/log/nginx/access.log"))])
+
+    def test_load_ignores_unsupported_index(self):
+        with open(self.store.get_index_path("/var/log/nginx/access.log"), "wb") as index_file:
+            index_file.write(b"garbage")
+
+        self.assertIsNone(self.store.load("/var/log/nginx/access.log"))
+
+
+if __name__ == "__main__":
+    unittest.main()
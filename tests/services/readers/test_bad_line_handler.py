@@ -0,0 +1,121 @@
+import os
+import pickle
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.models.error_policy import ErrorPolicy
+from src.services.analytics.analyzer import Analyzer
+from src.services.readers.bad_line_handler import BadLineHandler
+
+
+class TestBadLineHandler(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.quarantine_path = os.path.join(temp_dir.name, "rejected.log")
+        self.analyzer = Analyzer()
+
+    def test_skip_counts_bad_lines_per_source(self):
+        handler = BadLineHandler()
+
+        handler.reject(self.analyzer, "a.log", b"garbage", ValueError("bad"))
+        handler.reject(self.analyzer, "a.log", b"garbage", ValueError("bad"))
+        handler.reject(self.analyzer, "b.log", b"garbage", ValueError("bad"))
+        handler.flush()
+
+        self.assertEqual(self.analyzer.get_bad_line_counts(), {"a.log": 2, "b.log": 1})
+        self.assertFalse(os.path.exists(self.quarantine_path))
+
+    def test_quarantine_buffers_lines_until_flushed(self):
+        handler = BadLineHandler(ErrorPolicy.QUARANTINE, self.quarantine_path)
+
+        handler.reject(self.analyzer, "a.log", b"first", ValueError("bad"))
+        handler.reject(self.analyzer, "a.log", memoryview(b"second"), ValueError("bad"))
+        self.assertFalse(os.path.exists(self.quarantine_path))
+
+        with handler:
+            pass
+
+        with open(self.quarantine_path, "rb") as reader:
+            self.assertEqual(reader.read(), b"first\nsecond\n")
+
+    def test_quarantine_writes_when_buffer_is_full(self):
+        handler = BadLineHandler(ErrorPolicy.QUARANTINE, self.quarantine_path, buffer_size=10)
+
+        handler.reject(self.analyzer, "a.log", b"0123456789", ValueError("bad"))
+
+        with open(self.quarantine_path, "rb") as reader:
+            self.assertEqual(reader.read(), b"0123456789\n")
+
+    def test_quarantine_appends_to_existing_file(self):
+        with open(self.quarantine_path, "wb") as writer:
+            writer.write(b"earlier\n")
+
+        with BadLineHandler(ErrorPolicy.QUARANTINE, self.quarantine_path) as handler:
+            handler.reject(self.analyzer, "a.log", b"later", ValueError("bad"))
+
+        with open(self.quarantine_path, "rb") as reader:
+            self.assertEqual(reader.read(), b"earlier\nlater\n")
+
+    def test_fail_raises_with_source(self):
+        handler = BadLineHandler(ErrorPolicy.FAIL)
+
+        with self.assertRaises(ValueError) as context:
+            handler.reject(self.analyzer, "a.log", b"garbage", ValueError("bad"))
+
+        self.assertEqual(str(context.exception), "Error: Cannot parse a line of 'a.log': garbage")
+
+    @patch("src.services.readers.bad_line_handler.time.monotonic")
+    @patch("src.services.readers.bad_line_handler.LOGGER.warning")
+    def test_warnings_are_rate_limited(self, mock_warning, mock_monotonic):
+        handler = BadLineHandler(log_interval=10)
+
+        for now in (100.0, 101.0, 102.0, 111.0):
+            mock_monotonic.return_value = now
+            handler.reject(self.analyzer, "a.log", b"garbage", ValueError("bad"))
+
+        self.assertEqual(mock_warning.call_count, 2)
+        self.assertIn("2 more bad lines were not logged", mock_warning.call_args.args[0])
+
+    def test_shorten_cuts_long_lines(self):
+        self.assertEqual(BadLineHandler.shorten(b"x" * 300), "x" * 200 + "...")
+        self.assertEqual(BadLineHandler.shorten(b"\xff"), "�")
+
+    def test_pickled_copy_starts_with_empty_buffer(self):
+        handler = BadLineHandler(ErrorPolicy.QUARANTINE, self.quarantine_path)
+        handler.reject(self.analyzer, "a.log", b"parent", ValueError("bad"))
+
+        copy = pickle.loads(pickle.dumps(handler))
+        copy.reject(self.analyzer, "a.log", b"worker", ValueError("bad"))
+        copy.flush()
+        handler.flush()
+
+        with open(self.quarantine_path, "rb") as reader:
+            self.assertEqual(reader.read(), b"worker\nparent\n")
+
+    def test_deferred_copy_keeps_lines_until_taken(self):
+        handler = BadLineHandler(ErrorPolicy.QUARANTINE, self.quarantine_path, buffer_size=10)
+        deferred = handler.create_deferred()
+
+        deferred.reject(self.analyzer, "a.log", b"0123456789", ValueError("bad"))
+        deferred.flush()
+        self.assertFalse(os.path.exists(self.quarantine_path))
+
+        handler.add_to_buffer(deferred.take_buffer())
+
+        self.assertEqual(deferred.take_buffer(), b"")
+        with open(self.quarantine_path, "rb") as reader:
+            self.assertEqual(reader.read(), b"0123456789\n")
+
+    def test_invalid_settings(self):
+        with self.assertRaises(ValueError) as context:
+            BadLineHandler("ignore")
+        self.assertEqual(str(context.exception), "Error: Unsupported error policy 'ignore'")
+
+        with self.assertRaises(ValueError):
+            BadLineHandler(ErrorPolicy.QUARANTINE)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import bz2
+import gzip
+import lzma
+import struct
+import unittest
+
+import zstandard
+
+from src.models.compression_codec import CompressionCodec
+from src.services.readers.codec_detector import CodecDetector
+
+
+def build_seekable_zstd(chunks: list[bytes]) -> bytes:
+    frames = [zstandard.ZstdCompressor().compress(chunk) for chunk in chunks]
+    entries = b"".join(struct.pack("<II", len(frame), len(chunk)) for frame, chunk in zip(frames, chunks))
+    footer = struct.pack("<IBI", len(frames), 0, 0x8F92EAB1)
+    seek_table = struct.pack("<II", 0x184D2A5E, len(entries) + len(footer)) + entries + footer
+    return b"".join(frames) + seek_table
+
+
+class TestCodecDetector(unittest.TestCase):
+    def test_detect(self):
+        data = b"127.0.0.1 - - [19/Nov/2023:15:30:45 +0000]\n"
+        self.assertEqual(CodecDetector.detect(gzip.compress(data)[:6]), CompressionCodec.GZIP)
+        self.assertEqual(CodecDetector.detect(bz2.compress(data)[:6]), CompressionCodec.BZ2)
+        self.assertEqual(CodecDetector.detect(lzma.compress(data)[:6]), CompressionCodec.XZ)
+        self.assertEqual(CodecDetector.detect(zstandard.ZstdCompressor().compress(data)[:6]), CompressionCodec.ZSTD)
+        self.assertEqual(CodecDetector.detect(data[:6]), CompressionCodec.NONE)
+        self.assertEqual(CodecDetector.detect(b""), CompressionCodec.NONE)
+
+    def test_create_decompressor_reports_member_end(self):
+        data = b"first member\n"
+        for codec, compress in [
+            (CompressionCodec.GZIP, gzip.compress),
+            (CompressionCodec.BZ2, bz2.compress),
+            (CompressionCodec.XZ, lzma.compress),
+            (CompressionCodec.ZSTD, zstandard.ZstdCompressor().compress),
+        ]:
+            decompressor = CodecDetector.create_decompressor(codec)
+            self.assertEqual(decompressor.decompress(compress(data) + b"next"), data)
+            self.assertTrue(decompressor.eof)
+            self.assertEqual(decompressor.unused_data, b"next")
+
+    def test_create_decompressor_unsupported(self):
+        with self.assertRaises(ValueError):
+            CodecDetector.create_decompressor(CompressionCodec.NONE)
+
+    def test_find_member_start(self):
+        first = gzip.compress(b"a" * 100)
+        second = gzip.compress(b"b" * 100)
+        data = first + second
+
+        self.assertEqual(CodecDetector.find_member_start(data, 0, CompressionCodec.GZIP), 0)
+        self.assertEqual(CodecDetector.find_member_start(data, 1, CompressionCodec.GZIP), len(first))
+        self.assertEqual(CodecDetector.find_member_start(data, len(first) + 1, CompressionCodec.GZIP), -1)
+        self.assertEqual(CodecDetector.find_member_start(b"BZh9 not a block", 0, CompressionCodec.BZ2), -1)
+
+    def test_get_skippable_frame_length(self):
+        self.assertEqual(CodecDetector.get_skippable_frame_length(struct.pack("<II", 0x184D2A53, 10)), 18)
+        self.assertIsNone(CodecDetector.get_skippable_frame_length(b"\x28\xb5\x2f\xfd\x00\x00\x00\x00"))
+        self.assertIsNone(CodecDetector.get_skippable_frame_length(b"\x50\x2a"))
+
+    def test_read_zstd_seek_table(self):
+        chunks = [b"one\n" * 10, b"two\n" * 20, b"three\n" * 5]
+        data = build_seekable_zstd(chunks)
+        offsets = CodecDetector.read_zstd_seek_table(data)
+
+        self.assertEqual(len(offsets), 3)
+        self.assertEqual(offsets[0], 0)
+        for offset, chunk in zip(offsets, chunks):
+            self.assertEqual(zstandard.ZstdDecompressor().decompressobj().decompress(data[offset:]), chunk)
+
+        self.assertIsNone(CodecDetector.read_zstd_seek_table(zstandard.ZstdCompressor().compress(b"plain frame\n")))
+
+
+if __name__ == "__main__":
+    unittest.main()
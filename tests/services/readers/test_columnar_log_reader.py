@@ -0,0 +1,140 @@
+import gzip
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from src.parsers.nginx_log_parser import NginxLogParser
+from src.services.analytics.analyzer import Analyzer
+from src.services.analytics.ddsketch_quantile_estimator import DDSketchQuantileEstimator
+from src.services.analytics.hyperloglog_unique_counter import HyperLogLogUniqueCounter
+from src.services.analytics.numpy_batch_analyzer import NumpyBatchAnalyzer
+from src.services.analytics.time_series import TimeSeries
+from src.services.columnar.log_columns_cache import LogColumnsCache
+from src.services.readers.columnar_log_reader import ColumnarLogReader
+from src.services.readers.file_log_reader import FileLogReader
+
+
+def build_line(index: int) -> bytes:
+    time_zone = timezone(timedelta(hours=3 if index % 7 else -5))
+    time = (datetime(2023, 11, 19, tzinfo=timezone.utc) + timedelta(seconds=37 * index)).astimezone(time_zone)
+    return (
+        f"10.0.{index % 3}.{index % 11} - - [{time.strftime('%d/%b/%Y:%H:%M:%S %z')}] "
+        f"\"GET /page/{index % 13}?id={index % 4} HTTP/1.1\" {[200, 404, 500, 301][index % 4]} {index * 17 % 5000} "
+        f"\"-\" \"agent-{index % 5}\"\n"
+    ).encode("utf-8")
+
+
+class TestColumnarLogReader(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.file_path = os.path.join(directory.name, "access.log")
+        self.cache = LogColumnsCache(os.path.join(directory.name, "cache"))
+        self.write(b"".join(build_line(index) for index in range(500)))
+
+    def write(self, data: bytes, mode: str = "wb") -> None:
+        with open(self.file_path, mode) as log_file:
+            log_file.write(data)
+
+    def read_columnar(self, analyzer: Analyzer, *args) -> Analyzer:
+        ColumnarLogReader(analyzer, self.cache).read_logs(self.file_path, *args)
+        return analyzer
+
+    def read_in_full(self, analyzer: Analyzer, *args) -> Analyzer:
+        FileLogReader(analyzer).read_logs(self.file_path, *args)
+        return analyzer
+
+    def test_read_logs_matches_line_by_line_read(self):
+        queries = [
+            (None, None, None, None),
+            (datetime(2023, 11, 19, 1, 0), datetime(2023, 11, 19, 3, 0), None, None),
+            (datetime(2023, 11, 19, 1, 0, 0, 500), None, "status", "5xx"),
+            (None, None, "agent", "agent-3"),
+            (None, None, "request", "re:^GET /page/1[0-2]"),
+            (None, None, "ip", "10.0.1.0/24"),
+            (datetime(2024, 1, 1), None, None, None),
+        ]
+        for query in queries:
+            with self.subTest(query=query):
+                expected = self.read_in_full(Analyzer(), *query)
+                self.assertEqual(self.read_columnar(Analyzer(), *query).to_bytes(), expected.to_bytes())
+
+    def test_read_logs_matches_line_by_line_read_with_sketches_and_time_series(self):
+        def create_analyzer():
+            return Analyzer(DDSketchQuantileEstimator(), HyperLogLogUniqueCounter(), TimeSeries(60 * 60))
+
+        query = (datetime(2023, 11, 19, 2, 0), None, "status", "<400")
+        expected = self.read_in_full(create_analyzer(), *query)
+        analyzer = self.read_columnar(create_analyzer(), *query)
+
+        self.assertEqual(analyzer.get_time_series().get_intervals(), expected.get_time_series().get_intervals())
+        self.assertEqual(analyzer.calculate_95th_percentile(), expected.calculate_95th_percentile())
+        self.assertEqual(analyzer.get_unique_ip_count(), expected.get_unique_ip_count())
+
+    def test_read_logs_into_numpy_batch_analyzer(self):
+        query = (datetime(2023, 11, 19, 1, 0), None, "status", "<500")
+        expected = self.read_in_full(NumpyBatchAnalyzer(), *query)
+        analyzer = self.read_columnar(NumpyBatchAnalyzer(), *query)
+
+        self.assertEqual(analyzer.to_bytes(), expected.to_bytes())
+
+    def test_read_logs_parses_file_only_once(self):
+        self.read_columnar(Analyzer(), None, None, None, None)
+
+        with patch.object(NginxLogParser, "parse") as mock_parse:
+            analyzer = self.read_columnar(Analyzer(), None, None, "status", "404")
+
+        mock_parse.assert_not_called()
+        self.assertEqual(analyzer.get_count_logs(), 125)
+
+    def test_read_logs_counts_bad_lines_on_cache_hit(self):
+        self.write(b"garbage\n", mode="ab")
+
+        with self.assertLogs("BadLineHandler", level="WARNING"):
+            parsed = self.read_columnar(Analyzer(), None, None, None, None)
+        with self.assertNoLogs("BadLineHandler"):
+            cached = self.read_columnar(Analyzer(), None, None, None, None)
+
+        self.assertEqual(parsed.get_bad_line_counts(), {self.file_path: 1})
+        self.assertEqual(cached.to_bytes(), parsed.to_bytes())
+
+    def test_read_logs_rebuilds_columns_of_changed_file(self):
+        self.read_columnar(Analyzer(), None, None, None, None)
+        self.write(build_line(500), mode="ab")
+
+        analyzer = self.read_columnar(Analyzer(), None, None, None, None)
+
+        self.assertEqual(analyzer.get_count_logs(), 501)
+
+    def test_read_logs_caches_compressed_file(self):
+        with open(self.file_path, "rb") as log_file:
+            data = log_file.read()
+        self.write(gzip.compress(data))
+
+        analyzer = self.read_columnar(Analyzer(), None, None, "status", "200")
+
+        self.assertEqual(analyzer.get_count_logs(), 125)
+        self.assertIsNotNone(self.cache.load(self.file_path, os.stat(self.file_path)))
+
+    def test_read_logs_keeps_analyzing_when_cache_cannot_be_written(self):
+        with patch.object(LogColumnsCache, "save", side_effect=PermissionError), \
+                patch("src.services.readers.columnar_log_reader.LOGGER.warning") as mock_warning:
+            analyzer = self.read_columnar(Analyzer(), None, None, None, None)
+
+        self.assertEqual(analyzer.get_count_logs(), 500)
+        mock_warning.assert_called_once()
+
+    @patch("src.services.readers.columnar_log_reader.LOGGER.error")
+    def test_read_logs_missing_file(self, mock_error):
+        os.remove(self.file_path)
+
+        analyzer = self.read_columnar(Analyzer(), None, None, None, None)
+
+        self.assertEqual(analyzer.get_count_logs(), 0)
+        mock_error.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
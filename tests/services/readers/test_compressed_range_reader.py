@@ -0,0 +1,63 @@
+import gzip
+import io
+import struct
+import unittest
+
+import zstandard
+
+from src.models.compression_codec import CompressionCodec
+from src.services.readers.compressed_range_reader import CompressedRangeReader
+
+
+def read_all(reader: CompressedRangeReader) -> bytes:
+    chunks = []
+    while True:
+        chunk = reader.read()
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+
+
+class TestCompressedRangeReader(unittest.TestCase):
+    def test_reads_all_members(self):
+        first = gzip.compress(b"first\n")
+        second = gzip.compress(b"second\n")
+        data = first + second
+
+        reader = CompressedRangeReader(io.BytesIO(data), CompressionCodec.GZIP, chunk_size=5)
+        self.assertEqual(read_all(reader), b"first\nsecond\n")
+        self.assertEqual(reader.position, len(data))
+        self.assertTrue(reader.ends_with_newline)
+
+    def test_reads_members_starting_in_range(self):
+        first = gzip.compress(b"first\n")
+        second = gzip.compress(b"second")
+        data = first + second
+
+        reader = CompressedRangeReader(io.BytesIO(data), CompressionCodec.GZIP, 0, 1)
+        self.assertEqual(read_all(reader), b"first\n")
+        self.assertEqual(reader.position, len(first))
+
+        reader = CompressedRangeReader(io.BytesIO(data), CompressionCodec.GZIP, len(first), len(data))
+        self.assertEqual(read_all(reader), b"second")
+        self.assertFalse(reader.ends_with_newline)
+
+    def test_skips_zstd_skippable_frames(self):
+        compressor = zstandard.ZstdCompressor()
+        skippable_frame = struct.pack("<II", 0x184D2A5E, 3) + b"abc"
+        data = compressor.compress(b"one\n") + skippable_frame + compressor.compress(b"two\n") + skippable_frame
+
+        reader = CompressedRangeReader(io.BytesIO(data), CompressionCodec.ZSTD, chunk_size=7)
+        self.assertEqual(read_all(reader), b"one\ntwo\n")
+        self.assertEqual(reader.position, len(data))
+
+    def test_truncated_member(self):
+        data = zstandard.ZstdCompressor().compress(b"line\n" * 100)
+
+        reader = CompressedRangeReader(io.BytesIO(data[:-3]), CompressionCodec.ZSTD)
+        with self.assertRaises(EOFError):
+            read_all(reader)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,18 @@
+import bz2
+import gzip
+import io
+import lzma
+import os
 import unittest
+from tempfile import NamedTemporaryFile
 from unittest.mock import MagicMock, patch
+
+import zstandard
 from datetime import datetime, timezone
+from src.models.error_policy import ErrorPolicy
+from src.services.analytics.analyzer import Analyzer
+from src.services.analytics.numpy_batch_analyzer import NumpyBatchAnalyzer
+from src.services.readers.bad_line_handler import BadLineHandler
 from src.services.readers.file_log_reader import FileLogReader
 from src.models.nginx_log import NginxLog
 
@@ -11,12 +23,12 @@ class TestFileLogReader(unittest.TestCase):
         self.file_log_reader = FileLogReader(self.analyzer)
 
     @patch("src.services.readers.file_log_reader.Path")
-    @patch("src.services.readers.file_log_reader.NginxLogParser")
-    @patch("src.services.readers.file_log_reader.LogFilter")
-    def test_read_logs_valid_file(self, mock_log_filter, mock_nginx_log_parser, mock_path):
-        mock_parser_instance = mock_nginx_log_parser.return_value
+    @patch("src.services.readers.log_reader.LogParserFactory")
+    @patch("src.services.readers.log_reader.LogFilter")
+    def test_read_logs_valid_file(self, mock_log_filter, mock_log_parser_factory, mock_path):
+        mock_parser_instance = mock_log_parser_factory.return_value.get_parser.return_value
         mock_log_filter_instance = mock_log_filter.return_value
-        mock_parser_instance.parse.return_value = NginxLog(
+        mock_parser_instance.parse_matching.return_value = NginxLog(
             remote_addr="127.0.0.1",
             remote_user="-",
             time_local=datetime(2023, 11, 19, 15, 30, 45, tzinfo=timezone.utc),
@@ -26,12 +38,13 @@ class TestFileLogReader(unittest.TestCase):
             http_referer="-",
             http_user_agent="Mozilla/5.0"
         )
-        mock_log_filter_instance.matches_filter.return_value = True
+        mock_predicate = mock_log_filter_instance.compile.return_value
+        mock_predicate.matches_line.return_value = True
 
         mock_path_instance = mock_path.return_value
-        mock_path_instance.open.return_value.__enter__.return_value = iter([
-            "127.0.0.1 - - [19/Nov/2023:15:30:45 +0000] \"GET /index.html HTTP/1.1\" 200 1234 \"-\" \"Mozilla/5.0\""
-        ])
+        mock_path_instance.open.return_value.__enter__.return_value = io.BytesIO(
+            b"127.0.0.1 - - [19/Nov/2023:15:30:45 +0000] \"GET /index.html HTTP/1.1\" 200 1234 \"-\" \"Mozilla/5.0\""
+        )
 
         self.file_log_reader.read_logs(
             file_path="mock_file.log",
@@ -41,10 +54,30 @@ class TestFileLogReader(unittest.TestCase):
             filter_value="200"
         )
 
-        mock_parser_instance.parse.assert_called_once()
-        mock_log_filter_instance.matches_filter.assert_called_once()
+        mock_log_filter_instance.compile.assert_called_once_with("status", "200", None)
+        mock_parser_instance.parse_matching.assert_called_once()
+        mock_parser_instance.parse.assert_not_called()
         self.analyzer.update_metrics.assert_called_once()
 
+    def test_read_logs_filter_skips_lines_before_parsing_time(self):
+        lines = [
+            b"127.0.0.1 - - [19/Nov/2023:15:30:45 +0000] \"GET /a HTTP/1.1\" 200 10 \"-\" \"curl\"\n",
+            b"127.0.0.1 - - [19/Nov/2023:15:30:46 +0000] \"GET /b HTTP/1.1\" 503 20 \"-\" \"curl\"\n",
+            b"10.1.2.3 - - [19/Nov/2023:15:30:47 +0000] \"GET /c HTTP/1.1\" 500 30 \"-\" \"curl\"\n",
+        ]
+
+        with patch("src.parsers.nginx_log_parser.DateParser.check_time_pattern",
+                   return_value=datetime(2023, 11, 19, tzinfo=timezone.utc)) as mock_check_time_pattern:
+            self.file_log_reader.process_lines(lines, None, None, "status", ">=500")
+
+        self.assertEqual(mock_check_time_pattern.call_count, 2)
+        self.assertEqual(self.analyzer.update_metrics.call_count, 2)
+
+        self.analyzer.reset_mock()
+        self.file_log_reader.process_lines(lines, None, None, "ip", "10.0.0.0/8")
+        self.analyzer.update_metrics.assert_called_once()
+        self.assertEqual(self.analyzer.update_metrics.call_args[0][0].request, "GET /c HTTP/1.1")
+
     @patch("src.services.readers.file_log_reader.Path")
     @patch("src.services.readers.file_log_reader.LOGGER.error")
     def test_read_logs_file_io_error(self, mock_logger_error, mock_path):
@@ -64,6 +97,156 @@ class TestFileLogReader(unittest.TestCase):
             exc_info=True
         )
 
+    @patch("src.services.readers.log_reader.LogParserFactory")
+    def test_read_range(self, mock_log_parser_factory):
+        lines = [b"first line\n", b"second line\n", b"third line\n"]
+        mock_log_parser_factory.return_value.get_parser.return_value.parse.side_effect = lambda line: MagicMock(
+            time_local=datetime(2023, 11, 19, 15, 30, 45, tzinfo=timezone.utc)
+        )
+
+        with NamedTemporaryFile("wb", delete=False) as temp_file:
+            temp_file.write(b"".join(lines))
+        try:
+            self.file_log_reader.read_range(temp_file.name, len(lines[0]), len(lines[0]) + len(lines[1]), None, None, None, None)
+        finally:
+            os.remove(temp_file.name)
+
+        mock_log_parser_factory.return_value.get_parser.return_value.parse.assert_called_once_with(b"second line")
+        self.analyzer.update_metrics.assert_called_once()
+
+    def test_iter_block_lines_carries_lines_across_blocks(self):
+        data = b"first\nsecond line\nthird"
+        lines = list(FileLogReader.iter_block_lines(io.BytesIO(data), block_size=4))
+        self.assertEqual(lines, [b"first", b"second line", b"third"])
+
+        limited = list(FileLogReader.iter_block_lines(io.BytesIO(data), limit=len(b"first\nsecond line\n"), block_size=4))
+        self.assertEqual(limited, [b"first", b"second line"])
+
+    def test_read_logs_tolerates_invalid_utf8(self):
+        line = (
+            b"127.0.0.1 - - [19/Nov/2023:15:30:45 +0000] \"GET /index.html HTTP/1.1\" 200 1234 "
+            b"\"-\" \"Bad\xff\xfeAgent\"\n"
+        )
+        with NamedTemporaryFile("wb", delete=False) as temp_file:
+            temp_file.write(line * 2)
+        try:
+            self.file_log_reader.read_logs(temp_file.name, None, None, "agent", "Agent")
+        finally:
+            os.remove(temp_file.name)
+
+        self.assertEqual(self.analyzer.update_metrics.call_count, 2)
+        nginx_log = self.analyzer.update_metrics.call_args[0][0]
+        self.assertEqual(nginx_log.http_user_agent, "Bad\ufffd\ufffdAgent")
+        self.assertEqual(nginx_log.request, "GET /index.html HTTP/1.1")
+
+    def test_read_logs_compressed_files(self):
+        line = b"127.0.0.1 - - [19/Nov/2023:15:30:45 +0000] \"GET /index.html HTTP/1.1\" 200 1234 \"-\" \"Mozilla/5.0\"\n"
+        for compress in [gzip.compress, bz2.compress, lzma.compress, zstandard.ZstdCompressor().compress]:
+            analyzer = MagicMock()
+            with NamedTemporaryFile("wb", delete=False) as temp_file:
+                temp_file.write(compress(line * 2) + compress(line))
+            try:
+                FileLogReader(analyzer).read_logs(temp_file.name, None, None, None, None)
+            finally:
+                os.remove(temp_file.name)
+
+            self.assertEqual(analyzer.update_metrics.call_count, 3)
+            self.assertEqual(analyzer.update_metrics.call_args[0][0].body_bytes_sent, 1234)
+
+    @patch("src.services.readers.file_log_reader.LOGGER.error")
+    def test_read_logs_corrupt_compressed_file(self, mock_logger_error):
+        with NamedTemporaryFile("wb", delete=False) as temp_file:
+            temp_file.write(gzip.compress(
+                b"127.0.0.1 - - [19/Nov/2023:15:30:45 +0000] \"GET / HTTP/1.1\" 200 1 \"-\" \"-\"\n" * 100
+            )[:-10])
+        try:
+            self.file_log_reader.read_logs(temp_file.name, None, None, None, None)
+        finally:
+            os.remove(temp_file.name)
+
+        mock_logger_error.assert_called_once_with(f"Error reading logs from file: {temp_file.name}", exc_info=True)
+
+    def test_read_logs_batch_pipeline_matches_line_pipeline(self):
+        lines = b"".join(
+            f"10.0.{index % 3}.1 - - [19/Nov/2023:15:{index % 60:02d}:{index % 7:02d} +0300] "
+            f"\"GET /page/{index % 5} HTTP/1.1\" {[200, 404, 500][index % 3]} {index * 13} \"-\" \"agent-{index % 4}\"\n"
+            .encode("utf-8")
+            for index in range(200)
+        )
+        with NamedTemporaryFile("wb", delete=False) as temp_file:
+            temp_file.write(gzip.compress(lines))
+        self.addCleanup(os.remove, temp_file.name)
+
+        queries = [
+            (None, None, None, None),
+            (datetime(2023, 11, 19, 15, 10), datetime(2023, 11, 19, 15, 40), "agent", "agent-1"),
+            (None, None, "status", "4xx"),
+        ]
+        for query in queries:
+            with self.subTest(query=query):
+                expected = Analyzer()
+                FileLogReader(expected).read_logs(temp_file.name, *query)
+                analyzer = NumpyBatchAnalyzer(batch_size=32)
+                FileLogReader(analyzer).read_logs(temp_file.name, *query)
+
+                self.assertEqual(analyzer.get_count_logs(), expected.get_count_logs())
+                self.assertEqual(analyzer.get_unique_ip_count(), expected.get_unique_ip_count())
+                self.assertEqual(analyzer.get_start_date(), expected.get_start_date())
+                self.assertEqual(analyzer.get_end_date(), expected.get_end_date())
+                self.assertEqual(analyzer.calculate_95th_percentile(), expected.calculate_95th_percentile())
+                self.assertEqual(list(analyzer.get_status_code_counts().items()),
+                                 list(expected.get_status_code_counts().items()))
+                self.assertEqual(list(analyzer.get_requested_resources().items()),
+                                 list(expected.get_requested_resources().items()))
+
+    def test_read_logs_skips_and_quarantines_bad_lines(self):
+        good = b"10.0.0.1 - - [19/Nov/2023:15:30:45 +0000] \"GET /a HTTP/1.1\" 500 10 \"-\" \"curl\""
+        with NamedTemporaryFile("wb", delete=False) as temp_file:
+            temp_file.write(b"\n".join([b"garbage", good, b"", good, b"10.0.0.1 \"GET /b\" 500 10"]))
+        self.addCleanup(os.remove, temp_file.name)
+        quarantine_path = temp_file.name + ".rejected"
+        self.addCleanup(lambda: os.path.exists(quarantine_path) and os.remove(quarantine_path))
+
+        # Lines dropped by the raw filter checks are never parsed, so only the last one is seen with a filter.
+        queries = [(None, None, 3, b"garbage\n\n10.0.0.1 \"GET /b\" 500 10\n"),
+                   ("status", "500", 1, b"10.0.0.1 \"GET /b\" 500 10\n")]
+        for filter_field, filter_value, bad_line_count, quarantined in queries:
+            for analyzer in (Analyzer(), NumpyBatchAnalyzer(batch_size=2)):
+                with self.subTest(filter_field=filter_field, analyzer=type(analyzer).__name__):
+                    with BadLineHandler(ErrorPolicy.QUARANTINE, quarantine_path) as bad_lines:
+                        FileLogReader(analyzer, bad_lines=bad_lines).read_logs(temp_file.name, None, None,
+                                                                               filter_field, filter_value)
+
+                    self.assertEqual(analyzer.get_count_logs(), 2)
+                    self.assertEqual(analyzer.get_bad_line_counts(), {temp_file.name: bad_line_count})
+                    with open(quarantine_path, "rb") as reader:
+                        self.assertEqual(reader.read(), quarantined)
+                    os.remove(quarantine_path)
+
+    def test_read_logs_rate_limits_bad_line_reports(self):
+        good = b"10.0.0.1 - - [19/Nov/2023:15:30:45 +0000] \"GET /a HTTP/1.1\" 200 10 \"-\" \"curl\"\n"
+        with NamedTemporaryFile("wb", delete=False) as temp_file:
+            temp_file.write((good + b"garbage\n") * 1000)
+        self.addCleanup(os.remove, temp_file.name)
+
+        for analyzer in (Analyzer(), NumpyBatchAnalyzer(batch_size=64)):
+            with self.subTest(analyzer=type(analyzer).__name__):
+                with self.assertLogs(level="WARNING") as logs:
+                    FileLogReader(analyzer).read_logs(temp_file.name, None, None, None, None)
+
+                self.assertEqual(len(logs.records), 1)
+                self.assertEqual(logs.records[0].name, "BadLineHandler")
+                self.assertEqual(analyzer.get_bad_line_counts(), {temp_file.name: 1000})
+
+    def test_read_logs_fails_on_bad_line(self):
+        with NamedTemporaryFile("wb", delete=False) as temp_file:
+            temp_file.write(b"garbage\n")
+        self.addCleanup(os.remove, temp_file.name)
+
+        with self.assertRaises(ValueError):
+            FileLogReader(Analyzer(), bad_lines=BadLineHandler(ErrorPolicy.FAIL)).read_logs(temp_file.name, None,
+                                                                                             None, None, None)
+
     def test_is_within_time_range_within_range(self):
         nginx_log = MagicMock()
         nginx_log.time_local = datetime(2023, 11, 19, 15, 30, 45, tzinfo=timezone.utc)
@@ -0,0 +1,110 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from src.services.analytics.analyzer import Analyzer
+from src.services.readers.follow_log_reader import FollowLogReader
+
+
+def build_line(index: int) -> bytes:
+    return (
+        f"10.0.0.{index % 5} - - [19/Nov/2023:15:30:{index % 60:02d} +0000] "
+        f"\"GET /page/{index} HTTP/1.1\" 200 {index} \"-\" \"curl\"\n"
+    ).encode("utf-8")
+
+
+class TestFollowLogReader(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.file_path = os.path.join(directory.name, "access.log")
+        self.write(build_line(0), "wb")
+        self.analyzer = Analyzer()
+        self.refreshes = 0
+
+    def write(self, data: bytes, mode: str = "ab") -> None:
+        with open(self.file_path, mode) as log_file:
+            log_file.write(data)
+
+    def start_following(self, from_start: bool = False) -> threading.Event:
+        def on_refresh():
+            self.refreshes += 1
+
+        stop_event = threading.Event()
+        reader = FollowLogReader(self.analyzer, poll_interval=0.01)
+        thread = threading.Thread(target=reader.follow, args=(self.file_path, None, None, None, None, on_refresh),
+                                  kwargs={"refresh_interval": 0.05, "stop_event": stop_event, "from_start": from_start})
+        thread.start()
+
+        def stop():
+            stop_event.set()
+            thread.join()
+
+        self.addCleanup(stop)
+        return stop_event
+
+    def wait_for(self, condition) -> None:
+        deadline = time.monotonic() + 5
+        while not condition():
+            if time.monotonic() > deadline:
+                self.fail("Condition was not met in time")
+            time.sleep(0.01)
+
+    def requested_pages(self) -> set:
+        return set(self.analyzer.get_requested_resources())
+
+    def test_follow_reads_appended_lines_from_end(self):
+        self.start_following()
+        time.sleep(0.05)
+
+        line = build_line(1)
+        self.write(line[:30])
+        time.sleep(0.05)
+        self.assertEqual(self.analyzer.get_count_logs(), 0)
+
+        self.write(line[30:] + build_line(2))
+        self.wait_for(lambda: self.analyzer.get_count_logs() == 2)
+        self.assertEqual(self.requested_pages(), {"/page/1", "/page/2"})
+        self.wait_for(lambda: self.refreshes >= 2)
+
+    def test_follow_from_start(self):
+        self.start_following(from_start=True)
+
+        self.wait_for(lambda: self.analyzer.get_count_logs() == 1)
+
+    def test_follow_switches_to_rotated_file(self):
+        self.start_following()
+        time.sleep(0.05)
+        self.write(build_line(1))
+        self.wait_for(lambda: self.analyzer.get_count_logs() == 1)
+
+        os.rename(self.file_path, self.file_path + ".1")
+        self.write(build_line(2), "wb")
+
+        self.wait_for(lambda: self.analyzer.get_count_logs() == 2)
+        self.assertEqual(self.requested_pages(), {"/page/1", "/page/2"})
+
+    def test_follow_restarts_after_truncation(self):
+        self.write(build_line(1) + build_line(2))
+        self.start_following()
+        time.sleep(0.05)
+
+        self.write(build_line(3), "wb")
+
+        self.wait_for(lambda: self.analyzer.get_count_logs() == 1)
+        self.assertEqual(self.requested_pages(), {"/page/3"})
+
+    def test_follow_waits_for_missing_file(self):
+        os.remove(self.file_path)
+        self.start_following()
+        time.sleep(0.05)
+
+        self.write(build_line(4), "wb")
+
+        self.wait_for(lambda: self.analyzer.get_count_logs() == 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
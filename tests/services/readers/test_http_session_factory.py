@@ -0,0 +1,30 @@
+import unittest
+
+from src.services.readers.http_session_factory import HttpSessionFactory
+
+
+class TestHttpSessionFactory(unittest.TestCase):
+    def test_create_session_configures_pool_and_retries(self):
+        session = HttpSessionFactory.create_session(max_connections=8, retries=5, backoff_factor=0.1)
+        self.addCleanup(session.close)
+
+        for prefix in ["http://", "https://"]:
+            adapter = session.get_adapter(prefix + "example.com")
+            self.assertEqual(adapter._pool_maxsize, 8)
+            self.assertEqual(adapter.max_retries.total, 5)
+            self.assertEqual(adapter.max_retries.backoff_factor, 0.1)
+            self.assertIn(503, adapter.max_retries.status_forcelist)
+            self.assertIn("GET", adapter.max_retries.allowed_methods)
+
+    def test_create_session_invalid_arguments(self):
+        with self.assertRaises(ValueError) as context:
+            HttpSessionFactory.create_session(max_connections=0)
+        self.assertEqual(str(context.exception), "Error: Unsupported number of connections '0'")
+
+        with self.assertRaises(ValueError) as context:
+            HttpSessionFactory.create_session(retries=-1)
+        self.assertEqual(str(context.exception), "Error: Unsupported number of retries '-1'")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import gzip
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.parsers.nginx_log_parser import NginxLogParser
+from src.services.analytics.analyzer import Analyzer
+from src.services.checkpoints.checkpoint_store import CheckpointStore
+from src.services.readers.file_log_reader import FileLogReader
+from src.services.readers.incremental_log_reader import IncrementalLogReader
+
+
+def build_line(index: int) -> bytes:
+    return (
+        f"10.0.0.{index % 5} - - [19/Nov/2023:15:{index % 60:02d}:00 +0000] "
+        f"\"GET /page/{index % 3} HTTP/1.1\" {[200, 404][index % 2]} {index * 10} \"-\" \"curl\"\n"
+    ).encode("utf-8")
+
+
+class TestIncrementalLogReader(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.file_path = os.path.join(directory.name, "access.log")
+        self.store = CheckpointStore(os.path.join(directory.name, "state.sqlite"))
+        self.addCleanup(self.store.close)
+
+    def write(self, data: bytes, mode: str = "ab") -> None:
+        with open(self.file_path, mode) as log_file:
+            log_file.write(data)
+
+    def read_incrementally(self, settings: str = "{}") -> Analyzer:
+        analyzer = Analyzer()
+        IncrementalLogReader(analyzer, self.store, settings).read_logs(self.file_path, None, None, None, None)
+        return analyzer
+
+    def read_in_full(self) -> Analyzer:
+        analyzer = Analyzer()
+        FileLogReader(analyzer).read_logs(self.file_path, None, None, None, None)
+        return analyzer
+
+    def test_read_logs_parses_only_appended_lines(self):
+        self.write(b"".join(build_line(index) for index in range(10)))
+        self.assertEqual(self.read_incrementally().get_count_logs(), 10)
+
+        self.write(b"".join(build_line(index) for index in range(10, 15)))
+        parse = NginxLogParser.parse
+        with patch.object(NginxLogParser, "parse", autospec=True, side_effect=parse) as mock_parse:
+            analyzer = self.read_incrementally()
+
+        self.assertEqual(mock_parse.call_count, 5)
+        self.assertEqual(analyzer.to_bytes(), self.read_in_full().to_bytes())
+
+    def test_read_logs_waits_for_incomplete_line(self):
+        line = build_line(1)
+        self.write(build_line(0) + line[:20])
+        self.assertEqual(self.read_incrementally().get_count_logs(), 1)
+
+        self.write(line[20:])
+        analyzer = self.read_incrementally()
+
+        self.assertEqual(analyzer.get_count_logs(), 2)
+        self.assertEqual(analyzer.to_bytes(), self.read_in_full().to_bytes())
+
+    def test_read_logs_detects_rotation(self):
+        self.write(b"".join(build_line(index) for index in range(10)))
+        self.read_incrementally()
+
+        os.rename(self.file_path, self.file_path + ".1")
+        self.write(b"".join(build_line(index) for index in range(20, 32)), "wb")
+
+        self.assertEqual(self.read_incrementally().to_bytes(), self.read_in_full().to_bytes())
+
+    def test_read_logs_detects_truncation(self):
+        self.write(b"".join(build_line(index) for index in range(10)))
+        self.read_incrementally()
+
+        self.write(build_line(40), "wb")
+
+        analyzer = self.read_incrementally()
+        self.assertEqual(analyzer.get_count_logs(), 1)
+
+    def test_read_logs_detects_rewrite_in_place(self):
+        self.write(b"".join(build_line(index) for index in range(10)))
+        self.read_incrementally()
+
+        with open(self.file_path, "r+b") as log_file:
+            log_file.truncate(0)
+            log_file.write(b"".join(build_line(index) for index in range(50, 65)))
+
+        analyzer = self.read_incrementally()
+        self.assertEqual(analyzer.get_count_logs(), 15)
+        self.assertEqual(analyzer.to_bytes(), self.read_in_full().to_bytes())
+
+    def test_read_logs_ignores_checkpoint_of_other_settings(self):
+        self.write(b"".join(build_line(index) for index in range(10)))
+        self.read_incrementally()
+
+        self.assertEqual(self.read_incrementally("{\"filter-field\": \"status\"}").get_count_logs(), 10)
+
+    def test_read_logs_reads_compressed_files_in_full(self):
+        self.write(gzip.compress(b"".join(build_line(index) for index in range(10))), "wb")
+
+        self.assertEqual(self.read_incrementally().get_count_logs(), 10)
+        self.assertEqual(self.read_incrementally().get_count_logs(), 10)
+        self.assertIsNone(self.store.load(os.path.abspath(self.file_path), "{}"))
+
+    def test_find_last_line_end(self):
+        self.write(b"ab\ncd\nef")
+        with open(self.file_path, "rb") as reader:
+            self.assertEqual(IncrementalLogReader.find_last_line_end(reader, 0, 8), 6)
+            self.assertEqual(IncrementalLogReader.find_last_line_end(reader, 6, 8), 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -15,6 +15,11 @@ class TestLogReader(unittest.TestCase):
         expected_result = "Read logs from test.log with filter agent=Mozilla"
         self.assertEqual(result, expected_result)
 
+    def test_iter_batches(self):
+        batches = list(LogReader.iter_batches(iter(range(7)), 3))
+        self.assertEqual(batches, [[0, 1, 2], [3, 4, 5], [6]])
+        self.assertEqual(list(LogReader.iter_batches([], 3)), [])
+
     def test_abstract_class_cannot_be_instantiated(self):
         with self.assertRaises(TypeError):
             LogReader()
@@ -1,6 +1,11 @@
+import os
 import unittest
-from unittest.mock import patch, MagicMock
+from concurrent.futures import ProcessPoolExecutor
+from tempfile import NamedTemporaryFile
+from unittest.mock import ANY, patch, MagicMock
 from datetime import datetime
+from src.services.analytics.analyzer import Analyzer
+from src.services.readers.http_session_factory import DEFAULT_RETRIES, DEFAULT_TIMEOUT
 from src.services.readers.log_reader_service import LogReaderService
 
 
@@ -14,27 +19,184 @@ class TestLogReaderService(unittest.TestCase):
 
         service.read_logs("local_path.log", datetime(2023, 1, 1), datetime(2023, 1, 2), mock_analyzer, "agent", "Mozilla")
 
-        MockFileLogReader.assert_called_once_with(mock_analyzer)
+        MockFileLogReader.assert_called_once_with(mock_analyzer, fields=None, log_format=None, bad_lines=ANY)
         MockNetworkLogReader.assert_not_called()
         MockFileLogReader.return_value.read_logs.assert_called_once_with(
             "local_path.log", datetime(2023, 1, 1), datetime(2023, 1, 2), "agent", "Mozilla"
         )
 
+    @patch("src.services.readers.log_reader_service.HttpSessionFactory")
     @patch("src.services.readers.log_reader_service.FileLogReader")
     @patch("src.services.readers.log_reader_service.NetworkLogReader")
-    def test_read_logs_with_network_reader(self, MockNetworkLogReader, MockFileLogReader):
+    def test_read_logs_with_network_reader(self, MockNetworkLogReader, MockFileLogReader, MockHttpSessionFactory):
         mock_analyzer = MagicMock()
+        mock_session = MockHttpSessionFactory.create_session.return_value
 
         service = LogReaderService()
 
         service.read_logs("http://example.com/logs", datetime(2023, 1, 1), datetime(2023, 1, 2), mock_analyzer, "status", "404")
 
-        MockNetworkLogReader.assert_called_once_with(mock_analyzer)
+        MockNetworkLogReader.assert_called_once_with(mock_analyzer, fields=None, workers=1,
+                                                     session=mock_session.__enter__.return_value,
+                                                     timeout=DEFAULT_TIMEOUT, retries=DEFAULT_RETRIES,
+                                                     log_format=None, bad_lines=ANY)
+        mock_session.__exit__.assert_called_once()
         MockFileLogReader.assert_not_called()
         MockNetworkLogReader.return_value.read_logs.assert_called_once_with(
             "http://example.com/logs", datetime(2023, 1, 1), datetime(2023, 1, 2), "status", "404"
         )
 
+    @patch("src.services.readers.log_reader_service.ParallelFileLogReader")
+    @patch("src.services.readers.log_reader_service.FileLogReader")
+    def test_read_logs_with_parallel_reader(self, MockFileLogReader, MockParallelFileLogReader):
+        mock_analyzer = MagicMock()
+
+        service = LogReaderService(workers=4)
+
+        service.read_logs("local_path.log", None, None, mock_analyzer, None, None)
+
+        MockParallelFileLogReader.assert_called_once_with(mock_analyzer, 4, fields=None, log_format=None, bad_lines=ANY)
+        MockFileLogReader.assert_not_called()
+        MockParallelFileLogReader.return_value.read_logs.assert_called_once_with(
+            "local_path.log", None, None, None, None
+        )
+
+    @patch("src.services.readers.log_reader_service.FileLogReader")
+    def test_read_logs_passes_fields(self, MockFileLogReader):
+        mock_analyzer = MagicMock()
+        fields = frozenset({"status", "time_local"})
+
+        LogReaderService(fields=fields).read_logs("local_path.log", None, None, mock_analyzer, None, None)
+
+        MockFileLogReader.assert_called_once_with(mock_analyzer, fields=fields, log_format=None, bad_lines=ANY)
+
+    @patch("src.services.readers.log_reader_service.MmapLogReader")
+    @patch("src.services.readers.log_reader_service.FileLogReader")
+    def test_read_logs_with_mmap_reader_for_large_files(self, MockFileLogReader, MockMmapLogReader):
+        mock_analyzer = MagicMock()
+        with NamedTemporaryFile("wb", delete=False) as temp_file:
+            temp_file.write(b"x" * 100)
+        self.addCleanup(os.remove, temp_file.name)
+
+        LogReaderService(mmap_threshold=100).read_logs(temp_file.name, None, None, mock_analyzer, None, None)
+        LogReaderService(mmap_threshold=101).read_logs(temp_file.name, None, None, mock_analyzer, None, None)
+
+        MockMmapLogReader.assert_called_once_with(mock_analyzer, fields=None, log_format=None, bad_lines=ANY)
+        MockFileLogReader.assert_called_once_with(mock_analyzer, fields=None, log_format=None, bad_lines=ANY)
+
+    @patch("src.services.readers.log_reader_service.TimeIndexedLogReader")
+    @patch("src.services.readers.log_reader_service.FileLogReader")
+    def test_read_logs_with_time_indexed_reader_for_time_ranges(self, MockFileLogReader, MockTimeIndexedLogReader):
+        mock_analyzer = MagicMock()
+        mock_store = MagicMock()
+        from_time = datetime(2023, 11, 19)
+        with NamedTemporaryFile("wb", delete=False) as temp_file:
+            temp_file.write(b"x" * 100)
+        self.addCleanup(os.remove, temp_file.name)
+        service = LogReaderService(time_index_store=mock_store, time_index_threshold=100)
+
+        service.read_logs(temp_file.name, from_time, None, mock_analyzer, None, None)
+        service.read_logs(temp_file.name, None, None, mock_analyzer, None, None)
+
+        MockTimeIndexedLogReader.assert_called_once_with(mock_analyzer, fields=None, workers=1, store=mock_store,
+                                                         log_format=None, bad_lines=ANY)
+        MockFileLogReader.assert_called_once_with(mock_analyzer, fields=None, log_format=None, bad_lines=ANY)
+        MockTimeIndexedLogReader.return_value.read_logs.assert_called_once_with(temp_file.name, from_time, None, None, None)
+
+    @patch("src.services.readers.log_reader_service.TimeIndexedLogReader")
+    @patch("src.services.readers.log_reader_service.FileLogReader")
+    def test_read_logs_without_time_index_for_other_time_formats(self, MockFileLogReader, MockTimeIndexedLogReader):
+        mock_analyzer = MagicMock()
+        with NamedTemporaryFile("wb", delete=False) as temp_file:
+            temp_file.write(b"x" * 100)
+        self.addCleanup(os.remove, temp_file.name)
+        service = LogReaderService(time_index_threshold=100, log_format="$remote_addr [$time_iso8601] $status")
+
+        service.read_logs(temp_file.name, datetime(2023, 11, 19), None, mock_analyzer, None, None)
+
+        MockTimeIndexedLogReader.assert_not_called()
+        MockFileLogReader.assert_called_once_with(mock_analyzer, fields=None, log_format=service.log_format, bad_lines=ANY)
+
+    @patch("src.services.readers.log_reader_service.NetworkLogReader")
+    @patch("src.services.readers.log_reader_service.FileLogReader")
+    def test_read_all_shares_session_and_merges_in_order(self, MockFileLogReader, MockNetworkLogReader):
+        def read_remote(file_path, from_time, to_time, filter_field, filter_value):
+            analyzer = MockNetworkLogReader.call_args_list[-1].args[0]
+            analyzer.resource_counts[file_path] += 1
+
+        MockNetworkLogReader.return_value.read_logs.side_effect = read_remote
+        MockFileLogReader.side_effect = lambda analyzer, fields, log_format, bad_lines: MagicMock(
+            read_logs=lambda file_path, *args: analyzer.resource_counts.__setitem__(file_path, 1)
+        )
+        paths = ["http://a.example/log", "local.log", "http://b.example/log"]
+        analyzer = Analyzer()
+
+        LogReaderService(max_connections=1).read_all(paths, None, None, analyzer, None, None)
+
+        self.assertEqual(list(analyzer.get_requested_resources()), paths)
+        sessions = {call.kwargs["session"] for call in MockNetworkLogReader.call_args_list}
+        self.assertEqual(len(sessions), 1)
+        self.assertIsNotNone(sessions.pop())
+
+    @patch("src.services.readers.log_reader_service.IncrementalLogReader")
+    @patch("src.services.readers.log_reader_service.NetworkLogReader")
+    def test_read_logs_with_checkpoint_store(self, MockNetworkLogReader, MockIncrementalLogReader):
+        mock_analyzer = MagicMock()
+        mock_store = MagicMock()
+        service = LogReaderService(workers=4, checkpoint_store=mock_store, checkpoint_settings="{}")
+
+        service.read_logs("local_path.log", None, None, mock_analyzer, None, None)
+        service.read_logs("http://example.com/logs", None, None, mock_analyzer, None, None)
+
+        MockIncrementalLogReader.assert_called_once_with(mock_analyzer, mock_store, "{}", fields=None,
+                                                         log_format=None, bad_lines=ANY)
+        MockIncrementalLogReader.return_value.read_logs.assert_called_once_with("local_path.log", None, None, None, None)
+        MockNetworkLogReader.assert_called_once()
+
+    @patch("src.services.readers.log_reader_service.ColumnarLogReader")
+    @patch("src.services.readers.log_reader_service.NetworkLogReader")
+    def test_read_logs_with_column_cache(self, MockNetworkLogReader, MockColumnarLogReader):
+        mock_analyzer = MagicMock()
+        mock_cache = MagicMock()
+        service = LogReaderService(workers=4, column_cache=mock_cache)
+
+        service.read_logs("local_path.log", None, None, mock_analyzer, "status", "500")
+        service.read_logs("http://example.com/logs", None, None, mock_analyzer, None, None)
+
+        MockColumnarLogReader.assert_called_once_with(mock_analyzer, mock_cache, log_format=None, bad_lines=ANY)
+        MockColumnarLogReader.return_value.read_logs.assert_called_once_with("local_path.log", None, None, "status", "500")
+        MockNetworkLogReader.assert_called_once()
+
+    def test_read_all_reads_local_files_in_worker_processes(self):
+        paths = []
+        for index in range(3):
+            with NamedTemporaryFile("wb", suffix=".log", delete=False) as temp_file:
+                temp_file.write(f"10.0.0.{index} - - [19/Nov/2023:15:30:4{index} +0000] \"GET /{index} HTTP/1.1\" "
+                                f"200 10 \"-\" \"curl\"\n".encode() * (index + 1))
+                temp_file.write(b"garbage\n")
+            self.addCleanup(os.remove, temp_file.name)
+            paths.append(temp_file.name)
+
+        expected = Analyzer()
+        LogReaderService().read_all(paths, None, None, expected, None, None)
+        with patch("src.services.readers.log_reader_service.ProcessPoolExecutor",
+                   wraps=ProcessPoolExecutor) as MockProcessPoolExecutor:
+            analyzer = Analyzer()
+            LogReaderService(workers=2).read_all(paths, None, None, analyzer, None, None)
+
+        MockProcessPoolExecutor.assert_called_once_with(max_workers=2)
+        self.assertEqual(analyzer.to_bytes(), expected.to_bytes())
+        self.assertEqual(analyzer.get_bad_line_counts(), dict.fromkeys(paths, 1))
+
+    @patch("src.services.readers.log_reader_service.FileLogReader")
+    def test_read_all_single_path_reads_into_analyzer(self, MockFileLogReader):
+        mock_analyzer = MagicMock()
+
+        LogReaderService().read_all(["local.log"], None, None, mock_analyzer, None, None)
+
+        MockFileLogReader.assert_called_once_with(mock_analyzer, fields=None, log_format=None, bad_lines=ANY)
+        mock_analyzer.merge.assert_not_called()
+
 
 if __name__ == '__main__':
     unittest.main()
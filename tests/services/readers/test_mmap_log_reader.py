@@ -0,0 +1,97 @@
+import gzip
+import os
+import unittest
+from tempfile import NamedTemporaryFile
+from unittest.mock import MagicMock, patch
+
+from src.services.analytics.analyzer import Analyzer
+from src.services.analytics.numpy_batch_analyzer import NumpyBatchAnalyzer
+from src.services.readers.file_log_reader import FileLogReader
+from src.services.readers.mmap_log_reader import MmapLogReader
+
+
+class TestMmapLogReader(unittest.TestCase):
+    def setUp(self):
+        self.lines = [
+            b"127.0.0.1 - - [19/Nov/2023:15:30:45 +0000] \"GET /a HTTP/1.1\" 200 10 \"-\" \"curl\"\n",
+            b"10.0.0.1 - - [19/Nov/2023:15:30:46 +0000] \"GET /b HTTP/1.1\" 404 20 \"-\" \"Mozilla/5.0\"\n",
+            b"10.0.0.2 - - [19/Nov/2023:15:30:47 +0000] \"GET /c HTTP/1.1\" 500 30 \"-\" \"Mozilla/5.0\"",
+        ]
+        with NamedTemporaryFile("wb", delete=False) as temp_file:
+            temp_file.write(b"".join(self.lines))
+        self.file_path = temp_file.name
+        self.addCleanup(os.remove, self.file_path)
+
+    def test_read_logs_matches_file_reader(self):
+        for filter_field, filter_value in [(None, None), ("agent", "Mozilla"), ("status", ">=404"), ("ip", "10.0.0.0/8")]:
+            file_analyzer = Analyzer()
+            FileLogReader(file_analyzer).read_logs(self.file_path, None, None, filter_field, filter_value)
+            mmap_analyzer = Analyzer()
+            MmapLogReader(mmap_analyzer).read_logs(self.file_path, None, None, filter_field, filter_value)
+
+            self.assertEqual(mmap_analyzer.to_bytes(), file_analyzer.to_bytes())
+
+    def test_read_logs_feeds_batch_analyzer_in_batches(self):
+        for filter_field, filter_value in [(None, None), ("agent", "Mozilla"), ("status", ">=404")]:
+            with self.subTest(filter_field=filter_field):
+                file_analyzer = Analyzer()
+                FileLogReader(file_analyzer).read_logs(self.file_path, None, None, filter_field, filter_value)
+                analyzer = NumpyBatchAnalyzer(batch_size=2)
+
+                with patch.object(analyzer, "update_batch", wraps=analyzer.update_batch) as mock_update_batch:
+                    MmapLogReader(analyzer).read_logs(self.file_path, None, None, filter_field, filter_value)
+
+                self.assertEqual(mock_update_batch.call_count, 2)
+                self.assertEqual(analyzer.get_count_logs(), file_analyzer.get_count_logs())
+                self.assertEqual(analyzer.get_status_code_counts(), file_analyzer.get_status_code_counts())
+                self.assertEqual(analyzer.get_requested_resources(), file_analyzer.get_requested_resources())
+                self.assertEqual(analyzer.get_end_date(), file_analyzer.get_end_date())
+
+    def test_read_logs_skips_bad_lines(self):
+        with NamedTemporaryFile("wb", delete=False) as temp_file:
+            temp_file.write(b"garbage\n" + self.lines[0] + self.lines[1] + b"broken \"GET /x\" \"Mozilla/5.0\"")
+        self.addCleanup(os.remove, temp_file.name)
+
+        for filter_field, filter_value in [(None, None), ("agent", "Mozilla")]:
+            with self.subTest(filter_field=filter_field):
+                analyzer = Analyzer()
+                MmapLogReader(analyzer).read_logs(temp_file.name, None, None, filter_field, filter_value)
+
+                self.assertEqual(analyzer.get_count_logs(), 2 if filter_field is None else 1)
+                self.assertEqual(analyzer.get_bad_line_counts(), {temp_file.name: 2 if filter_field is None else 1})
+
+    def test_read_range(self):
+        analyzer = MagicMock()
+        start = len(self.lines[0])
+        MmapLogReader(analyzer).read_range(self.file_path, start, start + len(self.lines[1]), None, None, None, None)
+
+        analyzer.update_metrics.assert_called_once()
+        self.assertEqual(analyzer.update_metrics.call_args[0][0].request, "GET /b HTTP/1.1")
+
+    def test_read_logs_empty_file(self):
+        analyzer = MagicMock()
+        with NamedTemporaryFile("wb", delete=False) as temp_file:
+            pass
+        self.addCleanup(os.remove, temp_file.name)
+
+        MmapLogReader(analyzer).read_logs(temp_file.name, None, None, None, None)
+        analyzer.update_metrics.assert_not_called()
+
+    def test_read_logs_compressed_file(self):
+        analyzer = MagicMock()
+        with NamedTemporaryFile("wb", delete=False) as temp_file:
+            temp_file.write(gzip.compress(b"".join(self.lines)))
+        self.addCleanup(os.remove, temp_file.name)
+
+        MmapLogReader(analyzer).read_logs(temp_file.name, None, None, None, None)
+        self.assertEqual(analyzer.update_metrics.call_count, 3)
+
+    @patch("src.services.readers.mmap_log_reader.LOGGER.error")
+    def test_read_logs_missing_file(self, mock_logger_error):
+        MmapLogReader(MagicMock()).read_logs("missing_file.log", None, None, None, None)
+
+        mock_logger_error.assert_called_once_with("Error reading logs from file: missing_file.log", exc_info=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,39 +1,82 @@
+import threading
 import unittest
-from unittest.mock import patch, MagicMock
 from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from src.services.analytics.analyzer import Analyzer
+from src.services.readers.http_session_factory import DEFAULT_TIMEOUT, HttpSessionFactory
 from src.services.readers.network_log_reader import NetworkLogReader
-from src.models.nginx_log import NginxLog
+
+
+class RangeRequestHandler(BaseHTTPRequestHandler):
+    """Serves `server.payload`, honouring open-ended `Range` requests if `server.accept_ranges` is set."""
+
+    def do_HEAD(self):
+        self.send_headers(200, len(self.server.payload))
+
+    def do_GET(self):
+        payload = self.server.payload
+        self.server.requested_ranges.append(self.headers.get("Range"))
+        range_header = self.headers.get("Range")
+        if self.server.accept_ranges and range_header:
+            start = int(range_header.removeprefix("bytes=").split("-")[0])
+            self.send_headers(206, len(payload) - start, f"bytes {start}-{len(payload) - 1}/{len(payload)}")
+            self.wfile.write(payload[start:])
+        else:
+            status = self.server.statuses.pop(0) if self.server.statuses else 200
+            self.send_headers(status, len(payload))
+            self.wfile.write(payload)
+
+    def send_headers(self, status, length, content_range=None):
+        self.send_response(status)
+        self.send_header("Content-Length", str(length))
+        if self.server.accept_ranges:
+            self.send_header("Accept-Ranges", "bytes")
+        if content_range:
+            self.send_header("Content-Range", content_range)
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
 
 
 class TestNetworkLogReader(unittest.TestCase):
     def setUp(self):
         self.analyzer = MagicMock()
-        self.network_log_reader = NetworkLogReader(self.analyzer)
-
-    @patch("src.services.readers.network_log_reader.requests.get")
-    @patch("src.services.readers.network_log_reader.NginxLogParser")
-    @patch("src.services.readers.network_log_reader.LogFilter")
-    def test_read_logs_valid_response(self, mock_log_filter, mock_nginx_log_parser, mock_requests_get):
-        mock_response = MagicMock()
-        mock_response.text = (
-            "127.0.0.1 - john [19/Nov/2023:15:30:45 +0000] \"GET /index.html HTTP/1.1\" 200 1234 \"-\" \"Mozilla/5.0\"\n"
+        self.session = MagicMock()
+        self.network_log_reader = NetworkLogReader(self.analyzer, session=self.session)
+        self.log_line = (
+            b"127.0.0.1 - john [19/Nov/2023:15:30:45 +0000] \"GET /index.html HTTP/1.1\" 200 1234 \"-\" \"Mozilla/5.0\"\n"
         )
-        mock_response.status_code = 200
-        mock_requests_get.return_value = mock_response
-
-        mock_parser_instance = mock_nginx_log_parser.return_value
-        mock_log_filter_instance = mock_log_filter.return_value
-        mock_parser_instance.parse.return_value = NginxLog(
-            remote_addr="127.0.0.1",
-            remote_user="john",
-            time_local=datetime(2023, 11, 19, 15, 30, 45, tzinfo=timezone.utc),
-            request="GET /index.html HTTP/1.1",
-            status=200,
-            body_bytes_sent=1234,
-            http_referer="-",
-            http_user_agent="Mozilla/5.0"
-        )
-        mock_log_filter_instance.matches_filter.return_value = True
+
+    def start_server(self, payload: bytes, accept_ranges: bool) -> str:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), RangeRequestHandler)
+        server.payload = payload
+        server.accept_ranges = accept_ranges
+        server.requested_ranges = []
+        server.statuses = []
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.server = server
+        return f"http://127.0.0.1:{server.server_address[1]}/access.log"
+
+    def build_payload(self, count: int) -> bytes:
+        lines = []
+        for index in range(count):
+            lines.append(
+                f"10.0.{index % 7}.{index % 13} - - [19/Nov/2023:10:{index % 60:02d}:{index % 50:02d} +0000] "
+                f"\"GET /resource/{index % 11}{'x' * (index % 17)} HTTP/1.1\" {[200, 404, 500, 301][index % 4]} "
+                f"{index * 37 % 5000} \"-\" \"Mozilla/5.0\"\n".encode("utf-8")
+            )
+        return b"".join(lines)
+
+    def test_read_logs_valid_response(self):
+        mock_response = self.session.get.return_value.__enter__.return_value
+        mock_response.iter_content.return_value = iter([self.log_line[:40], self.log_line[40:]])
 
         self.network_log_reader.read_logs(
             file_path="http://mockurl.com/logs",
@@ -43,35 +86,13 @@ class TestNetworkLogReader(unittest.TestCase):
             filter_value="200"
         )
 
-        mock_requests_get.assert_called_once_with("http://mockurl.com/logs")
-        mock_parser_instance.parse.assert_called_once()
-        mock_log_filter_instance.matches_filter.assert_called_once()
+        self.session.get.assert_called_once_with("http://mockurl.com/logs", stream=True, timeout=DEFAULT_TIMEOUT)
         self.analyzer.update_metrics.assert_called_once()
+        self.assertEqual(self.analyzer.update_metrics.call_args[0][0].remote_user, "john")
 
-    @patch("src.services.readers.network_log_reader.requests.get")
-    @patch("src.services.readers.network_log_reader.NginxLogParser")
-    @patch("src.services.readers.network_log_reader.LogFilter")
-    def test_read_logs_filtering_logic(self, mock_log_filter, mock_nginx_log_parser, mock_requests_get):
-        mock_response = MagicMock()
-        mock_response.text = (
-            "127.0.0.1 - john [19/Nov/2023:15:30:45 +0000] \"GET /index.html HTTP/1.1\" 200 1234 \"-\" \"Mozilla/5.0\"\n"
-        )
-        mock_response.status_code = 200
-        mock_requests_get.return_value = mock_response
-
-        mock_parser_instance = mock_nginx_log_parser.return_value
-        mock_log_filter_instance = mock_log_filter.return_value
-        mock_parser_instance.parse.return_value = NginxLog(
-            remote_addr="127.0.0.1",
-            remote_user="john",
-            time_local=datetime(2023, 11, 19, 15, 30, 45, tzinfo=timezone.utc),
-            request="GET /index.html HTTP/1.1",
-            status=200,
-            body_bytes_sent=1234,
-            http_referer="-",
-            http_user_agent="Mozilla/5.0"
-        )
-        mock_log_filter_instance.matches_filter.return_value = False  # Simulate filtering out
+    def test_read_logs_filtering_logic(self):
+        mock_response = self.session.get.return_value.__enter__.return_value
+        mock_response.iter_content.return_value = iter([self.log_line])
 
         self.network_log_reader.read_logs(
             file_path="http://mockurl.com/logs",
@@ -83,6 +104,66 @@ class TestNetworkLogReader(unittest.TestCase):
 
         self.analyzer.update_metrics.assert_not_called()
 
+    @patch("src.services.readers.network_log_reader.LOGGER.error")
+    def test_read_logs_network_error(self, mock_logger_error):
+        self.session.get.side_effect = requests.ConnectionError("refused")
+
+        self.network_log_reader.read_logs("http://mockurl.com/logs", None, None, None, None)
+
+        mock_logger_error.assert_called_once_with("Error during network connection to URL: http://mockurl.com/logs",
+                                                  exc_info=True)
+
+    def test_iter_range_lines_realigns_at_newlines(self):
+        payload = b"aaa\nbbbb\ncc\nddd\n"
+        collected = []
+        for start, end in [(0, 5), (5, 10), (10, len(payload))]:
+            offset = max(start - 1, 0)
+            chunks = [payload[offset:][index:index + 3] for index in range(0, len(payload) - offset, 3)]
+            collected.extend(NetworkLogReader.iter_range_lines(iter(chunks), offset, start, end))
+
+        self.assertEqual(collected, [b"aaa", b"bbbb", b"cc", b"ddd"])
+
+    def test_read_logs_streams_from_server(self):
+        payload = self.build_payload(200)
+        url = self.start_server(payload, accept_ranges=False)
+
+        analyzer = Analyzer()
+        NetworkLogReader(analyzer, workers=4, min_range_size=1).read_logs(url, None, None, None, None)
+
+        self.assertEqual(analyzer.get_count_logs(), 200)
+        self.assertEqual(self.server.requested_ranges, [None])
+
+    def test_read_logs_retries_server_errors(self):
+        payload = self.build_payload(20)
+        url = self.start_server(payload, accept_ranges=False)
+        self.server.statuses = [503, 503]
+
+        analyzer = Analyzer()
+        session = HttpSessionFactory.create_session(retries=2, backoff_factor=0)
+        NetworkLogReader(analyzer, session=session).read_logs(url, None, None, None, None)
+
+        self.assertEqual(len(self.server.requested_ranges), 3)
+        self.assertEqual(analyzer.get_count_logs(), 20)
+
+    def test_read_logs_downloads_ranges_in_parallel(self):
+        payload = self.build_payload(300)
+        url = self.start_server(payload, accept_ranges=True)
+
+        streamed_analyzer = Analyzer()
+        NetworkLogReader(streamed_analyzer).read_logs(url, None, None, "status", ">=400")
+
+        parallel_analyzer = Analyzer()
+        NetworkLogReader(parallel_analyzer, workers=3, min_range_size=1).read_logs(url, None, None, "status", ">=400")
+
+        self.assertEqual(len(self.server.requested_ranges), 4)
+        self.assertEqual(parallel_analyzer.get_count_logs(), 150)
+        self.assertEqual(parallel_analyzer.get_count_logs(), streamed_analyzer.get_count_logs())
+        self.assertEqual(parallel_analyzer.get_average_size_logs(), streamed_analyzer.get_average_size_logs())
+        self.assertEqual(parallel_analyzer.get_unique_ip_count(), streamed_analyzer.get_unique_ip_count())
+        self.assertEqual(list(parallel_analyzer.get_requested_resources().items()),
+                         list(streamed_analyzer.get_requested_resources().items()))
+        self.assertEqual(parallel_analyzer.get_status_code_counts(), streamed_analyzer.get_status_code_counts())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,207 @@
+import gzip
+import os
+import unittest
+from tempfile import NamedTemporaryFile
+from unittest.mock import patch
+
+from src.models.compression_codec import CompressionCodec
+from src.models.error_policy import ErrorPolicy
+from src.services.analytics.analyzer import Analyzer
+from src.services.readers.bad_line_handler import BadLineHandler
+from src.services.readers.file_log_reader import FileLogReader
+from src.services.readers.parallel_file_log_reader import ParallelFileLogReader
+from tests.services.readers.test_codec_detector import build_seekable_zstd
+
+
+class TestParallelFileLogReader(unittest.TestCase):
+    def setUp(self):
+        lines = []
+        for index in range(300):
+            lines.append(
+                f"10.0.{index % 7}.{index % 13} - - [19/Nov/2023:10:{index % 60:02d}:{index % 50:02d} +0000] "
+                f"\"GET /resource/{index % 11} HTTP/1.1\" {[200, 404, 500, 301][index % 4]} {index * 37 % 5000} "
+                f"\"-\" \"Mozilla/5.0\"\n"
+            )
+
+        self.temp_file = NamedTemporaryFile("w", delete=False)
+        self.temp_file.write("".join(lines))
+        self.temp_file.close()
+
+    def tearDown(self):
+        os.remove(self.temp_file.name)
+
+    def test_split_into_ranges_is_newline_aligned(self):
+        reader = ParallelFileLogReader(Analyzer(), workers=4, min_range_size=1)
+        ranges = reader.split_into_ranges(self.temp_file.name)
+
+        self.assertEqual(len(ranges), 4)
+        self.assertEqual(ranges[0][0], 0)
+        self.assertEqual(ranges[-1][1], os.path.getsize(self.temp_file.name))
+        with open(self.temp_file.name, "rb") as file:
+            content = file.read()
+        for (start, end), (next_start, _) in zip(ranges, ranges[1:]):
+            self.assertEqual(end, next_start)
+            self.assertEqual(content[end - 1:end], b"\n")
+
+    def test_split_into_ranges_small_file_is_single_range(self):
+        reader = ParallelFileLogReader(Analyzer(), workers=4)
+        ranges = reader.split_into_ranges(self.temp_file.name)
+        self.assertEqual(ranges, [(0, os.path.getsize(self.temp_file.name))])
+
+    def test_read_logs_matches_serial_read(self):
+        serial_analyzer = Analyzer()
+        FileLogReader(serial_analyzer).read_logs(self.temp_file.name, None, None, "status", "404")
+
+        parallel_analyzer = Analyzer()
+        ParallelFileLogReader(parallel_analyzer, workers=3, min_range_size=1).read_logs(
+            self.temp_file.name, None, None, "status", "404"
+        )
+
+        self.assert_same_metrics(parallel_analyzer, serial_analyzer)
+
+    def test_workers_quarantine_bad_lines(self):
+        with open(self.temp_file.name, "rb") as reader:
+            lines = reader.read().splitlines(keepends=True)
+        lines[50:50] = [b"bad line 1\n"]
+        lines[250:250] = [b"bad line 2\n"]
+        with open(self.temp_file.name, "wb") as writer:
+            writer.writelines(lines)
+        quarantine_path = self.temp_file.name + ".rejected"
+        self.addCleanup(os.remove, quarantine_path)
+
+        analyzer = Analyzer()
+        with BadLineHandler(ErrorPolicy.QUARANTINE, quarantine_path) as bad_lines:
+            ParallelFileLogReader(analyzer, workers=3, min_range_size=1, bad_lines=bad_lines).read_logs(
+                self.temp_file.name, None, None, None, None
+            )
+
+        self.assertEqual(analyzer.get_count_logs(), 300)
+        self.assertEqual(analyzer.get_bad_line_counts(), {self.temp_file.name: 2})
+        with open(quarantine_path, "rb") as reader:
+            self.assertEqual(sorted(reader.read().splitlines()), [b"bad line 1", b"bad line 2"])
+
+    def test_read_multi_member_gzip_in_parallel(self):
+        with open(self.temp_file.name, "rb") as file:
+            lines = file.read().splitlines(keepends=True)
+        compressed_path = self.temp_file.name + ".gz"
+        with open(compressed_path, "wb") as file:
+            for start in range(0, len(lines), 50):
+                file.write(gzip.compress(b"".join(lines[start:start + 50])))
+        self.addCleanup(os.remove, compressed_path)
+
+        reader = ParallelFileLogReader(Analyzer(), workers=3, min_range_size=1)
+        ranges = reader.split_into_members(compressed_path, CompressionCodec.GZIP)
+        self.assertEqual(len(ranges), 3)
+
+        parallel_analyzer = Analyzer()
+        with patch.object(FileLogReader, "read_logs") as mock_serial_read:
+            ParallelFileLogReader(parallel_analyzer, workers=3, min_range_size=1).read_logs(
+                compressed_path, None, None, "status", "404"
+            )
+        mock_serial_read.assert_not_called()
+
+        serial_analyzer = Analyzer()
+        FileLogReader(serial_analyzer).read_logs(self.temp_file.name, None, None, "status", "404")
+        self.assert_same_metrics(parallel_analyzer, serial_analyzer)
+
+    def test_read_seekable_zstd_in_parallel(self):
+        with open(self.temp_file.name, "rb") as file:
+            lines = file.read().splitlines(keepends=True)
+        compressed_path = self.temp_file.name + ".zst"
+        with open(compressed_path, "wb") as file:
+            file.write(build_seekable_zstd([b"".join(lines[start:start + 30]) for start in range(0, len(lines), 30)]))
+        self.addCleanup(os.remove, compressed_path)
+
+        parallel_analyzer = Analyzer()
+        ParallelFileLogReader(parallel_analyzer, workers=4, min_range_size=1).read_logs(
+            compressed_path, None, None, None, None
+        )
+
+        serial_analyzer = Analyzer()
+        FileLogReader(serial_analyzer).read_logs(self.temp_file.name, None, None, None, None)
+        self.assert_same_metrics(parallel_analyzer, serial_analyzer)
+
+    @patch("src.services.readers.parallel_file_log_reader.LOGGER.warning")
+    def test_read_broken_member_chain_falls_back_to_serial(self, mock_logger_warning):
+        with open(self.temp_file.name, "rb") as file:
+            content = file.read()
+        compressed_path = self.temp_file.name + ".gz"
+        with open(compressed_path, "wb") as file:
+            middle = content.index(b"\n", len(content) * 3 // 4) - 5
+            file.write(gzip.compress(content[:middle]) + gzip.compress(content[middle:]))
+        self.addCleanup(os.remove, compressed_path)
+
+        parallel_analyzer = Analyzer()
+        ParallelFileLogReader(parallel_analyzer, workers=2, min_range_size=1).read_logs(
+            compressed_path, None, None, None, None
+        )
+
+        mock_logger_warning.assert_called_once()
+        serial_analyzer = Analyzer()
+        FileLogReader(serial_analyzer).read_logs(self.temp_file.name, None, None, None, None)
+        self.assert_same_metrics(parallel_analyzer, serial_analyzer)
+
+    @patch("src.services.readers.parallel_file_log_reader.LOGGER.warning")
+    def test_serial_fallback_quarantines_bad_lines_once(self, mock_logger_warning):
+        with open(self.temp_file.name, "rb") as file:
+            lines = file.read().splitlines(keepends=True)
+        lines[50:50] = [b"bad line 1\n"]
+        lines[280:280] = [b"bad line 2\n"]
+        content = b"".join(lines)
+        compressed_path = self.temp_file.name + ".gz"
+        quarantine_path = self.temp_file.name + ".rejected"
+        with open(compressed_path, "wb") as file:
+            middle = content.index(b"\n", len(content) * 3 // 4) - 5
+            file.write(gzip.compress(content[:middle]) + gzip.compress(content[middle:]))
+        self.addCleanup(os.remove, compressed_path)
+        self.addCleanup(os.remove, quarantine_path)
+
+        analyzer = Analyzer()
+        with BadLineHandler(ErrorPolicy.QUARANTINE, quarantine_path) as bad_lines:
+            ParallelFileLogReader(analyzer, workers=2, min_range_size=1, bad_lines=bad_lines).read_logs(
+                compressed_path, None, None, None, None
+            )
+
+        mock_logger_warning.assert_called_once()
+        self.assertEqual(analyzer.get_bad_line_counts(), {compressed_path: 2})
+        with open(quarantine_path, "rb") as reader:
+            self.assertEqual(reader.read(), b"bad line 1\nbad line 2\n")
+
+    def test_compressed_workers_quarantine_bad_lines_in_order(self):
+        with open(self.temp_file.name, "rb") as file:
+            lines = file.read().splitlines(keepends=True)
+        lines[20:20] = [b"bad line 1\n"]
+        lines[200:200] = [b"bad line 2\n"]
+        compressed_path = self.temp_file.name + ".gz"
+        quarantine_path = self.temp_file.name + ".rejected"
+        with open(compressed_path, "wb") as file:
+            for start in range(0, len(lines), 50):
+                file.write(gzip.compress(b"".join(lines[start:start + 50])))
+        self.addCleanup(os.remove, compressed_path)
+        self.addCleanup(os.remove, quarantine_path)
+
+        analyzer = Analyzer()
+        with BadLineHandler(ErrorPolicy.QUARANTINE, quarantine_path) as bad_lines, \
+                patch.object(FileLogReader, "read_logs") as mock_serial_read:
+            ParallelFileLogReader(analyzer, workers=3, min_range_size=1, bad_lines=bad_lines).read_logs(
+                compressed_path, None, None, None, None
+            )
+
+        mock_serial_read.assert_not_called()
+        with open(quarantine_path, "rb") as reader:
+            self.assertEqual(reader.read(), b"bad line 1\nbad line 2\n")
+
+    def assert_same_metrics(self, parallel_analyzer, serial_analyzer):
+        self.assertEqual(parallel_analyzer.get_count_logs(), serial_analyzer.get_count_logs())
+        self.assertEqual(parallel_analyzer.get_average_size_logs(), serial_analyzer.get_average_size_logs())
+        self.assertEqual(parallel_analyzer.calculate_95th_percentile(), serial_analyzer.calculate_95th_percentile())
+        self.assertEqual(parallel_analyzer.get_unique_ip_count(), serial_analyzer.get_unique_ip_count())
+        self.assertEqual(parallel_analyzer.get_start_date(), serial_analyzer.get_start_date())
+        self.assertEqual(parallel_analyzer.get_end_date(), serial_analyzer.get_end_date())
+        self.assertEqual(list(parallel_analyzer.get_requested_resources().items()),
+                         list(serial_analyzer.get_requested_resources().items()))
+        self.assertEqual(parallel_analyzer.get_status_code_counts(), serial_analyzer.get_status_code_counts())
+
+
+if __name__ == "__main__":
+    unittest.main()
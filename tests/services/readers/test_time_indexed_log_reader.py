@@ -0,0 +1,101 @@
+import gzip
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from src.services.analytics.analyzer import Analyzer
+from src.services.indexes.time_index_store import TimeIndexStore
+from src.services.readers.file_log_reader import FileLogReader
+from src.services.readers.mmap_log_reader import MmapLogReader
+from src.services.readers.time_indexed_log_reader import TimeIndexedLogReader
+
+
+def build_line(minute: int) -> bytes:
+    time = datetime(2023, 11, 19) + timedelta(minutes=minute)
+    return (
+        f"10.0.0.{minute % 5} - - [{time.strftime('%d/%b/%Y:%H:%M:%S')} +0000] "
+        f"\"GET /page/{minute % 3} HTTP/1.1\" {[200, 404][minute % 2]} {minute * 10} \"-\" \"curl\"\n"
+    ).encode("utf-8")
+
+
+class TestTimeIndexedLogReader(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.file_path = os.path.join(directory.name, "access.log")
+        self.store = TimeIndexStore(os.path.join(directory.name, "indexes"))
+        # Minute 50 is written out of order, two minutes late.
+        minutes = [minute for minute in range(300) if minute != 50]
+        minutes.insert(51, 50)
+        self.write(b"".join(build_line(minute) for minute in minutes))
+        self.from_time = datetime(2023, 11, 19, 0, 50)
+        self.to_time = datetime(2023, 11, 19, 1, 40)
+
+    def write(self, data: bytes, mode: str = "ab") -> None:
+        with open(self.file_path, mode) as log_file:
+            log_file.write(data)
+
+    def read_indexed(self, workers: int = 1, store: TimeIndexStore | None = None) -> Analyzer:
+        analyzer = Analyzer()
+        TimeIndexedLogReader(analyzer, workers=workers, store=store, sample_interval=1000, tolerance=5 * 60).read_logs(
+            self.file_path, self.from_time, self.to_time, None, None
+        )
+        return analyzer
+
+    def read_in_full(self) -> Analyzer:
+        analyzer = Analyzer()
+        FileLogReader(analyzer).read_logs(self.file_path, self.from_time, self.to_time, None, None)
+        return analyzer
+
+    def test_read_logs_matches_full_read_and_reads_only_selected_range(self):
+        read_range = MmapLogReader.read_range
+        with patch.object(MmapLogReader, "read_range", autospec=True, side_effect=read_range) as mock_read_range:
+            analyzer = self.read_indexed()
+
+        self.assertEqual(analyzer.to_bytes(), self.read_in_full().to_bytes())
+        self.assertEqual(analyzer.get_count_logs(), 51)
+        start, end = mock_read_range.call_args.args[2:4]
+        self.assertGreater(start, 0)
+        self.assertLess(end - start, os.path.getsize(self.file_path) // 2)
+
+    def test_read_logs_with_workers_matches_full_read(self):
+        analyzer = self.read_indexed(workers=2)
+
+        self.assertEqual(analyzer.to_bytes(), self.read_in_full().to_bytes())
+
+    def test_read_logs_caches_and_extends_index(self):
+        self.read_indexed(store=self.store)
+        cached = self.store.load(os.path.abspath(self.file_path))
+        self.assertEqual(cached.size, os.path.getsize(self.file_path))
+
+        self.write(b"".join(build_line(minute) for minute in range(300, 320)))
+        with patch("src.services.readers.time_indexed_log_reader.TimeIndex.extend", autospec=True,
+                   side_effect=lambda index, reader, size: setattr(index, "size", size)) as mock_extend:
+            self.read_indexed(store=self.store)
+
+        self.assertEqual(mock_extend.call_args.args[0].offsets, cached.offsets)
+        self.assertEqual(self.store.load(os.path.abspath(self.file_path)).size, os.path.getsize(self.file_path))
+
+    def test_read_logs_rebuilds_index_of_rewritten_file(self):
+        self.read_indexed(store=self.store)
+        self.write(b"".join(build_line(minute + 60) for minute in range(300)), mode="r+b")
+
+        analyzer = self.read_indexed(store=self.store)
+
+        self.assertEqual(analyzer.to_bytes(), self.read_in_full().to_bytes())
+
+    def test_read_logs_reads_compressed_file_in_full(self):
+        with open(self.file_path, "rb") as log_file:
+            data = log_file.read()
+        self.write(gzip.compress(data), mode="wb")
+
+        analyzer = self.read_indexed(store=self.store)
+
+        self.assertEqual(analyzer.get_count_logs(), 51)
+        self.assertIsNone(self.store.load(os.path.abspath(self.file_path)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+from array import array
+from datetime import datetime, timedelta, timezone
+
+from src.services.serialization.binary_reader import BinaryReader
+from src.services.serialization.binary_writer import BinaryWriter
+
+
+class TestBinaryReader(unittest.TestCase):
+    def test_round_trip(self):
+        aware = datetime(2023, 11, 19, 15, 30, 45, 123, tzinfo=timezone(timedelta(hours=3)))
+        naive = datetime(2023, 1, 1, 12, 0, 0)
+
+        writer = BinaryWriter()
+        writer.write_raw(b"MAGIC")
+        writer.write_uint8(7)
+        writer.write_uint32(70000)
+        writer.write_int32(-5)
+        writer.write_uint64(2 ** 40)
+        writer.write_int64(-(2 ** 40))
+        writer.write_float64(1.5)
+        writer.write_str("Mozilla/5.0 \udcff")
+        writer.write_int_array(array("q", [3, -4, 5]))
+        writer.write_datetime(aware)
+        writer.write_datetime(naive)
+        writer.write_datetime(None)
+
+        reader = BinaryReader(writer.getvalue())
+        self.assertEqual(reader.read_raw(5), b"MAGIC")
+        self.assertEqual(reader.read_uint8(), 7)
+        self.assertEqual(reader.read_uint32(), 70000)
+        self.assertEqual(reader.read_int32(), -5)
+        self.assertEqual(reader.read_uint64(), 2 ** 40)
+        self.assertEqual(reader.read_int64(), -(2 ** 40))
+        self.assertEqual(reader.read_float64(), 1.5)
+        self.assertEqual(reader.read_str(), "Mozilla/5.0 \udcff")
+        self.assertEqual(reader.read_int_array(), array("q", [3, -4, 5]))
+
+        restored_aware = reader.read_datetime()
+        self.assertEqual(restored_aware, aware)
+        self.assertEqual(restored_aware.utcoffset(), timedelta(hours=3))
+        restored_naive = reader.read_datetime()
+        self.assertEqual(restored_naive, naive)
+        self.assertIsNone(restored_naive.tzinfo)
+        self.assertIsNone(reader.read_datetime())
+        self.assertTrue(reader.at_end())
+
+    def test_read_past_end(self):
+        reader = BinaryReader(b"\x01\x02")
+        with self.assertRaises(ValueError):
+            reader.read_uint32()
+
+    def test_read_unknown_datetime_marker(self):
+        reader = BinaryReader(b"\x09" + b"\x00" * 12)
+        with self.assertRaises(ValueError):
+            reader.read_datetime()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+from array import array
+from datetime import datetime, timezone
+
+from src.services.serialization.binary_writer import BinaryWriter
+
+
+class TestBinaryWriter(unittest.TestCase):
+    def setUp(self):
+        self.writer = BinaryWriter()
+
+    def test_write_numbers_little_endian(self):
+        self.writer.write_uint8(1)
+        self.writer.write_uint32(2)
+        self.writer.write_int64(-1)
+        self.assertEqual(self.writer.getvalue(), b"\x01" + b"\x02\x00\x00\x00" + b"\xff" * 8)
+
+    def test_write_str_is_length_prefixed(self):
+        self.writer.write_str("/é")
+        self.assertEqual(self.writer.getvalue(), b"\x03" + b"\x00" * 7 + "/é".encode("utf-8"))
+
+    def test_write_int_array(self):
+        self.writer.write_int_array(array("q", [1, 2]))
+        self.assertEqual(
+            self.writer.getvalue(),
+            b"\x10" + b"\x00" * 7 + b"\x01" + b"\x00" * 7 + b"\x02" + b"\x00" * 7
+        )
+
+    def test_write_datetime_none(self):
+        self.writer.write_datetime(None)
+        self.assertEqual(self.writer.getvalue(), b"\x00")
+
+    def test_write_datetime_aware(self):
+        self.writer.write_datetime(datetime(1970, 1, 1, 0, 0, 1, tzinfo=timezone.utc))
+        self.assertEqual(self.writer.getvalue(), b"\x02" + (10 ** 6).to_bytes(8, "little") + b"\x00" * 4)
+
+
+if __name__ == "__main__":
+    unittest.main()